@@ -272,6 +272,10 @@ struct gc_collection_stats {
     Py_ssize_t collected;
     /* total number of uncollectable objects (put into gc.garbage) */
     Py_ssize_t uncollectable;
+    /* number of objects examined by the collection */
+    Py_ssize_t visited;
+    /* duration of the collection */
+    PyTime_t duration;
 };
 
 /* Running stats per generation */
@@ -317,6 +321,10 @@ struct _gc_runtime_state {
     /* Which of the old spaces is the visited space */
     int visited_space;
     int phase;
+    /* Maximum duration of an incremental collection, 0 if unbounded */
+    PyTime_t pause_target;
+    /* Estimated duration of the collection of one object, in nanoseconds */
+    double visit_cost;
 
 #ifdef Py_GIL_DISABLED
     /* This is the number of objects that survived the last full
@@ -785,6 +785,7 @@ extern "C" {
     INIT_ID(aggregate_class), \
     INIT_ID(alias), \
     INIT_ID(align), \
+    INIT_ID(all_threads), \
     INIT_ID(allow_code), \
     INIT_ID(append), \
     INIT_ID(arg), \
@@ -911,6 +912,7 @@ extern "C" {
     INIT_ID(end_lineno), \
     INIT_ID(end_offset), \
     INIT_ID(endpos), \
+    INIT_ID(entries), \
     INIT_ID(entrypoint), \
     INIT_ID(env), \
     INIT_ID(errors), \
@@ -987,6 +989,7 @@ extern "C" {
     INIT_ID(imag), \
     INIT_ID(importlib), \
     INIT_ID(in_fd), \
+    INIT_ID(inclusive), \
     INIT_ID(incoming), \
     INIT_ID(index), \
     INIT_ID(indexgroup), \
@@ -1058,9 +1061,11 @@ extern "C" {
     INIT_ID(manual_reset), \
     INIT_ID(mapping), \
     INIT_ID(match), \
+    INIT_ID(max_key), \
     INIT_ID(max_length), \
     INIT_ID(maxdigits), \
     INIT_ID(maxevents), \
+    INIT_ID(maximum), \
     INIT_ID(maxlen), \
     INIT_ID(maxmem), \
     INIT_ID(maxsplit), \
@@ -1073,6 +1078,8 @@ extern "C" {
     INIT_ID(method), \
     INIT_ID(microsecond), \
     INIT_ID(milliseconds), \
+    INIT_ID(min_key), \
+    INIT_ID(minimum), \
     INIT_ID(minute), \
     INIT_ID(mod), \
     INIT_ID(mode), \
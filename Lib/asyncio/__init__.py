@@ -45,3 +45,9 @@
 else:
     from .unix_events import *  # pragma: no cover
     __all__ += unix_events.__all__
+    try:
+        from .uring_events import *
+    except ImportError:
+        pass
+    else:
+        __all__ += uring_events.__all__
@@ -67,6 +67,13 @@
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Number of slots of each level of the timer wheel, as a power of 2, and
+# number of levels.  With a resolution of 10 ms, the wheel spans 46 hours.
+_TIMER_WHEEL_BITS = 6
+_TIMER_WHEEL_SIZE = 1 << _TIMER_WHEEL_BITS
+_TIMER_WHEEL_MASK = _TIMER_WHEEL_SIZE - 1
+_TIMER_WHEEL_LEVELS = 4
+
 
 def _format_handle(handle):
     cb = handle._callback
@@ -414,6 +421,160 @@ async def wait_closed(self):
         await waiter
 
 
+class _TimerWheel:
+    """Hierarchical timing wheel holding the timers of an event loop which
+    are not due in the current tick.
+
+    Time is divided into ticks of *resolution* seconds.  Level 0 has one
+    slot per tick and each slot of a higher level spans a whole turn of the
+    level below.  Adding or cancelling a timer is O(1).  When the current
+    tick reaches a slot, its timers move down a level, or from level 0 into
+    the heap of the loop, from which they run at their exact time.
+    Cancelled timers are dropped on the way and never reach the heap.
+    """
+
+    def __init__(self, resolution, now):
+        self.resolution = resolution
+        # The timers due before the end of the current tick are in the heap.
+        self._tick = int(now // resolution)
+        self._slots = [[[] for i in range(_TIMER_WHEEL_SIZE)]
+                       for level in range(_TIMER_WHEEL_LEVELS)]
+        # Number of timers stored in each level, including cancelled ones.
+        self._counts = [0] * _TIMER_WHEEL_LEVELS
+        # Timers due after the last slot of the last level.
+        self._overflow = []
+        self.cancelled_count = 0
+
+    def __len__(self):
+        return sum(self._counts) + len(self._overflow)
+
+    def __contains__(self, timer):
+        # A scheduled timer stays in the wheel until its tick is reached.
+        return timer._when // self.resolution > self._tick
+
+    def add(self, timer):
+        """Add a timer to the wheel.
+
+        Return False if the timer is due in the current tick: it must be
+        pushed to the heap instead.
+        """
+        tick = timer._when // self.resolution
+        current = self._tick
+        if not tick > current:
+            return False
+        shift = _TIMER_WHEEL_BITS * _TIMER_WHEEL_LEVELS
+        if tick >= ((current >> shift) + 1) << shift:
+            self._overflow.append(timer)
+            return True
+        tick = int(tick)
+        # The level of the highest bit which differs from the current tick.
+        level = ((tick ^ current).bit_length() - 1) // _TIMER_WHEEL_BITS
+        shift = _TIMER_WHEEL_BITS * level
+        self._slots[level][(tick >> shift) & _TIMER_WHEEL_MASK].append(timer)
+        self._counts[level] += 1
+        return True
+
+    def next_time(self):
+        """Return the time at which advance() has timers to move."""
+        tick = self._tick
+        for level in range(_TIMER_WHEEL_LEVELS):
+            if self._counts[level]:
+                shift = _TIMER_WHEEL_BITS * level
+                slots = self._slots[level]
+                base = tick >> shift
+                for index in range((base & _TIMER_WHEEL_MASK) + 1,
+                                   _TIMER_WHEEL_SIZE):
+                    if slots[index]:
+                        base = (base & ~_TIMER_WHEEL_MASK) | index
+                        return (base << shift) * self.resolution
+        if self._overflow:
+            shift = _TIMER_WHEEL_BITS * _TIMER_WHEEL_LEVELS
+            return (((tick >> shift) + 1) << shift) * self.resolution
+        return (tick + 1) * self.resolution
+
+    def advance(self, now, heap):
+        """Push to heap the timers due before the end of the tick of now."""
+        target = int(now // self.resolution)
+        tick = self._tick
+        counts = self._counts
+        while tick < target:
+            # Jump over the ticks of the empty lower levels.
+            level = 0
+            while level < _TIMER_WHEEL_LEVELS and not counts[level]:
+                level += 1
+            if level == _TIMER_WHEEL_LEVELS and not self._overflow:
+                break
+            shift = _TIMER_WHEEL_BITS * level
+            tick = ((tick >> shift) + 1) << shift
+            if tick > target:
+                break
+            self._tick = tick
+            self._expire(tick, heap)
+        self._tick = target
+
+    def _expire(self, tick, heap):
+        # Higher levels first: their timers may move to lower slots which
+        # start at this tick.
+        level = 0
+        while (level < _TIMER_WHEEL_LEVELS and
+               not tick & ((1 << _TIMER_WHEEL_BITS * (level + 1)) - 1)):
+            level += 1
+        if level == _TIMER_WHEEL_LEVELS:
+            timers = self._overflow
+            self._overflow = []
+            self._reinsert(timers, heap)
+            level -= 1
+        for level in range(level, -1, -1):
+            shift = _TIMER_WHEEL_BITS * level
+            slots = self._slots[level]
+            index = (tick >> shift) & _TIMER_WHEEL_MASK
+            timers = slots[index]
+            if timers:
+                slots[index] = []
+                self._counts[level] -= len(timers)
+                self._reinsert(timers, heap)
+
+    def _reinsert(self, timers, heap):
+        for timer in timers:
+            if timer._cancelled:
+                timer._scheduled = False
+                self.cancelled_count -= 1
+            elif not self.add(timer):
+                heapq.heappush(heap, timer)
+
+    def purge(self):
+        """Remove the cancelled timers."""
+        for level, slots in enumerate(self._slots):
+            for index, timers in enumerate(slots):
+                if timers:
+                    slots[index] = self._purge_list(timers)
+            self._counts[level] = sum(map(len, slots))
+        self._overflow = self._purge_list(self._overflow)
+        self.cancelled_count = 0
+
+    def _purge_list(self, timers):
+        alive = []
+        for timer in timers:
+            if timer._cancelled:
+                timer._scheduled = False
+            else:
+                alive.append(timer)
+        return alive
+
+    def clear(self):
+        """Remove all the timers and return them."""
+        timers = self._overflow
+        for slots in self._slots:
+            for index, slot in enumerate(slots):
+                if slot:
+                    timers.extend(slot)
+                    slots[index] = []
+        self._counts = [0] * _TIMER_WHEEL_LEVELS
+        self._overflow = []
+        self.cancelled_count = 0
+        return timers
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
@@ -422,6 +583,7 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -744,6 +906,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -811,10 +975,58 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None or not self._timer_wheel.add(timer):
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
+    def set_timer_wheel(self, resolution=0.01):
+        """Store the timers due in more than *resolution* seconds in a
+        hierarchical timing wheel.
+
+        Scheduling and cancelling such timers is O(1) instead of
+        O(log n) with the heap of timers.  They move into the heap when
+        they become due in less than *resolution* seconds, so they still
+        run at their exact time.  If resolution is None, the timing wheel
+        is disabled.
+        """
+        if resolution is not None and not resolution > 0:
+            raise ValueError('resolution must be a positive number')
+        handles = self._scheduled
+        if self._timer_wheel is not None:
+            handles.extend(self._timer_wheel.clear())
+        if resolution is None:
+            self._timer_wheel = None
+        else:
+            self._timer_wheel = _TimerWheel(resolution, self.time())
+        scheduled = []
+        for handle in handles:
+            if handle._cancelled:
+                handle._scheduled = False
+            elif (self._timer_wheel is None or
+                    not self._timer_wheel.add(handle)):
+                scheduled.append(handle)
+        heapq.heapify(scheduled)
+        self._scheduled = scheduled
+        self._timer_cancelled_count = 0
+
+    def get_timer_stats(self):
+        """Return a dict with the number of scheduled timers.
+
+        'heap' and 'wheel' count the timers in the heap and in the timing
+        wheel; 'heap_cancelled' and 'wheel_cancelled' count the cancelled
+        timers among them which were not removed yet.  'wheel_resolution'
+        is the resolution of the timing wheel, or None if it is disabled.
+        """
+        wheel = self._timer_wheel
+        return {
+            'heap': len(self._scheduled),
+            'heap_cancelled': self._timer_cancelled_count,
+            'wheel': len(wheel) if wheel is not None else 0,
+            'wheel_cancelled': wheel.cancelled_count if wheel is not None else 0,
+            'wheel_resolution': wheel.resolution if wheel is not None else None,
+        }
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -1948,7 +2160,10 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is not None and handle in self._timer_wheel:
+                self._timer_wheel.cancelled_count += 1
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1981,12 +2196,25 @@ def _run_once(self):
                 handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
+        wheel = self._timer_wheel
+        if (wheel is not None and
+            wheel.cancelled_count > _MIN_SCHEDULED_TIMER_HANDLES and
+            wheel.cancelled_count / len(wheel) >
+                _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
+            wheel.purge()
+
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
+        elif self._scheduled or wheel:
             # Compute the desired timeout.
-            timeout = self._scheduled[0]._when - self.time()
+            if not self._scheduled:
+                when = wheel.next_time()
+            elif wheel:
+                when = min(self._scheduled[0]._when, wheel.next_time())
+            else:
+                when = self._scheduled[0]._when
+            timeout = when - self.time()
             if timeout > MAXIMUM_SELECT_TIMEOUT:
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
@@ -1999,6 +2227,8 @@ def _run_once(self):
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
+        if wheel is not None:
+            wheel.advance(end_time, self._scheduled)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
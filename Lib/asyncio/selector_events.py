@@ -932,6 +932,8 @@ def __init__(self, loop, sock, protocol, waiter=None,
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._empty_waiter = None
+        self._corked = False
+        self._corked_size = 0
         if _HAS_SENDMSG:
             self._write_ready = self._write_sendmsg
         else:
@@ -1061,6 +1063,13 @@ def write(self, data):
             self._conn_lost += 1
             return
 
+        if self._corked:
+            self._buffer.append(data)
+            self._corked_size += len(data)
+            if self._corked_size > self._high_water:
+                self._flush_corked()
+            return
+
         if not self._buffer:
             # Optimization: try to send now.
             try:
@@ -1159,6 +1168,7 @@ def _write_send(self):
     def write_eof(self):
         if self._closing or self._eof:
             return
+        self.uncork()
         self._eof = True
         if not self._buffer:
             self._sock.shutdown(socket.SHUT_WR)
@@ -1170,13 +1180,33 @@ def writelines(self, list_of_data):
             raise RuntimeError('unable to writelines; sendfile is in progress')
         if not list_of_data:
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
+        data = [memoryview(data) for data in list_of_data]
+        self._buffer.extend(data)
+        if self._corked:
+            self._corked_size += sum(map(len, data))
+            if self._corked_size <= self._high_water:
+                return
+        self._flush_corked()
+
+    def _flush_corked(self):
+        # Send the buffered data with a single system call if possible.
+        self._corked_size = 0
+        if not self._buffer or self._conn_lost:
+            return
         self._write_ready()
         # If the entire buffer couldn't be written, register a write handler
         if self._buffer:
             self._loop._add_writer(self._sock_fd, self._write_ready)
             self._maybe_pause_protocol()
 
+    def cork(self):
+        self._corked = True
+
+    def uncork(self):
+        if self._corked:
+            self._corked = False
+            self._flush_corked()
+
     def can_write_eof(self):
         return True
 
@@ -1189,6 +1219,7 @@ def _call_connection_lost(self, exc):
     def _make_empty_waiter(self):
         if self._empty_waiter is not None:
             raise RuntimeError("Empty waiter is already set")
+        self.uncork()
         self._empty_waiter = self._loop.create_future()
         if not self._buffer:
             self._empty_waiter.set_result(None)
@@ -1198,6 +1229,8 @@ def _reset_empty_waiter(self):
         self._empty_waiter = None
 
     def close(self):
+        if not self._closing:
+            self.uncork()
         self._read_ready_cb = None
         self._write_ready = None
         super().close()
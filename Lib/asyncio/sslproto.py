@@ -113,6 +113,7 @@ def close(self):
         """
         if not self._closed:
             self._closed = True
+            self._ssl_protocol._uncork()
             self._ssl_protocol._start_shutdown()
         else:
             self._ssl_protocol = None
@@ -229,6 +230,18 @@ def writelines(self, list_of_data):
         """
         self._ssl_protocol._write_appdata(list_of_data)
 
+    def cork(self):
+        """Buffer the data written until uncork() is called.
+
+        The data is then encrypted and passed to the underlying transport
+        in a single write.
+        """
+        self._ssl_protocol._corked = True
+
+    def uncork(self):
+        """Send the data buffered since cork() was called."""
+        self._ssl_protocol._uncork()
+
     def write_eof(self):
         """Close the write end after flushing buffered data.
 
@@ -308,6 +321,7 @@ def __init__(self, loop, app_protocol, sslcontext, waiter,
         # App data write buffering
         self._write_backlog = collections.deque()
         self._write_buffer_size = 0
+        self._corked = False
 
         self._waiter = waiter
         self._loop = loop
@@ -692,6 +706,10 @@ def _write_appdata(self, list_of_data):
             self._write_backlog.append(data)
             self._write_buffer_size += len(data)
 
+        if (self._corked and
+                self._write_buffer_size <= self._outgoing_high_water):
+            return
+
         try:
             if self._state == SSLProtocolState.WRAPPED:
                 self._do_write()
@@ -699,6 +717,17 @@ def _write_appdata(self, list_of_data):
         except Exception as ex:
             self._fatal_error(ex, 'Fatal error on SSL protocol')
 
+    def _uncork(self):
+        if not self._corked:
+            return
+        self._corked = False
+        try:
+            if (self._state == SSLProtocolState.WRAPPED and
+                    self._write_backlog):
+                self._do_write()
+        except Exception as ex:
+            self._fatal_error(ex, 'Fatal error on SSL protocol')
+
     def _do_write(self):
         try:
             while self._write_backlog:
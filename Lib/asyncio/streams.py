@@ -22,6 +22,11 @@
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
 
+# Receive buffers recycled by _BufferedStreamReaderProtocol.
+_RECV_BUFFER_SIZE = 2 ** 16  # 64 KiB
+_MAX_FREE_RECV_BUFFERS = 16
+_free_recv_buffers = []
+
 
 async def open_connection(host=None, port=None, *,
                           limit=_DEFAULT_LIMIT, **kwds):
@@ -44,7 +49,7 @@ async def open_connection(host=None, port=None, *,
     """
     loop = events.get_running_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -77,8 +82,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -93,7 +98,7 @@ async def open_unix_connection(path=None, *,
         loop = events.get_running_loop()
 
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -106,8 +111,9 @@ async def start_unix_server(client_connected_cb, path=None, *,
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = _BufferedStreamReaderProtocol(reader,
+                                                     client_connected_cb,
+                                                     loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -306,6 +312,63 @@ def __del__(self):
                 closed.exception()
 
 
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data into recycled buffers.
+
+    The transport receives data into a buffer taken from a shared pool,
+    instead of allocating a new bytes object for each read.  If
+    StreamReader.readinto() is waiting and the stream buffer is empty,
+    data is received directly into the buffer passed to readinto().
+    """
+
+    _recv_buffer = None
+    _recv_target = None
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is not None:
+            target = reader._get_readinto_buffer()
+            if target is not None:
+                self._recv_target = target
+                return target
+        self._recv_target = None
+        buf = self._recv_buffer
+        if buf is None:
+            try:
+                buf = _free_recv_buffers.pop()
+            except IndexError:
+                buf = memoryview(bytearray(_RECV_BUFFER_SIZE))
+            self._recv_buffer = buf
+        return buf
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        target = self._recv_target
+        if target is not None:
+            self._recv_target = None
+            if reader is not None and reader._readinto_done(target, nbytes):
+                return
+            buf = target
+        else:
+            buf = self._recv_buffer
+        if reader is not None:
+            reader.feed_data(buf[:nbytes])
+        self._release_recv_buffer()
+
+    def _release_recv_buffer(self):
+        buf = self._recv_buffer
+        if buf is not None:
+            self._recv_buffer = None
+            if len(_free_recv_buffers) < _MAX_FREE_RECV_BUFFERS:
+                _free_recv_buffers.append(buf)
+
+    def connection_lost(self, exc):
+        self._release_recv_buffer()
+        self._recv_target = None
+        super().connection_lost(exc)
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -342,6 +405,12 @@ def write(self, data):
     def writelines(self, data):
         self._transport.writelines(data)
 
+    def cork(self):
+        self._transport.cork()
+
+    def uncork(self):
+        self._transport.uncork()
+
     def write_eof(self):
         return self._transport.write_eof()
 
@@ -431,6 +500,8 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._exception = None
         self._transport = None
         self._paused = False
+        self._readinto_buffer = None  # Buffer of a waiting readinto()
+        self._readinto_nbytes = 0  # Bytes received into _readinto_buffer
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -512,6 +583,24 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
+    def _get_readinto_buffer(self):
+        """Return the buffer of a waiting readinto() call, if data can be
+        received directly into it."""
+        if self._buffer or self._eof:
+            return None
+        return self._readinto_buffer
+
+    def _readinto_done(self, buffer, nbytes):
+        """Called when nbytes were received into the buffer returned by
+        _get_readinto_buffer()."""
+        if buffer is not self._readinto_buffer:
+            # readinto() is not waiting anymore.
+            return False
+        self._readinto_buffer = None
+        self._readinto_nbytes = nbytes
+        self._wakeup_waiter()
+        return True
+
     async def _wait_for_data(self, func_name):
         """Wait until feed_data() or feed_eof() is called.
 
@@ -736,6 +825,59 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read as soon as at least 1 byte is
+        available.  Return 0 if EOF was received and the internal buffer is
+        empty, or if buffer is empty.
+
+        Streams created by open_connection() and start_server() receive data
+        directly into the buffer when the internal buffer is empty, which
+        avoids copying the data.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        view = memoryview(buffer).cast('B')
+        if view.readonly:
+            raise TypeError('readinto() argument must be read-write '
+                            'bytes-like object')
+
+        if self._exception is not None:
+            raise self._exception
+
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            if self._waiter is not None:
+                raise RuntimeError(
+                    'readinto() called while another coroutine is '
+                    'already waiting for incoming data')
+            self._readinto_buffer = view
+            try:
+                await self._wait_for_data('readinto')
+            except BaseException:
+                # Keep the data already received into the buffer.
+                if self._readinto_nbytes:
+                    self._buffer[:0] = view[:self._readinto_nbytes]
+                raise
+            finally:
+                self._readinto_buffer = None
+                nbytes = self._readinto_nbytes
+                self._readinto_nbytes = 0
+            if nbytes:
+                return nbytes
+
+        nbytes = min(len(view), len(self._buffer))
+        with memoryview(self._buffer) as data:
+            view[:nbytes] = data[:nbytes]
+        del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
@@ -122,6 +122,20 @@ def writelines(self, list_of_data):
         data = b''.join(list_of_data)
         self.write(data)
 
+    def cork(self):
+        """Buffer the data written until uncork() is called.
+
+        Many small writes can then be sent together with a single system
+        call.  Data is still sent if the write buffer grows above the
+        high-water limit.  The default implementation does nothing.
+        """
+
+    def uncork(self):
+        """Send the data buffered since cork() was called.
+
+        The default implementation does nothing.
+        """
+
     def write_eof(self):
         """Close the write end after flushing buffered data.
 
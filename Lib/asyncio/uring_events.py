@@ -0,0 +1,527 @@
+"""Proactor event loop for Linux using io_uring."""
+
+import sys
+
+if not sys.platform.startswith('linux'):  # pragma: no cover
+    raise ImportError('Linux only')
+
+import _uring
+import os
+import socket
+import subprocess
+import time
+import weakref
+from select import POLLIN, POLLOUT
+
+from . import base_subprocess
+from . import exceptions
+from . import futures
+from . import proactor_events
+from . import unix_events
+from .log import logger
+
+
+__all__ = (
+    'IoUringProactor', 'IoUringEventLoop',
+)
+
+
+# Default number of entries of the submission queue
+DEFAULT_RING_ENTRIES = 256
+
+# Returned by a completion callback which resubmitted its operation
+_RESUBMITTED = object()
+
+
+class _UringFuture(futures.Future):
+    """Subclass of Future which represents an io_uring operation.
+
+    Cancelling it will immediately cancel the operation.
+    """
+
+    def __init__(self, proactor, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._proactor = proactor
+        self._token = None
+
+    def _repr_info(self):
+        info = super()._repr_info()
+        if self._token is not None:
+            info.insert(1, f'token={self._token}')
+        return info
+
+    def _cancel_operation(self):
+        if self._token is None:
+            return
+        try:
+            self._proactor._cancel(self._token)
+        except OSError as exc:
+            context = {
+                'message': 'Cancelling an io_uring future failed',
+                'exception': exc,
+                'future': self,
+            }
+            if self._source_traceback:
+                context['source_traceback'] = self._source_traceback
+            self._loop.call_exception_handler(context)
+        self._token = None
+
+    def cancel(self, msg=None):
+        self._cancel_operation()
+        return super().cancel(msg=msg)
+
+    def set_exception(self, exception):
+        super().set_exception(exception)
+        self._cancel_operation()
+
+    def set_result(self, result):
+        super().set_result(result)
+        self._token = None
+
+
+def _check_result(res):
+    if res < 0:
+        raise OSError(-res, os.strerror(-res))
+    return res
+
+
+class IoUringProactor:
+    """Proactor implementation using io_uring.
+
+    Operations are queued in the submission queue of the ring and handed
+    to the kernel in a single system call per event loop iteration.
+    """
+
+    def __init__(self, entries=DEFAULT_RING_ENTRIES):
+        self._loop = None
+        self._results = []
+        self._ring = _uring.Ring(entries)
+        self._cache = {}
+        self._stopped_serving = weakref.WeakSet()
+        self._fixed_buffers = {}
+
+    def _check_closed(self):
+        if self._ring is None:
+            raise RuntimeError('IoUringProactor is closed')
+
+    def __repr__(self):
+        info = ['operation#=%s' % len(self._cache),
+                'result#=%s' % len(self._results)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if not self._results:
+            self._poll(timeout)
+        tmp = self._results
+        self._results = []
+        try:
+            return tmp
+        finally:
+            # Needed to break cycles when an exception occurs.
+            tmp = None
+
+    def _result(self, value):
+        fut = self._loop.create_future()
+        fut.set_result(value)
+        return fut
+
+    def _register(self, obj, callback, submit, *args, discard=None,
+                  future=None):
+        """Queue an operation and return a future for its result.
+
+        submit() is the Ring method queueing the operation.  Once it
+        completes, the future is set to the value returned by
+        callback(res, data).  If the future was cancelled but the
+        operation succeeded anyway, discard(res, data) is called to
+        release what the operation produced.
+        """
+        self._check_closed()
+        if future is None:
+            future = _UringFuture(self, loop=self._loop)
+            if future._source_traceback:
+                del future._source_traceback[-1]
+        future._token = submit(future, *args)
+        # Keep a reference to obj until the operation completes, so that it
+        # is not garbage collected (and its file descriptor closed) too early.
+        self._cache[future] = (obj, callback, discard)
+        return future
+
+    def _cancel(self, token):
+        if self._ring is not None:
+            self._ring.cancel(token)
+
+    def _poll_then(self, conn, events, func, *args):
+        """Call func(*args) once conn is ready for events."""
+
+        def finish_poll(res, data):
+            _check_result(res)
+            try:
+                return func(*args)
+            except (BlockingIOError, InterruptedError):
+                # Spurious wakeup: wait again with the same future.
+                self._register(conn, finish_poll, self._ring.poll,
+                               conn.fileno(), events, future=fut)
+                return _RESUBMITTED
+
+        fut = self._register(conn, finish_poll, self._ring.poll,
+                             conn.fileno(), events)
+        return fut
+
+    @staticmethod
+    def _finish_data(res, data):
+        _check_result(res)
+        return data
+
+    @staticmethod
+    def _finish_nbytes(res, data):
+        return _check_result(res)
+
+    def register_buffers(self, buffers):
+        """Register writable buffers with the kernel.
+
+        recv_into() and send() on a registered buffer use it without
+        pinning its memory for each operation.
+        """
+        self._check_closed()
+        buffers = list(buffers)
+        self._ring.register_buffers(buffers)
+        self._fixed_buffers = {id(buf): (index, buf)
+                               for index, buf in enumerate(buffers)}
+
+    def unregister_buffers(self):
+        """Unregister the buffers registered by register_buffers()."""
+        self._check_closed()
+        self._ring.unregister_buffers()
+        self._fixed_buffers = {}
+
+    def _fixed_index(self, buf):
+        entry = self._fixed_buffers.get(id(buf))
+        if entry is not None and entry[1] is buf:
+            return entry[0]
+        return None
+
+    def recv(self, conn, nbytes, flags=0):
+        if isinstance(conn, socket.socket):
+            return self._register(conn, self._finish_data, self._ring.recv,
+                                  conn.fileno(), nbytes, flags)
+        return self._register(conn, self._finish_data, self._ring.read,
+                              conn.fileno(), nbytes)
+
+    def recv_into(self, conn, buf, flags=0):
+        index = self._fixed_index(buf)
+        if index is not None and not flags:
+            return self._register(conn, self._finish_nbytes,
+                                  self._ring.read_fixed,
+                                  conn.fileno(), index)
+        if isinstance(conn, socket.socket):
+            return self._register(conn, self._finish_nbytes,
+                                  self._ring.recv_into,
+                                  conn.fileno(), buf, flags)
+        return self._register(conn, self._finish_nbytes, self._ring.readinto,
+                              conn.fileno(), buf)
+
+    def recvfrom(self, conn, nbytes, flags=0):
+        try:
+            return self._result(conn.recvfrom(nbytes, flags))
+        except (BlockingIOError, InterruptedError):
+            pass
+        return self._poll_then(conn, POLLIN,
+                               conn.recvfrom, nbytes, flags)
+
+    def recvfrom_into(self, conn, buf, nbytes=0, flags=0):
+        try:
+            return self._result(conn.recvfrom_into(buf, nbytes, flags))
+        except (BlockingIOError, InterruptedError):
+            pass
+        return self._poll_then(conn, POLLIN,
+                               conn.recvfrom_into, buf, nbytes, flags)
+
+    def sendto(self, conn, buf, flags=0, addr=None):
+        try:
+            return self._result(conn.sendto(buf, flags, addr))
+        except (BlockingIOError, InterruptedError):
+            pass
+        return self._poll_then(conn, POLLOUT,
+                               conn.sendto, buf, flags, addr)
+
+    def send(self, conn, buf, flags=0):
+        index = self._fixed_index(buf)
+        if index is not None and not flags:
+            return self._register(conn, self._finish_nbytes,
+                                  self._ring.write_fixed,
+                                  conn.fileno(), index, len(buf))
+        if isinstance(conn, socket.socket):
+            return self._register(conn, self._finish_nbytes, self._ring.send,
+                                  conn.fileno(), buf, flags)
+        return self._register(conn, self._finish_nbytes, self._ring.write,
+                              conn.fileno(), buf)
+
+    def accept(self, listener):
+        def finish_accept(res, data):
+            fd = _check_result(res)
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=fd)
+            conn.settimeout(listener.gettimeout())
+            return conn, conn.getpeername()
+
+        def discard_accept(res, data):
+            if res >= 0:
+                os.close(res)
+
+        flags = socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC
+        return self._register(listener, finish_accept, self._ring.accept,
+                              listener.fileno(), flags,
+                              discard=discard_accept)
+
+    def connect(self, conn, address):
+        try:
+            conn.connect(address)
+        except (BlockingIOError, InterruptedError):
+            pass
+        else:
+            return self._result(None)
+
+        def finish_connect():
+            err = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err != 0:
+                # Jump to any except clause below.
+                raise OSError(err, f'Connect call failed {address}')
+
+        return self._poll_then(conn, POLLOUT, finish_connect)
+
+    def wait_for_fd(self, fd, events=POLLIN):
+        """Wait until the file descriptor fd is ready for events.
+
+        Return a future whose result is the mask of ready events.
+        """
+        return self._register(fd, self._finish_nbytes, self._ring.poll,
+                              fd, events)
+
+    def _poll(self, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError("negative timeout")
+
+        for f, res, data in self._ring.wait(timeout):
+            try:
+                obj, callback, discard = self._cache.pop(f)
+            except KeyError:
+                if self._loop.get_debug():
+                    self._loop.call_exception_handler({
+                        'message': ('io_uring returned an unexpected '
+                                    'completion'),
+                        'status': f'res={res}',
+                    })
+                continue
+
+            if obj in self._stopped_serving:
+                f.cancel()
+                if discard is not None:
+                    discard(res, data)
+            elif f.done():
+                # The future was cancelled, but the operation may have
+                # completed before the cancellation reached the kernel.
+                if discard is not None:
+                    discard(res, data)
+            else:
+                try:
+                    value = callback(res, data)
+                except OSError as e:
+                    f.set_exception(e)
+                    self._results.append(f)
+                else:
+                    if value is not _RESUBMITTED:
+                        f.set_result(value)
+                        self._results.append(f)
+                finally:
+                    f = None
+
+    def _stop_serving(self, obj):
+        # obj is a socket. It will be closed in
+        # BaseProactorEventLoop._stop_serving() which will make any
+        # pending operations fail quickly.
+        self._stopped_serving.add(obj)
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+
+        # Cancel remaining registered operations.
+        for fut in list(self._cache):
+            if not fut.done():
+                fut.cancel()
+
+        # Wait until all cancelled operations complete: the kernel may still
+        # be using their buffers. Display progress every second if the
+        # loop is still running.
+        msg_update = 1.0
+        start_time = time.monotonic()
+        next_msg = start_time + msg_update
+        while self._cache:
+            if next_msg <= time.monotonic():
+                logger.debug('%r is running after closing for %.1f seconds',
+                             self, time.monotonic() - start_time)
+                next_msg = time.monotonic() + msg_update
+
+            # handle a few events, or timeout
+            self._poll(msg_update)
+
+        self._results = []
+        self._fixed_buffers = {}
+        self._ring.close()
+        self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+class _UringWritePipeTransport(
+        proactor_events._ProactorBaseWritePipeTransport):
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        # Wait for no event: the poll only completes with the error reported
+        # once the read end of the pipe is closed.
+        self._read_fut = self._loop._proactor.wait_for_fd(
+            self._sock.fileno(), 0)
+        self._read_fut.add_done_callback(self._pipe_closed)
+
+    def _pipe_closed(self, fut):
+        if fut.cancelled():
+            # the transport has been closed
+            return
+        if self._closing:
+            assert self._read_fut is None
+            return
+        assert fut is self._read_fut, (fut, self._read_fut)
+        self._read_fut = None
+        if self._write_fut is not None:
+            self._force_close(BrokenPipeError())
+        else:
+            self.close()
+
+
+class _UringSubprocessTransport(base_subprocess.BaseSubprocessTransport):
+
+    def _start(self, args, shell, stdin, stdout, stderr, bufsize, **kwargs):
+        self._proc = subprocess.Popen(
+            args, shell=shell, stdin=stdin, stdout=stdout, stderr=stderr,
+            universal_newlines=False, bufsize=bufsize, **kwargs)
+        pidfd = os.pidfd_open(self._proc.pid)
+
+        def callback(f):
+            try:
+                returncode = self._proc.wait()
+            finally:
+                os.close(pidfd)
+            self._process_exited(returncode)
+
+        f = self._loop._proactor.wait_for_fd(pidfd)
+        f.add_done_callback(callback)
+
+
+class IoUringEventLoop(proactor_events.BaseProactorEventLoop):
+    """Linux version of proactor event loop using io_uring."""
+
+    def __init__(self, proactor=None):
+        if proactor is None:
+            proactor = IoUringProactor()
+        super().__init__(proactor)
+        self._signal_handlers = {}
+        self._unix_server_sockets = {}
+
+    def close(self):
+        if self.is_running():
+            raise RuntimeError("Cannot close a running event loop")
+        if self.is_closed():
+            return
+        for sig in list(self._signal_handlers):
+            self.remove_signal_handler(sig)
+        super().close()
+
+    # Signals are delivered through the self-pipe exactly as with
+    # _UnixSelectorEventLoop, so share its implementation.
+    add_signal_handler = unix_events._UnixSelectorEventLoop.add_signal_handler
+    remove_signal_handler = (
+        unix_events._UnixSelectorEventLoop.remove_signal_handler)
+    _handle_signal = unix_events._UnixSelectorEventLoop._handle_signal
+    _check_signal = unix_events._UnixSelectorEventLoop._check_signal
+    _process_self_data = unix_events._UnixSelectorEventLoop._process_self_data
+
+    # Likewise, UNIX sockets only need the generic socket methods.
+    create_unix_connection = (
+        unix_events._UnixSelectorEventLoop.create_unix_connection)
+    create_unix_server = unix_events._UnixSelectorEventLoop.create_unix_server
+
+    def _stop_serving(self, sock):
+        # Is this a unix socket that needs cleanup?
+        if sock in self._unix_server_sockets:
+            path = sock.getsockname()
+        else:
+            path = None
+
+        super()._stop_serving(sock)
+
+        if path is not None:
+            prev_ino = self._unix_server_sockets.pop(sock)
+            try:
+                if os.stat(path).st_ino == prev_ino:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                logger.error('Unable to clean up listening UNIX socket '
+                             '%r: %r', path, err)
+
+    def _loop_self_reading(self, f=None):
+        if f is not None and not f.cancelled() and f.exception() is None:
+            self._process_self_data(f.result())
+        super()._loop_self_reading(f)
+
+    def _run_forever_setup(self):
+        assert self._self_reading_future is None
+        self.call_soon(self._loop_self_reading)
+        super()._run_forever_setup()
+
+    def _run_forever_cleanup(self):
+        super()._run_forever_cleanup()
+        if self._self_reading_future is not None:
+            self._self_reading_future.cancel()
+            self._self_reading_future = None
+
+    def _make_write_pipe_transport(self, sock, protocol, waiter=None,
+                                   extra=None):
+        return _UringWritePipeTransport(self, sock, protocol, waiter, extra)
+
+    async def _sock_sendfile_native(self, sock, file, offset, count):
+        raise exceptions.SendfileNotAvailableError(
+            "sendfile is not supported by IoUringEventLoop")
+
+    async def _make_subprocess_transport(self, protocol, args, shell,
+                                         stdin, stdout, stderr, bufsize,
+                                         extra=None, **kwargs):
+        if not unix_events.can_use_pidfd():
+            raise NotImplementedError(
+                "subprocesses require pidfd_open() support")
+        waiter = self.create_future()
+        transp = _UringSubprocessTransport(self, protocol, args, shell,
+                                           stdin, stdout, stderr, bufsize,
+                                           waiter=waiter, extra=extra,
+                                           **kwargs)
+        try:
+            await waiter
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException:
+            transp.close()
+            await transp._wait()
+            raise
+
+        return transp
@@ -18,6 +18,9 @@
     'ChainMap',
     'Counter',
     'OrderedDict',
+    'SortedDict',
+    'SortedList',
+    'SortedSet',
     'UserDict',
     'UserList',
     'UserString',
@@ -32,6 +35,9 @@
 _sys.modules['collections.abc'] = _collections_abc
 abc = _collections_abc
 
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
+from itertools import accumulate as _accumulate
 from itertools import chain as _chain
 from itertools import repeat as _repeat
 from itertools import starmap as _starmap
@@ -1123,6 +1129,734 @@ def __ror__(self, other):
         return self.__class__(m)
 
 
+################################################################################
+### SortedList, SortedDict, SortedSet
+################################################################################
+
+# The values of a SortedList are stored in a list of sorted chunks holding
+# between _SORTED_LOAD//2 and 2*_SORTED_LOAD values.  Inserting or deleting
+# a value only moves the values of one chunk, and the chunk is located by
+# bisecting the list of the greatest key of each chunk.
+_SORTED_LOAD = 512
+
+class SortedList:
+    '''List which keeps its values sorted.
+
+    The values are ordered by key(value) if key is not None, and values
+    with equal keys are kept in insertion order.  Adding, removing and
+    locating values take logarithmic time on average.
+    '''
+
+    __slots__ = ('_key', '_lists', '_keys', '_maxes', '_offsets', '_len',
+                 '_state', '__weakref__')
+
+    def __init__(self, iterable=(), key=None):
+        if key is not None and not callable(key):
+            raise TypeError('key must be callable or None')
+        self._key = key
+        self._state = 0             # incremented on every mutation
+        self.clear()
+        self.update(iterable)
+
+    @property
+    def key(self):
+        'Function computing the sort key of the values, or None.'
+        return self._key
+
+    def clear(self):
+        'Remove all values from the list.'
+        self._lists = []            # sorted chunks of values
+        # Keys of the values, the same lists as _lists if key is None.
+        self._keys = [] if self._key is not None else self._lists
+        self._maxes = []            # greatest key of each chunk
+        self._offsets = None        # index of the first value of each chunk
+        self._len = 0
+        self._state += 1
+
+    def _getkey(self, value):
+        key = self._key
+        return value if key is None else key(value)
+
+    def _split(self, pos):
+        for chunks in ((self._lists, self._keys) if self._key is not None
+                       else (self._lists,)):
+            chunk = chunks[pos]
+            chunks.insert(pos + 1, chunk[_SORTED_LOAD:])
+            del chunk[_SORTED_LOAD:]
+        self._maxes.insert(pos, self._keys[pos][-1])
+
+    def _insert(self, value, key):
+        lists = self._lists
+        maxes = self._maxes
+        self._len += 1
+        self._offsets = None
+        self._state += 1
+        if not maxes:
+            lists.append([value])
+            if self._key is not None:
+                self._keys.append([key])
+            maxes.append(key)
+            return
+        pos = _bisect_right(maxes, key)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            if self._key is not None:
+                self._keys[pos].append(key)
+            maxes[pos] = key
+        else:
+            idx = _bisect_right(self._keys[pos], key)
+            lists[pos].insert(idx, value)
+            if self._key is not None:
+                self._keys[pos].insert(idx, key)
+        if len(lists[pos]) > 2 * _SORTED_LOAD:
+            self._split(pos)
+
+    def _delete(self, pos, idx):
+        del self._lists[pos][idx]
+        if self._key is not None:
+            del self._keys[pos][idx]
+        self._len -= 1
+        self._offsets = None
+        self._state += 1
+        self._shrunk(pos)
+
+    def _delete_range(self, start, stop):
+        # Remove the values from start to stop, 0 <= start < stop <= len(self),
+        # deleting whole slices of the chunks.
+        spos, sidx = self._locate(start)
+        epos, eidx = self._locate(stop - 1)
+        for chunks in ((self._lists, self._keys) if self._key is not None
+                       else (self._lists,)):
+            if spos == epos:
+                del chunks[spos][sidx:eidx + 1]
+            else:
+                del chunks[epos][:eidx + 1]
+                del chunks[spos + 1:epos]
+                del chunks[spos][sidx:]
+        self._len -= stop - start
+        self._offsets = None
+        self._state += 1
+        if spos != epos:
+            del self._maxes[spos + 1:epos]
+            self._shrunk(spos + 1)
+        self._shrunk(spos)
+
+    def _shrunk(self, pos):
+        # Restore the invariants after values were removed from chunk pos.
+        lists = self._lists
+        keyed = self._key is not None
+        if not lists[pos]:
+            del lists[pos]
+            if keyed:
+                del self._keys[pos]
+            del self._maxes[pos]
+            return
+        self._maxes[pos] = self._keys[pos][-1]
+        if len(lists[pos]) < _SORTED_LOAD // 2 and len(lists) > 1:
+            # Merge the chunk with its neighbour.
+            if pos == len(lists) - 1:
+                pos -= 1
+            for chunks in (lists, self._keys) if keyed else (lists,):
+                chunks[pos] += chunks[pos + 1]
+                del chunks[pos + 1]
+            del self._maxes[pos]
+            if len(lists[pos]) > 2 * _SORTED_LOAD:
+                self._split(pos)
+
+    def _offset(self, pos):
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = [0, *_accumulate(map(len, self._lists))]
+        return offsets[pos]
+
+    def _locate(self, index):
+        # Return the chunk and the position in the chunk of the value at
+        # index, 0 <= index < len(self).
+        self._offset(0)
+        offsets = self._offsets
+        pos = _bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def _find(self, value):
+        # Return the location of a value equal to value, or None.
+        key = self._getkey(value)
+        maxes = self._maxes
+        pos = _bisect_left(maxes, key)
+        if pos == len(maxes):
+            return None
+        idx = _bisect_left(self._keys[pos], key)
+        if self._key is None:
+            x = self._lists[pos][idx]
+            return (pos, idx) if x is value or x == value else None
+        # Search the values with the same key.
+        for pos in range(pos, len(maxes)):
+            keys = self._keys[pos]
+            values = self._lists[pos]
+            for idx in range(idx, len(keys)):
+                if key < keys[idx]:
+                    return None
+                x = values[idx]
+                if x is value or x == value:
+                    return pos, idx
+            idx = 0
+        return None
+
+    def _index(self, index):
+        try:
+            index = index.__index__()
+        except AttributeError:
+            raise TypeError(f'{type(self).__name__} indices must be '
+                            f'integers or slices, not '
+                            f'{type(index).__name__}') from None
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        return index
+
+    def _islice(self, start, stop, reverse=False):
+        if start >= stop:
+            return self._iter((), self._state)
+        spos, sidx = self._locate(start)
+        epos, eidx = self._locate(stop - 1)
+        lists = self._lists
+        if spos == epos:
+            chunks = [lists[spos][sidx:eidx + 1]]
+        else:
+            chunks = [lists[spos][sidx:], *lists[spos + 1:epos],
+                      lists[epos][:eidx + 1]]
+        if reverse:
+            chunks = map(reversed, reversed(chunks))
+        return self._iter(chunks, self._state)
+
+    def _iter(self, chunks, state):
+        # Iterate over the values of chunks, failing like the C implementation
+        # if the list is mutated.
+        for chunk in chunks:
+            for value in chunk:
+                if self._state != state:
+                    raise RuntimeError(f'{type(self).__name__} mutated '
+                                       f'during iteration')
+                yield value
+        if self._state != state:
+            raise RuntimeError(f'{type(self).__name__} mutated '
+                               f'during iteration')
+
+    def add(self, value):
+        'Add value to the list, after the values with the same key.'
+        self._insert(value, self._getkey(value))
+
+    def update(self, iterable):
+        'Add the values of iterable to the list.'
+        values = list(iterable)
+        if len(values) * 32 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        if not values:
+            return
+        # Adding many values: sort all the values again.
+        key = self._key
+        if key is None:
+            values[:0] = _chain.from_iterable(self._lists)
+            values.sort()
+            keys = values
+        else:
+            keys = [*_chain.from_iterable(self._keys), *map(key, values)]
+            values[:0] = _chain.from_iterable(self._lists)
+            order = sorted(range(len(values)), key=keys.__getitem__)
+            values = [values[i] for i in order]
+            keys = [keys[i] for i in order]
+        self._set_sorted(values, keys)
+
+    def _set_sorted(self, values, keys):
+        # Replace the contents with the sorted values and their keys.
+        self._lists = [values[i:i + _SORTED_LOAD]
+                       for i in range(0, len(values), _SORTED_LOAD)]
+        if self._key is None:
+            self._keys = self._lists
+        else:
+            self._keys = [keys[i:i + _SORTED_LOAD]
+                          for i in range(0, len(keys), _SORTED_LOAD)]
+        self._maxes = [chunk[-1] for chunk in self._keys]
+        self._len = len(values)
+        self._offsets = None
+        self._state += 1
+
+    def remove(self, value):
+        '''Remove a value equal to value.
+
+        Raise ValueError if the value is not present.
+        '''
+        loc = self._find(value)
+        if loc is None:
+            raise ValueError(f'{value!r} not in {type(self).__name__}')
+        self._delete(*loc)
+
+    def discard(self, value):
+        'Remove a value equal to value if it is present.'
+        loc = self._find(value)
+        if loc is not None:
+            self._delete(*loc)
+
+    def pop(self, index=-1):
+        '''Remove and return the value at index (default last).
+
+        Raise IndexError if the list is empty or index is out of range.
+        '''
+        if not self._len:
+            raise IndexError(f'pop from empty {type(self).__name__}')
+        pos, idx = self._locate(self._index(index))
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def __iter__(self):
+        return self._iter(self._lists, self._state)
+
+    def __reversed__(self):
+        return self._iter(map(reversed, reversed(self._lists)), self._state)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return list(self)[index]
+        pos, idx = self._locate(self._index(index))
+        return self._lists[pos][idx]
+
+    def __setitem__(self, index, value):
+        raise TypeError(f"'{type(self).__name__}' object does not support "
+                        f"item assignment")
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._len))
+            if not indices:
+                return
+            if indices.step < 0:
+                indices = indices[::-1]
+            if indices.step == 1:
+                self._delete_range(indices.start, indices.stop)
+                return
+            values = list(_chain.from_iterable(self._lists))
+            del values[indices.start:indices.stop:indices.step]
+            keys = values
+            if self._key is not None:
+                keys = list(_chain.from_iterable(self._keys))
+                del keys[indices.start:indices.stop:indices.step]
+            self._set_sorted(values, keys)
+            return
+        self._delete(*self._locate(self._index(index)))
+
+    def index(self, value, start=0, stop=_sys.maxsize):
+        '''Return the first index of a value equal to value.
+
+        Raise ValueError if the value is not present.
+        '''
+        start, stop, _ = slice(start, stop).indices(self._len)
+        key = self._getkey(value)
+        lo = max(self.bisect_key_left(key), start)
+        hi = min(self.bisect_key_right(key), stop)
+        for i, x in enumerate(self._islice(lo, hi), lo):
+            if x is value or x == value:
+                return i
+        raise ValueError(f'{value!r} is not in {type(self).__name__}')
+
+    def count(self, value):
+        'Return the number of values equal to value.'
+        key = self._getkey(value)
+        values = self._islice(self.bisect_key_left(key),
+                              self.bisect_key_right(key))
+        if self._key is None:
+            return sum(1 for _ in values)
+        return sum(1 for x in values if x is value or x == value)
+
+    def bisect_key_left(self, key):
+        '''Return the index of the first value whose key is not less than key.
+
+        The index where a value with this key would be inserted before the
+        values with the same key.
+        '''
+        pos = _bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + _bisect_left(self._keys[pos], key)
+
+    def bisect_key_right(self, key):
+        '''Return the index of the first value whose key is greater than key.
+
+        The index where a value with this key would be inserted after the
+        values with the same key.
+        '''
+        pos = _bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + _bisect_right(self._keys[pos], key)
+
+    def bisect_left(self, value):
+        'Like bisect_key_left(), but take a value rather than a key.'
+        return self.bisect_key_left(self._getkey(value))
+
+    def bisect_right(self, value):
+        'Like bisect_key_right(), but take a value rather than a key.'
+        return self.bisect_key_right(self._getkey(value))
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the values between minimum and maximum.
+
+        The bounds are values, compared by their keys.  None means no bound.
+        inclusive is a pair of booleans telling whether the values equal to
+        minimum and maximum are included.  If reverse is true, iterate in
+        descending order.
+        '''
+        key = self._key
+        if key is not None:
+            if minimum is not None:
+                minimum = key(minimum)
+            if maximum is not None:
+                maximum = key(maximum)
+        return self.irange_key(minimum, maximum, inclusive, reverse)
+
+    def irange_key(self, min_key=None, max_key=None, inclusive=(True, True),
+                   reverse=False):
+        'Like irange(), but the bounds are keys rather than values.'
+        min_inclusive, max_inclusive = inclusive
+        if min_key is None:
+            start = 0
+        elif min_inclusive:
+            start = self.bisect_key_left(min_key)
+        else:
+            start = self.bisect_key_right(min_key)
+        if max_key is None:
+            stop = self._len
+        elif max_inclusive:
+            stop = self.bisect_key_right(max_key)
+        else:
+            stop = self.bisect_key_left(max_key)
+        return self._islice(start, stop, reverse)
+
+    def copy(self):
+        'Return a shallow copy of the list.'
+        return self.__class__(self, self._key)
+
+    __copy__ = copy
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self._key is None:
+            return f'{self.__class__.__name__}({list(self)!r})'
+        return f'{self.__class__.__name__}({list(self)!r}, key={self._key!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, __class__):
+            return NotImplemented
+        return self._len == len(other) and list(self) == list(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        state = getattr(self, '__dict__', None) or None
+        return self.__class__, (list(self), self._key), state
+
+    __class_getitem__ = classmethod(_collections_abc.GenericAlias)
+
+try:
+    from _collections import SortedList
+except ImportError:
+    pass
+
+_collections_abc.Sequence.register(SortedList)
+
+
+class SortedDict(_collections_abc.MutableMapping):
+    '''Dictionary which iterates over its keys in sorted order.
+
+    The keys are ordered by key(k) if key is not None.  Items can also be
+    looked up by their position and by a range of keys.
+    '''
+
+    def __init__(self, other=(), /, key=None):
+        self._dict = {}
+        self._list = SortedList(key=key)
+        self.update(other)
+
+    @property
+    def key(self):
+        'Function computing the sort key of the keys, or None.'
+        return self._list.key
+
+    def __len__(self):
+        return len(self._dict)
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __setitem__(self, key, value):
+        if key not in self._dict:
+            self._list.add(key)
+        self._dict[key] = value
+
+    def __delitem__(self, key):
+        del self._dict[key]
+        self._list.remove(key)
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __contains__(self, key):
+        return key in self._dict
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None, key=None):
+        'Create a new dictionary with keys from iterable and values set to value.'
+        return cls(dict.fromkeys(iterable, value), key)
+
+    def get(self, key, default=None):
+        return self._dict.get(key, default)
+
+    __marker = object()
+
+    def pop(self, key, default=__marker):
+        '''Remove key and return its value.
+
+        If key is not found, return default if given, otherwise raise
+        KeyError.
+        '''
+        if key in self._dict:
+            self._list.remove(key)
+            return self._dict.pop(key)
+        if default is self.__marker:
+            raise KeyError(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        'Insert key with a value of default if key is not in the dictionary.'
+        if key in self._dict:
+            return self._dict[key]
+        self[key] = default
+        return default
+
+    def popitem(self, index=-1):
+        '''Remove and return the (key, value) pair at index (default last).
+
+        Raise KeyError if the dictionary is empty and IndexError if index
+        is out of range.
+        '''
+        if not self._dict:
+            raise KeyError('popitem(): dictionary is empty')
+        key = self._list.pop(index)
+        return key, self._dict.pop(key)
+
+    def peekitem(self, index=-1):
+        'Return the (key, value) pair at index (default last).'
+        key = self._list[index]
+        return key, self._dict[key]
+
+    def clear(self):
+        self._dict.clear()
+        self._list.clear()
+
+    def update(self, other=(), /, **kwds):
+        '''Update the dictionary from a mapping or an iterable of pairs,
+        and from keyword arguments.
+        '''
+        items = dict(other, **kwds)
+        d = self._dict
+        self._list.update([key for key in items if key not in d])
+        d.update(items)
+
+    def index(self, key, start=0, stop=_sys.maxsize):
+        'Return the position of key in the sorted keys.'
+        return self._list.index(key, start, stop)
+
+    def bisect_left(self, key):
+        'Return the position of the first key not less than key.'
+        return self._list.bisect_left(key)
+
+    def bisect_right(self, key):
+        'Return the position of the first key greater than key.'
+        return self._list.bisect_right(key)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the keys between minimum and maximum.
+
+        See SortedList.irange().
+        '''
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def copy(self):
+        'Return a shallow copy of the dictionary.'
+        return self.__class__(self, self.key)
+
+    __copy__ = copy
+
+    @_recursive_repr()
+    def __repr__(self):
+        items = ', '.join(f'{k!r}: {v!r}' for k, v in self.items())
+        if self.key is None:
+            return f'{self.__class__.__name__}({{{items}}})'
+        return f'{self.__class__.__name__}({{{items}}}, key={self.key!r})'
+
+    def __reduce__(self):
+        state = vars(self).copy()
+        del state['_dict'], state['_list']
+        return self.__class__, (dict(self), self.key), state or None
+
+    def __or__(self, other):
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        new = self.__class__(other, self.key)
+        new.update(self)
+        return new
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class SortedSet(_collections_abc.MutableSet):
+    '''Set which iterates over its values in sorted order.
+
+    The values are ordered by key(value) if key is not None.  Values can
+    also be looked up by their position and by a range of values.
+    '''
+
+    def __init__(self, iterable=(), key=None):
+        self._set = set(iterable)
+        self._list = SortedList(self._set, key)
+
+    def _from_iterable(self, iterable):
+        return self.__class__(iterable, self.key)
+
+    @property
+    def key(self):
+        'Function computing the sort key of the values, or None.'
+        return self._list.key
+
+    def __len__(self):
+        return len(self._set)
+
+    def __contains__(self, value):
+        return value in self._set
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __getitem__(self, index):
+        return self._list[index]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            values = self._list[index]
+            del self._list[index]
+            self._set.difference_update(values)
+        else:
+            self._set.remove(self._list.pop(index))
+
+    def add(self, value):
+        'Add value to the set.'
+        if value not in self._set:
+            self._list.add(value)
+            self._set.add(value)
+
+    def discard(self, value):
+        'Remove value from the set if it is present.'
+        if value in self._set:
+            self._set.remove(value)
+            self._list.remove(value)
+
+    def pop(self, index=-1):
+        '''Remove and return the value at index (default last).
+
+        Raise IndexError if the set is empty or index is out of range.
+        '''
+        value = self._list.pop(index)
+        self._set.remove(value)
+        return value
+
+    def clear(self):
+        self._set.clear()
+        self._list.clear()
+
+    def update(self, *iterables):
+        'Add the values of all the iterables to the set.'
+        values = set().union(*iterables)
+        values -= self._set
+        self._list.update(values)
+        self._set |= values
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def index(self, value, start=0, stop=_sys.maxsize):
+        'Return the position of value in the set.'
+        if value not in self._set:
+            raise ValueError(f'{value!r} is not in {type(self).__name__}')
+        return self._list.index(value, start, stop)
+
+    def count(self, value):
+        'Return 1 if value is in the set, else 0.'
+        return int(value in self._set)
+
+    def bisect_left(self, value):
+        'Return the position of the first value not less than value.'
+        return self._list.bisect_left(value)
+
+    def bisect_right(self, value):
+        'Return the position of the first value greater than value.'
+        return self._list.bisect_right(value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the values between minimum and maximum.
+
+        See SortedList.irange().
+        '''
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def copy(self):
+        'Return a shallow copy of the set.'
+        return self.__class__(self._set, self.key)
+
+    __copy__ = copy
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self.key is None:
+            return f'{self.__class__.__name__}({list(self)!r})'
+        return f'{self.__class__.__name__}({list(self)!r}, key={self.key!r})'
+
+    def __reduce__(self):
+        state = vars(self).copy()
+        del state['_set'], state['_list']
+        return self.__class__, (list(self._set), self.key), state or None
+
+
 ################################################################################
 ### UserDict
 ################################################################################
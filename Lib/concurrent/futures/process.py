@@ -153,6 +153,8 @@ def __init__(self, future, fn, args, kwargs):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        # Shared memory segment holding the large arguments, if any.
+        self.segment = None
 
 class _ResultItem(object):
     def __init__(self, work_id, exception=None, result=None, exit_pid=None):
@@ -204,18 +206,26 @@ def _process_chunk(fn, chunk):
 
 
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shared_memory_threshold=None):
     """Safely send back the given result or exception"""
     try:
-        result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+        result_item = _ResultItem(work_id, result=result,
+                                  exception=exception, exit_pid=exit_pid)
+        if shared_memory_threshold is None:
+            result_queue.put(result_item)
+        else:
+            # The parent process becomes the owner of the shared memory.
+            from multiprocessing import _shm_transport
+            _shm_transport.send(result_queue.put, result_item,
+                                shared_memory_threshold)
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
         result_queue.put(_ResultItem(work_id, exception=exc,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    max_tasks=None, shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -227,6 +237,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to run before exiting, or None
+        shared_memory_threshold: The minimum size of the buffers of the
+            results that are sent through shared memory, or None
     """
     if initializer is not None:
         try:
@@ -258,7 +271,8 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
                              exit_pid=exit_pid)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -321,6 +335,17 @@ def weakref_cb(_,
         # exiting safely
         self.max_tasks_per_child = executor._max_tasks_per_child
 
+        # Minimum size of the buffers of the arguments that are sent to the
+        # workers through shared memory, or None
+        self.shared_memory_threshold = executor._shared_memory_threshold
+
+        # Shared memory segments of the finished calls kept for reuse until
+        # the executor shuts down.
+        self.segment_pool = None
+        if self.shared_memory_threshold is not None:
+            from multiprocessing import _shm_transport
+            self.segment_pool = _shm_transport.SegmentPool()
+
         # A dict mapping work ids to _WorkItems e.g.
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
@@ -393,11 +418,22 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    call_item = _CallItem(work_id,
+                                          work_item.fn,
+                                          work_item.args,
+                                          work_item.kwargs)
+                    if self.shared_memory_threshold is not None:
+                        from multiprocessing import _shm_transport
+                        try:
+                            call_item, work_item.segment = (
+                                _shm_transport.dumps(
+                                    call_item, self.shared_memory_threshold,
+                                    self.segment_pool))
+                        except BaseException as e:
+                            del self.pending_work_items[work_id]
+                            work_item.future.set_exception(e)
+                            continue
+                    self.call_queue.put(call_item, block=True)
                 else:
                     del self.pending_work_items[work_id]
                     continue
@@ -440,6 +476,7 @@ def process_result_item(self, result_item):
         work_item = self.pending_work_items.pop(result_item.work_id, None)
         # work_item can be None if another process terminated (see above)
         if work_item is not None:
+            self.release_segment(work_item)
             if result_item.exception:
                 work_item.future.set_exception(result_item.exception)
             else:
@@ -488,6 +525,8 @@ def _terminate_broken(self, cause):
                 # set_exception() would leave a race condition if the future is
                 # cancelled between the check and set_exception().
                 pass
+            # The segment is destroyed once the workers have exited.
+            self.release_segment(work_item)
             # Delete references to object. See issue16284
             del work_item
         self.pending_work_items.clear()
@@ -567,6 +606,18 @@ def _join_executor_internals(self, broken=False):
                 p.terminate()
             p.join()
 
+        # The workers are not going to read the arguments anymore.
+        if self.segment_pool is not None:
+            self.segment_pool.close()
+            for work_item in self.pending_work_items.values():
+                self.release_segment(work_item)
+
+    def release_segment(self, work_item):
+        # Recycle the shared memory used for the arguments of a call.
+        segment, work_item.segment = work_item.segment, None
+        if segment is not None:
+            self.segment_pool.release(segment)
+
     def get_n_children_alive(self):
         # This is an upper bound on the number of children alive.
         return sum(p.is_alive() for p in self.processes.values())
@@ -629,7 +680,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -647,6 +699,11 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: The minimum size in bytes of the bytes and
+                bytearray objects, and of the other buffers supporting pickle
+                protocol 5, which are passed to and from the workers through
+                shared memory rather than through a pipe. The default of None
+                disables the use of shared memory.
         """
         _check_system_limits()
 
@@ -693,6 +750,13 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -770,13 +834,21 @@ def _launch_processes(self):
             self._spawn_process()
 
     def _spawn_process(self):
+        shared_memory_threshold = self._shared_memory_threshold
+        if shared_memory_threshold is not None:
+            # Results can only be sent through segments created by the
+            # workers where shared memory outlives the process creating it.
+            from multiprocessing import _shm_transport
+            if not _shm_transport.CAN_TRANSFER:
+                shared_memory_threshold = None
         p = self._mp_context.Process(
             target=_process_worker,
             args=(self._call_queue,
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  shared_memory_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -805,7 +877,7 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -816,6 +888,11 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+            buffersize: The number of submitted tasks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task is
+                submitted for each.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -831,7 +908,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
 
         results = super().map(partial(_process_chunk, fn),
                               itertools.batched(zip(*iterables), chunksize),
-                              timeout=timeout)
+                              timeout=timeout,
+                              buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
@@ -12,15 +12,15 @@
 __all__ = ['update_wrapper', 'wraps', 'WRAPPER_ASSIGNMENTS', 'WRAPPER_UPDATES',
            'total_ordering', 'cache', 'cmp_to_key', 'lru_cache', 'reduce',
            'partial', 'partialmethod', 'singledispatch', 'singledispatchmethod',
-           'cached_property', 'Placeholder']
+           'cached_property', 'Placeholder', 'bounded_cache']
 
 from abc import get_cache_token
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 # import weakref  # Deferred to single_dispatch()
 from operator import itemgetter
 from reprlib import recursive_repr
 from types import GenericAlias, MethodType, MappingProxyType, UnionType
-from _thread import RLock
+from _thread import RLock, allocate_lock, get_ident
 
 ################################################################################
 ### update_wrapper() and wraps() decorator
@@ -743,6 +743,487 @@ def cache(user_function, /):
     return lru_cache(maxsize=None)(user_function)
 
 
+################################################################################
+### bounded_cache() -- cache bounded by size, weight and age
+################################################################################
+
+_BoundedCacheInfo = namedtuple("BoundedCacheInfo",
+                               ["hits", "misses", "evictions", "maxsize",
+                                "currsize", "maxweight", "weight"])
+
+def _pop_expired(entries, now):
+    # Remove the expired entries at the front of an OrderedDict.  Return the
+    # removed entries.
+    expired = []
+    while entries:
+        key = next(iter(entries))
+        expires = entries[key][2]
+        if expires is None or expires > now:
+            break
+        expired.append(entries.pop(key))
+    return expired
+
+class _LRUStore:
+    """Entries of a bounded_cache() ordered by recency of use."""
+
+    def __init__(self, maxsize, maxweight):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.entries = OrderedDict()
+        self.weight = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def _full(self):
+        return ((self.maxsize is not None and len(self.entries) > self.maxsize)
+                or (self.maxweight is not None and self.weight > self.maxweight))
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def remove(self, key):
+        self.weight -= self.entries.pop(key)[1]
+
+    def add(self, key, entry):
+        # Return the number of evicted entries.
+        self.entries[key] = entry
+        self.weight += entry[1]
+        evicted = 0
+        while self._full():
+            _, (_, weight, _) = self.entries.popitem(last=False)
+            self.weight -= weight
+            evicted += 1
+        return evicted
+
+    def expire(self, now):
+        expired = _pop_expired(self.entries, now)
+        self.weight -= sum(weight for _, weight, _ in expired)
+        return len(expired)
+
+    def clear(self):
+        self.entries.clear()
+        self.weight = 0
+
+_SKETCH_SEEDS = (0xc3a5c85c97cb3127, 0xb492b66fbe98f273,
+                 0x9ae16a3b2f90404f, 0xcbf29ce484222325)
+_HALVE = bytes(i >> 1 for i in range(256))
+
+class _FrequencySketch:
+    """Count-min sketch estimating how often keys were recently used.
+
+    Each key increments four 4-bit counters.  All the counters are halved
+    once the number of increments reaches ten times the capacity, so that
+    the estimates favor recent uses.
+    """
+
+    def __init__(self, capacity):
+        self.resize(capacity)
+
+    def resize(self, capacity):
+        self.capacity = capacity
+        size = 1 << max(capacity - 1, 15).bit_length()
+        self.mask = size - 1
+        self.table = bytearray(size)
+        self.additions = 0
+        self.sample_size = 10 * capacity
+
+    def _indexes(self, key):
+        h = hash(key)
+        mask = self.mask
+        return [(((h * seed) & 0xffffffffffffffff) >> 32) & mask
+                for seed in _SKETCH_SEEDS]
+
+    def increment(self, key):
+        table = self.table
+        added = False
+        for i in self._indexes(key):
+            if table[i] < 15:
+                table[i] += 1
+                added = True
+        if added:
+            self.additions += 1
+            if self.additions >= self.sample_size:
+                self.table = table.translate(_HALVE)
+                self.additions //= 2
+
+    def frequency(self, key):
+        table = self.table
+        return min(table[i] for i in self._indexes(key))
+
+class _TinyLFUStore:
+    """Entries of a bounded_cache() managed by the W-TinyLFU policy.
+
+    New entries enter a small LRU window.  Entries leaving the window join
+    the probation segment of the main area, and probation entries used
+    again move to its protected segment.  When the cache is full, the
+    newest probation entry is only kept instead of the least recently used
+    one if it was used more often, according to a frequency sketch.  A
+    burst of keys used once therefore cannot flush the frequently used
+    entries.
+
+    See:  https://arxiv.org/abs/1512.00727
+
+    """
+
+    def __init__(self, maxsize, maxweight):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        capacity = maxweight if maxweight is not None else maxsize
+        if capacity is None:
+            capacity = 0
+        self.window_limit = max(1, capacity // 100)
+        self.protected_limit = (capacity - self.window_limit) * 4 // 5
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.window_weight = self.protected_weight = self.weight = 0
+        self.sketch = _FrequencySketch(max(maxsize or 0, 16))
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    def __contains__(self, key):
+        return (key in self.window or key in self.probation or
+                key in self.protected)
+
+    def _full(self):
+        return ((self.maxsize is not None and len(self) > self.maxsize)
+                or (self.maxweight is not None and self.weight > self.maxweight))
+
+    def get(self, key):
+        self.sketch.increment(key)
+        entry = self.window.get(key)
+        if entry is not None:
+            self.window.move_to_end(key)
+            return entry
+        entry = self.protected.get(key)
+        if entry is not None:
+            self.protected.move_to_end(key)
+            return entry
+        entry = self.probation.pop(key, None)
+        if entry is not None:
+            # Promote the entry, demoting the least recently used protected
+            # entries if needed.
+            self.protected[key] = entry
+            self.protected_weight += entry[1]
+            while (self.protected_weight > self.protected_limit and
+                   len(self.protected) > 1):
+                demoted_key, demoted = self.protected.popitem(last=False)
+                self.protected_weight -= demoted[1]
+                self.probation[demoted_key] = demoted
+        return entry
+
+    def remove(self, key):
+        if key in self.window:
+            weight = self.window.pop(key)[1]
+            self.window_weight -= weight
+        elif key in self.protected:
+            weight = self.protected.pop(key)[1]
+            self.protected_weight -= weight
+        else:
+            weight = self.probation.pop(key)[1]
+        self.weight -= weight
+
+    def add(self, key, entry):
+        # Return the number of evicted entries.
+        weight = entry[1]
+        self.window[key] = entry
+        self.window_weight += weight
+        self.weight += weight
+        while self.window_weight > self.window_limit and len(self.window) > 1:
+            candidate_key, candidate = self.window.popitem(last=False)
+            self.window_weight -= candidate[1]
+            self.probation[candidate_key] = candidate
+        if self.maxsize is None and len(self) > self.sketch.capacity:
+            self.sketch.resize(2 * len(self))
+        evicted = 0
+        while self._full():
+            self._evict()
+            evicted += 1
+        return evicted
+
+    def _evict(self):
+        probation = self.probation
+        if probation:
+            victim = next(iter(probation))
+            candidate = next(reversed(probation))
+            frequency = self.sketch.frequency
+            if (candidate is not victim and
+                    frequency(candidate) > frequency(victim)):
+                key = victim
+            else:
+                key = candidate
+            weight = probation.pop(key)[1]
+        elif self.protected:
+            _, (_, weight, _) = self.protected.popitem(last=False)
+            self.protected_weight -= weight
+        else:
+            _, (_, weight, _) = self.window.popitem(last=False)
+            self.window_weight -= weight
+        self.weight -= weight
+
+    def expire(self, now):
+        count = 0
+        for entries in (self.window, self.probation, self.protected):
+            expired = _pop_expired(entries, now)
+            weight = sum(weight for _, weight, _ in expired)
+            if entries is self.window:
+                self.window_weight -= weight
+            elif entries is self.protected:
+                self.protected_weight -= weight
+            self.weight -= weight
+            count += len(expired)
+        return count
+
+    def clear(self):
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+        self.window_weight = self.protected_weight = self.weight = 0
+
+_CACHE_POLICIES = {'lru': _LRUStore, 'tinylfu': _TinyLFUStore}
+
+def bounded_cache(maxsize=128, *, ttl=None, maxweight=None, weigher=None,
+                  policy='lru', typed=False, timer=None):
+    """Cache decorator bounded by number of entries, weight and age.
+
+    If *maxsize* is not None, at most *maxsize* results are cached.
+
+    If *ttl* is not None, cached results expire *ttl* seconds after being
+    computed, as measured by *timer*, which defaults to time.monotonic().
+
+    If *maxweight* is not None, the total weight of the cached results is
+    kept under *maxweight*.  The weight of a result is given by the
+    *weigher* function called with it, for example len() or sys.getsizeof().
+    Without *weigher*, each result weighs 1.
+
+    *policy* selects the entries evicted when the cache is full: 'lru'
+    evicts the least recently used one, 'tinylfu' uses the W-TinyLFU policy,
+    which resists scans of keys used only once.
+
+    Concurrent calls with the same arguments wait for the first one instead
+    of computing the same result again.  For coroutine functions, the result
+    of the coroutine is cached rather than the coroutine object.
+
+    *typed* has the same meaning as for lru_cache().  View the cache
+    statistics named tuple (hits, misses, evictions, maxsize, currsize,
+    maxweight, weight) with f.cache_info().  Clear the cache and statistics
+    with f.cache_clear().  Access the underlying function with f.__wrapped__.
+
+    """
+    if callable(maxsize) and isinstance(typed, bool):
+        # The user_function was passed in directly via the maxsize argument
+        user_function, maxsize = maxsize, 128
+        return bounded_cache(maxsize, ttl=ttl, maxweight=maxweight,
+                             weigher=weigher, policy=policy, typed=typed,
+                             timer=timer)(user_function)
+    if maxsize is not None:
+        if not isinstance(maxsize, int):
+            raise TypeError(
+                'Expected first argument to be an integer, a callable, or None')
+        if maxsize < 0:
+            raise ValueError('maxsize must be non-negative')
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be positive')
+    if maxweight is not None and maxweight < 0:
+        raise ValueError('maxweight must be non-negative')
+    if policy not in _CACHE_POLICIES:
+        raise ValueError(f'unknown cache policy: {policy!r}')
+    if timer is None:
+        from time import monotonic as timer
+
+    def decorating_function(user_function):
+        wrapper = _bounded_cache_wrapper(user_function, maxsize, ttl,
+                                         maxweight, weigher, policy, typed,
+                                         timer)
+        wrapper.cache_parameters = lambda : {
+            'maxsize': maxsize, 'ttl': ttl, 'maxweight': maxweight,
+            'policy': policy, 'typed': typed}
+        return update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+class _PendingCall:
+    # Computation of a result shared by the threads calling a cached
+    # function with the same arguments.
+
+    __slots__ = ('owner', 'done', 'result', 'exception')
+
+    def __init__(self):
+        self.owner = get_ident()
+        self.done = allocate_lock()
+        self.done.acquire()
+        self.result = self.exception = None
+
+    def wait(self):
+        with self.done:
+            pass
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+def _bounded_cache_wrapper(user_function, maxsize, ttl, maxweight, weigher,
+                           policy, typed, timer):
+    sentinel = object()          # unique object used to signal cache misses
+    make_key = _make_key         # build a key from the function arguments
+
+    store = _CACHE_POLICIES[policy](maxsize, maxweight)
+    pending = {}                 # computations in progress by key
+    hits = misses = evictions = 0
+    lock = RLock()
+
+    def lookup(key):
+        # Return the cached result for key or sentinel, with the lock held.
+        nonlocal hits, evictions
+        entry = store.get(key)
+        if entry is not None:
+            result, _, expires = entry
+            if expires is None or timer() < expires:
+                hits += 1
+                return result
+            store.remove(key)
+            evictions += 1
+        return sentinel
+
+    def save(key, result, weight):
+        # Cache a computed result, with the lock held.
+        nonlocal evictions
+        if maxweight is not None and weight > maxweight:
+            return
+        if key in store:
+            store.remove(key)
+        expires = None
+        if ttl is not None:
+            now = timer()
+            evictions += store.expire(now)
+            expires = now + ttl
+        evictions += store.add(key, [result, weight, expires])
+
+    def weigh(result):
+        return 1 if weigher is None else weigher(result)
+
+    from inspect import iscoroutinefunction
+    if iscoroutinefunction(user_function):
+        import asyncio
+
+        async def wrapper(*args, **kwds):
+            nonlocal hits, misses
+            key = make_key(args, kwds, typed)
+            loop = asyncio.get_running_loop()
+            task = asyncio.current_task()
+            while True:
+                with lock:
+                    result = lookup(key)
+                    if result is not sentinel:
+                        return result
+                    future, owner = pending.get(key, (None, None))
+                    if future is None:
+                        future = loop.create_future()
+                        pending[key] = (future, task)
+                        misses += 1
+                        break
+                    shared = owner is not task and future.get_loop() is loop
+                    if shared:
+                        hits += 1
+                    else:
+                        misses += 1
+                if not shared:
+                    # A recursive call, or a call from another event loop:
+                    # compute the result without sharing it.
+                    return await user_function(*args, **kwds)
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    if not future.cancelled():
+                        raise
+                # The first call was cancelled, try again.
+
+            try:
+                result = await user_function(*args, **kwds)
+                weight = weigh(result)
+            except BaseException as exc:
+                with lock:
+                    del pending[key]
+                if isinstance(exc, Exception):
+                    future.set_exception(exc)
+                    # Waiting callers are optional.
+                    future.exception()
+                else:
+                    future.cancel()
+                raise
+            with lock:
+                save(key, result, weight)
+                del pending[key]
+            future.set_result(result)
+            return result
+
+    else:
+
+        def wrapper(*args, **kwds):
+            nonlocal hits, misses
+            key = make_key(args, kwds, typed)
+            with lock:
+                result = lookup(key)
+                if result is not sentinel:
+                    return result
+                call = pending.get(key)
+                if call is None:
+                    call = pending[key] = _PendingCall()
+                    misses += 1
+                    shared = False
+                elif call.owner == get_ident():
+                    # A recursive call: compute the result without sharing it.
+                    call = None
+                    misses += 1
+                else:
+                    hits += 1
+                    shared = True
+            if call is None:
+                return user_function(*args, **kwds)
+            if shared:
+                return call.wait()
+
+            try:
+                result = user_function(*args, **kwds)
+                weight = weigh(result)
+            except BaseException as exc:
+                call.exception = exc
+                with lock:
+                    del pending[key]
+                call.done.release()
+                raise
+            call.result = result
+            with lock:
+                save(key, result, weight)
+                del pending[key]
+            call.done.release()
+            return result
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            return _BoundedCacheInfo(hits, misses, evictions, maxsize,
+                                     len(store), maxweight, store.weight)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, evictions
+        with lock:
+            store.clear()
+            hits = misses = evictions = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
 ################################################################################
 ### singledispatch() - single-dispatch generic function decorator
 ################################################################################
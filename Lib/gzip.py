@@ -6,12 +6,14 @@
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
 import struct, sys, time, os
+import bisect
 import zlib
 import builtins
 import io
 import _compression
 
-__all__ = ["BadGzipFile", "GzipFile", "open", "compress", "decompress"]
+__all__ = ["BadGzipFile", "GzipFile", "GzipIndex", "open", "compress",
+           "decompress"]
 
 FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
@@ -25,9 +27,21 @@
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
 
+# Parallel compression splits the data in blocks compressed independently,
+# each one primed with the last 32 KiB of the previous block.
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+# Final empty block ending a deflate stream made of sync-flushed blocks.
+_FINAL_EMPTY_BLOCK = b'\003\000'
+# Empty stored block written by a sync or full flush.
+_SYNC_MARKER = b'\000\000\377\377'
+
+_INDEX_SPAN = 1024 * 1024
+_INDEX_MAGIC = b'PYGZIDX\001'
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, workers=1, index=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -38,8 +52,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, workers=workers, index=index). In
+    this case, the encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -59,9 +73,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               workers=workers, index=index)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               workers=workers, index=index)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -151,7 +167,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, workers=1, index=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -184,12 +201,34 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        When writing, if workers is greater than 1, the data is split in
+        blocks which are compressed in parallel by that many threads.  The
+        output is a regular gzip stream.
+
+        When reading, index can be a GzipIndex of the file, which is used by
+        seek() to start decompressing from the nearest access point.
+
+        A ValueError is raised if workers is given when reading or index when
+        writing.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
             raise ValueError("Invalid mode: {!r}".format(mode))
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         if mode and 'b' not in mode:
             mode += 'b'
+        # Check the arguments before opening (and maybe truncating) the file.
+        actual_mode = mode or getattr(fileobj, 'mode', 'rb')
+        if actual_mode.startswith('r'):
+            if workers != 1:
+                raise ValueError("Argument 'workers' not supported in read "
+                                 "mode")
+        elif actual_mode.startswith(('w', 'a', 'x')):
+            if index is not None:
+                raise ValueError("Argument 'index' not supported in write "
+                                 "mode")
         if fileobj is None:
             fileobj = self.myfileobj = builtins.open(filename, mode or 'rb')
         if filename is None:
@@ -205,7 +244,7 @@ def __init__(self, filename=None, mode=None,
 
         if mode.startswith('r'):
             self.mode = READ
-            raw = _GzipReader(fileobj)
+            raw = _GzipReader(fileobj, index)
             self._buffer = io.BufferedReader(raw)
             self.name = filename
 
@@ -225,6 +264,12 @@ def __init__(self, filename=None, mode=None,
                                              zlib.DEF_MEM_LEVEL,
                                              0)
             self._write_mtime = mtime
+            self._compresslevel = compresslevel
+            self._workers = workers
+            self._executor = None
+            self._pending = []
+            self._block = bytearray()
+            self._window = b''
             self._buffer_size = _WRITE_BUFFER_SIZE
             self._buffer = io.BufferedWriter(_WriteBufferStream(self),
                                              buffer_size=self._buffer_size)
@@ -311,13 +356,43 @@ def _write_raw(self, data):
             length = data.nbytes
 
         if length > 0:
-            self.fileobj.write(self.compress.compress(data))
+            if self._workers > 1:
+                self._write_parallel(data)
+            else:
+                self.fileobj.write(self.compress.compress(data))
             self.size += length
             self.crc = zlib.crc32(data, self.crc)
             self.offset += length
 
         return length
 
+    def _write_parallel(self, data):
+        self._block += data
+        while len(self._block) >= _PARALLEL_BLOCK_SIZE:
+            block = bytes(self._block[:_PARALLEL_BLOCK_SIZE])
+            del self._block[:_PARALLEL_BLOCK_SIZE]
+            self._submit_block(block)
+
+    def _submit_block(self, block):
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self._workers)
+        future = self._executor.submit(_compress_block, block,
+                                       self._compresslevel, self._window)
+        self._pending.append(future)
+        self._window = block[-_DEFLATE_WINDOW_SIZE:]
+        # Bound the memory used by the blocks waiting to be written.
+        while len(self._pending) > 2 * self._workers:
+            self.fileobj.write(self._pending.pop(0).result())
+
+    def _flush_parallel(self):
+        if self._block:
+            block = bytes(self._block)
+            self._block.clear()
+            self._submit_block(block)
+        while self._pending:
+            self.fileobj.write(self._pending.pop(0).result())
+
     def read(self, size=-1):
         self._check_not_closed()
         if self.mode != READ:
@@ -356,7 +431,11 @@ def close(self):
         try:
             if self.mode == WRITE:
                 self._buffer.flush()
-                fileobj.write(self.compress.flush())
+                if self._workers > 1:
+                    self._flush_parallel()
+                    fileobj.write(_FINAL_EMPTY_BLOCK)
+                else:
+                    fileobj.write(self.compress.flush())
                 write32u(fileobj, self.crc)
                 # self.size may exceed 2 GiB, or even 4 GiB
                 write32u(fileobj, self.size & 0xffffffff)
@@ -364,6 +443,9 @@ def close(self):
                 self._buffer.close()
         finally:
             self.fileobj = None
+            if self.mode == WRITE and self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
             myfileobj = self.myfileobj
             if myfileobj:
                 self.myfileobj = None
@@ -373,8 +455,14 @@ def flush(self,zlib_mode=zlib.Z_SYNC_FLUSH):
         self._check_not_closed()
         if self.mode == WRITE:
             self._buffer.flush()
-            # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._workers > 1:
+                # Blocks already end with a sync flush.
+                self._flush_parallel()
+                if zlib_mode == zlib.Z_FULL_FLUSH:
+                    self._window = b''
+            else:
+                # Ensure the compressor's buffer is flushed
+                self.fileobj.write(self.compress.flush(zlib_mode))
             self.fileobj.flush()
 
     def fileno(self):
@@ -483,12 +571,15 @@ def _read_gzip_header(fp):
 
 
 class _GzipReader(_compression.DecompressReader):
-    def __init__(self, fp):
+    def __init__(self, fp, index=None):
         super().__init__(_PaddedFile(fp), zlib._ZlibDecompressor,
                          wbits=-zlib.MAX_WBITS)
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        self._index = index
+        if index is not None:
+            self._size = index.size
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
@@ -579,14 +670,238 @@ def _rewind(self):
         super()._rewind()
         self._new_member = True
 
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index is None:
+            return super().seek(offset, whence)
+        if whence == io.SEEK_CUR:
+            offset = self._pos + offset
+        elif whence == io.SEEK_END:
+            offset = self._size + offset
+        elif whence != io.SEEK_SET:
+            raise ValueError("Invalid value for whence: {}".format(whence))
+        point = self._index._find(offset)
+        if point is not None and (offset < self._pos or point[0] > self._pos):
+            self._restore(point)
+        return super().seek(offset)
+
+    def _restore(self, point):
+        # Resume decompressing from an access point of the index.
+        uoffset, coffset, crc, member_size, window = point
+        self._fp.seek(coffset)
+        self._eof = False
+        self._pos = uoffset
+        if member_size:
+            self._decompressor = self._decomp_factory(**self._decomp_args,
+                                                      zdict=window)
+            self._crc = crc
+            self._stream_size = member_size
+            self._new_member = False
+        else:
+            # The access point is the header of a member.
+            self._decompressor = self._decomp_factory(**self._decomp_args)
+            self._new_member = True
+
+
+def _compress_block(data, compresslevel, zdict):
+    # Compress a block of a parallel compression, ending with a sync flush
+    # so that the compressed blocks can be concatenated.
+    if zdict:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                      -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                      0, zdict)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                      -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class GzipIndex:
+    """Index of the access points of a gzip file.
+
+    An access point is a position from which decompression can resume:
+    the start of a member, or a flush point within a member, such as those
+    written by GzipFile.flush() and by parallel compression.  Passing the
+    index to GzipFile lets seek() start from the nearest access point
+    instead of decompressing the file from the beginning.
+
+    Use GzipIndex.build() to scan a file, and save() and load() to store
+    the index.
+    """
+
+    def __init__(self, points, size):
+        # Sorted list of (uncompressed offset, compressed offset, member CRC,
+        # member size, window) tuples.  Points with a member size of 0 are
+        # at the header of a member.
+        self._points = points
+        self._offsets = [point[0] for point in points]
+        self.size = size
+
+    def __len__(self):
+        return len(self._points)
+
+    def __repr__(self):
+        return '<%s size=%d points=%d>' % (type(self).__name__, self.size,
+                                           len(self._points))
+
+    def _find(self, offset):
+        # Return the last access point at or before offset.
+        i = bisect.bisect_right(self._offsets, offset)
+        if i:
+            return self._points[i - 1]
+        return None
+
+    @classmethod
+    def build(cls, file, span=_INDEX_SPAN):
+        """Build the index of a gzip file.
+
+        file is a file name or a seekable binary file object.  Access points
+        are recorded at most every span bytes of uncompressed data; more
+        points make seeking faster and the index larger.
+        """
+        if span <= 0:
+            raise ValueError("span must be positive")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'rb') as fp:
+                return cls(*_build_index(fp, span))
+        return cls(*_build_index(file, span))
+
+    def save(self, file):
+        """Write the index to file, a file name or a binary file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'wb') as fp:
+                self.save(fp)
+            return
+        file.write(_INDEX_MAGIC)
+        file.write(struct.pack('<QQ', self.size, len(self._points)))
+        for uoffset, coffset, crc, member_size, window in self._points:
+            window = zlib.compress(window)
+            file.write(struct.pack('<QQIQI', uoffset, coffset, crc,
+                                   member_size, len(window)))
+            file.write(window)
+
+    @classmethod
+    def load(cls, file):
+        """Read an index written by save() from file, a file name or a
+        binary file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, 'rb') as fp:
+                return cls.load(fp)
+        if _read_exact(file, len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+            raise ValueError('Not a gzip index file')
+        size, count = struct.unpack('<QQ', _read_exact(file, 16))
+        points = []
+        for _ in range(count):
+            uoffset, coffset, crc, member_size, length = struct.unpack(
+                '<QQIQI', _read_exact(file, 32))
+            window = zlib.decompress(_read_exact(file, length))
+            points.append((uoffset, coffset, crc, member_size, window))
+        return cls(points, size)
+
+
+def _inflate(decompressor, data):
+    # Decompress data, yielding the output in chunks of bounded size.
+    while True:
+        out = decompressor.decompress(data, READ_BUFFER_SIZE)
+        data = decompressor.unconsumed_tail
+        if out:
+            yield out
+        if decompressor.eof or (not data and len(out) < READ_BUFFER_SIZE):
+            return
+
+
+def _build_index(fp, span):
+    points = []
+    uoffset = 0
+    while True:
+        header_offset = fp.tell()
+        if _read_gzip_header(fp) is None:
+            return points, uoffset
+        points.append((uoffset, header_offset, 0, 0, b''))
+        last = uoffset
+        position = fp.tell()
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        crc = size = 0
+        window = b''
+        # A flush point is only recorded after checking that a new
+        # decompressor started there produces the same output.
+        verifier = candidate = None
+        while not decompressor.eof:
+            chunk = fp.read(READ_BUFFER_SIZE)
+            if not chunk:
+                raise EOFError("Compressed file ended before the "
+                               "end-of-stream marker was reached")
+            start = 0
+            while start < len(chunk) and not decompressor.eof:
+                end = len(chunk)
+                marker = chunk.find(_SYNC_MARKER, start)
+                if marker >= 0:
+                    end = marker + len(_SYNC_MARKER)
+                data = chunk[start:end]
+                start = end
+                position += len(data)
+                piece_crc = piece_size = 0
+                for out in _inflate(decompressor, data):
+                    crc = zlib.crc32(out, crc)
+                    piece_crc = zlib.crc32(out, piece_crc)
+                    piece_size += len(out)
+                    window = (window + out[-_DEFLATE_WINDOW_SIZE:])[
+                        -_DEFLATE_WINDOW_SIZE:]
+                size += piece_size
+                if verifier is not None:
+                    verified_crc = verified_size = 0
+                    try:
+                        for out in _inflate(verifier, data):
+                            verified_crc = zlib.crc32(out, verified_crc)
+                            verified_size += len(out)
+                    except zlib.error:
+                        verifier = None
+                    else:
+                        if (verified_crc != piece_crc or
+                            verified_size != piece_size or
+                            verifier.eof != decompressor.eof):
+                            verifier = None
+                        elif (verifier.eof or
+                              size - candidate[3] >= _DEFLATE_WINDOW_SIZE):
+                            points.append(candidate)
+                            last = candidate[0]
+                            verifier = None
+                if (verifier is None and marker >= 0 and
+                    not decompressor.eof and uoffset + size - last >= span):
+                    candidate = (uoffset + size, position, crc, size, window)
+                    verifier = zlib.decompressobj(-zlib.MAX_WBITS,
+                                                  zdict=window)
+        uoffset += size
+        # Check the trailer, which follows the compressed data.
+        position -= len(decompressor.unused_data)
+        fp.seek(position)
+        crc32, isize = struct.unpack("<II", _read_exact(fp, 8))
+        if crc32 != crc:
+            raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
+                                                             hex(crc)))
+        elif isize != (size & 0xffffffff):
+            raise BadGzipFile("Incorrect length of data produced")
+        # Skip the zero padding between members.
+        while (c := fp.read(1)) == b'\x00':
+            pass
+        if c:
+            fp.seek(-1, io.SEEK_CUR)
+
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=0):
+def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=0, workers=1):
     """Compress data in one shot and return the compressed string.
 
     compresslevel sets the compression level in range of 0-9.
     mtime can be used to set the modification time.
     The modification time is set to 0 by default, for reproducibility.
+    If workers is greater than 1, the data is compressed in parallel by
+    that many threads.
     """
+    if workers != 1:
+        buf = io.BytesIO()
+        with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                      mtime=mtime, workers=workers) as f:
+            f.write(data)
+        return buf.getvalue()
     # Wbits=31 automatically includes a gzip header and trailer.
     gzip_data = zlib.compress(data, level=compresslevel, wbits=31)
     if mtime is None:
@@ -127,7 +127,7 @@
 """
 
 __all__ = ['heappush', 'heappop', 'heapify', 'heapreplace', 'merge',
-           'nlargest', 'nsmallest', 'heappushpop']
+           'nlargest', 'nsmallest', 'heappushpop', 'IndexedHeap']
 
 def heappush(heap, item):
     """Push item onto heap, maintaining the heap invariant."""
@@ -578,6 +578,152 @@ def nlargest(n, iterable, key=None):
     result.sort(reverse=True)
     return [elem for (k, order, elem) in result]
 
+class HeapHandle:
+    """Handle of a value pushed on an IndexedHeap."""
+
+    __slots__ = ('_priority', '_value', '_index')
+
+    def __init__(self, priority, value):
+        self._priority = priority
+        self._value = value
+        self._index = -1
+
+    @property
+    def priority(self):
+        """The priority of the value."""
+        return self._priority
+
+    @property
+    def value(self):
+        """The value pushed on the heap."""
+        return self._value
+
+class IndexedHeap:
+    """Min-heap of values ordered by priority.
+
+    push() returns a handle which can be passed to update() to change the
+    priority of the value, or to remove() to remove it from the heap, in
+    O(log n) time.
+    """
+
+    __slots__ = ('_heap',)
+
+    def __init__(self):
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, handle):
+        if not isinstance(handle, HeapHandle):
+            return False
+        pos = handle._index
+        return 0 <= pos < len(self._heap) and self._heap[pos] is handle
+
+    def push(self, priority, value):
+        """Push value with the given priority and return its handle."""
+        handle = HeapHandle(priority, value)
+        handle._index = len(self._heap)
+        self._heap.append(handle)
+        self._siftdown(0, handle._index)
+        return handle
+
+    def pop(self):
+        """Remove and return the (priority, value) pair with the lowest
+        priority."""
+        if not self._heap:
+            raise IndexError('pop from an empty heap')
+        handle = self._heap[0]
+        self._remove(0)
+        return handle._priority, handle._value
+
+    def peek(self):
+        """Return the (priority, value) pair with the lowest priority."""
+        if not self._heap:
+            raise IndexError('peek at an empty heap')
+        handle = self._heap[0]
+        return handle._priority, handle._value
+
+    def update(self, handle, priority):
+        """Change the priority of the value of handle."""
+        pos = self._getindex(handle)
+        # Keep the old priority alive until the heap is consistent again:
+        # its __del__() could modify the heap.
+        old_priority, handle._priority = handle._priority, priority
+        self._resift(pos)
+        del old_priority
+
+    def remove(self, handle):
+        """Remove the value of handle from the heap."""
+        self._remove(self._getindex(handle))
+
+    def _getindex(self, handle):
+        if not isinstance(handle, HeapHandle):
+            raise TypeError('expected a HeapHandle, got %s'
+                            % type(handle).__name__)
+        if handle not in self:
+            raise ValueError('handle is not in the heap')
+        return handle._index
+
+    def _remove(self, pos):
+        heap = self._heap
+        handle = heap[pos]
+        lastelt = heap.pop()
+        handle._index = -1
+        if lastelt is not handle:
+            heap[pos] = lastelt
+            lastelt._index = pos
+            self._resift(pos)
+
+    def _resift(self, pos):
+        # Move the item at pos up, or else down, to its place.
+        item = self._heap[pos]
+        self._siftdown(0, pos)
+        if item._index == pos:
+            self._siftup(pos)
+
+    # Variants of _siftdown() and _siftup() which compare the priorities
+    # and keep the index of the handles up to date.
+
+    def _siftdown(self, startpos, pos):
+        heap = self._heap
+        newitem = heap[pos]
+        try:
+            while pos > startpos:
+                parentpos = (pos - 1) >> 1
+                parent = heap[parentpos]
+                if newitem._priority < parent._priority:
+                    heap[pos] = parent
+                    parent._index = pos
+                    pos = parentpos
+                    continue
+                break
+        finally:
+            heap[pos] = newitem
+            newitem._index = pos
+
+    def _siftup(self, pos):
+        heap = self._heap
+        endpos = len(heap)
+        startpos = pos
+        newitem = heap[pos]
+        childpos = 2*pos + 1
+        try:
+            while childpos < endpos:
+                rightpos = childpos + 1
+                if (rightpos < endpos and
+                        not heap[childpos]._priority < heap[rightpos]._priority):
+                    childpos = rightpos
+                child = heap[childpos]
+                heap[pos] = child
+                child._index = pos
+                pos = childpos
+                childpos = 2*pos + 1
+        finally:
+            heap[pos] = newitem
+            newitem._index = pos
+        self._siftdown(startpos, pos)
+
 # If available, use C implementation
 try:
     from _heapq import *
@@ -1454,6 +1454,9 @@ class HTTPSConnection(HTTPConnection):
 
         default_port = HTTPS_PORT
 
+        # TLS session to resume when connecting, if any.
+        _ssl_session = None
+
         def __init__(self, host, port=None,
                      *, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
                      source_address=None, context=None, blocksize=8192):
@@ -1474,8 +1477,13 @@ def connect(self):
             else:
                 server_hostname = self.host
 
-            self.sock = self._context.wrap_socket(self.sock,
-                                                  server_hostname=server_hostname)
+            if self._ssl_session is not None:
+                self.sock = self._context.wrap_socket(
+                    self.sock, server_hostname=server_hostname,
+                    session=self._ssl_session)
+            else:
+                self.sock = self._context.wrap_socket(
+                    self.sock, server_hostname=server_hostname)
 
     __all__.append("HTTPSConnection")
 
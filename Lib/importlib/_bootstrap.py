@@ -1311,6 +1311,11 @@ def _find_and_load_unlocked(name, import_):
         if name in sys.modules:
             return sys.modules[name]
         parent_module = sys.modules[parent]
+        # Reading __dict__ executes a lazily loaded parent, which may set
+        # __path__ or add the submodule to sys.modules.
+        getattr(parent_module, '__dict__', None)
+        if name in sys.modules:
+            return sys.modules[name]
         try:
             path = parent_module.__path__
         except AttributeError:
@@ -5,6 +5,7 @@
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import SourceFileLoader, SourcelessFileLoader
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
 from ._bootstrap_external import source_from_cache
@@ -164,12 +165,28 @@ def override(self):
         return -1 if self.disable_check else 1
 
 
+# The attributes set by module_from_spec() before the module is executed,
+# and the registry of the warnings module, which only exists once it is.
+_MODULE_METADATA = frozenset({'__name__', '__loader__', '__package__',
+                              '__spec__', '__path__', '__file__',
+                              '__cached__', '__warningregistry__'})
+
+
 class _LazyModule(types.ModuleType):
 
     """A subclass of the module type which triggers loading upon attribute access."""
 
     def __getattribute__(self, attr):
         """Trigger the load of the module and return the attribute."""
+        if attr in _MODULE_METADATA:
+            # The import system and code walking sys.modules read the
+            # metadata of modules; reading it does not load the module.
+            __dict__ = object.__getattribute__(self, '__dict__')
+            try:
+                return __dict__[attr]
+            except KeyError:
+                raise AttributeError(f"module {__dict__['__name__']!r} "
+                                     f"has no attribute {attr!r}") from None
         __spec__ = object.__getattribute__(self, '__spec__')
         loader_state = __spec__.loader_state
         with loader_state['lock']:
@@ -225,9 +242,8 @@ def __getattribute__(self, attr):
 
     def __delattr__(self, attr):
         """Trigger the load and then perform the deletion."""
-        # To trigger the load and raise an exception if the attribute
-        # doesn't exist.
-        self.__getattribute__(attr)
+        # Reading __dict__ triggers the load, unlike the module metadata.
+        self.__getattribute__('__dict__')
         delattr(self, attr)
 
 
@@ -273,7 +289,107 @@ def exec_module(self, module):
         module.__class__ = _LazyModule
 
 
+class _LazyFileLoader(LazyLoader):
+
+    """Lazy loader also providing the methods of the file loader it wraps.
+
+    runpy, linecache and other users of the module loader call methods
+    like get_code() and get_source().
+    """
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _LazyImportFinder:
+
+    """Meta path finder making the loaders of the modules it selects lazy."""
+
+    def __init__(self, include, exclude):
+        self.include = include
+        self.exclude = exclude
+
+    @staticmethod
+    def _matches(fullname, names):
+        for name in names:
+            if fullname == name or fullname.startswith(name + '.'):
+                return True
+        return False
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == '__main__' or self._matches(fullname, self.exclude):
+            return None
+        if (self.include is not None and
+                not self._matches(fullname, self.include)):
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        # Built-in and extension modules are loaded eagerly: creating them
+        # runs their initialization code.
+        if isinstance(spec.loader, (SourceFileLoader, SourcelessFileLoader)):
+            spec.loader = _LazyFileLoader(spec.loader)
+        return spec
+
+
+def enable_lazy_imports(include=None, exclude=()):
+    """Import modules lazily.
+
+    Modules imported from source or bytecode files are executed on the first
+    access to one of their attributes instead of when they are imported.
+    *include* and *exclude* are iterables of module names; a name also
+    selects the submodules of a package.  If *include* is not None, only
+    the modules it selects are imported lazily.  Modules selected by
+    *exclude* are always imported eagerly.
+    """
+    # LazyLoader needs threading: it cannot be imported lazily.
+    import threading
+    disable_lazy_imports()
+    include = None if include is None else tuple(include)
+    sys.meta_path.insert(0, _LazyImportFinder(include, tuple(exclude)))
+
+
+def disable_lazy_imports():
+    """Import modules eagerly again.
+
+    Modules already imported lazily are executed on first attribute access.
+    """
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, _LazyImportFinder)]
+
+
+def _enable_lazy_imports_from_option(value):
+    # Parse the value of -X lazy_imports or PYTHONLAZYIMPORTS: a comma
+    # separated list of modules to import lazily, "all" or "1" for all
+    # modules, and of modules to exclude prefixed by "-".
+    include = []
+    exclude = []
+    if value is True:
+        value = 'all'
+    for name in value.split(','):
+        name = name.strip()
+        if name.startswith('-'):
+            exclude.append(name[1:].strip())
+        elif name in ('1', 'all'):
+            include = None
+        elif name and include is not None:
+            include.append(name)
+    if include == []:
+        include = None
+    enable_lazy_imports(include, exclude)
+
+
 __all__ = ['LazyLoader', 'Loader', 'MAGIC_NUMBER',
-           'cache_from_source', 'decode_source', 'find_spec',
+           'cache_from_source', 'decode_source', 'disable_lazy_imports',
+           'enable_lazy_imports', 'find_spec',
            'module_from_spec', 'resolve_name', 'source_from_cache',
            'source_hash', 'spec_from_file_location', 'spec_from_loader']
@@ -97,13 +97,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONIncrementalDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONIncrementalDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -166,18 +166,21 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    if type(encoder).iterencode is JSONEncoder.iterencode:
+        encoder._dump(obj, fp.write)
+    else:
+        # could accelerate with writelines in some versions of Python, at
+        # a debuggability cost
+        for chunk in encoder.iterencode(obj):
+            fp.write(chunk)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -240,6 +243,8 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
 
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
+_ITERLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def detect_encoding(b):
     bstartswith = b.startswith
@@ -327,6 +332,9 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     This can be used to raise an exception if invalid JSON numbers
     are encountered.
 
+    ``type``, if specified, is the type the document is decoded to, e.g.
+    a dataclass or ``list[SomeDataclass]``; see ``JSONDecoder``.
+
     To use a custom ``JSONDecoder`` subclass, specify it with the ``cls``
     kwarg; otherwise ``JSONDecoder`` is used.
     """
@@ -357,3 +365,36 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+def iterload(fp, *, lines=False, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON array) and yield its elements one at a time.
+
+    If ``lines`` is true, ``fp`` is in the JSON Lines format instead:
+    every line of it holds a JSON value, and those values are yielded.
+
+    ``fp`` is read in chunks, so that only the text of the element
+    being decoded needs to be kept in memory.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    decoder = JSONIncrementalDecoder(cls(**kw), lines=lines)
+    while True:
+        chunk = fp.read(_ITERLOAD_CHUNK_SIZE)
+        yield from decoder._iterdecode(chunk, not chunk)
+        if not chunk:
+            break
@@ -1,5 +1,7 @@
 """Implementation of JSONDecoder
 """
+import codecs
+import functools
 import re
 
 from json import scanner
@@ -8,7 +10,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONIncrementalDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -259,6 +261,87 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
     return values, end
 
 
+# Kinds of decoding plans, see Modules/_json.c.
+PLAN_OBJECT = 0
+PLAN_DICT = 1
+PLAN_ARRAY = 2
+PLAN_TUPLE = 3
+PLAN_SCALAR = 4
+PLAN_OPTIONAL = 5
+
+def JSONTyped(context, s, idx, plan):
+    # Used by the pure Python scanner to decode a term to the type described
+    # by plan.  Unlike the C scanner, which builds the typed objects while
+    # scanning, it decodes the term without hooks, then converts it and
+    # reports errors at the position of the whole term.
+    untyped = object.__new__(type(context))
+    untyped.__dict__.update(vars(context))
+    untyped.object_hook = untyped.object_pairs_hook = None
+    untyped.memo = {}
+    obj, end = scanner.py_make_scanner(untyped)(s, idx)
+    return _convert(obj, plan, s, idx, context), end
+
+def _convert(obj, plan, doc, pos, context):
+    if plan is None:
+        return _apply_hooks(obj, context)
+    kind, factory, table, extra = plan
+    if kind == PLAN_OPTIONAL:
+        if obj is None:
+            return None
+        return _convert(obj, table, doc, pos, context)
+    if kind == PLAN_SCALAR:
+        if type(obj) not in table:
+            raise JSONDecodeError(f'Expecting {extra}', doc, pos)
+        if factory is not None and type(obj) is not factory:
+            try:
+                obj = factory(obj)
+            except (ValueError, OverflowError) as exc:
+                # Not a member of the enum, or too large for a float
+                raise JSONDecodeError(str(exc), doc, pos)
+        return obj
+    if kind == PLAN_OBJECT or kind == PLAN_DICT:
+        if type(obj) is not dict:
+            raise JSONDecodeError('Expecting object', doc, pos)
+        if kind == PLAN_DICT:
+            return {key: _convert(value, table, doc, pos, context)
+                    for key, value in obj.items()}
+        result = {}
+        for key, value in obj.items():
+            if key not in table:
+                raise JSONDecodeError(f'Unexpected key {key!r}', doc, pos)
+            result[key] = _convert(value, table[key], doc, pos, context)
+        for key in extra:
+            if key not in result:
+                raise JSONDecodeError(f'Missing key {key!r}', doc, pos)
+        if factory is None:
+            return result
+        return factory(**result)
+    if type(obj) is not list:
+        raise JSONDecodeError('Expecting array', doc, pos)
+    if kind == PLAN_TUPLE:
+        if len(obj) != len(table):
+            raise JSONDecodeError(f'Expecting {len(table)} items', doc, pos)
+        return tuple(_convert(item, item_plan, doc, pos, context)
+                     for item, item_plan in zip(obj, table))
+    result = [_convert(item, table, doc, pos, context) for item in obj]
+    if factory is not None:
+        result = factory(result)
+    return result
+
+def _apply_hooks(obj, context):
+    if context.object_hook is None and context.object_pairs_hook is None:
+        return obj
+    if type(obj) is list:
+        return [_apply_hooks(item, context) for item in obj]
+    if type(obj) is dict:
+        pairs = [(key, _apply_hooks(value, context))
+                 for key, value in obj.items()]
+        if context.object_pairs_hook is not None:
+            return context.object_pairs_hook(pairs)
+        return context.object_hook(dict(pairs))
+    return obj
+
+
 class JSONDecoder(object):
     """Simple JSON <https://json.org> decoder
 
@@ -291,7 +374,7 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, type=None):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -323,6 +406,15 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        ``type``, if specified, is the type of the decoded documents: a
+        dataclass, a TypedDict, an enum, ``list[T]``, ``tuple[T, ...]``,
+        ``dict[str, T]``, a union with None, ``str``, ``int``, ``float``,
+        ``bool`` or ``typing.Any``, nested arbitrarily.  Objects are
+        built directly while scanning and a JSONDecodeError is raised if the
+        document does not match the type.  ``object_hook`` and
+        ``object_pairs_hook`` are only called for the objects decoded as
+        ``typing.Any``.
         """
         self.object_hook = object_hook
         self.parse_float = parse_float or float
@@ -333,8 +425,11 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
+        self.parse_typed = JSONTyped
         self.memo = {}
         self.scan_once = scanner.make_scanner(self)
+        self.type = type
+        self._plan = None if type is None else _make_plan(type)
 
 
     def decode(self, s, _w=WHITESPACE.match):
@@ -358,7 +453,317 @@ def raw_decode(self, s, idx=0):
 
         """
         try:
-            obj, end = self.scan_once(s, idx)
+            if self._plan is None:
+                obj, end = self.scan_once(s, idx)
+            else:
+                obj, end = self.scan_once(s, idx, self._plan)
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+def _make_plan(tp):
+    """Return the plan used by the scanner to decode JSON to type tp.
+
+    A plan is None for any JSON term, or a list [kind, factory, table,
+    extra] described in Modules/_json.c.
+    """
+    try:
+        return _cached_plan(tp)
+    except TypeError:
+        pass  # Unhashable types.  Real errors are raised below.
+    return _build_plan(tp, {})
+
+@functools.lru_cache(maxsize=256)
+def _cached_plan(tp):
+    return _build_plan(tp, {})
+
+def _build_plan(tp, building):
+    import dataclasses
+    import enum
+    import types
+    import typing
+
+    if tp is typing.Any or tp is object:
+        return None
+    if isinstance(tp, type) and tp in building:
+        # A recursive dataclass or TypedDict
+        return building[tp]
+    if tp is None or tp is types.NoneType:
+        return [PLAN_SCALAR, None, (types.NoneType,), 'null']
+    if tp is float:
+        return [PLAN_SCALAR, float, (float, int), 'float']
+    if tp in (str, int, bool):
+        return [PLAN_SCALAR, None, (tp,), tp.__name__]
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        value_types = tuple(dict.fromkeys(type(m.value) for m in tp))
+        return [PLAN_SCALAR, tp, value_types, tp.__name__]
+    if isinstance(tp, typing.NewType):
+        return _build_plan(tp.__supertype__, building)
+
+    if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+        fields = {}
+        plan = building[tp] = [PLAN_OBJECT, tp, fields, ()]
+        hints = typing.get_type_hints(tp)
+        required = []
+        for field in dataclasses.fields(tp):
+            if not field.init:
+                continue
+            fields[field.name] = _build_plan(hints[field.name], building)
+            if (field.default is dataclasses.MISSING and
+                    field.default_factory is dataclasses.MISSING):
+                required.append(field.name)
+        plan[3] = tuple(required)
+        return plan
+    if typing.is_typeddict(tp):
+        fields = {}
+        plan = building[tp] = [PLAN_OBJECT, None, fields, ()]
+        hints = typing.get_type_hints(tp)
+        for name, hint in hints.items():
+            fields[name] = _build_plan(hint, building)
+        plan[3] = tuple(name for name in hints
+                        if name in tp.__required_keys__)
+        return plan
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Annotated:
+        return _build_plan(args[0], building)
+    if origin is typing.Union or origin is types.UnionType:
+        plans = [_build_plan(arg, building)
+                 for arg in args if arg is not types.NoneType]
+        if len(plans) == 1:
+            plan = plans[0]
+        elif None in plans:
+            plan = None
+        elif all(p[0] == PLAN_SCALAR and p[1] in (None, float)
+                 for p in plans):
+            value_types = tuple(dict.fromkeys(t for p in plans for t in p[2]))
+            plan = [PLAN_SCALAR, None, value_types,
+                    ' or '.join(p[3] for p in plans)]
+        else:
+            raise TypeError(f'cannot decode JSON to {tp!r}: only unions '
+                            f'of scalar types and None are supported')
+        if plan is None or types.NoneType not in args:
+            return plan
+        return [PLAN_OPTIONAL, None, plan, None]
+
+    if origin is None and tp in (list, tuple, set, frozenset, dict):
+        origin = tp
+        args = (typing.Any, typing.Any) if tp is dict else (typing.Any, ...)
+    if origin is tuple and not (len(args) == 2 and args[1] is ...):
+        items = tuple(_build_plan(arg, building) for arg in args)
+        return [PLAN_TUPLE, None, items, None]
+    if origin in (list, tuple, set, frozenset):
+        factory = None if origin is list else origin
+        return [PLAN_ARRAY, factory, _build_plan(args[0], building),
+                None]
+    if origin is dict:
+        if args[0] is not str and args[0] is not typing.Any:
+            raise TypeError(f'cannot decode JSON to {tp!r}: keys of JSON '
+                            f'objects are strings')
+        return [PLAN_DICT, None, _build_plan(args[1], building), None]
+    raise TypeError(f'cannot decode JSON to {tp!r}')
+
+
+# Tails of a document which only failed to decode because it is truncated:
+# an unfinished literal, number or \uXXXX escape, or nothing at all.
+INCOMPLETE = re.compile(r'''
+    (?: t(?:r(?:u)?)? | f(?:a(?:l(?:s)?)?)? | n(?:u(?:l)?)? | N(?:a)?
+      | -?(?:I(?:n(?:f(?:i(?:n(?:i(?:t)?)?)?)?)?)?)?
+      | [.eE][-+]? | u[0-9A-Fa-f]{0,4} )\Z
+    ''', FLAGS)
+
+_START, _FIRST, _ITEM, _END = range(4)
+
+
+class JSONIncrementalDecoder(object):
+    """Incremental JSON decoder
+
+    Decodes a JSON document fed in chunks, returning values as soon as
+    they are complete.  By default the document must be an array and
+    its elements are returned one at a time.  If ``lines`` is true, the
+    input is in the JSON Lines format: every line holds a separate JSON
+    value (blank lines are ignored).
+
+    Only the text of the value being decoded is kept in memory, so a
+    large stream can be decoded with memory proportional to the size
+    of its largest element.
+
+    """
+
+    # Do not retry decoding an unfinished value longer than this until
+    # its length has doubled, to keep the total work linear.
+    _retry_threshold = 1 << 16
+
+    def __init__(self, decoder=None, *, lines=False):
+        """``decoder`` is the ``JSONDecoder`` used to decode values;
+        a default ``JSONDecoder`` is used if it is not specified.
+        """
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.decoder = decoder
+        self.lines = lines
+        self.reset()
+
+    def reset(self):
+        """Reset the decoder to its initial state, discarding any
+        buffered data.
+        """
+        # The text not decoded yet starts at _pos in ''.join(_chunks)
+        self._chunks = []
+        self._pos = 0
+        self._size = 0
+        self._retry_size = 0
+        self._pending = b''
+        self._textdecoder = None
+        self._state = _START
+        self._error = None
+
+    def decode(self, data, final=False):
+        """Feed ``data`` (a ``str``, ``bytes`` or ``bytearray`` instance)
+        to the decoder and return a list of the values completed by it.
+
+        If ``final`` is true, the end of the document has been reached:
+        a ``JSONDecodeError`` is raised if it is incomplete.  Bytes are
+        decoded from UTF-8, UTF-16 or UTF-32, detected as in ``loads()``.
+
+        If invalid data follows complete values, these values are returned
+        and the error is raised by the next call.
+        """
+        if self._error is not None:
+            raise self._error
+        values = []
+        try:
+            for value in self._iterdecode(data, final):
+                values.append(value)
+        except JSONDecodeError as err:
+            if not values:
+                raise
+            self._error = err
+        return values
+
+    def _iterdecode(self, data, final):
+        if isinstance(data, str):
+            text = data
+        elif isinstance(data, (bytes, bytearray)):
+            text = self._decode_bytes(data, final)
+        else:
+            raise TypeError(f'the JSON object must be str, bytes or '
+                            f'bytearray, not {data.__class__.__name__}')
+        if text:
+            self._chunks.append(text)
+            self._size += len(text)
+        if self._size < self._retry_size and not final:
+            return
+        s = ''.join(self._chunks)
+        self._chunks = [s]
+        if self.lines:
+            yield from self._decode_lines(s, final)
+        else:
+            yield from self._decode_items(s, final)
+        if self._pos:
+            self._chunks = [s[self._pos:]] if self._pos < len(s) else []
+            self._pos = 0
+        if self._size >= self._retry_threshold:
+            self._retry_size = 2 * self._size
+        else:
+            self._retry_size = 0
+        if final:
+            self.reset()
+
+    def _decode_bytes(self, data, final):
+        if self._textdecoder is None:
+            data = self._pending + data
+            if len(data) < 4 and not final:
+                self._pending = data
+                return ''
+            self._pending = b''
+            from json import detect_encoding
+            encoding = detect_encoding(data)
+            self._textdecoder = codecs.getincrementaldecoder(encoding)(
+                'surrogatepass')
+        return self._textdecoder.decode(data, final)
+
+    def _consume(self, s, end, state):
+        self._pos = end
+        self._size = len(s) - end
+        self._state = state
+
+    def _decode_lines(self, s, final):
+        end = self._pos
+        n = len(s)
+        while end < n:
+            nl = s.find('\n', end)
+            if nl < 0:
+                if not final:
+                    break
+                nl = n
+            line = s[end:nl]
+            if self._state == _START and line.startswith('\ufeff'):
+                raise JSONDecodeError("Unexpected UTF-8 BOM "
+                                      "(decode using utf-8-sig)", line, 0)
+            end = min(nl + 1, n)
+            if line.strip(WHITESPACE_STR):
+                value = self.decoder.decode(line)
+                self._consume(s, end, _ITEM)
+                yield value
+            else:
+                self._consume(s, end, _ITEM)
+
+    def _decode_items(self, s, final, _w=WHITESPACE.match):
+        end = self._pos
+        state = self._state
+        n = len(s)
+        while True:
+            end = _w(s, end).end()
+            if end == n:
+                if final and state != _END:
+                    raise JSONDecodeError("Expecting value", s, end)
+                self._consume(s, end, state)
+                return
+            nextchar = s[end]
+            if state == _START:
+                if nextchar == '\ufeff':
+                    raise JSONDecodeError("Unexpected UTF-8 BOM "
+                                          "(decode using utf-8-sig)", s, end)
+                if nextchar != '[':
+                    raise JSONDecodeError("Expecting '['", s, end)
+                state = _FIRST
+                end += 1
+                continue
+            if state == _END:
+                raise JSONDecodeError("Extra data", s, end)
+            if nextchar == ']':
+                if state == _ITEM:
+                    raise JSONDecodeError(
+                        "Illegal trailing comma before end of array", s, end)
+                state = _END
+                end += 1
+                continue
+            try:
+                value, valueend = self.decoder.raw_decode(s, end)
+                # A value is only complete once followed by a delimiter:
+                # a number could continue in the next chunk.
+                delim = _w(s, valueend).end()
+                nextchar = s[delim:delim + 1]
+                if nextchar == ',':
+                    state = _ITEM
+                elif nextchar == ']':
+                    state = _END
+                else:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, delim)
+            except JSONDecodeError as err:
+                if final or not self._is_incomplete(err):
+                    raise
+                self._consume(s, end, state)
+                return
+            end = delim + 1
+            self._consume(s, end, state)
+            yield value
+
+    @staticmethod
+    def _is_incomplete(err):
+        if err.msg.startswith('Unterminated string'):
+            return True
+        return INCOMPLETE.match(err.doc, err.pos) is not None
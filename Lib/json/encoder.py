@@ -212,14 +212,9 @@ def iterencode(self, o, _one_shot=False):
                 mysocket.write(chunk)
 
         """
-        if self.check_circular:
-            markers = {}
-        else:
-            markers = None
-        if self.ensure_ascii:
-            _encoder = encode_basestring_ascii
-        else:
-            _encoder = encode_basestring
+        if _one_shot and c_make_encoder is not None:
+            return self._make_c_encoder()(o, 0)
+        markers, _encoder, indent = self._encoder_args()
 
         def floatstr(o, allow_nan=self.allow_nan,
                 _repr=float.__repr__, _inf=INFINITY, _neginf=-INFINITY):
@@ -244,21 +239,47 @@ def floatstr(o, allow_nan=self.allow_nan,
             return text
 
 
+        _iterencode = _make_iterencode(
+            markers, self.default, _encoder, indent, floatstr,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, _one_shot)
+        return _iterencode(o, 0)
+
+    def _encoder_args(self):
+        # The arguments shared by the C and the Python encoders.
+        if self.check_circular:
+            markers = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
         if self.indent is None or isinstance(self.indent, str):
             indent = self.indent
         else:
             indent = ' ' * self.indent
-        if _one_shot and c_make_encoder is not None:
-            _iterencode = c_make_encoder(
-                markers, self.default, _encoder, indent,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+        return markers, _encoder, indent
+
+    def _make_c_encoder(self):
+        markers, _encoder, indent = self._encoder_args()
+        return c_make_encoder(
+            markers, self.default, _encoder, indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+
+    def _dump(self, o, write):
+        """Encode the given object and pass the JSON text to write().
+
+        Used by json.dump() for encoders which do not override iterencode().
+        The C encoder, if available, streams the text in large chunks,
+        with indentation or not.
+        """
+        if c_make_encoder is None:
+            for chunk in self.iterencode(o):
+                write(chunk)
         else:
-            _iterencode = _make_iterencode(
-                markers, self.default, _encoder, indent, floatstr,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
-        return _iterencode(o, 0)
+            self._make_c_encoder().dump(o, write)
 
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
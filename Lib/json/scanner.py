@@ -62,7 +62,9 @@ def _scan_once(string, idx):
         else:
             raise StopIteration(idx)
 
-    def scan_once(string, idx):
+    def scan_once(string, idx, plan=None):
+        if plan is not None:
+            return context.parse_typed(context, string, idx, plan)
         try:
             return _scan_once(string, idx)
         finally:
@@ -70,4 +72,5 @@ def scan_once(string, idx):
 
     return scan_once
 
+
 make_scanner = c_make_scanner or py_make_scanner
@@ -1007,6 +1007,17 @@ def emit(self, record):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emitBatch(self, records):
+        """
+        Emit a list of records.
+
+        This version just calls emit() for each record. Subclasses can
+        override it to output the records more efficiently, for example
+        with a single write.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -1026,6 +1037,28 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        This is the equivalent of calling handle() for each record, but the
+        I/O thread lock is only acquired once, around a single call to
+        emitBatch() with the records which passed the filters.
+
+        Returns the list of the records that were emitted.
+        """
+        batch = []
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                batch.append(rv)
+            elif rv:
+                batch.append(record)
+        if batch:
+            with self.lock:
+                self.emitBatch(batch)
+        return batch
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1157,6 +1190,38 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a list of records.
+
+        The records are formatted, then written to the stream with a single
+        write, and the stream is flushed once. Subclasses overriding emit()
+        get it called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emitBatch(self, records)
+            return
+        self._writeBatch(records)
+
+    def _writeBatch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if not msgs:
+            return
+        try:
+            self.stream.write(''.join(msgs))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1263,6 +1328,22 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit a list of records.
+
+        The stream is opened if needed, as in emit(), then the records are
+        written with a single write.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emitBatch(self, records)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            self._writeBatch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
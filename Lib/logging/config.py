@@ -759,8 +759,11 @@ def _configure_queue_handler(self, klass, **kwargs):
         rhl = kwargs.pop('respect_handler_level', False)
         lklass = kwargs.pop('listener', logging.handlers.QueueListener)
         handlers = kwargs.pop('handlers', [])
+        lkwargs = {}
+        if 'batch_size' in kwargs:
+            lkwargs['batch_size'] = kwargs.pop('batch_size')
 
-        listener = lklass(q, *handlers, respect_handler_level=rhl)
+        listener = lklass(q, *handlers, respect_handler_level=rhl, **lkwargs)
         handler = klass(q, **kwargs)
         handler.listener = listener
         return handler
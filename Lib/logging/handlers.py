@@ -693,6 +693,30 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a list of records.
+
+        The pickled records are sent to the socket at once. Subclasses
+        overriding emit() or send() get them called for each record
+        instead.
+        """
+        cls = type(self)
+        if cls.emit is not SocketHandler.emit or cls.send is not SocketHandler.send:
+            logging.Handler.emitBatch(self, records)
+            return
+        pickles = []
+        for record in records:
+            try:
+                pickles.append(self.makePickle(record))
+            except Exception:
+                self.handleError(record)
+        if pickles:
+            try:
+                self.send(b''.join(pickles))
+            except Exception:
+                self.handleError(records[-1])
+
     def close(self):
         """
         Closes the socket.
@@ -1503,15 +1527,25 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than 1, the records waiting in the queue
+        are dequeued together, up to batch_size records at a time, and
+        passed to the handlers with handleBatch().
         """
+        if not isinstance(batch_size, int):
+            raise TypeError('batch_size must be an integer')
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def dequeue(self, block):
         """
@@ -1559,6 +1593,60 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handleBatch(self, records):
+        """
+        Handle a list of records.
+
+        This prepares the records and passes them to the handleBatch()
+        method of each handler, so that the handlers can output them
+        together.  Handlers which override handle() but not handleBatch()
+        are passed the records one at a time by handle().
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            if self._handles_batches(handler):
+                handler.handleBatch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
+    @staticmethod
+    def _handles_batches(handler):
+        # A handler overriding handle() may filter or lock there, which the
+        # default handleBatch() would bypass.
+        cls = type(handler)
+        handle_batch = getattr(cls, 'handleBatch', None)
+        if handle_batch is None:
+            return False
+        return (handle_batch is not logging.Handler.handleBatch or
+                cls.handle is logging.Handler.handle)
+
+    def _dequeue_batch(self):
+        """
+        Dequeue a record, blocking, and the records which are already
+        waiting in the queue, up to batch_size records.
+
+        Return the list of records and whether the sentinel was seen.
+        """
+        records = []
+        record = self.dequeue(True)
+        while record is not self._sentinel:
+            records.append(record)
+            if len(records) >= self.batch_size:
+                return records, False
+            try:
+                record = self.dequeue(False)
+            except queue.Empty:
+                return records, False
+        return records, True
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1567,6 +1655,9 @@ def _monitor(self):
         This method runs on a separate, internal thread.
         The thread will terminate if it sees a sentinel object in the queue.
         """
+        if self.batch_size > 1:
+            self._monitor_batches()
+            return
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
         while True:
@@ -1582,6 +1673,22 @@ def _monitor(self):
             except queue.Empty:
                 break
 
+    def _monitor_batches(self):
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        while True:
+            try:
+                records, done = self._dequeue_batch()
+            except queue.Empty:
+                break
+            if records:
+                self.handleBatch(records)
+            if has_task_done:
+                for _ in range(len(records) + done):
+                    q.task_done()
+            if done:
+                break
+
     def enqueue_sentinel(self):
         """
         This is used to enqueue the sentinel record.
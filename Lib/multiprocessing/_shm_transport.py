@@ -0,0 +1,271 @@
+#
+# Out-of-band transfer of large buffers through shared memory
+#
+# multiprocessing/_shm_transport.py
+#
+# Licensed to PSF under a Contributor Agreement.
+#
+# Objects are pickled with protocol 5.  Bytes-like objects of at least
+# ``threshold`` bytes are written to a shared memory segment instead of
+# the pickle stream, so that only a small header goes through the pipe.
+# The resulting payload unpickles itself into the original object on the
+# receiving side, hence the queues and pipes carrying it need no changes.
+#
+
+import io
+import pickle
+import threading
+
+from .reduction import ForkingPickler
+from .shared_memory import SharedMemory, _USE_POSIX
+
+__all__ = ['dumps', 'send', 'SegmentPool', 'CAN_TRANSFER']
+
+#
+# Segments created by a process other than the receiver can only outlive
+# their creator with POSIX shared memory: a Windows segment is destroyed
+# once its last handle is closed.
+#
+
+CAN_TRANSFER = _USE_POSIX
+
+_MIN_SEGMENT_SIZE = 64 * 1024
+_MAX_FREE_SIZE = 256 * 1024 * 1024
+_ALIGNMENT = 64
+_MAX_DEPTH = 4
+
+#
+# Pool of segments recycled between tasks
+#
+
+class SegmentPool(object):
+    '''
+    Pool of shared memory segments owned by the current process.
+
+    Segments are grouped by size classes which are powers of two.  At most
+    *max_free_size* bytes are kept around for reuse; released segments
+    beyond that limit are destroyed.  The owner of the pool must call
+    close() once it is done with it.
+    '''
+    def __init__(self, max_free_size=_MAX_FREE_SIZE):
+        self._lock = threading.Lock()
+        self._free = {}
+        self._free_size = 0
+        self._max_free_size = max_free_size
+        self._closed = False
+
+    @staticmethod
+    def _size_class(size):
+        return max(_MIN_SEGMENT_SIZE, 1 << (size - 1).bit_length())
+
+    def acquire(self, size):
+        '''Return a segment of at least *size* bytes.'''
+        size = self._size_class(size)
+        with self._lock:
+            segments = self._free.get(size)
+            if segments:
+                segment = segments.pop()
+                self._free_size -= segment.size
+                return segment
+        return SharedMemory(create=True, size=size)
+
+    def release(self, segment):
+        '''Give back a segment which is no longer in use.'''
+        # Round down so that any segment of a class is large enough for
+        # all the requests mapped to that class by acquire().
+        size = 1 << (segment.size.bit_length() - 1)
+        with self._lock:
+            if (not self._closed and size >= _MIN_SEGMENT_SIZE and
+                    self._free_size + segment.size <= self._max_free_size):
+                self._free.setdefault(size, []).append(segment)
+                self._free_size += segment.size
+                return
+        _destroy(segment)
+
+    def close(self):
+        '''Destroy all the free segments.'''
+        with self._lock:
+            self._closed = True
+            free, self._free = self._free, {}
+            self._free_size = 0
+        for segments in free.values():
+            for segment in segments:
+                _destroy(segment)
+
+
+def _destroy(segment):
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+#
+# Pickling
+#
+
+def _wrap(obj, threshold, depth=0):
+    # Only the exact types are wrapped, subclasses would lose their type.
+    # A PickleBuffer pickled out-of-band unpickles into the buffer object
+    # supplied to the unpickler, which _load() creates with the type of the
+    # original object: bytes for a read-only buffer, bytearray otherwise.
+    # Objects supporting out-of-band pickling by themselves (for instance
+    # NumPy arrays) are handled by the buffer callback in dumps().
+    cls = type(obj)
+    if cls is bytes or cls is bytearray:
+        if len(obj) >= threshold:
+            return pickle.PickleBuffer(obj)
+        return obj
+    if depth >= _MAX_DEPTH:
+        return obj
+    depth += 1
+    if cls is tuple or cls is list:
+        items = [_wrap(x, threshold, depth) for x in obj]
+        if any(x is not y for x, y in zip(items, obj)):
+            return cls(items)
+    elif cls is dict:
+        items = {k: _wrap(v, threshold, depth) for k, v in obj.items()}
+        if any(items[k] is not v for k, v in obj.items()):
+            return items
+    elif _is_plain(cls) and isinstance(getattr(obj, '__dict__', None), dict):
+        # Instances pickled by default are pickled as their class and their
+        # __dict__, so a copy with a wrapped __dict__ pickles the same way.
+        state = _wrap(obj.__dict__, threshold, depth - 1)
+        if state is not obj.__dict__:
+            new = object.__new__(cls)
+            new.__dict__.update(state)
+            return new
+    return obj
+
+
+def _is_plain(cls):
+    return (cls.__reduce_ex__ is object.__reduce_ex__ and
+            cls.__reduce__ is object.__reduce__ and
+            cls.__getstate__ is object.__getstate__ and
+            cls.__new__ is object.__new__ and
+            not hasattr(cls, '__slots__') and
+            cls not in ForkingPickler._copyreg_dispatch_table and
+            cls not in ForkingPickler._extra_reducers)
+
+
+class SharedPickle(object):
+    '''
+    Pickled object whose large buffers live in a shared memory segment.
+
+    Unpickling it returns the original object.  With *transfer* true, the
+    receiver becomes the owner of the segment and destroys it, otherwise
+    the sender keeps it and must not reuse it before the receiver is done.
+    '''
+    __slots__ = ('data', 'name', 'layout', 'transfer')
+
+    def __init__(self, data, name=None, layout=(), transfer=False):
+        self.data = data
+        self.name = name
+        self.layout = layout
+        self.transfer = transfer
+
+    def __reduce__(self):
+        return _load, (self.data, self.name, self.layout, self.transfer)
+
+
+def _load(data, name, layout, transfer):
+    if name is None:
+        return ForkingPickler.loads(data)
+    segment = SharedMemory(name, track=transfer)
+    try:
+        # Copy the buffers out, so that the loaded objects do not depend
+        # on the lifetime of the segment.  The unpickler uses these copies
+        # as is for the bytes and bytearray objects.
+        buf = segment.buf
+        buffers = [(bytes if readonly else bytearray)(
+                       buf[offset:offset + size])
+                   for offset, size, readonly in layout]
+        del buf
+        return ForkingPickler.loads(data, buffers=buffers)
+    finally:
+        if transfer:
+            _destroy(segment)
+        else:
+            segment.close()
+
+
+def dumps(obj, threshold, pool=None):
+    '''
+    Pickle *obj*, storing buffers of at least *threshold* bytes in shared
+    memory.
+
+    Return a ``(payload, segment)`` pair.  *payload* is picklable and
+    unpickles into a copy of *obj*.  *segment* is None if no buffer was
+    large enough.
+
+    If *pool* is given, the segment is taken from it and must be released
+    to it once the receiver has loaded the payload.  Otherwise a new
+    segment is created whose ownership passes to the receiver; the caller
+    should only close it after sending the payload, or destroy it if
+    sending failed.
+    '''
+    wrapped = _wrap(obj, threshold)
+    buffers = []
+
+    def buffer_callback(pb):
+        try:
+            raw = pb.raw()
+        except BufferError:
+            # Non-contiguous buffers can only be serialized in-band.
+            return True
+        if raw.nbytes < threshold:
+            raw.release()
+            return True
+        buffers.append(raw)
+        return False
+
+    f = io.BytesIO()
+    ForkingPickler(f, 5, buffer_callback=buffer_callback).dump(wrapped)
+    data = f.getvalue()
+    del wrapped
+    if not buffers:
+        return SharedPickle(data), None
+
+    layout = []
+    offset = 0
+    for raw in buffers:
+        layout.append((offset, raw.nbytes, raw.readonly))
+        offset += -(-raw.nbytes // _ALIGNMENT) * _ALIGNMENT
+    if pool is not None:
+        segment = pool.acquire(offset)
+    else:
+        segment = SharedMemory(create=True, size=offset, track=False)
+    try:
+        buf = segment.buf
+        for raw, (offset, size, _) in zip(buffers, layout):
+            buf[offset:offset + size] = raw
+            raw.release()
+        del buf
+    except BaseException:
+        if pool is not None:
+            pool.release(segment)
+        else:
+            _destroy(segment)
+        raise
+    payload = SharedPickle(data, segment.name, tuple(layout),
+                           transfer=pool is None)
+    return payload, segment
+
+
+def send(put, obj, threshold):
+    '''
+    Send *obj* using the *put* function, handing over the ownership of the
+    shared memory holding its large buffers to the receiver.
+    '''
+    payload, segment = dumps(obj, threshold)
+    if segment is None:
+        put(payload)
+        return
+    try:
+        put(payload)
+    except BaseException:
+        segment.unlink()
+        raise
+    finally:
+        segment.close()
@@ -14,6 +14,7 @@
 #
 
 import collections
+import functools
 import itertools
 import os
 import queue
@@ -95,12 +96,17 @@ def __repr__(self):
 
 
 def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
-           wrap_exception=False):
+           wrap_exception=False, shared_memory_threshold=None):
     if (maxtasks is not None) and not (isinstance(maxtasks, int)
                                        and maxtasks >= 1):
         raise AssertionError("Maxtasks {!r} is not valid".format(maxtasks))
     put = outqueue.put
     get = inqueue.get
+    if shared_memory_threshold is not None:
+        # The parent process becomes the owner of the shared memory.
+        from . import _shm_transport
+        put = functools.partial(_shm_transport.send, outqueue.put,
+                                threshold=shared_memory_threshold)
     if hasattr(inqueue, '_writer'):
         inqueue._writer.close()
         outqueue._reader.close()
@@ -139,6 +145,54 @@ def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
         completed += 1
     util.debug('worker exiting after %d tasks' % completed)
 
+class _SharedMemoryTasks(object):
+    '''
+    Wrapper of the functions sending the tasks and receiving the results of
+    a pool, which passes large buffers of the tasks through shared memory.
+    '''
+    def __init__(self, put, get, threshold):
+        from . import _shm_transport
+        self._shm_transport = _shm_transport
+        self._put = put
+        self._get = get
+        self._threshold = threshold
+        # Segments of finished tasks kept for reuse until the pool closes.
+        self._segment_pool = _shm_transport.SegmentPool()
+        # Map of (job, i) to the segments used by the running tasks.
+        self._segments = {}
+
+    def put(self, task):
+        if task is None:
+            self._put(task)
+            return
+        job, i = task[:2]
+        payload, segment = self._shm_transport.dumps(
+            task, self._threshold, self._segment_pool)
+        if segment is not None:
+            self._segments[job, i] = segment
+        try:
+            self._put(payload)
+        except BaseException:
+            self._release(job, i)
+            raise
+
+    def get(self):
+        task = self._get()
+        if task is not None:
+            self._release(*task[:2])
+        return task
+
+    def _release(self, job, i):
+        segment = self._segments.pop((job, i), None)
+        if segment is not None:
+            self._segment_pool.release(segment)
+
+    def close(self):
+        # The workers have exited: destroy all the segments.
+        self._segment_pool.close()
+        while self._segments:
+            self._segment_pool.release(self._segments.popitem()[1])
+
 def _helper_reraises_exception(ex):
     'Pickle-able helper function for use by _guarded_task_generation.'
     raise ex
@@ -181,14 +235,28 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *,
+                 shared_memory_threshold=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
         self._state = INIT
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            if shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+        self._shared_memory_threshold = shared_memory_threshold
+
         self._ctx = context or get_context()
         self._setup_queues()
+        self._shared_memory = None
+        if shared_memory_threshold is not None:
+            self._shared_memory = _SharedMemoryTasks(
+                self._quick_put, self._quick_get, shared_memory_threshold)
+            self._quick_put = self._shared_memory.put
+            self._quick_get = self._shared_memory.get
         self._taskqueue = queue.SimpleQueue()
         # The _change_notifier queue exist to wake up self._handle_workers()
         # when the cache (self._cache) is empty or when there is a change in
@@ -228,7 +296,8 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             args=(self._cache, self._taskqueue, self._ctx, self.Process,
                   self._processes, self._pool, self._inqueue, self._outqueue,
                   self._initializer, self._initargs, self._maxtasksperchild,
-                  self._wrap_exception, sentinels, self._change_notifier)
+                  self._wrap_exception, sentinels, self._change_notifier,
+                  self._worker_shared_memory_threshold())
             )
         self._worker_handler.daemon = True
         self._worker_handler._state = RUN
@@ -256,7 +325,7 @@ def __init__(self, processes=None, initializer=None, initargs=(),
             self, self._terminate_pool,
             args=(self._taskqueue, self._inqueue, self._outqueue, self._pool,
                   self._change_notifier, self._worker_handler, self._task_handler,
-                  self._result_handler, self._cache),
+                  self._result_handler, self._cache, self._shared_memory),
             exitpriority=15
             )
         self._state = RUN
@@ -302,6 +371,15 @@ def _join_exited_workers(pool):
                 del pool[i]
         return cleaned
 
+    def _worker_shared_memory_threshold(self):
+        # Results can only be sent through segments created by the workers
+        # where shared memory outlives the process creating it.
+        if self._shared_memory_threshold is not None:
+            from . import _shm_transport
+            if _shm_transport.CAN_TRANSFER:
+                return self._shared_memory_threshold
+        return None
+
     def _repopulate_pool(self):
         return self._repopulate_pool_static(self._ctx, self.Process,
                                             self._processes,
@@ -309,12 +387,14 @@ def _repopulate_pool(self):
                                             self._outqueue, self._initializer,
                                             self._initargs,
                                             self._maxtasksperchild,
-                                            self._wrap_exception)
+                                            self._wrap_exception,
+                                            self._worker_shared_memory_threshold())
 
     @staticmethod
     def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                                 outqueue, initializer, initargs,
-                                maxtasksperchild, wrap_exception):
+                                maxtasksperchild, wrap_exception,
+                                shared_memory_threshold=None):
         """Bring the number of pool processes up to the specified number,
         for use after reaping workers which have exited.
         """
@@ -323,7 +403,7 @@ def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                         args=(inqueue, outqueue,
                               initializer,
                               initargs, maxtasksperchild,
-                              wrap_exception))
+                              wrap_exception, shared_memory_threshold))
             w.name = w.name.replace('Process', 'PoolWorker')
             w.daemon = True
             w.start()
@@ -333,14 +413,15 @@ def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
     @staticmethod
     def _maintain_pool(ctx, Process, processes, pool, inqueue, outqueue,
                        initializer, initargs, maxtasksperchild,
-                       wrap_exception):
+                       wrap_exception, shared_memory_threshold=None):
         """Clean up any exited workers and start replacements for them.
         """
         if Pool._join_exited_workers(pool):
             Pool._repopulate_pool_static(ctx, Process, processes, pool,
                                          inqueue, outqueue, initializer,
                                          initargs, maxtasksperchild,
-                                         wrap_exception)
+                                         wrap_exception,
+                                         shared_memory_threshold)
 
     def _setup_queues(self):
         self._inqueue = self._ctx.SimpleQueue()
@@ -507,7 +588,7 @@ def _wait_for_updates(sentinels, change_notifier, timeout=None):
     def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
                         pool, inqueue, outqueue, initializer, initargs,
                         maxtasksperchild, wrap_exception, sentinels,
-                        change_notifier):
+                        change_notifier, shared_memory_threshold=None):
         thread = threading.current_thread()
 
         # Keep maintaining workers until the cache gets drained, unless the pool
@@ -515,7 +596,8 @@ def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
         while thread._state == RUN or (cache and thread._state != TERMINATE):
             cls._maintain_pool(ctx, Process, processes, pool, inqueue,
                                outqueue, initializer, initargs,
-                               maxtasksperchild, wrap_exception)
+                               maxtasksperchild, wrap_exception,
+                               shared_memory_threshold)
 
             current_sentinels = [*cls._get_worker_sentinels(pool), *sentinels]
 
@@ -679,7 +761,8 @@ def _help_stuff_finish(inqueue, task_handler, size):
 
     @classmethod
     def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
-                        worker_handler, task_handler, result_handler, cache):
+                        worker_handler, task_handler, result_handler, cache,
+                        shared_memory=None):
         # this is guaranteed to only be called once
         util.debug('finalizing pool')
 
@@ -731,6 +814,10 @@ def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, change_notifier,
                     util.debug('cleaning up worker %d' % p.pid)
                     p.join()
 
+        if shared_memory is not None:
+            util.debug('releasing shared memory')
+            shared_memory.close()
+
     def __enter__(self):
         self._check_running()
         return self
@@ -0,0 +1,5 @@
+"""Python profilers.
+
+The :mod:`profiling.sampling` subpackage implements a statistical profiler
+which samples the stacks of a running process from outside of it.
+"""
@@ -0,0 +1,13 @@
+"""Statistical profiler for running Python processes.
+
+The profiler periodically reads the Python stacks of another process
+through its memory, without stopping it and without any cooperation from
+the profiled code.  Samples are aggregated into pstats-compatible
+statistics or into collapsed stacks suitable for flame graphs.
+"""
+
+from .collector import Collector, PstatsCollector, CollapsedStackCollector
+from .sample import SampleProfiler, sample
+
+__all__ = ("Collector", "PstatsCollector", "CollapsedStackCollector",
+           "SampleProfiler", "sample")
@@ -0,0 +1,5 @@
+"""Command line interface of the sampling profiler."""
+
+from .sample import main
+
+main()
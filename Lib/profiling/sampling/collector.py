@@ -0,0 +1,101 @@
+"""Aggregation of the stack samples."""
+
+import collections
+import marshal
+
+__all__ = ("Collector", "PstatsCollector", "CollapsedStackCollector")
+
+
+class Collector:
+    """Base class of the objects aggregating stack samples.
+
+    A sample is a list of ``(thread_id, frames)`` pairs, where *frames* is a
+    list of ``(filename, firstlineno, function_name)`` tuples, innermost
+    first.
+    """
+
+    def collect(self, stack_frames):
+        """Add a sample."""
+        raise NotImplementedError
+
+    def export(self, filename):
+        """Write the aggregated samples to *filename*."""
+        raise NotImplementedError
+
+
+class PstatsCollector(Collector):
+    """Collector building statistics compatible with :mod:`pstats`.
+
+    The time spent in a function is estimated as the number of samples in
+    which it appears multiplied by the sampling interval.  The call counts
+    of the statistics are numbers of samples.
+    """
+
+    def __init__(self, sample_interval_usec):
+        self.sample_interval_usec = sample_interval_usec
+        self.stats = {}
+        # Number of samples in which a function is running, and in which a
+        # function is on the stack.
+        self._direct = collections.Counter()
+        self._cumulative = collections.Counter()
+        # Same counts for the (caller, callee) pairs.
+        self._edge_direct = collections.Counter()
+        self._edge_cumulative = collections.Counter()
+
+    def collect(self, stack_frames):
+        for thread_id, frames in stack_frames:
+            if not frames:
+                continue
+            self._direct[frames[0]] += 1
+            if len(frames) > 1:
+                self._edge_direct[frames[1], frames[0]] += 1
+            # Recursive functions are only counted once per sample.
+            self._cumulative.update(set(frames))
+            self._edge_cumulative.update(set(zip(frames[1:], frames)))
+
+    def create_stats(self):
+        """Compute the :attr:`stats` dictionary, as used by :mod:`pstats`."""
+        interval = self.sample_interval_usec / 1e6
+        callers = collections.defaultdict(dict)
+        for edge, count in self._edge_cumulative.items():
+            caller, callee = edge
+            direct = self._edge_direct[edge]
+            callers[callee][caller] = (count, count,
+                                       direct * interval, count * interval)
+        self.stats = {
+            func: (count, count, self._direct[func] * interval,
+                   count * interval, callers[func])
+            for func, count in self._cumulative.items()
+        }
+
+    def export(self, filename):
+        """Write the statistics to *filename*, readable by
+        :class:`pstats.Stats`."""
+        self.create_stats()
+        with open(filename, "wb") as f:
+            marshal.dump(self.stats, f)
+
+
+class CollapsedStackCollector(Collector):
+    """Collector counting identical stacks.
+
+    The export format has one line per distinct stack: the frames from the
+    outermost to the innermost one, separated by semicolons, followed by a
+    space and the number of samples.  It is the input format of flame graph
+    tools.
+    """
+
+    def __init__(self):
+        self.stack_counter = collections.Counter()
+
+    def collect(self, stack_frames):
+        for thread_id, frames in stack_frames:
+            if frames:
+                self.stack_counter[tuple(reversed(frames))] += 1
+
+    def export(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            for stack, count in self.stack_counter.items():
+                names = ";".join(f"{file}:{funcname}:{lineno}"
+                                 for file, lineno, funcname in stack)
+                f.write(f"{names} {count}\n")
@@ -0,0 +1,142 @@
+"""Sampling of the stacks of a running process."""
+
+import argparse
+import pstats
+import sys
+import time
+
+import _remote_debugging
+
+from .collector import PstatsCollector, CollapsedStackCollector
+
+__all__ = ("SampleProfiler", "sample", "main")
+
+DEFAULT_SAMPLE_INTERVAL_USEC = 1000
+DEFAULT_DURATION_SEC = 10
+
+
+class SampleProfiler:
+    """Profiler sampling the stacks of the process *pid* every
+    *sample_interval_usec* microseconds.
+
+    With *all_threads* true, all the threads of the process are sampled,
+    otherwise only its main thread is.
+    """
+
+    def __init__(self, pid, sample_interval_usec=DEFAULT_SAMPLE_INTERVAL_USEC,
+                 *, all_threads=False):
+        if sample_interval_usec <= 0:
+            raise ValueError("sample_interval_usec must be positive")
+        self.pid = pid
+        self.sample_interval_usec = sample_interval_usec
+        self.all_threads = all_threads
+        self.unwinder = _remote_debugging.RemoteUnwinder(
+            pid, all_threads=all_threads)
+
+    def sample(self, collector, duration_sec=DEFAULT_DURATION_SEC):
+        """Feed *collector* with samples during *duration_sec* seconds.
+
+        Sampling stops early if the process exits.  Return the number of
+        samples taken and the number of samples which could not be read,
+        since the stacks of the process can change while being read.
+        """
+        interval = self.sample_interval_usec / 1e6
+        start = next_time = time.perf_counter()
+        deadline = start + duration_sec
+        num_samples = num_errors = 0
+        while (now := time.perf_counter()) < deadline:
+            if now < next_time:
+                time.sleep(min(next_time, deadline) - now)
+                continue
+            try:
+                stack_frames = self.unwinder.get_stack_trace()
+            except ProcessLookupError:
+                break
+            except (OSError, RuntimeError, UnicodeDecodeError):
+                num_errors += 1
+            else:
+                collector.collect(stack_frames)
+            num_samples += 1
+            # Do not try to catch up with missed samples.
+            next_time = max(next_time + interval, now)
+        return num_samples, num_errors
+
+
+def sample(pid, *, sample_interval_usec=DEFAULT_SAMPLE_INTERVAL_USEC,
+           duration_sec=DEFAULT_DURATION_SEC, all_threads=False,
+           output_format="pstats", filename=None, sort="cumulative",
+           limit=None):
+    """Profile the process *pid* for *duration_sec* seconds.
+
+    With the ``"pstats"`` *output_format*, the statistics are printed to
+    the standard output sorted by *sort*, or written to *filename* if it is
+    given.  With the ``"collapsed"`` *output_format*, the collapsed stacks
+    are written to *filename*, which defaults to ``collapsed.<pid>.txt``.
+    """
+    if output_format == "pstats":
+        collector = PstatsCollector(sample_interval_usec)
+    elif output_format == "collapsed":
+        collector = CollapsedStackCollector()
+        if filename is None:
+            filename = f"collapsed.{pid}.txt"
+    else:
+        raise ValueError(f"unknown output format: {output_format!r}")
+
+    profiler = SampleProfiler(pid, sample_interval_usec,
+                              all_threads=all_threads)
+    num_samples, num_errors = profiler.sample(collector, duration_sec)
+
+    if filename is not None:
+        collector.export(filename)
+    else:
+        stats = pstats.Stats(collector)
+        stats.sort_stats(sort)
+        if limit is None:
+            stats.print_stats()
+        else:
+            stats.print_stats(limit)
+        print(f"Captured {num_samples} samples, {num_errors} failed.")
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m profiling.sampling",
+        description="Profile a running Python process by sampling its "
+                    "stacks.")
+    parser.add_argument("pid", type=int, help="process to profile")
+    parser.add_argument("-i", "--interval", type=int,
+                        default=DEFAULT_SAMPLE_INTERVAL_USEC,
+                        help="sampling interval in microseconds "
+                             "(default: %(default)s)")
+    parser.add_argument("-d", "--duration", type=float,
+                        default=DEFAULT_DURATION_SEC,
+                        help="sampling duration in seconds "
+                             "(default: %(default)s)")
+    parser.add_argument("-a", "--all-threads", action="store_true",
+                        help="sample all threads, not only the main thread")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--pstats", action="store_const", const="pstats",
+                        dest="format", default="pstats",
+                        help="output pstats statistics (default)")
+    output.add_argument("--collapsed", action="store_const",
+                        const="collapsed", dest="format",
+                        help="output collapsed stacks for flame graphs")
+    parser.add_argument("-o", "--outfile",
+                        help="write the output to this file")
+    parser.add_argument("-s", "--sort", default="cumulative",
+                        choices=sorted(pstats.Stats.sort_arg_dict_default),
+                        help="sort order of the printed statistics "
+                             "(default: %(default)s)")
+    parser.add_argument("-l", "--limit", type=int,
+                        help="maximum number of printed functions")
+    args = parser.parse_args(args)
+    if args.interval <= 0:
+        parser.error("the sampling interval must be positive")
+
+    try:
+        sample(args.pid, sample_interval_usec=args.interval,
+               duration_sec=args.duration, all_threads=args.all_threads,
+               output_format=args.format, filename=args.outfile,
+               sort=args.sort, limit=args.limit)
+    except (OSError, RuntimeError) as exc:
+        sys.exit(f"Cannot profile process {args.pid}: {exc}")
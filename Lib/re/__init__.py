@@ -96,8 +96,10 @@
     compile   Compile a pattern into a Pattern object.
     purge     Clear the regular expression cache.
     escape    Backslash all non-alphanumerics in a string.
+    save_cache  Save compiled patterns to a file.
+    load_cache  Load compiled patterns saved by save_cache.
 
-Each function other than purge and escape can take an optional 'flags' argument
+Each function other than purge, escape, save_cache and load_cache can take an optional 'flags' argument
 consisting of one or more of the following module constants, joined by "|".
 A, L, and U are mutually exclusive.
     A  ASCII       For string patterns, make \w, \W, \b, \B, \d, \D
@@ -134,7 +136,8 @@
     "findall", "finditer", "compile", "purge", "escape",
     "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
-    "UNICODE", "NOFLAG", "RegexFlag", "PatternError"
+    "UNICODE", "NOFLAG", "RegexFlag", "PatternError",
+    "save_cache", "load_cache", "RegexSet",
 ]
 
 __version__ = "2.2.1"
@@ -292,8 +295,76 @@ def purge():
     "Clear the regular expression caches"
     _cache.clear()
     _cache2.clear()
+    _code_cache.clear()
     _compile_template.cache_clear()
 
+def save_cache(file, patterns=None):
+    """Save the compiled code of patterns to file, a file name or a
+    binary file object.
+
+    patterns is an iterable of pattern strings or (pattern, flags) pairs.
+    By default, the patterns of the regular expression cache are saved.
+    The file can be loaded with load_cache() by the same version of Python.
+    """
+    if not hasattr(file, 'write'):
+        with open(file, 'wb') as fp:
+            return save_cache(fp, patterns)
+    import marshal
+    if patterns is None:
+        keys = list(_cache)
+    else:
+        keys = []
+        for pattern in patterns:
+            flags = 0
+            if isinstance(pattern, tuple):
+                pattern, flags = pattern
+            if isinstance(flags, RegexFlag):
+                flags = flags.value
+            if not _compiler.isstring(pattern):
+                raise TypeError("patterns must be strings or "
+                                "(pattern, flags) pairs")
+            keys.append((type(pattern), pattern, flags))
+    entries = []
+    for _, pattern, flags in keys:
+        if flags & DEBUG:
+            continue
+        args = _code_cache.get((type(pattern), pattern, flags))
+        if args is None:
+            args = _compiler.compile_args(pattern, flags)
+            # The code contains opcode constants, which are int subclasses.
+            pattern, pflags, code, *rest = args
+            args = (pattern, pflags, list(map(int, code)), *rest)
+        entries.append((flags, args))
+    file.write(marshal.dumps((_cache_header(), entries)))
+
+def load_cache(file):
+    """Load the compiled code of patterns saved by save_cache() from file,
+    a file name or a binary file object.
+
+    The patterns are then compiled from the loaded code instead of being
+    parsed.  Return the number of loaded patterns, 0 if the file was saved
+    by a different version of Python.  Only load files from trusted sources.
+    """
+    if not hasattr(file, 'read'):
+        with open(file, 'rb') as fp:
+            return load_cache(fp)
+    import marshal
+    try:
+        header, entries = marshal.loads(file.read())
+    except (EOFError, ValueError, TypeError):
+        raise ValueError("not a regular expression cache file") from None
+    if header != _cache_header():
+        return 0
+    for flags, args in entries:
+        pattern = args[0]
+        _code_cache[type(pattern), pattern, flags] = args
+    return len(entries)
+
+def _cache_header():
+    import sys
+    return ('re', sys.hexversion, _sre.MAGIC, _sre.CODESIZE,
+            _sre.MAXREPEAT, _sre.MAXGROUPS)
+
 
 # SPECIAL_CHARS
 # closing ')', '}' and ']'
@@ -323,6 +394,7 @@ def escape(pattern):
 # _cache uses the LRU policy which has better hit rate.
 _cache = {}  # LRU
 _cache2 = {}  # FIFO
+_code_cache = {}  # arguments of _sre.compile() loaded by load_cache()
 _MAXCACHE = 512
 _MAXCACHE2 = 256
 assert _MAXCACHE2 < _MAXCACHE
@@ -347,7 +419,10 @@ def _compile(pattern, flags):
             return pattern
         if not _compiler.isstring(pattern):
             raise TypeError("first argument must be string or compiled pattern")
-        p = _compiler.compile(pattern, flags)
+        args = _code_cache.get(key)
+        if args is None:
+            args = _compiler.compile_args(pattern, flags)
+        p = _sre.compile(*args)
         if flags & DEBUG:
             return p
         if len(_cache) >= _MAXCACHE:
@@ -426,3 +501,92 @@ def scan(self, string):
                 append(action)
             i = j
         return result, string[i:]
+
+
+class RegexSet:
+    """A set of regular expressions matched together.
+
+    The search(), match() and fullmatch() methods return the sorted list of
+    the indices of the patterns matching a string.  Patterns which contain
+    a literal that does not occur in the string are skipped without
+    running them.
+    """
+
+    def __init__(self, patterns, flags=0):
+        if isinstance(flags, RegexFlag):
+            flags = flags.value
+        compiled = []
+        string_type = None
+        for pattern in patterns:
+            p = _compile(pattern, flags)
+            if string_type is None:
+                string_type = type(p.pattern)
+            elif type(p.pattern) is not string_type:
+                raise TypeError("cannot mix str and bytes patterns")
+            compiled.append(p)
+        self.patterns = tuple(compiled)
+
+        # Group the patterns by their longest required literal.
+        literals = {}
+        unfiltered = []
+        for i, p in enumerate(compiled):
+            literal = None
+            if p.pattern is not None and not p.flags & DEBUG:
+                parsed = _parser.parse(p.pattern, p.flags)
+                codes = _compiler._get_required_literal(
+                    parsed, p.flags | parsed.state.flags)
+                if codes:
+                    if string_type is str:
+                        literal = ''.join(map(chr, codes))
+                    else:
+                        literal = bytes(codes)
+            if literal is None:
+                unfiltered.append(i)
+            else:
+                literals.setdefault(literal, []).append(i)
+        self._literals = list(literals.items())
+        self._unfiltered = unfiltered
+        if string_type is bytes:
+            self._string_types = (bytes, bytearray)
+        else:
+            self._string_types = str
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return '<%s.%s with %d patterns>' % (
+            self.__class__.__module__, self.__class__.__qualname__,
+            len(self.patterns))
+
+    def _candidates(self, string):
+        if not isinstance(string, self._string_types):
+            # Let the patterns report the error.
+            return range(len(self.patterns))
+        candidates = self._unfiltered[:]
+        for literal, indices in self._literals:
+            if literal in string:
+                candidates += indices
+        candidates.sort()
+        return candidates
+
+    def search(self, string):
+        """Return the indices of the patterns matching anywhere in the
+        string."""
+        patterns = self.patterns
+        return [i for i in self._candidates(string)
+                if patterns[i].search(string)]
+
+    def match(self, string):
+        """Return the indices of the patterns matching at the beginning of
+        the string."""
+        patterns = self.patterns
+        return [i for i in self._candidates(string)
+                if patterns[i].match(string)]
+
+    def fullmatch(self, string):
+        """Return the indices of the patterns matching all of the
+        string."""
+        patterns = self.patterns
+        return [i for i in self._candidates(string)
+                if patterns[i].fullmatch(string)]
@@ -478,6 +478,48 @@ def _get_literal_prefix(pattern, flags):
         return prefix, prefix_skip, True
     return prefix, prefix_skip, False
 
+def _get_required_literal(pattern, flags):
+    # look for the longest literal which occurs in every match
+    best = []
+    run = []
+    def flush():
+        nonlocal best, run
+        if len(run) > len(best):
+            best = run
+        run = []
+    def visit(pattern, flags):
+        iscased = _get_iscased(flags)
+        for op, av in pattern.data:
+            if op is LITERAL:
+                if iscased and iscased(av):
+                    flush()
+                else:
+                    run.append(av)
+            elif op is SUBPATTERN:
+                group, add_flags, del_flags, p = av
+                flags1 = _combine_flags(flags, add_flags, del_flags)
+                if flags1 & SRE_FLAG_IGNORECASE and flags1 & SRE_FLAG_LOCALE:
+                    flush()
+                else:
+                    visit(p, flags1)
+            elif op is ATOMIC_GROUP:
+                visit(av, flags)
+            elif op in _REPEATING_CODES:
+                min, max, item = av
+                flush()
+                if min >= 1:
+                    visit(item, flags)
+                    flush()
+            elif op is AT or op is ASSERT or op is ASSERT_NOT:
+                # zero-width
+                pass
+            else:
+                flush()
+    if not (flags & SRE_FLAG_IGNORECASE and flags & SRE_FLAG_LOCALE):
+        visit(pattern, flags)
+        flush()
+    return best
+
 def _get_charset_prefix(pattern, flags):
     while True:
         if not pattern.data:
@@ -754,8 +796,8 @@ def print_2(*args):
     dis_(0, len(code))
 
 
-def compile(p, flags=0):
-    # internal: convert pattern list to internal format
+def compile_args(p, flags=0):
+    # internal: convert pattern list to the arguments of _sre.compile()
 
     if isstring(p):
         pattern = p
@@ -775,8 +817,10 @@ def compile(p, flags=0):
     for k, i in groupindex.items():
         indexgroup[i] = k
 
-    return _sre.compile(
-        pattern, flags | p.state.flags, code,
-        p.state.groups-1,
-        groupindex, tuple(indexgroup)
-        )
+    return (pattern, flags | p.state.flags, code,
+            p.state.groups-1,
+            groupindex, tuple(indexgroup))
+
+def compile(p, flags=0):
+    # internal: convert pattern list to internal format
+    return _sre.compile(*compile_args(p, flags))
@@ -53,7 +53,9 @@ class scheduler:
     def __init__(self, timefunc=_time, delayfunc=time.sleep):
         """Initialize a new instance, passing the time and delay
         functions"""
-        self._queue = []
+        self._queue = heapq.IndexedHeap()
+        # Map the sequence numbers of the events to their heap handles.
+        self._handles = {}
         self._lock = threading.RLock()
         self.timefunc = timefunc
         self.delayfunc = delayfunc
@@ -72,7 +74,7 @@ def enterabs(self, time, priority, action, argument=(), kwargs=_sentinel):
         with self._lock:
             event = Event(time, priority, next(self._sequence_generator),
                           action, argument, kwargs)
-            heapq.heappush(self._queue, event)
+            self._handles[event.sequence] = self._queue.push(event, event)
         return event # The ID
 
     def enter(self, delay, priority, action, argument=(), kwargs=_sentinel):
@@ -92,8 +94,11 @@ def cancel(self, event):
 
         """
         with self._lock:
-            self._queue.remove(event)
-            heapq.heapify(self._queue)
+            handle = self._handles.get(event.sequence)
+            if handle is None or handle.value != event:
+                raise ValueError('event not in queue')
+            self._queue.remove(handle)
+            del self._handles[event.sequence]
 
     def empty(self):
         """Check whether the queue is empty."""
@@ -128,21 +133,22 @@ def run(self, blocking=True):
         # and to improve thread safety
         lock = self._lock
         q = self._queue
+        handles = self._handles
         delayfunc = self.delayfunc
         timefunc = self.timefunc
-        pop = heapq.heappop
         while True:
             with lock:
                 if not q:
                     break
                 (time, priority, sequence, action,
-                 argument, kwargs) = q[0]
+                 argument, kwargs) = q.peek()[1]
                 now = timefunc()
                 if time > now:
                     delay = True
                 else:
                     delay = False
-                    pop(q)
+                    q.pop()
+                    del handles[sequence]
             if delay:
                 if not blocking:
                     return time - now
@@ -159,9 +165,9 @@ def queue(self):
             time, priority, action, arguments, kwargs
 
         """
-        # Use heapq to sort the queue rather than using 'sorted(self._queue)'.
-        # With heapq, two events scheduled at the same time will show in
-        # the actual order they would be retrieved.
+        # The sequence numbers are unique, so events scheduled at the same
+        # time are sorted in the actual order they would be retrieved.
         with self._lock:
-            events = self._queue[:]
-        return list(map(heapq.heappop, [events]*len(events)))
+            events = [handle.value for handle in self._handles.values()]
+        events.sort()
+        return events
@@ -44,11 +44,18 @@
 else:
     _winapi = None
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 COPY_BUFSIZE = 1024 * 1024 if _WINDOWS else 256 * 1024
 # This should never be removed, see rationale in:
 # https://bugs.python.org/issue43743#msg393429
 _USE_CP_SENDFILE = (hasattr(os, "sendfile")
                     and sys.platform.startswith(("linux", "android", "sunos")))
+_USE_CP_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_USE_CP_FICLONE = hasattr(fcntl, "FICLONE")
 _HAS_FCOPYFILE = posix and hasattr(posix, "_fcopyfile")  # macOS
 
 # CMD defaults in Windows 10
@@ -107,6 +114,89 @@ def _fastcopy_fcopyfile(fsrc, fdst, flags):
         else:
             raise err from None
 
+def _fastcopy_ficlone(fsrc, fdst):
+    """Make fdst share the data of fsrc by using the FICLONE ioctl (Linux).
+    The data is only copied when one of the files is later modified.
+    This works on filesystems supporting reflinks, such as Btrfs and XFS.
+    """
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    try:
+        fcntl.ioctl(outfd, fcntl.FICLONE, infd)
+    except OSError as err:
+        err.filename = fsrc.name
+        err.filename2 = fdst.name
+        if err.errno == errno.ENOSPC:  # filesystem is full
+            raise err from None
+        # Reflinks are not supported by the filesystem, or the files are
+        # on different filesystems.  Nothing has been written.
+        raise _GiveupOnFastCopy(err)
+
+def _determine_linux_fastcopy_blocksize(infd):
+    """Determine blocksize for fastcopying on Linux.
+
+    Hopefully the whole file will be copied in a single call.
+    The copying itself should be performed in a loop 'till EOF is
+    reached (0 return) so a blocksize smaller or bigger than the actual
+    file size should not make any difference, also in case the file
+    content changes while being copied.
+    """
+    try:
+        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8 MiB
+    except OSError:
+        blocksize = 2 ** 27  # 128 MiB
+    # On 32-bit architectures truncate to 1 GiB to avoid OverflowError,
+    # see bpo-38319.
+    if sys.maxsize < 2 ** 32:
+        blocksize = min(blocksize, 2 ** 30)
+    return blocksize
+
+def _fastcopy_copy_file_range(fsrc, fdst):
+    """Copy data from one regular mmap-like fd to another by using
+    a high-performance copy_file_range(2) syscall that gives filesystems
+    an opportunity to implement the use of reflinks or server-side copy.
+    This should work on Linux >= 4.5 only.
+    """
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    blocksize = _determine_linux_fastcopy_blocksize(infd)
+    offset = 0
+    while True:
+        try:
+            n_copied = os.copy_file_range(infd, outfd, blocksize,
+                                          offset_dst=offset)
+        except OSError as err:
+            # ...in order to have a more informative exception.
+            err.filename = fsrc.name
+            err.filename2 = fdst.name
+
+            if err.errno == errno.ENOSPC:  # filesystem is full
+                raise err from None
+
+            # Give up on first call and if no data was copied.
+            if offset == 0 and os.lseek(outfd, 0, os.SEEK_CUR) == 0:
+                raise _GiveupOnFastCopy(err)
+
+            raise err
+        else:
+            if n_copied == 0:
+                # If no bytes have been copied yet, copy_file_range
+                # might silently fail, for instance with files of
+                # virtual filesystems such as /proc reporting a size of
+                # zero.  Let the next method copy the file.
+                if offset == 0:
+                    raise _GiveupOnFastCopy()
+                break
+            offset += n_copied
+
 def _fastcopy_sendfile(fsrc, fdst):
     """Copy data from one regular mmap-like fd to another by using
     high-performance sendfile(2) syscall.
@@ -128,20 +218,7 @@ def _fastcopy_sendfile(fsrc, fdst):
     except Exception as err:
         raise _GiveupOnFastCopy(err)  # not a regular file
 
-    # Hopefully the whole file will be copied in a single call.
-    # sendfile() is called in a loop 'till EOF is reached (0 return)
-    # so a bufsize smaller or bigger than the actual file size
-    # should not make any difference, also in case the file content
-    # changes while being copied.
-    try:
-        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8MiB
-    except OSError:
-        blocksize = 2 ** 27  # 128MiB
-    # On 32-bit architectures truncate to 1GiB to avoid OverflowError,
-    # see bpo-38319.
-    if sys.maxsize < 2 ** 32:
-        blocksize = min(blocksize, 2 ** 30)
-
+    blocksize = _determine_linux_fastcopy_blocksize(infd)
     offset = 0
     while True:
         try:
@@ -266,12 +343,28 @@ def copyfile(src, dst, *, follow_symlinks=True):
                         except _GiveupOnFastCopy:
                             pass
                     # Linux / Android / Solaris
-                    elif _USE_CP_SENDFILE:
-                        try:
-                            _fastcopy_sendfile(fsrc, fdst)
-                            return dst
-                        except _GiveupOnFastCopy:
-                            pass
+                    elif (_USE_CP_FICLONE or _USE_CP_COPY_FILE_RANGE or
+                          _USE_CP_SENDFILE):
+                        # reflink, then copy offloaded to the filesystem,
+                        # then in-kernel copy
+                        if _USE_CP_FICLONE:
+                            try:
+                                _fastcopy_ficlone(fsrc, fdst)
+                                return dst
+                            except _GiveupOnFastCopy:
+                                pass
+                        if _USE_CP_COPY_FILE_RANGE:
+                            try:
+                                _fastcopy_copy_file_range(fsrc, fdst)
+                                return dst
+                            except _GiveupOnFastCopy:
+                                pass
+                        if _USE_CP_SENDFILE:
+                            try:
+                                _fastcopy_sendfile(fsrc, fdst)
+                                return dst
+                            except _GiveupOnFastCopy:
+                                pass
                     # Windows, see:
                     # https://github.com/python/cpython/pull/7160#discussion_r195405230
                     elif _WINDOWS and file_size > 0:
@@ -479,8 +572,61 @@ def _ignore_patterns(path, names):
         return set(ignored_names)
     return _ignore_patterns
 
+class _ParallelCopy:
+    """State of a copytree() copying files with a pool of threads.
+
+    At most *limit* file copies are pending at any time.  The metadata of
+    the directories is copied at the end, once all their files have been
+    written.
+    """
+
+    def __init__(self, executor, limit):
+        self.executor = executor
+        self.limit = limit
+        self.pending = collections.deque()
+        self.dirs = []
+        self.errors = []
+
+    def copy(self, copy_function, srcobj, srcname, dstname):
+        future = self.executor.submit(copy_function, srcobj, dstname)
+        self.pending.append((future, srcname, dstname))
+        while len(self.pending) > self.limit:
+            self._wait_oldest()
+
+    def _wait_oldest(self):
+        future, srcname, dstname = self.pending.popleft()
+        try:
+            future.result()
+        except Error as err:
+            self.errors.extend(err.args[0])
+        except OSError as why:
+            self.errors.append((srcname, dstname, str(why)))
+
+    def finish(self):
+        while self.pending:
+            self._wait_oldest()
+        # Subdirectories come before their parent directory.
+        for src, dst in self.dirs:
+            try:
+                copystat(src, dst)
+            except OSError as why:
+                # Copying file access times may fail on Windows
+                if getattr(why, 'winerror', None) is None:
+                    self.errors.append((src, dst, str(why)))
+
+def _copysubtree(src, dst, symlinks, ignore, copy_function,
+                 ignore_dangling_symlinks, dirs_exist_ok, parallel):
+    if parallel is None:
+        return copytree(src, dst, symlinks, ignore, copy_function,
+                        ignore_dangling_symlinks, dirs_exist_ok)
+    sys.audit("shutil.copytree", src, dst)
+    with os.scandir(src) as itr:
+        entries = list(itr)
+    return _copytree(entries, src, dst, symlinks, ignore, copy_function,
+                     ignore_dangling_symlinks, dirs_exist_ok, parallel)
+
 def _copytree(entries, src, dst, symlinks, ignore, copy_function,
-              ignore_dangling_symlinks, dirs_exist_ok=False):
+              ignore_dangling_symlinks, dirs_exist_ok=False, parallel=None):
     if ignore is not None:
         ignored_names = ignore(os.fspath(src), [x.name for x in entries])
     else:
@@ -518,14 +664,18 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
                         continue
                     # otherwise let the copy occur. copy2 will raise an error
                     if srcentry.is_dir():
-                        copytree(srcobj, dstname, symlinks, ignore,
-                                 copy_function, ignore_dangling_symlinks,
-                                 dirs_exist_ok)
+                        _copysubtree(srcobj, dstname, symlinks, ignore,
+                                     copy_function, ignore_dangling_symlinks,
+                                     dirs_exist_ok, parallel)
+                    elif parallel is not None:
+                        parallel.copy(copy_function, srcobj, srcname, dstname)
                     else:
                         copy_function(srcobj, dstname)
             elif srcentry.is_dir():
-                copytree(srcobj, dstname, symlinks, ignore, copy_function,
-                         ignore_dangling_symlinks, dirs_exist_ok)
+                _copysubtree(srcobj, dstname, symlinks, ignore, copy_function,
+                             ignore_dangling_symlinks, dirs_exist_ok, parallel)
+            elif parallel is not None:
+                parallel.copy(copy_function, srcobj, srcname, dstname)
             else:
                 # Will raise a SpecialFileError for unsupported file types
                 copy_function(srcobj, dstname)
@@ -535,6 +685,10 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
             errors.extend(err.args[0])
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
+    if parallel is not None:
+        parallel.errors.extend(errors)
+        parallel.dirs.append((src, dst))
+        return dst
     try:
         copystat(src, dst)
     except OSError as why:
@@ -546,7 +700,8 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
     return dst
 
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False, dirs_exist_ok=False):
+             ignore_dangling_symlinks=False, dirs_exist_ok=False, *,
+             workers=1):
     """Recursively copy a directory tree and return the destination directory.
 
     If exception(s) occur, an Error is raised with a list of reasons.
@@ -584,14 +739,35 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     operation will continue if it encounters existing directories, and files
     within the `dst` tree will be overwritten by corresponding files from the
     `src` tree.
+
+    If workers is greater than 1, the files are copied concurrently by a
+    pool of that many threads, so copy_function must be thread-safe.  The
+    tree is still walked, and the directories created, in the calling
+    thread.  The metadata of the directories is copied once all the files
+    have been copied.
     """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
     sys.audit("shutil.copytree", src, dst)
     with os.scandir(src) as itr:
         entries = list(itr)
-    return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
-                     ignore=ignore, copy_function=copy_function,
-                     ignore_dangling_symlinks=ignore_dangling_symlinks,
-                     dirs_exist_ok=dirs_exist_ok)
+    if workers == 1:
+        return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
+                         ignore=ignore, copy_function=copy_function,
+                         ignore_dangling_symlinks=ignore_dangling_symlinks,
+                         dirs_exist_ok=dirs_exist_ok)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(workers) as executor:
+        parallel = _ParallelCopy(executor, 4 * workers)
+        _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
+                  ignore=ignore, copy_function=copy_function,
+                  ignore_dangling_symlinks=ignore_dangling_symlinks,
+                  dirs_exist_ok=dirs_exist_ok, parallel=parallel)
+        parallel.finish()
+    if parallel.errors:
+        raise Error(parallel.errors)
+    return dst
 
 if hasattr(os.stat_result, 'st_file_attributes'):
     def _rmtree_islink(st):
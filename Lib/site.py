@@ -684,6 +684,17 @@ def execusercustomize():
                 (err.__class__.__name__, err))
 
 
+def enablelazyimports():
+    """Enable lazy imports if requested by the -X lazy_imports option or
+    the PYTHONLAZYIMPORTS environment variable."""
+    value = sys._xoptions.get('lazy_imports')
+    if value is None and not sys.flags.ignore_environment:
+        value = os.environ.get('PYTHONLAZYIMPORTS')
+    if value:
+        import importlib.util
+        importlib.util._enable_lazy_imports_from_option(value)
+
+
 def main():
     """Add standard site-specific directories to the module search path.
 
@@ -712,6 +723,7 @@ def main():
     execsitecustomize()
     if ENABLE_USER_SITE:
         execusercustomize()
+    enablelazyimports()
 
 # Prevent extending of sys.path when python was started with -S and
 # site is imported later.
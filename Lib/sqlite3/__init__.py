@@ -55,3 +55,18 @@
 """
 
 from sqlite3.dbapi2 import *
+
+
+def __dir__():
+    return sorted({*globals(), 'ConnectionPool'})
+
+
+def __getattr__(name):
+    # Import the pool lazily, it needs the threading module.
+    global ConnectionPool
+
+    if name == 'ConnectionPool':
+        from sqlite3.pool import ConnectionPool
+        return ConnectionPool
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,213 @@
+"""A pool of SQLite connections shared by threads.
+
+A ConnectionPool opens up to max_readers read-only connections and one
+connection for writing.  In WAL mode, SQLite lets readers run concurrently
+with the writer, so threads only wait for each other when they write.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlite3.dbapi2 import connect, OperationalError, ProgrammingError
+
+__all__ = ["ConnectionPool"]
+
+
+class ConnectionPool:
+    """Pool of connections to the SQLite database *database*.
+
+    Connections are opened on demand: at most *max_readers* read-only
+    connections, handed out by reader(), and a single connection for
+    writing, handed out by writer().  Waiting for a connection raises
+    OperationalError after *timeout* seconds, which is also the busy
+    timeout of the connections.
+
+    If *wal* is true, the database is switched to WAL mode so that readers
+    do not block the writer.  The SQL statements of *prepare* are compiled
+    into the statement cache of each new connection.  Other keyword
+    arguments are passed to sqlite3.connect(); connections are created with
+    check_same_thread=False since they are shared by threads.
+    """
+
+    def __init__(self, database, *, max_readers=4, timeout=5.0, wal=True,
+                 prepare=(), **kwargs):
+        if max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+        if database in ("", ":memory:", b"", b":memory:"):
+            raise ValueError("cannot pool connections to a private "
+                             "in-memory or temporary database")
+        kwargs["timeout"] = timeout
+        kwargs["check_same_thread"] = False
+        self._database = database
+        self._kwargs = kwargs
+        self._max_readers = max_readers
+        self._timeout = timeout
+        self._prepare = tuple(prepare)
+        self._closed = False
+
+        self._cond = threading.Condition()
+        # Idle read-only connections, the most recently used last to keep
+        # their caches warm, and the number of open read-only connections.
+        self._idle = []
+        self._num_readers = 0
+        self._writer_lock = threading.Lock()
+        self._writer = None
+
+        if wal:
+            # The journal mode is persistent: set it once with the writer
+            # before any reader connects.
+            self._writer = self._connect()
+            try:
+                self._writer.execute("PRAGMA journal_mode=WAL")
+            except BaseException:
+                self._writer.close()
+                raise
+
+    def __repr__(self):
+        return "<%s database=%r readers=%d/%d>" % (
+            type(self).__name__, self._database, self._num_readers,
+            self._max_readers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self, readonly=False):
+        cx = connect(self._database, **self._kwargs)
+        try:
+            if readonly:
+                cx.execute("PRAGMA query_only=ON")
+            for sql in self._prepare:
+                cx._prepare(sql)
+        except BaseException:
+            cx.close()
+            raise
+        return cx
+
+    def _check_closed(self):
+        if self._closed:
+            raise ProgrammingError("Cannot operate on a closed pool.")
+
+    def _get_timeout(self, timeout):
+        return self._timeout if timeout is None else timeout
+
+    def _acquire_reader(self, timeout):
+        deadline = time.monotonic() + self._get_timeout(timeout)
+        with self._cond:
+            while True:
+                self._check_closed()
+                if self._idle:
+                    return self._idle.pop()
+                if self._num_readers < self._max_readers:
+                    self._num_readers += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise OperationalError(
+                        "timed out waiting for a reader connection")
+                self._cond.wait(remaining)
+        try:
+            return self._connect(readonly=True)
+        except BaseException:
+            with self._cond:
+                self._num_readers -= 1
+                self._cond.notify()
+            raise
+
+    def _release_reader(self, cx):
+        try:
+            if cx.in_transaction:
+                cx.rollback()
+        except BaseException:
+            cx.close()
+            with self._cond:
+                self._num_readers -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            if not self._closed:
+                self._idle.append(cx)
+                self._cond.notify()
+                return
+            self._num_readers -= 1
+        cx.close()
+
+    @contextmanager
+    def reader(self, timeout=None):
+        """Context manager returning a read-only connection of the pool.
+
+        The connection returns to the pool at the end of the with block;
+        a transaction left open is rolled back.
+        """
+        cx = self._acquire_reader(timeout)
+        try:
+            yield cx
+        finally:
+            self._release_reader(cx)
+
+    @contextmanager
+    def writer(self, timeout=None):
+        """Context manager returning the connection used for writing.
+
+        Only one thread at a time holds the writer.  The transaction is
+        committed at the end of the with block, or rolled back if an
+        exception was raised.
+        """
+        self._check_closed()
+        if not self._writer_lock.acquire(timeout=self._get_timeout(timeout)):
+            raise OperationalError("timed out waiting for the writer "
+                                   "connection")
+        try:
+            self._check_closed()
+            if self._writer is None:
+                self._writer = self._connect()
+            cx = self._writer
+            with cx:
+                yield cx
+        finally:
+            if self._closed and self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._writer_lock.release()
+
+    def read(self, func, /, *args, **kwargs):
+        """Call func(connection, *args, **kwargs) with a reader connection
+        and return its result.
+
+        It can be run from asyncio with asyncio.to_thread(pool.read, ...).
+        """
+        with self.reader() as cx:
+            return func(cx, *args, **kwargs)
+
+    def write(self, func, /, *args, **kwargs):
+        """Call func(connection, *args, **kwargs) with the writer
+        connection in a transaction and return its result.
+
+        It can be run from asyncio with asyncio.to_thread(pool.write, ...).
+        """
+        with self.writer() as cx:
+            return func(cx, *args, **kwargs)
+
+    def close(self):
+        """Close the connections of the pool.
+
+        Connections in use are closed when they are returned.
+        """
+        with self._cond:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._num_readers -= len(idle)
+            self._cond.notify_all()
+        for cx in idle:
+            cx.close()
+        if self._writer_lock.acquire(blocking=False):
+            try:
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+            finally:
+                self._writer_lock.release()
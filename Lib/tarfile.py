@@ -67,7 +67,7 @@
            "DEFAULT_FORMAT", "open","fully_trusted_filter", "data_filter",
            "tar_filter", "FilterError", "AbsoluteLinkError",
            "OutsideDestinationError", "SpecialFileError", "AbsolutePathError",
-           "LinkOutsideDestinationError"]
+           "LinkOutsideDestinationError", "TarIndex"]
 
 
 #---------------------------------------------------------
@@ -1694,7 +1694,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None, stream=False):
+            errorlevel=None, copybufsize=None, stream=False, index=None):
         """Open an (uncompressed) tar archive 'name'. 'mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. 'mode'
@@ -1702,10 +1702,19 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
            If 'fileobj' is given, it is used for reading or writing data. If it
            can be determined, 'mode' is overridden by 'fileobj's mode.
            'fileobj' is not closed, when TarFile is closed.
+           If 'index' is a TarIndex of the archive, getmember() reads the
+           member's header at the offset recorded in the index instead of
+           scanning the archive.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
             raise ValueError("mode must be 'r', 'a', 'w' or 'x'")
+        if index is not None:
+            if mode != "r":
+                raise ValueError("index can only be used in mode 'r'")
+            if isinstance(fileobj, _Stream):
+                raise ValueError("index cannot be used with a stream")
+        self._index = index
         self.mode = mode
         self._mode = modes[mode]
 
@@ -2037,7 +2046,10 @@ def getmember(self, name):
            than once in the archive, its last occurrence is assumed to be the
            most up-to-date version.
         """
-        tarinfo = self._getmember(name.rstrip('/'))
+        if self._index is not None and not self._loaded:
+            tarinfo = self._getmember_indexed(name.rstrip('/'))
+        else:
+            tarinfo = self._getmember(name.rstrip('/'))
         if tarinfo is None:
             raise KeyError("filename %r not found" % name)
         return tarinfo
@@ -2305,7 +2317,7 @@ def _get_filter_function(self, filter):
             raise ValueError(f"filter {filter!r} not found") from None
 
     def extractall(self, path=".", members=None, *, numeric_owner=False,
-                   filter=None):
+                   filter=None, workers=1):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. 'path' specifies a different directory
@@ -2317,24 +2329,36 @@ def extractall(self, path=".", members=None, *, numeric_owner=False,
            before extraction.
            It can return a changed TarInfo or None to skip the member.
            String names of common filters are accepted.
+
+           If 'workers' is greater than 1 and the archive is an uncompressed
+           file opened by name, regular files are extracted by that many
+           threads.
         """
-        directories = []
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
 
         filter_function = self._get_filter_function(filter)
         if members is None:
             members = self
 
-        for member in members:
-            tarinfo = self._get_extract_tarinfo(member, filter_function, path)
-            if tarinfo is None:
-                continue
-            if tarinfo.isdir():
-                # For directories, delay setting attributes until later,
-                # since permissions can interfere with extraction and
-                # extracting contents can reset mtime.
-                directories.append(tarinfo)
-            self._extract_one(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                              numeric_owner=numeric_owner)
+        if workers > 1 and self._can_reopen():
+            directories = self._extractall_parallel(members, path,
+                                                    filter_function,
+                                                    numeric_owner, workers)
+        else:
+            directories = []
+            for member in members:
+                tarinfo = self._get_extract_tarinfo(member, filter_function,
+                                                    path)
+                if tarinfo is None:
+                    continue
+                if tarinfo.isdir():
+                    # For directories, delay setting attributes until later,
+                    # since permissions can interfere with extraction and
+                    # extracting contents can reset mtime.
+                    directories.append(tarinfo)
+                self._extract_one(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                                  numeric_owner=numeric_owner)
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name, reverse=True)
@@ -2349,6 +2373,84 @@ def extractall(self, path=".", members=None, *, numeric_owner=False,
             except ExtractError as e:
                 self._handle_nonfatal_error(e)
 
+    def _can_reopen(self):
+        """Return True if the archive can be read through another file
+           object opened by name, that is if it is an uncompressed file.
+        """
+        return (self.name is not None and
+                isinstance(self.fileobj, io.BufferedReader) and
+                os.path.isfile(self.name))
+
+    def _extractall_parallel(self, members, path, filter_function,
+                             numeric_owner, workers):
+        """Extract the regular files of 'members' in a pool of 'workers'
+           threads and the other members in this thread. Return the list
+           of the extracted directories.
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Each thread extracts through a shallow copy of the TarFile which
+        # reads the archive with its own file object.
+        local = threading.local()
+        files = []
+
+        def extract(tarinfo):
+            worker = getattr(local, "tarfile", None)
+            if worker is None:
+                worker = copy.copy(self)
+                worker.fileobj = bltn_open(self.name, "rb")
+                files.append(worker.fileobj)
+                local.tarfile = worker
+            worker._extract_one(tarinfo, path, set_attrs=True,
+                                numeric_owner=numeric_owner)
+
+        directories = []
+        pending = {}
+
+        def wait():
+            while pending:
+                pending.pop(next(iter(pending))).result()
+
+        try:
+            with ThreadPoolExecutor(workers) as executor:
+                try:
+                    for member in members:
+                        tarinfo = self._get_extract_tarinfo(
+                            member, filter_function, path)
+                        if tarinfo is None:
+                            continue
+                        key = os.path.normpath(tarinfo.name)
+                        if tarinfo.isreg():
+                            if key in pending:
+                                # A later member replaces the pending one.
+                                wait()
+                            while len(pending) >= 4 * workers:
+                                pending.pop(next(iter(pending))).result()
+                            pending[key] = executor.submit(extract, tarinfo)
+                            continue
+                        if tarinfo.isdir():
+                            # Directories may be created concurrently with
+                            # the files they contain, their attributes are
+                            # set at the end.
+                            directories.append(tarinfo)
+                            self._extract_one(tarinfo, path, set_attrs=False,
+                                              numeric_owner=numeric_owner)
+                            continue
+                        # Links, devices and other members may refer to or
+                        # replace the pending files.
+                        wait()
+                        self._extract_one(tarinfo, path, set_attrs=True,
+                                          numeric_owner=numeric_owner)
+                    wait()
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            for fileobj in files:
+                fileobj.close()
+        return directories
+
     def extract(self, member, path="", set_attrs=True, *, numeric_owner=False,
                 filter=None):
         """Extract a member from the archive to the current working directory,
@@ -2759,6 +2861,27 @@ def _getmember(self, name, tarinfo=None, normalize=False):
             # Starting point was not found
             raise ValueError(tarinfo)
 
+    def _getmember_indexed(self, name):
+        """Read the member 'name' at the offset recorded in the index.
+        """
+        self._check("r")
+        entry = self._index._members.get(name)
+        if entry is None:
+            return None
+        offset, size = entry
+        # next() seeks back to self.offset when it is called again.
+        position = self.offset
+        try:
+            self.fileobj.seek(offset)
+            tarinfo = self.tarinfo.fromtarfile(self)
+        except HeaderError as e:
+            raise ReadError("index does not match the archive: %s" % e) from None
+        finally:
+            self.offset = position
+        if tarinfo.name != name or tarinfo.size != size:
+            raise ReadError("index does not match the archive: %r" % name)
+        return tarinfo
+
     def _load(self):
         """Read through the entire archive file and look for readable
            members. This should not run if the file is set to stream.
@@ -2847,6 +2970,82 @@ def __exit__(self, type, value, traceback):
                 self.fileobj.close()
             self.closed = True
 
+#--------------
+# member index
+#--------------
+
+class TarIndex:
+    """Index of the members of a tar archive.
+
+    The index maps the name of each member to the offset of its header in
+    the uncompressed archive.  Passing it to TarFile lets getmember() read
+    the header of a member directly instead of scanning all the headers
+    before it.
+
+    Use TarIndex.build() to scan an archive, and save() and load() to store
+    the index.
+    """
+
+    def __init__(self, members):
+        # Map of member names to (offset, size) pairs.  If a name occurs
+        # more than once, the last member wins, as in TarFile.getmember().
+        self._members = members
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, name):
+        return name.rstrip("/") in self._members
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __repr__(self):
+        return "<%s members=%d>" % (type(self).__name__, len(self._members))
+
+    @classmethod
+    def build(cls, file):
+        """Build the index of a tar archive.
+
+        file is a file name or a TarFile opened for reading.  Compressed
+        archives are supported, offsets are positions in the uncompressed
+        data.
+        """
+        if isinstance(file, TarFile):
+            return cls({tarinfo.name: (tarinfo.offset, tarinfo.size)
+                        for tarinfo in file})
+        with TarFile.open(file) as tar:
+            return cls.build(tar)
+
+    def save(self, file):
+        """Write the index to file, a file name or a binary file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "wb") as fp:
+                self.save(fp)
+            return
+        import json
+        members = [[name, offset, size]
+                   for name, (offset, size) in self._members.items()]
+        data = json.dumps({"version": 1, "members": members})
+        file.write(data.encode("ascii"))
+
+    @classmethod
+    def load(cls, file):
+        """Read an index written by save() from file, a file name or a
+        binary file object."""
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "rb") as fp:
+                return cls.load(fp)
+        import json
+        try:
+            data = json.loads(file.read())
+            if data["version"] != 1:
+                raise ValueError
+            return cls({name: (offset, size)
+                        for name, offset, size in data["members"]})
+        except (ValueError, TypeError, KeyError):
+            raise ValueError("Not a tar index file") from None
+
 #--------------------
 # exported functions
 #--------------------
@@ -3123,6 +3123,43 @@ def errback(exc):
         p.close()
         p.join()
 
+def concat(a, b):
+    return a + b
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestPoolSharedMemory(BaseTestCase):
+    ALLOWED_TYPES = ('processes', )
+
+    def test_shared_memory_threshold(self):
+        big = bytes(range(256)) * 100
+        with self.Pool(2, shared_memory_threshold=1024) as p:
+            self.assertEqual(p.apply(concat, (big, b'x')), big + b'x')
+            self.assertEqual(p.apply(concat, ([big], [bytearray(big)])),
+                             [big, bytearray(big)])
+            self.assertEqual(p.map(len, [big, b'x'] * 10, chunksize=3),
+                             [len(big), 1] * 10)
+            self.assertEqual(list(p.imap(len, [{1: big}] * 5)), [1] * 5)
+            self.assertRaises(Exception, p.apply, concat, (big, lambda: 1))
+            self.assertEqual(p.apply(concat, (b'x', b'y')), b'xy')
+            # All the tasks are done, no segment is in use anymore.
+            self.assertEqual(p._shared_memory._segments, {})
+            names = [segment.name
+                     for segments in p._shared_memory._segment_pool._free.values()
+                     for segment in segments]
+            self.assertTrue(names)
+            p.close()
+            p.join()
+        # The segments kept for reuse are destroyed with the pool.
+        for name in names:
+            self.assertRaises(FileNotFoundError,
+                              shared_memory.SharedMemory, name)
+
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(TypeError):
+            self.Pool(2, shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.Pool(2, shared_memory_threshold=0)
+
 class _TestPoolWorkerLifetime(BaseTestCase):
     ALLOWED_TYPES = ('processes', )
 
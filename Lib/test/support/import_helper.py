@@ -172,12 +172,16 @@ def import_fresh_module(name, fresh=(), blocked=(), *,
         try:
             with frozen_modules(usefrozen):
                 # Return None when one of the "fresh" modules can not be imported.
+                # vars() executes the modules imported lazily (-X lazy_imports)
+                # while the fresh and blocked modules are in place.
                 try:
                     for modname in fresh:
-                        __import__(modname)
+                        vars(importlib.import_module(modname))
                 except ImportError:
                     return None
-                return importlib.import_module(name)
+                module = importlib.import_module(name)
+                vars(module)
+                return module
         finally:
             _save_and_remove_modules(names)
             sys.modules.update(orig_modules)
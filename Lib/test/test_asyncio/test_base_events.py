@@ -4,6 +4,7 @@
 import errno
 import math
 import platform
+import random
 import socket
 import sys
 import threading
@@ -488,6 +489,124 @@ def cb():
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def set_fake_time(self, now):
+        self.now = now
+        self.loop.time = lambda: self.now
+        self.loop._process_events = mock.Mock()
+
+    def test_timer_wheel(self):
+        self.set_fake_time(1000.0)
+        self.loop.set_timer_wheel(0.01)
+        calls = []
+        delays = [0, 0.5, 0.52, 30, 100, 5000, 1e6]
+        for delay in delays:
+            self.loop.call_later(delay, calls.append, delay)
+        self.assertEqual(self.loop.get_timer_stats(),
+                         {'heap': 1, 'heap_cancelled': 0,
+                          'wheel': 6, 'wheel_cancelled': 0,
+                          'wheel_resolution': 0.01})
+
+        previous = 0
+        for delay in delays:
+            # The loop wakes up when the wheel has timers to move to the
+            # heap, at the latest when the next timer is due.
+            self.loop._run_once()
+            select_timeout = self.loop._selector.select.call_args[0][0]
+            self.assertLessEqual(select_timeout, delay - previous)
+            self.now = 1000.0 + delay
+            self.loop._run_once()
+            self.assertEqual(calls[-1], delay)
+            previous = delay
+        self.assertEqual(calls, delays)
+        self.assertEqual(self.loop.get_timer_stats()['wheel'], 0)
+        self.assertEqual(self.loop._scheduled, [])
+
+    def test_timer_wheel_order(self):
+        # Timers run at the same iterations as with the heap only.
+        rng = random.Random(0)
+        self.set_fake_time(1000.0)
+        self.loop.set_timer_wheel(0.01)
+        when = [1000.0 + rng.expovariate(1 / rng.choice([0.1, 10, 1000]))
+                for i in range(2000)]
+        calls = []
+        handles = [self.loop.call_at(t, calls.append, t) for t in when]
+        for handle in rng.sample(handles, 500):
+            handle.cancel()
+            when.remove(handle.when())
+        for i in range(300):
+            self.now += rng.expovariate(1 / rng.choice([0.001, 1, 100]))
+            self.loop._run_once()
+            self.loop._run_once()
+            end_time = self.now + self.loop._clock_resolution
+            self.assertEqual(calls, sorted(t for t in when if t < end_time))
+        self.now = max(when) + 1
+        self.loop._run_once()
+        self.loop._run_once()
+        self.assertEqual(calls, sorted(when))
+        self.assertFalse(any(handle._scheduled for handle in handles))
+
+    def test_timer_wheel_cancel(self):
+        self.set_fake_time(1000.0)
+        self.loop.set_timer_wheel(0.25)
+        cb = mock.Mock()
+        self.loop.call_later(10, cb)
+        handles = [self.loop.call_later(60.1, cb) for i in range(200)]
+        for h in handles[:50]:
+            h.cancel()
+        stats = self.loop.get_timer_stats()
+        self.assertEqual(stats['wheel'], 201)
+        self.assertEqual(stats['wheel_cancelled'], 50)
+        self.assertEqual(stats['heap_cancelled'], 0)
+
+        # Cancelled timers are dropped when their slot is reached.
+        self.now += 60
+        self.loop._run_once()
+        stats = self.loop.get_timer_stats()
+        self.assertEqual(stats['heap'], 150)
+        self.assertEqual(stats['wheel'], 0)
+        self.assertEqual(stats['wheel_cancelled'], 0)
+        self.assertEqual(stats['heap_cancelled'], 0)
+        self.assertFalse(handles[0]._scheduled)
+        self.assertEqual(cb.call_count, 1)
+        self.now += 0.1
+        self.loop._run_once()
+        self.assertEqual(cb.call_count, 151)
+
+        # The wheel is purged when most of its timers are cancelled.
+        handles = [self.loop.call_later(60, cb) for i in range(200)]
+        for h in handles[:150]:
+            h.cancel()
+        self.loop._run_once()
+        stats = self.loop.get_timer_stats()
+        self.assertEqual(stats['wheel'], 50)
+        self.assertEqual(stats['wheel_cancelled'], 0)
+
+    def test_set_timer_wheel(self):
+        self.set_fake_time(1000.0)
+        cb = mock.Mock()
+        h1 = self.loop.call_later(0, cb)
+        h2 = self.loop.call_later(10, cb)
+        h3 = self.loop.call_later(20, cb)
+        h3.cancel()
+        self.loop.set_timer_wheel()
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertEqual(self.loop.get_timer_stats(),
+                         {'heap': 1, 'heap_cancelled': 0,
+                          'wheel': 1, 'wheel_cancelled': 0,
+                          'wheel_resolution': 0.01})
+        self.assertFalse(h3._scheduled)
+
+        self.loop.set_timer_wheel(None)
+        self.assertEqual(sorted(self.loop._scheduled), [h1, h2])
+        self.assertEqual(self.loop.get_timer_stats(),
+                         {'heap': 2, 'heap_cancelled': 0,
+                          'wheel': 0, 'wheel_cancelled': 0,
+                          'wheel_resolution': None})
+
+        for resolution in (0, -1, float('nan')):
+            with self.assertRaises(ValueError):
+                self.loop.set_timer_wheel(resolution)
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
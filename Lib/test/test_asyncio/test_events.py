@@ -2258,6 +2258,57 @@ class SelectEventLoopTests(EventLoopTestsMixin,
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    if hasattr(asyncio, 'IoUringEventLoop'):
+        class IoUringEventLoopTests(EventLoopTestsMixin,
+                                    SubprocessTestsMixin,
+                                    test_utils.TestCase):
+
+            def create_event_loop(self):
+                try:
+                    return asyncio.IoUringEventLoop()
+                except OSError as exc:
+                    # io_uring may be disabled by a seccomp filter or
+                    # the kernel.io_uring_disabled sysctl.
+                    raise unittest.SkipTest(f"io_uring not available: {exc}")
+
+            def test_reader_callback(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not have add_reader()")
+
+            def test_reader_callback_cancel(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not have add_reader()")
+
+            def test_writer_callback(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not have add_writer()")
+
+            def test_writer_callback_cancel(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not have add_writer()")
+
+            def test_remove_fds_after_closing(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not have add_reader()")
+
+            # These tests read the other end with a blocking read before
+            # the loop had a chance to submit the write.
+            def test_write_pipe(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not write synchronously")
+
+            def test_write_pty(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not write synchronously")
+
+            def test_bidirectional_pty(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop does not write synchronously")
+
+            def test_unclosed_pipe_transport(self):
+                raise unittest.SkipTest(
+                    "IoUringEventLoop uses proactor pipe transports")
+
 
 def noop(*args, **kwargs):
     pass
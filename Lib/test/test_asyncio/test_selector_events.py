@@ -817,6 +817,82 @@ def test_writelines_pauses_protocol(self):
         self.assertTrue(self.sock.send.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_cork(self):
+        sent = []
+        def sendmsg(buffers):
+            buffers = list(buffers)
+            sent.append(buffers)
+            return sum(map(len, buffers))
+        self.sock.sendmsg = mock.Mock(side_effect=sendmsg)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.cork()
+        transport.write(b'data1')
+        transport.writelines([b'data2', b'data3'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertFalse(self.loop.writers)
+        self.assertEqual(transport.get_write_buffer_size(), 15)
+
+        # All the data is sent with a single call.
+        transport.uncork()
+        self.assertEqual(sent, [[b'data1', b'data2', b'data3']])
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+
+        # Not corked anymore.
+        self.sock.send.return_value = 4
+        transport.write(b'data')
+        self.sock.send.assert_called_with(b'data')
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_cork_partial(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 3
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.cork()
+        transport.write(b'data')
+        transport.uncork()
+        self.assertTrue(self.sock.sendmsg.called)
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'a']), transport._buffer)
+
+    def test_cork_high_water(self):
+        self.sock.send.return_value = 4
+
+        transport = self.socket_transport()
+        transport.set_write_buffer_limits(high=6)
+        transport.cork()
+        transport.write(b'data')
+        self.assertFalse(self.sock.send.called)
+        # Data is sent when the buffer exceeds the high-water limit.
+        transport.write(b'data')
+        self.assertTrue(self.sock.send.called)
+        self.assertFalse(self.protocol.pause_writing.called)
+        self.assertTrue(transport._corked)
+
+    def test_cork_close(self):
+        self.sock.send.return_value = 4
+
+        transport = self.socket_transport()
+        transport.cork()
+        transport.write(b'data')
+        transport.close()
+        self.sock.send.assert_called_with(b'data')
+        self.assertFalse(transport._buffer)
+
+    def test_cork_write_eof(self):
+        self.sock.send.return_value = 4
+
+        transport = self.socket_transport()
+        transport.cork()
+        transport.write(b'data')
+        transport.write_eof()
+        self.sock.send.assert_called_with(b'data')
+        self.sock.shutdown.assert_called_with(socket.SHUT_WR)
+
     @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
     def test_write_sendmsg_full(self):
         data = memoryview(b'data')
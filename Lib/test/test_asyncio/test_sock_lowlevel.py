@@ -674,6 +674,19 @@ class SelectEventLoopTests(BaseSockTestsMixin,
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    if hasattr(asyncio, 'IoUringEventLoop'):
+        class IoUringEventLoopTests(BaseSockTestsMixin,
+                                    test_utils.TestCase):
+
+            def create_event_loop(self):
+                try:
+                    return asyncio.IoUringEventLoop()
+                except OSError as exc:
+                    raise unittest.SkipTest(f"io_uring not available: {exc}")
+
+            def test_sendto_blocking(self):
+                raise unittest.SkipTest('Not relevant to IoUringEventLoop')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -221,6 +221,43 @@ def test_write_after_closing(self):
         # should not raise
         self.assertIsNone(transp.write(b'data'))
 
+    def test_cork(self):
+        ssl_proto = self.ssl_protocol()
+        transport = self.connection_made(ssl_proto)
+        ssl_proto._state = sslproto.SSLProtocolState.WRAPPED
+        sslobj = ssl_proto._sslobj
+        def encrypt(data):
+            ssl_proto._outgoing.write(b'<%s>' % data)
+            return len(data)
+        sslobj.write.side_effect = encrypt
+        transp = ssl_proto._app_transport
+
+        transp.cork()
+        transp.write(b'data1')
+        transp.writelines([b'data2', b'data3'])
+        self.assertFalse(sslobj.write.called)
+        self.assertEqual(transp.get_write_buffer_size(), 15)
+
+        # The data is passed to the transport in a single write.
+        transp.uncork()
+        self.assertEqual(sslobj.write.call_count, 3)
+        transport.write.assert_called_once_with(b'<data1><data2><data3>')
+        self.assertEqual(transp.get_write_buffer_size(), 0)
+
+        transp.write(b'data4')
+        transport.write.assert_called_with(b'<data4>')
+
+    def test_cork_close(self):
+        ssl_proto = self.ssl_protocol()
+        self.connection_made(ssl_proto)
+        ssl_proto._state = sslproto.SSLProtocolState.WRAPPED
+        ssl_proto._sslobj.write.side_effect = len
+        transp = ssl_proto._app_transport
+        transp.cork()
+        transp.write(b'data')
+        transp.close()
+        ssl_proto._sslobj.write.assert_called_once_with(b'data')
+
 
 ##############################################################################
 # Start TLS Tests
@@ -586,6 +586,175 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        buf = bytearray(5)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 5)
+        self.assertEqual(buf, b'line1')
+        self.assertEqual(b'\nline2\nline3\n', stream._buffer)
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[10:]))
+        self.assertEqual(n, len(self.DATA) - 5)
+        self.assertEqual(buf[10:10+n], self.DATA[5:])
+        self.assertEqual(b'', stream._buffer)
+
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readinto(bytearray())), 0)
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'12345'))
+
+    def test_readinto_wait(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(30)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(buf[:n], self.DATA)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(10)))
+
+        def cb():
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 0)
+        self.assertTrue(stream.at_eof())
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(10)))
+
+    def test_readinto_direct(self):
+        # Data is received directly into the buffer passed to readinto().
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        recv = protocol.get_buffer(-1)
+        self.assertIs(recv.obj, buf)
+        recv[:3] = b'abc'
+        protocol.buffer_updated(3)
+        self.assertEqual(self.loop.run_until_complete(read_task), 3)
+        self.assertEqual(buf[:3], b'abc')
+        self.assertEqual(stream._buffer, b'')
+
+        # Without a waiting readinto(), data is received into a pooled
+        # buffer and copied to the stream buffer.
+        recv = protocol.get_buffer(-1)
+        self.assertIsNot(recv.obj, buf)
+        recv[:3] = b'def'
+        protocol.buffer_updated(3)
+        self.assertEqual(stream._buffer, b'def')
+        self.assertIs(protocol.get_buffer(-1), recv)
+        protocol.buffer_updated(0)
+
+        # With data in the stream buffer, data is appended to it.
+        read_task = self.loop.create_task(stream.readinto(buf))
+        recv = protocol.get_buffer(-1)
+        self.assertIsNot(recv.obj, buf)
+        recv[:3] = b'ghi'
+        protocol.buffer_updated(3)
+        self.assertEqual(self.loop.run_until_complete(read_task), 6)
+        self.assertEqual(buf[:6], b'defghi')
+
+    def test_readinto_direct_cancelled(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        # Data received before the cancelled readinto() returns is kept.
+        read_task.cancel()
+        recv = protocol.get_buffer(-1)
+        recv[:3] = b'abc'
+        protocol.buffer_updated(3)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer, b'abc')
+        self.assertIsNone(stream._readinto_buffer)
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readexactly(3)), b'abc')
+
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertIsNone(stream._readinto_buffer)
+
+    def test_readinto_connection(self):
+        data = os.urandom(1024 * 1024)
+
+        async def handle_client(reader, writer):
+            writer.write(data)
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        async def main():
+            server = await asyncio.start_server(
+                handle_client, socket_helper.HOSTv4, 0)
+            addr = server.sockets[0].getsockname()
+            reader, writer = await asyncio.open_connection(*addr)
+            received = bytearray()
+            buf = bytearray(10000)
+            while n := await reader.readinto(buf):
+                received += buf[:n]
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return received
+
+        self.assertEqual(self.loop.run_until_complete(main()), data)
+
+    def test_writer_cork(self):
+        async def handle_client(reader, writer):
+            writer.write(await reader.read())
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        async def main():
+            server = await asyncio.start_server(
+                handle_client, socket_helper.HOSTv4, 0)
+            addr = server.sockets[0].getsockname()
+            reader, writer = await asyncio.open_connection(*addr)
+            writer.cork()
+            for i in range(100):
+                writer.write(b'%d,' % i)
+            self.assertGreater(writer.transport.get_write_buffer_size(), 0)
+            writer.uncork()
+            await writer.drain()
+            writer.write_eof()
+            data = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return data
+
+        self.assertEqual(self.loop.run_until_complete(main()),
+                         b''.join(b'%d,' % i for i in range(100)))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
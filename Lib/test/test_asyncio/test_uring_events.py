@@ -0,0 +1,174 @@
+import errno
+import os
+import socket
+import unittest
+
+from test.support import import_helper
+
+_uring = import_helper.import_module('_uring')
+
+import asyncio
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio._set_event_loop_policy(None)
+
+
+def make_ring(*args):
+    try:
+        return _uring.Ring(*args)
+    except OSError as exc:
+        raise unittest.SkipTest(f"io_uring not available: {exc}")
+
+
+class RingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = make_ring(8)
+        self.addCleanup(self.ring.close)
+        self.rsock, self.wsock = socket.socketpair()
+        self.addCleanup(self.rsock.close)
+        self.addCleanup(self.wsock.close)
+
+    def test_bad_entries(self):
+        self.assertRaises(ValueError, _uring.Ring, 0)
+        self.assertRaises(ValueError, _uring.Ring, -1)
+
+    def test_recv(self):
+        token = self.ring.recv('key', self.rsock.fileno(), 10)
+        self.assertIsInstance(token, int)
+        self.wsock.send(b'data')
+        self.assertEqual(self.ring.wait(), [('key', 4, b'data')])
+
+    def test_recv_into(self):
+        buf = bytearray(10)
+        self.ring.recv_into('key', self.rsock.fileno(), buf)
+        self.wsock.send(b'data')
+        self.assertEqual(self.ring.wait(), [('key', 4, None)])
+        self.assertEqual(buf[:4], b'data')
+
+    def test_send(self):
+        self.ring.send('key', self.wsock.fileno(), b'data')
+        self.assertEqual(self.ring.wait(), [('key', 4, None)])
+        self.assertEqual(self.rsock.recv(10), b'data')
+
+    def test_readonly_buffer(self):
+        self.assertRaises(TypeError, self.ring.recv_into,
+                          'key', self.rsock.fileno(), b'data')
+
+    def test_wait_timeout(self):
+        self.assertEqual(self.ring.wait(0), [])
+        self.assertEqual(self.ring.wait(0.01), [])
+        self.assertEqual(self.ring.wait(-1), [])
+
+    def test_poll(self):
+        self.ring.poll('key', self.wsock.fileno(), 0x004)  # POLLOUT
+        [(key, res, data)] = self.ring.wait()
+        self.assertEqual(key, 'key')
+        self.assertTrue(res & 0x004)
+
+    def test_cancel(self):
+        token = self.ring.recv('key', self.rsock.fileno(), 10)
+        self.ring.cancel(token)
+        self.assertEqual(self.ring.wait(), [('key', -errno.ECANCELED, None)])
+        # Cancelling a completed operation is a no-op.
+        self.ring.cancel(token)
+        self.assertEqual(self.ring.wait(0), [])
+
+    def test_registered_buffers(self):
+        buf = bytearray(16)
+        self.ring.register_buffers([buf])
+        self.assertRaises(IndexError, self.ring.read_fixed,
+                          'key', self.rsock.fileno(), 1)
+        self.ring.read_fixed('key', self.rsock.fileno(), 0)
+        self.wsock.send(b'data')
+        self.assertEqual(self.ring.wait(), [('key', 4, None)])
+        self.assertEqual(buf[:4], b'data')
+        self.ring.unregister_buffers()
+
+    def test_close(self):
+        self.ring.recv('key', self.rsock.fileno(), 10)
+        self.assertFalse(self.ring.closed)
+        self.ring.close()
+        self.assertTrue(self.ring.closed)
+        self.ring.close()
+        self.assertRaises(ValueError, self.ring.wait)
+        self.assertRaises(ValueError, self.ring.fileno)
+
+
+class IoUringEventLoopTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        try:
+            self.loop = asyncio.IoUringEventLoop()
+        except OSError as exc:
+            raise unittest.SkipTest(f"io_uring not available: {exc}")
+        self.set_event_loop(self.loop)
+
+    def test_cancel_recv(self):
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        with rsock, wsock:
+            async def main():
+                task = asyncio.create_task(self.loop.sock_recv(rsock, 10))
+                await asyncio.sleep(0)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                # The cancelled operation must not consume data.
+                wsock.send(b'data')
+                return await self.loop.sock_recv(rsock, 10)
+
+            self.assertEqual(self.loop.run_until_complete(main()), b'data')
+
+    def test_recv_into_registered_buffer(self):
+        proactor = self.loop._proactor
+        buf = bytearray(16)
+        proactor.register_buffers([buf])
+        rsock, wsock = socket.socketpair()
+        with rsock, wsock:
+            wsock.send(b'data')
+            fut = proactor.recv_into(rsock, buf)
+            self.assertEqual(self.loop.run_until_complete(fut), 4)
+            self.assertEqual(buf[:4], b'data')
+        proactor.unregister_buffers()
+
+    def test_wait_for_fd(self):
+        rfd, wfd = os.pipe()
+        try:
+            fut = self.loop._proactor.wait_for_fd(rfd)
+            os.write(wfd, b'x')
+            self.assertTrue(self.loop.run_until_complete(fut))
+        finally:
+            os.close(rfd)
+            os.close(wfd)
+
+    def test_datagram_close(self):
+        async def main():
+            transport, _ = await self.loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, local_addr=('127.0.0.1', 0))
+            transport.close()
+            await asyncio.sleep(0)
+            return transport
+
+        transport = self.loop.run_until_complete(main())
+        self.assertTrue(transport.is_closing())
+
+    def test_close_with_pending_operations(self):
+        rsock, wsock = socket.socketpair()
+        with rsock, wsock:
+            fut = self.loop._proactor.recv(rsock, 10)
+            self.loop.close()
+            self.assertTrue(fut.cancelled())
+            self.assertIsNone(self.loop._proactor)
+
+    def test_sendfile_not_available(self):
+        self.assertRaises(asyncio.SendfileNotAvailableError,
+                          self.loop.run_until_complete,
+                          self.loop._sock_sendfile_native(None, None, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,8 @@
 from concurrent.futures.process import BrokenProcessPool
 
 from test import support
-from test.support import hashlib_helper
+from test.support import hashlib_helper, import_helper, os_helper
+from test.support import script_helper
 
 from .executor import ExecutorTest, mul
 from .util import (
@@ -15,6 +16,10 @@
     create_executor_tests, setup_module)
 
 
+def _concat(a, b):
+    return a + b
+
+
 class EventfulGCObj():
     def __init__(self, mgr):
         self.event = mgr.Event()
@@ -190,6 +195,91 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    def test_shared_memory_threshold(self):
+        import_helper.import_module('_posixshmem' if os.name == 'posix'
+                                    else '_winapi')
+        from multiprocessing import _shm_transport
+        executor = self.executor_type(
+                2, mp_context=self.get_context(), shared_memory_threshold=1024)
+        with executor:
+            big = bytes(range(256)) * 100
+            self.assertEqual(executor.submit(_concat, big, b'x').result(),
+                             big + b'x')
+            self.assertEqual(executor.submit(_concat, [big], [b'x']).result(),
+                             [big, b'x'])
+            result = executor.submit(_concat, bytearray(big), big).result()
+            self.assertIs(type(result), bytearray)
+            self.assertEqual(result, big * 2)
+            self.assertEqual(list(executor.map(len, [big, b'x'] * 10)),
+                             [len(big), 1] * 10)
+            # The segments of finished calls are kept for reuse.
+            segment_pool = executor._executor_manager_thread.segment_pool
+            names = [segment.name for segments in segment_pool._free.values()
+                     for segment in segments]
+            self.assertTrue(names)
+        # They are destroyed when the executor shuts down.
+        for name in names:
+            self.assertRaises(FileNotFoundError,
+                              _shm_transport.SharedMemory, name)
+
+    def test_shared_memory_load_copies_once(self):
+        import_helper.import_module('_posixshmem' if os.name == 'posix'
+                                    else '_winapi')
+        import pickle
+        import tracemalloc
+        from multiprocessing import _shm_transport
+        size = 10 * 1024 * 1024
+        for obj in bytes(size), bytearray(size), [b'x', bytes(size)]:
+            with self.subTest(type=type(obj)):
+                payload, segment = _shm_transport.dumps(obj, 1024)
+                data = pickle.dumps(payload)
+                segment.close()
+                tracemalloc.start()
+                try:
+                    result = pickle.loads(data)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                self.assertEqual(type(result), type(obj))
+                self.assertEqual(result, obj)
+                self.assertLess(peak, size * 3 // 2)
+
+    def test_shared_memory_threshold_no_leak(self):
+        import_helper.import_module('_posixshmem' if os.name == 'posix'
+                                    else '_winapi')
+        code = f"""if 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            def concat(a, b):
+                return a + b
+
+            if __name__ == '__main__':
+                context = multiprocessing.get_context(
+                    {self.get_context().get_start_method()!r})
+                big = bytes(range(256)) * 1000
+                with ProcessPoolExecutor(2, mp_context=context,
+                                         shared_memory_threshold=1024) as e:
+                    for result in e.map(concat, [big] * 10, [big] * 10):
+                        assert result == big * 2
+            """
+        with os_helper.temp_dir() as tmpdir:
+            script = script_helper.make_script(tmpdir, 'shm_leak', code)
+            rc, out, err = script_helper.assert_python_ok(script)
+        self.assertNotIn(b'leaked', err)
+
+    def test_shared_memory_threshold_errors(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=0)
+        executor = self.executor_type(
+                1, mp_context=self.get_context(), shared_memory_threshold=1024)
+        with executor:
+            fut = executor.submit(_concat, b'x' * 2048, lambda: None)
+            self.assertRaises(Exception, fut.result)
+            self.assertEqual(executor.submit(mul, 2, 3).result(), 6)
+
     def test_python_finalization_error(self):
         # gh-109047: Catch RuntimeError on thread creation
         # during Python finalization.
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import builtins
 import collections
 import collections.abc
@@ -18,7 +19,7 @@
 import gc
 from weakref import proxy
 import contextlib
-from inspect import Signature
+from inspect import Signature, iscoroutinefunction
 
 from test.support import import_helper
 from test.support import threading_helper
@@ -2115,6 +2116,247 @@ def cached_staticmeth(x, y):
             return 3 * x + y
 
 
+class TestBoundedCache(unittest.TestCase):
+
+    def test_lru(self):
+        @functools.bounded_cache(maxsize=3)
+        def f(x):
+            return x * 10
+        for x in [1, 2, 3, 1, 4, 5]:
+            self.assertEqual(f(x), x * 10)
+        self.assertEqual(f.cache_info(),
+                         (1, 5, 2, 3, 3, None, 3))
+        self.assertEqual(f(1), 10)
+        self.assertEqual(f.cache_info().hits, 2)
+        self.assertEqual(f(2), 20)
+        self.assertEqual(f.cache_info().misses, 6)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 0, 3, 0, None, 0))
+
+    def test_decoration(self):
+        def f(x):
+            'docstring'
+            return x
+        g = functools.bounded_cache(f)
+        for attr in ('__module__', '__name__', '__qualname__', '__doc__'):
+            self.assertEqual(getattr(g, attr), getattr(f, attr))
+        self.assertIs(g.__wrapped__, f)
+        self.assertEqual(g.cache_parameters(),
+                         {'maxsize': 128, 'ttl': None, 'maxweight': None,
+                          'policy': 'lru', 'typed': False})
+
+    def test_typed(self):
+        @functools.bounded_cache(typed=True)
+        def f(x):
+            return type(x)
+        self.assertIs(f(1), int)
+        self.assertIs(f(1.0), float)
+        self.assertEqual(f.cache_info().misses, 2)
+
+    def test_ttl(self):
+        now = 0
+        @functools.bounded_cache(ttl=10, timer=lambda: now)
+        def f(x):
+            return x, now
+        self.assertEqual(f(1), (1, 0))
+        now = 5
+        self.assertEqual(f(1), (1, 0))
+        self.assertEqual(f(2), (2, 5))
+        now = 10
+        self.assertEqual(f(1), (1, 10))
+        self.assertEqual(f.cache_info().evictions, 1)
+        now = 20
+        # Expired entries are also removed when results are cached.
+        self.assertEqual(f(3), (3, 20))
+        self.assertEqual(f.cache_info(), (1, 4, 3, 128, 1, None, 1))
+
+    def test_maxweight(self):
+        @functools.bounded_cache(maxsize=None, maxweight=10, weigher=len)
+        def f(x):
+            return 'a' * x
+        f(4)
+        f(5)
+        self.assertEqual(f.cache_info().weight, 9)
+        f(3)
+        self.assertEqual(f.cache_info(), (0, 3, 1, None, 2, 10, 8))
+        # Results weighing more than maxweight are not cached.
+        f(11)
+        self.assertEqual(f.cache_info(), (0, 4, 1, None, 2, 10, 8))
+        f(5)
+        f(3)
+        self.assertEqual(f.cache_info().hits, 2)
+
+    def test_tinylfu(self):
+        # The frequently used keys survive a scan with W-TinyLFU.
+        for policy, min_hits, max_hits in ('lru', 0, 0), ('tinylfu', 45, 50):
+            with self.subTest(policy=policy):
+                @functools.bounded_cache(maxsize=100, policy=policy)
+                def f(x):
+                    return x
+                for _ in range(10):
+                    for x in range(50):
+                        f(x)
+                # A scan of keys used once.
+                for x in range(1000, 2000):
+                    f(x)
+                hits = f.cache_info().hits
+                for x in range(50):
+                    f(x)
+                hits = f.cache_info().hits - hits
+                self.assertGreaterEqual(hits, min_hits)
+                self.assertLessEqual(hits, max_hits)
+                self.assertEqual(f.cache_info().currsize, 100)
+
+    def test_tinylfu_maxweight(self):
+        @functools.bounded_cache(maxsize=None, maxweight=1000, weigher=len,
+                                 policy='tinylfu')
+        def f(x):
+            return 'a' * (x % 20)
+        for x in range(1000):
+            f(x)
+            self.assertLessEqual(f.cache_info().weight, 1000)
+        self.assertGreater(f.cache_info().weight, 900)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            functools.bounded_cache('spam')
+        with self.assertRaises(ValueError):
+            functools.bounded_cache(-1)
+        with self.assertRaises(ValueError):
+            functools.bounded_cache(ttl=0)
+        with self.assertRaises(ValueError):
+            functools.bounded_cache(maxweight=-1)
+        with self.assertRaises(ValueError):
+            functools.bounded_cache(policy='spam')
+
+    def test_recursive(self):
+        @functools.bounded_cache
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+        self.assertEqual(fib(50), 12586269025)
+        self.assertEqual(fib.cache_info().misses, 51)
+
+    def test_exception(self):
+        @functools.bounded_cache
+        def f(x):
+            raise ZeroDivisionError(x)
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                f(1)
+        self.assertEqual(f.cache_info().misses, 2)
+        self.assertEqual(f.cache_info().currsize, 0)
+
+    @threading_helper.requires_working_threading()
+    def test_threads_share_computation(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        @functools.bounded_cache
+        def f(x):
+            calls.append(x)
+            started.set()
+            release.wait(support.SHORT_TIMEOUT)
+            return [x]
+        results = []
+        def call():
+            results.append(f(1))
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        with threading_helper.start_threads(threads[:1]):
+            started.wait(support.SHORT_TIMEOUT)
+            with threading_helper.start_threads(threads[1:]):
+                # Wait for the other threads to block on the first call.
+                while f.cache_info().hits < 4:
+                    time.sleep(0.01)
+                release.set()
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(results), 5)
+        for result in results:
+            self.assertIs(result, results[0])
+
+    @threading_helper.requires_working_threading()
+    def test_threads_share_exception(self):
+        started = threading.Event()
+        release = threading.Event()
+        @functools.bounded_cache
+        def f(x):
+            started.set()
+            release.wait(support.SHORT_TIMEOUT)
+            raise ZeroDivisionError
+        errors = []
+        def call():
+            try:
+                f(1)
+            except ZeroDivisionError as exc:
+                errors.append(exc)
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        with threading_helper.start_threads(threads[:1]):
+            started.wait(support.SHORT_TIMEOUT)
+            with threading_helper.start_threads(threads[1:]):
+                while f.cache_info().hits < 2:
+                    time.sleep(0.01)
+                release.set()
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(f.cache_info().misses, 1)
+
+    def run_async(self, coro):
+        try:
+            asyncio.run(coro)
+        finally:
+            asyncio._set_event_loop_policy(None)
+
+    def test_coroutine_function(self):
+        calls = []
+        @functools.bounded_cache
+        async def f(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return [x]
+        async def main():
+            results = await asyncio.gather(*[f(1) for _ in range(5)])
+            self.assertEqual(calls, [1])
+            for result in results:
+                self.assertIs(result, results[0])
+            self.assertIs(await f(1), results[0])
+            self.assertEqual(f.cache_info().hits, 5)
+            self.assertEqual(f.cache_info().misses, 1)
+        self.run_async(main())
+        self.assertTrue(iscoroutinefunction(f))
+
+    def test_coroutine_function_cancelled(self):
+        calls = []
+        @functools.bounded_cache
+        async def f(x):
+            calls.append(x)
+            await asyncio.sleep(0 if len(calls) > 1 else support.SHORT_TIMEOUT)
+            return x
+        async def main():
+            first = asyncio.create_task(f(1))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(f(1))
+            await asyncio.sleep(0)
+            first.cancel()
+            # The waiting call computes the result itself.
+            self.assertEqual(await second, 1)
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+        self.run_async(main())
+        self.assertEqual(calls, [1, 1])
+
+    def test_coroutine_function_exception(self):
+        @functools.bounded_cache
+        async def f(x):
+            await asyncio.sleep(0)
+            raise ZeroDivisionError
+        async def main():
+            results = await asyncio.gather(f(1), f(1), return_exceptions=True)
+            self.assertIsInstance(results[0], ZeroDivisionError)
+            self.assertIs(results[1], results[0])
+            with self.assertRaises(ZeroDivisionError):
+                await f(1)
+            self.assertEqual(f.cache_info().misses, 2)
+        self.run_async(main())
+
+
 class TestSingleDispatch(unittest.TestCase):
     def test_simple_overloads(self):
         @functools.singledispatch
@@ -785,6 +785,19 @@ def __del__(self):
         rc, out, err = assert_python_ok(TESTFN)
         self.assertEqual(out.strip(), b'__del__ called')
 
+    def test_pause_target(self):
+        self.addCleanup(gc.set_pause_target, gc.get_pause_target())
+        self.assertEqual(gc.get_pause_target(), 0.0)
+        gc.set_pause_target(0.001)
+        self.assertEqual(gc.get_pause_target(), 0.001)
+        gc.set_pause_target(1)
+        self.assertEqual(gc.get_pause_target(), 1.0)
+        gc.set_pause_target(0)
+        self.assertEqual(gc.get_pause_target(), 0.0)
+        self.assertRaises(ValueError, gc.set_pause_target, -1)
+        self.assertRaises(TypeError, gc.set_pause_target, "1")
+        self.assertEqual(gc.get_pause_target(), 0.0)
+
     def test_get_stats(self):
         stats = gc.get_stats()
         self.assertEqual(len(stats), 3)
@@ -1186,6 +1199,33 @@ def make_ll(depth):
         if not enabled:
             gc.disable()
 
+    @requires_gil_enabled("Free threading does not support incremental GC")
+    def test_pause_target_collects_old_cycles(self):
+        # Even when collecting the young generation alone takes longer than
+        # the target, automatic collections keep scanning the old
+        # generation and reclaim its cyclic garbage.
+        class Cycle:
+            pass
+
+        self.addCleanup(gc.set_pause_target, gc.get_pause_target())
+        gc.collect()
+        gc.set_pause_target(1e-9)
+        cycles = []
+        for i in range(1000):
+            cycle = Cycle()
+            cycle.self = cycle
+            cycles.append(cycle)
+        refs = [weakref.ref(cycle) for cycle in cycles]
+        # Move the cycles to the old generation.
+        gc.collect(1)
+        del cycles, cycle
+        keep = []
+        for i in range(100):
+            keep.extend([] for _ in range(10_000))
+            if not any(ref() is not None for ref in refs):
+                break
+        self.assertEqual(sum(ref() is not None for ref in refs), 0)
+
 
 class GCCallbackTests(unittest.TestCase):
     def setUp(self):
@@ -1264,6 +1304,23 @@ def test_collect(self):
             self.assertTrue("generation" in info)
             self.assertTrue("collected" in info)
             self.assertTrue("uncollectable" in info)
+            self.assertTrue("visited" in info)
+            self.assertTrue("duration" in info)
+
+    def test_collect_visited_duration(self):
+        self.preclean()
+        objs = [[] for _ in range(100)]
+        gc.collect()
+        stop = [v[2] for v in self.visit if v[1] == "stop"]
+        self.assertTrue(stop)
+        for info in stop:
+            self.assertGreaterEqual(info["visited"], len(objs))
+            self.assertIsInstance(info["duration"], float)
+            self.assertGreaterEqual(info["duration"], 0.0)
+        start = [v[2] for v in self.visit if v[1] == "start"]
+        for info in start:
+            self.assertEqual(info["visited"], 0)
+            self.assertEqual(info["duration"], 0.0)
 
     def test_collect_generation(self):
         self.preclean()
@@ -858,6 +858,141 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    def test_parallel_compress(self):
+        data = make_large_data()
+        datac = gzip.compress(data, workers=3)
+        self.assertEqual(gzip.decompress(datac), data)
+        self.assertEqual(zlib.decompress(datac, wbits=31), data)
+        # The output does not depend on the number of workers.
+        self.assertEqual(gzip.compress(data, workers=2), datac)
+        self.assertEqual(gzip.compress(b'', workers=2),
+                         gzip.compress(b'', workers=3))
+        self.assertEqual(gzip.decompress(gzip.compress(b'', workers=2)), b'')
+
+    def test_parallel_write(self):
+        data = make_large_data()
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', workers=4) as f:
+            f.write(data[:1000])
+            f.flush()
+            self.assertEqual(zlib.decompressobj(wbits=31).decompress(
+                b.getvalue()), data[:1000])
+            f.write(memoryview(data)[1000:500_000])
+            f.flush(zlib.Z_FULL_FLUSH)
+            self.assertEqual(f.tell(), 500_000)
+            f.write(data[500_000:])
+        self.assertEqual(gzip.decompress(b.getvalue()), data)
+
+    def test_workers_errors(self):
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', workers=0)
+        with self.assertRaises(ValueError):
+            gzip.compress(data1, workers=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(data1)),
+                          mode='rb', workers=2)
+        index = gzip.GzipIndex.build(io.BytesIO(gzip.compress(data1)))
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', index=index)
+        # The file is not truncated.
+        with open(self.filename, 'wb') as f:
+            f.write(b'spam')
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(self.filename, 'wb', index=index)
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), b'spam')
+
+
+def make_large_data():
+    words = [bytes([97 + (i * 7 + j) % 26 for j in range(i % 9 + 2)])
+             for i in range(1000)]
+    return b' '.join(words[(i * i) % 997] for i in range(300_000))
+
+
+class TestGzipIndex(BaseTest):
+    def check_seek(self, datac, data, index, offsets):
+        with gzip.GzipFile(fileobj=io.BytesIO(datac), index=index) as f:
+            for offset in offsets:
+                with self.subTest(offset=offset):
+                    self.assertEqual(f.seek(offset), offset)
+                    self.assertEqual(f.read(100), data[offset:offset + 100])
+            self.assertEqual(f.seek(-10, io.SEEK_END), len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            f.seek(20)
+            self.assertEqual(f.seek(-10, io.SEEK_CUR), 10)
+            self.assertEqual(f.read(10), data[10:20])
+
+    def test_parallel_compressed(self):
+        data = make_large_data()
+        datac = gzip.compress(data, workers=2)
+        index = gzip.GzipIndex.build(io.BytesIO(datac), span=100_000)
+        self.assertEqual(index.size, len(data))
+        self.assertGreater(len(index), len(data) // 200_000)
+        offsets = [len(data) - 50, 5, 1_000_000, 123_456, 0, 300_001]
+        self.check_seek(datac, data, index, offsets)
+
+    def test_flushed(self):
+        data = make_large_data()
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb') as f:
+            for i in range(0, len(data), 50_000):
+                f.write(data[i:i + 50_000])
+                f.flush()
+        datac = b.getvalue()
+        index = gzip.GzipIndex.build(io.BytesIO(datac), span=1)
+        self.assertEqual(len(index), -(-len(data) // 50_000))
+        self.check_seek(datac, data, index, [len(data) - 1, 49_999, 50_000])
+
+    def test_multiple_members(self):
+        datac = (gzip.compress(data1) + b'\0' * 10 + gzip.compress(b'') +
+                 gzip.compress(data2))
+        index = gzip.GzipIndex.build(io.BytesIO(datac))
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.size, len(data1 + data2))
+        self.check_seek(datac, data1 + data2, index,
+                        [len(data1) + 5, 0, len(data1) - 1, 20])
+
+    def test_single_member(self):
+        data = make_large_data()
+        datac = gzip.compress(data)
+        index = gzip.GzipIndex.build(io.BytesIO(datac), span=1000)
+        self.assertEqual(len(index), 1)
+        self.check_seek(datac, data, index, [len(data) - 1, 5])
+
+    def test_save_load(self):
+        data = make_large_data()
+        datac = gzip.compress(data, workers=2)
+        with open(self.filename, 'wb') as f:
+            f.write(datac)
+        index = gzip.GzipIndex.build(self.filename, span=200_000)
+        b = io.BytesIO()
+        index.save(b)
+        index2 = gzip.GzipIndex.load(io.BytesIO(b.getvalue()))
+        self.assertEqual(index2.size, index.size)
+        self.assertEqual(index2._points, index._points)
+        self.check_seek(datac, data, index2, [len(data) - 1, 600_000, 0])
+
+        index_filename = self.filename + '.idx'
+        self.addCleanup(os_helper.unlink, index_filename)
+        index.save(index_filename)
+        index2 = gzip.GzipIndex.load(index_filename)
+        self.assertEqual(index2._points, index._points)
+        with gzip.GzipFile(self.filename, index=index2) as f:
+            f.seek(700_000)
+            self.assertEqual(f.read(10), data[700_000:700_010])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.build(io.BytesIO(gzip.compress(data1)), span=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.load(io.BytesIO(b'spam' * 10))
+        with self.assertRaises(EOFError):
+            gzip.GzipIndex.build(io.BytesIO(gzip.compress(data1)[:-10]))
+        datac = bytearray(gzip.compress(data1))
+        datac[-5] ^= 1
+        with self.assertRaises(gzip.BadGzipFile):
+            gzip.GzipIndex.build(io.BytesIO(datac))
+
 
 class TestOpen(BaseTest):
     def test_binary_modes(self):
@@ -968,6 +1103,22 @@ def test_bad_params(self):
             gzip.open(self.filename, "rb", errors="ignore")
         with self.assertRaises(ValueError):
             gzip.open(self.filename, "rb", newline="\n")
+        with self.assertRaises(ValueError):
+            gzip.open(self.filename, "rb", workers=2)
+        index = gzip.GzipIndex.build(io.BytesIO(gzip.compress(data1)))
+        with self.assertRaises(ValueError):
+            gzip.open(self.filename, "wt", index=index)
+
+    def test_workers_and_index(self):
+        uncompressed = data1.decode("ascii") * 5000
+        with gzip.open(self.filename, "wt", workers=2) as f:
+            f.write(uncompressed)
+        index = gzip.GzipIndex.build(self.filename, span=10_000)
+        self.assertGreater(len(index), 1)
+        with gzip.open(self.filename, "rb", index=index) as f:
+            f.seek(100_000)
+            self.assertEqual(f.read(10),
+                             uncompressed[100_000:100_010].encode("ascii"))
 
     def test_encoding(self):
         # Test non-default encoding.
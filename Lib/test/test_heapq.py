@@ -273,6 +273,149 @@ class TestHeapC(TestHeap, TestCase):
     module = c_heapq
 
 
+class TestIndexedHeap:
+
+    def check_invariant(self, heap):
+        items = []
+        while heap:
+            items.append(heap.pop())
+        self.assertEqual(items, sorted(items, key=itemgetter(0)))
+        return items
+
+    def test_push_pop(self):
+        heap = self.module.IndexedHeap()
+        self.assertEqual(len(heap), 0)
+        data = [random.random() for i in range(256)]
+        handles = [heap.push(p, i) for i, p in enumerate(data)]
+        self.assertEqual(len(heap), 256)
+        self.assertEqual(heap.peek(), (min(data), data.index(min(data))))
+        for handle, p, i in zip(handles, data, range(256)):
+            self.assertIs(handle.priority, p)
+            self.assertEqual(handle.value, i)
+            self.assertIn(handle, heap)
+        results = [heap.pop() for i in range(256)]
+        self.assertEqual(results, sorted((p, i) for i, p in enumerate(data)))
+        self.assertFalse(any(handle in heap for handle in handles))
+        self.assertRaises(IndexError, heap.pop)
+        self.assertRaises(IndexError, heap.peek)
+
+    def test_update(self):
+        heap = self.module.IndexedHeap()
+        priorities = {}
+        handles = []
+        for i in range(200):
+            priorities[i] = random.random()
+            handles.append(heap.push(priorities[i], i))
+        for i in random.sample(range(200), 100):
+            priorities[i] = random.random() * 2 - 0.5
+            heap.update(handles[i], priorities[i])
+            self.assertEqual(handles[i].priority, priorities[i])
+        self.assertEqual(heap.peek(), min((p, i) for i, p in priorities.items()))
+        self.assertEqual(self.check_invariant(heap),
+                         sorted((p, i) for i, p in priorities.items()))
+
+    def test_remove(self):
+        heap = self.module.IndexedHeap()
+        handles = [heap.push(random.random(), i) for i in range(200)]
+        removed = set(random.sample(range(200), 120))
+        for i in removed:
+            heap.remove(handles[i])
+            self.assertNotIn(handles[i], heap)
+        self.assertEqual(len(heap), 80)
+        self.assertEqual(sorted(value for p, value in self.check_invariant(heap)),
+                         sorted(set(range(200)) - removed))
+
+        with self.assertRaises(ValueError):
+            heap.remove(handles[0])
+        with self.assertRaises(ValueError):
+            heap.update(handles[0], 0)
+        other = self.module.IndexedHeap()
+        with self.assertRaises(ValueError):
+            other.remove(heap.push(1, 'a'))
+        with self.assertRaises(TypeError):
+            heap.remove((1, 'a'))
+        self.assertNotIn((1, 'a'), heap)
+
+    def test_dijkstra(self):
+        graph = {'a': {'b': 7, 'c': 9, 'f': 14}, 'b': {'c': 10, 'd': 15},
+                 'c': {'d': 11, 'f': 2}, 'd': {'e': 6}, 'e': {},
+                 'f': {'e': 9}}
+        heap = self.module.IndexedHeap()
+        dist = {'a': 0}
+        handles = {'a': heap.push(0, 'a')}
+        while heap:
+            d, node = heap.pop()
+            for succ, weight in graph[node].items():
+                if succ not in dist:
+                    dist[succ] = d + weight
+                    handles[succ] = heap.push(d + weight, succ)
+                elif d + weight < dist[succ]:
+                    dist[succ] = d + weight
+                    heap.update(handles[succ], d + weight)
+        self.assertEqual(dist, {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20,
+                                'f': 11})
+
+    def test_cmp_err(self):
+        heap = self.module.IndexedHeap()
+        handles = [heap.push(i, i) for i in range(10)]
+        self.assertRaises(ZeroDivisionError, heap.push, CmpErr(), 'x')
+        self.assertRaises(ZeroDivisionError, heap.update, handles[3], CmpErr())
+        self.assertEqual(len(heap), 11)
+        # Each handle still knows its position in the heap.
+        for handle in handles:
+            self.assertIn(handle, heap)
+
+    def test_update_priority_destructor(self):
+        class Priority(int):
+            def __del__(self):
+                while heap:
+                    heap.pop()
+
+        heap = self.module.IndexedHeap()
+        for i in range(10):
+            heap.push(i, i)
+        handle = heap.push(Priority(20), 'x')
+        heap.update(handle, -1)
+        self.assertEqual(len(heap), 0)
+        self.assertNotIn(handle, heap)
+
+    def test_subclass(self):
+        class Heap(self.module.IndexedHeap):
+            pass
+        heap = Heap()
+        heap.push(2, 'b')
+        heap.push(1, 'a')
+        self.assertEqual(heap.pop(), (1, 'a'))
+
+
+class TestIndexedHeapPython(TestIndexedHeap, TestCase):
+    module = py_heapq
+
+
+@skipUnless(c_heapq, 'requires _heapq')
+class TestIndexedHeapC(TestIndexedHeap, TestCase):
+    module = c_heapq
+
+    def test_c_types(self):
+        self.assertEqual(self.module.IndexedHeap.__module__, '_heapq')
+        with self.assertRaises(TypeError):
+            self.module.HeapHandle(1, 2)
+
+    def test_comparison_modifying_heap(self):
+        class EvilLT(int):
+            def __lt__(self, other):
+                heap.pop()
+                return NotImplemented
+
+        heap = self.module.IndexedHeap()
+        heap.push(1, 'a')
+        handle = heap.push(2, 'b')
+        self.assertRaises(RuntimeError, heap.push, EvilLT(0), 'c')
+        self.assertRaises(RuntimeError, heap.update, handle, EvilLT(0))
+        self.assertEqual(len(heap), 3)
+        self.assertIn(handle, heap)
+
+
 #==============================================================================
 
 class LenOnly:
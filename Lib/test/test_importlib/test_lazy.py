@@ -1,13 +1,15 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
 import time
 import threading
 import types
 import unittest
 
-from test.support import threading_helper
+from test.support import import_helper, os_helper, threading_helper
+from test.support import script_helper
 from test.test_importlib import util as test_util
 
 
@@ -90,8 +92,12 @@ def test_e2e(self):
             with test_util.import_state(meta_path=[importer]):
                 module = importlib.import_module(importer.module_name)
         self.assertIsNone(importer.loaded)
-        # Trigger load.
+        # Reading the module metadata does not trigger the load.
         self.assertEqual(module.__loader__, importer)
+        self.assertEqual(module.__name__, importer.module_name)
+        self.assertIsNone(importer.loaded)
+        # Trigger load.
+        self.assertEqual(module.attr, 42)
         self.assertIsNotNone(importer.loaded)
         self.assertEqual(module, importer.loaded)
 
@@ -99,6 +105,7 @@ def test_attr_unchanged(self):
         # An attribute only mutated as a side-effect of import should not be
         # changed needlessly.
         module = self.new_module()
+        module.attr
         self.assertEqual(TestingImporter.mutated_name, module.__name__)
 
     def test_new_attr(self):
@@ -132,20 +139,37 @@ def test_delete_preexisting_attr(self):
         del module.__name__
         self.assertFalse(hasattr(module, '__name__'))
 
+    def test_metadata(self):
+        # The attributes set before the module is executed are read
+        # without loading it.
+        with test_util.uncache(TestingImporter.module_name):
+            loader = TestingImporter()
+            module = self.new_module(loader=loader)
+            __dict__ = object.__getattribute__(module, '__dict__')
+            for attr in ('__name__', '__loader__', '__package__', '__spec__'):
+                with self.subTest(attr=attr):
+                    self.assertIs(getattr(module, attr), __dict__[attr])
+            for attr in ('__file__', '__path__', '__cached__'):
+                with self.subTest(attr=attr):
+                    self.assertFalse(hasattr(module, attr))
+            self.assertIsNone(loader.loaded)
+            self.assertEqual(module.__dict__['attr'], 42)
+            self.assertIs(loader.loaded, module)
+
     def test_module_substitution_error(self):
         with test_util.uncache(TestingImporter.module_name):
             fresh_module = types.ModuleType(TestingImporter.module_name)
             sys.modules[TestingImporter.module_name] = fresh_module
             module = self.new_module()
             with self.assertRaisesRegex(ValueError, "substituted"):
-                module.__name__
+                module.attr
 
     def test_module_already_in_sys(self):
         with test_util.uncache(TestingImporter.module_name):
             module = self.new_module()
             sys.modules[TestingImporter.module_name] = module
             # Force the load; just care that no exception is raised.
-            module.__name__
+            module.attr
 
     @threading_helper.requires_working_threading()
     def test_module_load_race(self):
@@ -225,5 +249,161 @@ def __delattr__(self, name):
             del module.CONSTANT
 
 
+class LazyImportsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(util.disable_lazy_imports)
+        self.tmpdir = self.enterContext(os_helper.temp_dir())
+        self.enterContext(import_helper.DirsOnSysPath(self.tmpdir))
+        self.enterContext(import_helper.isolated_modules())
+        pkg = os.path.join(self.tmpdir, 'lazypkg')
+        os.mkdir(pkg)
+        script_helper.make_script(pkg, '__init__', 'executed = True')
+        script_helper.make_script(pkg, 'sub', 'executed = True')
+        script_helper.make_script(self.tmpdir, 'lazymod', 'executed = True')
+        importlib.invalidate_caches()
+
+    def assertLazy(self, name):
+        module = sys.modules[name]
+        self.assertIsInstance(module, util._LazyModule)
+        self.assertNotIn('executed', object.__getattribute__(module, '__dict__'))
+
+    def assertEager(self, name):
+        module = sys.modules[name]
+        self.assertNotIsInstance(module, util._LazyModule)
+        self.assertIs(module.executed, True)
+
+    def test_lazy(self):
+        util.enable_lazy_imports()
+        import lazymod
+        self.assertLazy('lazymod')
+        # Importing the module again does not execute it.
+        import lazymod
+        self.assertLazy('lazymod')
+        self.assertIs(lazymod.executed, True)
+        self.assertEager('lazymod')
+
+    def test_loader_methods(self):
+        # runpy and linecache use the loader of the spec.
+        util.enable_lazy_imports()
+        loader = util.find_spec('lazymod').loader
+        self.assertIsInstance(loader, util.LazyLoader)
+        self.assertEqual(loader.get_source('lazymod'), 'executed = True')
+        self.assertIsNotNone(loader.get_code('lazymod'))
+
+    def test_builtin_modules(self):
+        util.enable_lazy_imports()
+        with import_helper.CleanImport('_testcapi'):
+            _testcapi = import_helper.import_module('_testcapi')
+            self.assertNotIsInstance(_testcapi, util._LazyModule)
+
+    def test_include(self):
+        util.enable_lazy_imports(include=['lazypkg'])
+        import lazymod
+        self.assertEager('lazymod')
+        import lazypkg.sub
+        self.assertLazy('lazypkg.sub')
+
+    def test_exclude(self):
+        util.enable_lazy_imports(exclude=['lazypkg.sub'])
+        import lazymod
+        self.assertLazy('lazymod')
+        import lazypkg.sub
+        self.assertEager('lazypkg.sub')
+
+    def test_walk_sys_modules(self):
+        # Reading the metadata of the modules in sys.modules does not
+        # execute them, which would import more modules.
+        util.enable_lazy_imports()
+        import lazymod
+        import lazypkg.sub
+        for attr in ('__file__', '__path__', '__name__', '__loader__',
+                     '__package__', '__spec__', '__cached__',
+                     '__warningregistry__'):
+            with self.subTest(attr=attr):
+                for module in sys.modules.values():
+                    getattr(module, attr, None)
+        self.assertLazy('lazymod')
+        self.assertEqual(lazypkg.__path__,
+                         [os.path.join(self.tmpdir, 'lazypkg')])
+        self.assertLazy('lazypkg.sub')
+        self.assertEqual(lazypkg.sub.__file__,
+                         os.path.join(self.tmpdir, 'lazypkg', 'sub.py'))
+        self.assertLazy('lazypkg.sub')
+        script_helper.assert_python_ok(
+            '-X', 'lazy_imports', '-c',
+            'import sys, json, csv\n'
+            '[getattr(m, "__file__", None) for m in sys.modules.values()]')
+
+    def test_submodule_path(self):
+        # A package extending its __path__ is executed before its
+        # submodules are imported.
+        pkg = os.path.join(self.tmpdir, 'pathpkg')
+        os.mkdir(pkg)
+        extra = os.path.join(self.tmpdir, 'extra')
+        os.mkdir(extra)
+        script_helper.make_script(pkg, '__init__',
+                                  f'__path__.append({extra!r})')
+        script_helper.make_script(extra, 'sub', 'executed = True')
+        importlib.invalidate_caches()
+        util.enable_lazy_imports()
+        import pathpkg.sub
+        self.assertLazy('pathpkg.sub')
+
+    def test_submodule_alias(self):
+        # The package registers a submodule alias in sys.modules when it
+        # is executed, while the submodule is being imported.
+        pkg = os.path.join(self.tmpdir, 'aliaspkg')
+        os.mkdir(pkg)
+        script_helper.make_script(pkg, '__init__',
+                                  'import sys, lazymod as alias\n'
+                                  'sys.modules["aliaspkg.alias"] = alias')
+        importlib.invalidate_caches()
+        util.enable_lazy_imports()
+        import aliaspkg.alias
+        self.assertIs(aliaspkg.alias, sys.modules['lazymod'])
+
+    def test_disable(self):
+        util.enable_lazy_imports()
+        util.enable_lazy_imports()
+        self.assertEqual(sum(isinstance(finder, util._LazyImportFinder)
+                             for finder in sys.meta_path), 1)
+        util.disable_lazy_imports()
+        self.assertFalse(any(isinstance(finder, util._LazyImportFinder)
+                             for finder in sys.meta_path))
+        import lazymod
+        self.assertEager('lazymod')
+
+    def test_option(self):
+        code = ('import sys, importlib.util\n'
+                f'sys.path.insert(0, {self.tmpdir!r})\n'
+                'import lazymod\n'
+                'print(isinstance(lazymod, importlib.util._LazyModule))')
+        for args, env, expected in [
+            ((), {}, b'False'),
+            (('-X', 'lazy_imports'), {}, b'True'),
+            (('-X', 'lazy_imports=lazymod'), {}, b'True'),
+            (('-X', 'lazy_imports=json'), {}, b'False'),
+            (('-X', 'lazy_imports=all,-lazymod'), {}, b'False'),
+            ((), {'PYTHONLAZYIMPORTS': '1'}, b'True'),
+            ((), {'PYTHONLAZYIMPORTS': '-lazymod'}, b'False'),
+            (('-X', 'lazy_imports=-lazymod'), {'PYTHONLAZYIMPORTS': '1'},
+             b'False'),
+            (('-E',), {'PYTHONLAZYIMPORTS': '1'}, b'False'),
+        ]:
+            with self.subTest(args=args, env=env):
+                res = script_helper.assert_python_ok(
+                    *args, '-c', code, **env)
+                self.assertEqual(res.out.strip(), expected)
+
+    def test_option_stdlib(self):
+        # collections registers collections.abc as an alias when executed.
+        for name in ('collections.abc', 'asyncio', 'logging',
+                     'concurrent.futures'):
+            with self.subTest(name=name):
+                script_helper.assert_python_ok(
+                    '-X', 'lazy_imports', '-c', f'import {name}; {name}.__dict__')
+
+
 if __name__ == '__main__':
     unittest.main()
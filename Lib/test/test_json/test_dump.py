@@ -9,6 +9,47 @@ def test_dump(self):
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_same_as_dumps(self):
+        obj = {'a': [1, 2.5, None, True, {'b': 'c\u20ac'}], 'd': {}, 'e': []}
+        for kwargs in [{}, {'indent': 2}, {'indent': '\t'}, {'indent': 0},
+                       {'sort_keys': True, 'separators': (',', ':')},
+                       {'ensure_ascii': False, 'check_circular': False}]:
+            with self.subTest(**kwargs):
+                sio = StringIO()
+                self.json.dump(obj, sio, **kwargs)
+                self.assertEqual(sio.getvalue(), self.dumps(obj, **kwargs))
+
+    def test_dump_large(self):
+        obj = [{'key': i, 'value': [str(i)] * 10} for i in range(5000)]
+        chunks = []
+        class Writer:
+            write = chunks.append
+        self.json.dump(obj, Writer, indent=2)
+        self.assertEqual(''.join(chunks), self.dumps(obj, indent=2))
+        self.assertEqual(self.loads(''.join(chunks)), obj)
+
+    def test_dump_error(self):
+        sio = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump([1, 2, object()], sio)
+
+    def test_dump_write_mutating_dict(self):
+        # The output is written while the dict is being encoded.
+        obj = {str(i): 'x' * 100 for i in range(2000)}
+        class Writer:
+            def write(chunk):
+                obj[f'new{len(obj)}'] = None
+        with self.assertRaisesRegex(RuntimeError, 'changed size'):
+            self.json.dump(obj, Writer)
+
+    def test_dump_iterencode_override(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield '"spam"'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '"spam"')
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
@@ -62,6 +103,16 @@ class TestPyDump(TestDump, PyTest): pass
 
 class TestCDump(TestDump, CTest):
 
+    def test_dump_chunks(self):
+        # The C encoder writes large chunks.
+        obj = [{'key': i, 'value': [str(i)] * 10} for i in range(5000)]
+        chunks = []
+        class Writer:
+            write = chunks.append
+        self.json.dump(obj, Writer, indent=2)
+        self.assertGreater(len(chunks), 1)
+        self.assertLess(len(chunks), 100)
+
     # The size requirement here is hopefully over-estimated (actual
     # memory consumption depending on implementation details, and also
     # system memory management, since this may allocate a lot of
@@ -0,0 +1,138 @@
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOC = [
+    {"a\xe9\U0001d11e\n": [1.5e-3, -25.0, True, False, None, -1234567]},
+    "x\"y\\z", [], {}, 1, 23, -4.5e10, "",
+]
+
+
+class TestIterload:
+    def decode_chunks(self, data, size, **kwargs):
+        decoder = self.json.JSONIncrementalDecoder(**kwargs)
+        values = []
+        for i in range(0, len(data), size):
+            values += decoder.decode(data[i:i+size])
+        values += decoder.decode(data[:0], final=True)
+        return values
+
+    def test_chunks(self):
+        text = self.dumps(DOC)
+        for size in range(1, 10):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode_chunks(text, size), DOC)
+
+    def test_bytes(self):
+        text = self.dumps(DOC, ensure_ascii=False)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-32', 'utf-32-be'):
+            data = text.encode(encoding)
+            for size in (1, 3, 7):
+                with self.subTest(encoding=encoding, size=size):
+                    self.assertEqual(self.decode_chunks(data, size), DOC)
+
+    def test_values_returned_early(self):
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertEqual(decoder.decode('[1, "ab'), [1])
+        self.assertEqual(decoder.decode('c", 2'), ['abc'])
+        # A number is only complete once followed by a delimiter.
+        self.assertEqual(decoder.decode('3'), [])
+        self.assertEqual(decoder.decode('.5e'), [])
+        self.assertEqual(decoder.decode('1 ,tr'), [23.5e1])
+        self.assertEqual(decoder.decode('ue]'), [True])
+        self.assertEqual(decoder.decode(' ', final=True), [])
+
+    def test_empty_array(self):
+        self.assertEqual(self.decode_chunks('[]', 1), [])
+        self.assertEqual(self.decode_chunks(' [ ] \n', 1), [])
+
+    def test_lines(self):
+        text = ''.join(self.dumps(value) + '\n' for value in DOC)
+        for size in (1, 5, 64):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode_chunks(text, size, lines=True),
+                                 DOC)
+        self.assertEqual(self.decode_chunks('1\r\n\n  \n[2]', 2, lines=True),
+                         [1, [2]])
+
+    def test_lines_invalid(self):
+        decoder = self.json.JSONIncrementalDecoder(lines=True)
+        self.assertEqual(decoder.decode('1\n'), [1])
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Extra data'):
+            decoder.decode('1 2\n')
+
+    def test_invalid(self):
+        tests = [
+            ('', 'Expecting value'),
+            ('{}', "Expecting '\\['"),
+            ('[', 'Expecting value'),
+            ('[1,', 'Expecting value'),
+            ('[1,]', 'Illegal trailing comma before end of array'),
+            ('[1 2]', "Expecting ',' delimiter"),
+            ('[1] 2', 'Extra data'),
+            ('[tru]', 'Expecting value'),
+            ('[1.]', "Expecting ',' delimiter"),
+            ('["\\u12"]', 'Invalid \\\\uXXXX escape'),
+            ('["abc', 'Unterminated string starting at'),
+            ('\ufeff[]', 'Unexpected UTF-8 BOM'),
+        ]
+        for text, msg in tests:
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(self.JSONDecodeError, msg):
+                    self.decode_chunks(text, 1)
+
+    def test_invalid_detected_early(self):
+        decoder = self.json.JSONIncrementalDecoder()
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Expecting value'):
+            decoder.decode('[x')
+        # Values preceding the error are returned first.
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertEqual(decoder.decode('[1, x'), [1])
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Expecting value'):
+            decoder.decode(']')
+
+    def test_reset(self):
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertEqual(decoder.decode('[1, 2'), [1])
+        decoder.reset()
+        self.assertEqual(decoder.decode('[3]', final=True), [3])
+
+    def test_decoder(self):
+        decoder = self.json.JSONIncrementalDecoder(
+            self.json.JSONDecoder(parse_int=str))
+        self.assertEqual(decoder.decode('[1, {"a": 2}]'), ['1', {'a': '2'}])
+
+    def test_type_error(self):
+        decoder = self.json.JSONIncrementalDecoder()
+        self.assertRaises(TypeError, decoder.decode, ['[]'])
+
+    def test_iterload(self):
+        text = self.dumps(DOC)
+        self.assertEqual(list(self.json.iterload(StringIO(text))), DOC)
+        self.assertEqual(list(self.json.iterload(BytesIO(text.encode()))),
+                         DOC)
+        it = self.json.iterload(StringIO('[1, {"a": 2.5}]'),
+                                parse_float=str, object_hook=len)
+        self.assertEqual(list(it), [1, 1])
+
+    def test_iterload_lines(self):
+        text = '{"a": 1}\n[2]\n"3"\n'
+        self.assertEqual(list(self.json.iterload(StringIO(text), lines=True)),
+                         [{'a': 1}, [2], '3'])
+
+    def test_iterload_large(self):
+        chunk_size = self.json._ITERLOAD_CHUNK_SIZE
+        doc = ['x' * (3 * chunk_size), list(range(chunk_size)), 'y']
+        it = self.json.iterload(StringIO(self.dumps(doc)))
+        self.assertEqual(list(it), doc)
+
+    def test_iterload_lazy(self):
+        it = self.json.iterload(StringIO('[1, 2, oops]'))
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        self.assertRaises(self.JSONDecodeError, next, it)
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
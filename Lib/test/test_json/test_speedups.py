@@ -59,6 +59,55 @@ def bad_encoder2(*args):
         with self.assertRaises(ZeroDivisionError):
             enc('spam', 4)
 
+    def test_encoder_dump(self):
+        for indent in None, '  ':
+            enc = self.json.encoder.c_make_encoder(
+                {}, None, self.json.encoder.c_encode_basestring, indent,
+                ': ', ',', False, False, True)
+            obj = [list(range(10)), {'a': 'b' * 20, 'c': [None, 1.5]}]
+            expected = self.dumps(obj, indent=indent, separators=(',', ': '))
+            for chunk_size in 1, 7, 100, 10000:
+                with self.subTest(indent=indent, chunk_size=chunk_size):
+                    chunks = []
+                    self.assertIsNone(enc.dump(obj, chunks.append, chunk_size))
+                    self.assertEqual(''.join(chunks), expected)
+                    if chunk_size > len(expected):
+                        self.assertEqual(len(chunks), 1)
+                    else:
+                        self.assertGreater(len(chunks), 1)
+            chunks = []
+            enc.dump(obj, chunks.append)
+            self.assertEqual(chunks, [expected])
+
+    def test_encoder_dump_mutating(self):
+        enc = self.json.encoder.c_make_encoder(
+            {}, None, self.json.encoder.c_encode_basestring, None,
+            ': ', ', ', False, False, True)
+        obj = {'a': [1, 2], 'b': {'c': [3]}, 'd': 4}
+        self.assertRaises(RuntimeError, enc.dump, obj,
+                          lambda chunk: obj.clear(), 1)
+        # A list shrinking while it is encoded is truncated, like with
+        # the Python encoder.
+        lst = [[1, 2], {'a': [3]}, 4]
+        chunks = []
+        def write(chunk):
+            chunks.append(chunk)
+            lst.clear()
+        enc.dump(lst, write, 1)
+        self.assertEqual(''.join(chunks), '[[1, 2]]')
+
+        with self.assertRaises(ValueError):
+            enc.dump(obj, chunks.append, 0)
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.c_encode_basestring, None,
+            ': ', ', ', False, False, True)
+        def write(chunk):
+            1/0
+        with self.assertRaises(ZeroDivisionError):
+            enc.dump(obj, write, 1)
+        with self.assertRaises(ZeroDivisionError):
+            enc.dump(obj, write)
+
     def test_bad_markers_argument_to_encoder(self):
         # https://bugs.python.org/issue45269
         with self.assertRaisesRegex(
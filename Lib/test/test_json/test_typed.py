@@ -0,0 +1,208 @@
+import dataclasses
+import enum
+from typing import Annotated, Any, NewType, NotRequired, Optional, TypedDict
+from test.test_json import PyTest, CTest
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+UserId = NewType('UserId', int)
+
+@dataclasses.dataclass
+class Point:
+    x: float
+    y: float
+    label: str | None = None
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: list['Node'] = dataclasses.field(default_factory=list)
+    parent: Optional['Node'] = None
+    size: int = dataclasses.field(default=0, init=False)
+
+@dataclasses.dataclass
+class Checked:
+    value: int
+
+    def __post_init__(self):
+        if self.value < 0:
+            raise ValueError('negative value')
+
+class Movie(TypedDict):
+    title: str
+    year: int
+    tags: NotRequired[list[str]]
+
+
+class TestTyped:
+    # The pure Python scanner reports errors at the start of the document.
+    exact_positions = True
+
+    def assertDecodeError(self, s, tp, msg, pos):
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.loads(s, type=tp)
+        self.assertEqual(cm.exception.msg, msg)
+        self.assertEqual(cm.exception.pos, pos if self.exact_positions else 0)
+
+    def test_scalars(self):
+        self.assertEqual(self.loads('"a"', type=str), 'a')
+        self.assertEqual(self.loads('1', type=int), 1)
+        self.assertIs(self.loads('true', type=bool), True)
+        self.assertIsNone(self.loads('null', type=None))
+        self.assertEqual(self.loads('1.5', type=float), 1.5)
+        value = self.loads('2', type=float)
+        self.assertIs(type(value), float)
+        self.assertEqual(value, 2.0)
+        self.assertEqual(self.loads('[1, "a"]', type=Any), [1, 'a'])
+        self.assertEqual(self.loads('{"a": 1}', type=object), {'a': 1})
+        self.assertEqual(self.loads('3', type=UserId), 3)
+        self.assertEqual(self.loads('3', type=Annotated[int, 'meta']), 3)
+
+        self.assertDecodeError('1', str, 'Expecting str', 0)
+        self.assertDecodeError('true', int, 'Expecting int', 0)
+        self.assertDecodeError('1.5', int, 'Expecting int', 0)
+        self.assertDecodeError('"1"', float, 'Expecting float', 0)
+        self.assertDecodeError('null', bool, 'Expecting bool', 0)
+        self.assertDecodeError('[]', str, 'Expecting str', 0)
+
+    def test_enum(self):
+        self.assertIs(self.loads('"red"', type=Color), Color.RED)
+        self.assertIs(self.loads('2', type=Level), Level.HIGH)
+        self.assertDecodeError('1', Color, 'Expecting Color', 0)
+        self.assertDecodeError('"blue"', Color, "'blue' is not a valid Color",
+                               0)
+        self.assertDecodeError('[1, 3]', list[Level],
+                               '3 is not a valid Level', 4)
+
+    def test_float_overflow(self):
+        self.assertDecodeError('[1e3, 1%s]' % ('0' * 400), list[float],
+                               'int too large to convert to float', 6)
+
+    def test_optional_and_unions(self):
+        self.assertIsNone(self.loads('null', type=int | None))
+        self.assertEqual(self.loads('1', type=Optional[int]), 1)
+        self.assertEqual(self.loads('[1, "a", 2.5]', type=list[int | str | float]),
+                         [1, 'a', 2.5])
+        self.assertDecodeError('"a"', int | None, 'Expecting int', 0)
+        self.assertDecodeError('null', int | str, 'Expecting int or str', 0)
+        with self.assertRaises(TypeError):
+            self.loads('1', type=list[int] | dict[str, int])
+
+    def test_containers(self):
+        self.assertEqual(self.loads('[1, 2]', type=list[int]), [1, 2])
+        self.assertEqual(self.loads('[1, 2]', type=list), [1, 2])
+        self.assertEqual(self.loads('[1, 2, 1]', type=set[int]), {1, 2})
+        self.assertEqual(self.loads('[1, 2]', type=frozenset[int]),
+                         frozenset({1, 2}))
+        self.assertEqual(self.loads('[1, 2]', type=tuple[int, ...]), (1, 2))
+        self.assertEqual(self.loads('[1, "a"]', type=tuple[int, str]),
+                         (1, 'a'))
+        self.assertEqual(self.loads('[]', type=tuple[()]), ())
+        self.assertEqual(self.loads('{"a": [1], "b": []}',
+                                    type=dict[str, list[int]]),
+                         {'a': [1], 'b': []})
+        self.assertEqual(self.loads('{"a": 1}', type=dict), {'a': 1})
+
+        self.assertDecodeError('{}', list[int], 'Expecting array', 0)
+        self.assertDecodeError('[]', dict[str, int], 'Expecting object', 0)
+        self.assertDecodeError('[1, "a"]', list[int], 'Expecting int', 4)
+        self.assertDecodeError('{"a": "b"}', dict[str, int], 'Expecting int', 6)
+        self.assertDecodeError('[1]', tuple[int, str], 'Expecting 2 items', 0)
+        self.assertDecodeError('[1, "a", 2]', tuple[int, str],
+                               'Expecting 2 items', 0)
+        with self.assertRaises(TypeError):
+            self.loads('{}', type=dict[int, str])
+
+    def test_dataclass(self):
+        self.assertEqual(self.loads('{"x": 1, "y": 2.5}', type=Point),
+                         Point(1.0, 2.5))
+        self.assertEqual(self.loads('[{"y": 0, "x": 1, "label": "a"}]',
+                                    type=list[Point]),
+                         [Point(1.0, 0.0, 'a')])
+        self.assertDecodeError('{"x": 1}', Point, "Missing key 'y'", 0)
+        self.assertDecodeError('{"x": 1, "y": 2, "z": 3}', Point,
+                               "Unexpected key 'z'", 17)
+        self.assertDecodeError('{"x": 1, "y": "2"}', Point,
+                               'Expecting float', 14)
+        self.assertDecodeError('[]', Point, 'Expecting object', 0)
+
+    def test_recursive_dataclass(self):
+        node = self.loads('{"name": "a", "children": [{"name": "b"}, '
+                          '{"name": "c", "parent": {"name": "d"}}]}',
+                          type=Node)
+        self.assertEqual(node, Node('a', [Node('b'),
+                                          Node('c', parent=Node('d'))]))
+        # Fields with init=False cannot be set.
+        self.assertDecodeError('{"name": "a", "size": 1}', Node,
+                               "Unexpected key 'size'", 14)
+
+    def test_dataclass_post_init(self):
+        self.assertEqual(self.loads('{"value": 1}', type=Checked), Checked(1))
+        with self.assertRaisesRegex(ValueError, 'negative value'):
+            self.loads('{"value": -1}', type=Checked)
+
+    def test_typeddict(self):
+        self.assertEqual(
+            self.loads('{"title": "a", "year": 2000}', type=Movie),
+            {'title': 'a', 'year': 2000})
+        self.assertEqual(
+            self.loads('{"title": "a", "year": 2000, "tags": ["b"]}',
+                       type=Movie),
+            {'title': 'a', 'year': 2000, 'tags': ['b']})
+        self.assertDecodeError('{"title": "a"}', Movie, "Missing key 'year'", 0)
+        self.assertDecodeError('{"title": "a", "year": 2000, "tags": [1]}',
+                               Movie, 'Expecting str', 38)
+
+    def test_hooks(self):
+        # Hooks are only called for objects decoded as Any.
+        hook = lambda obj: ('hooked', obj)
+        self.assertEqual(
+            self.loads('{"a": {"b": 1}}', type=dict[str, Any],
+                       object_hook=hook),
+            {'a': ('hooked', {'b': 1})})
+        self.assertEqual(
+            self.loads('{"a": {"b": 1}}', type=dict[str, Any],
+                       object_pairs_hook=hook),
+            {'a': ('hooked', [('b', 1)])})
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(type=list[Point])
+        self.assertEqual(decoder.type, list[Point])
+        self.assertEqual(decoder.decode('[{"x": 1, "y": 2}]'), [Point(1, 2)])
+        self.assertEqual(decoder.raw_decode('[] []'), ([], 2))
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Extra data'):
+            self.loads('[1] x', type=list[int])
+
+    def test_unhashable_type(self):
+        self.assertEqual(
+            self.loads('{"x": 1}', type=dict[str, Annotated[int, []]]),
+            {'x': 1})
+        self.assertDecodeError('{"x": "a"}', dict[str, Annotated[int, []]],
+                               'Expecting int', 6)
+
+    def test_unsupported_type(self):
+        for tp in (bytes, complex, list[int] | list[str]):
+            with self.subTest(tp=tp):
+                with self.assertRaises(TypeError):
+                    self.json.JSONDecoder(type=tp)
+
+
+class TestPyTyped(TestTyped, PyTest):
+    exact_positions = False
+
+class TestCTyped(TestTyped, CTest):
+
+    def test_invalid_plan(self):
+        scanner = self.json.scanner.make_scanner(self.json.JSONDecoder())
+        for plan in (1, [], [99, None, None, None], [0, None, [], ()],
+                     [4, None, (int,), None]):
+            with self.subTest(plan=plan):
+                with self.assertRaises(TypeError):
+                    scanner('{}', 0, plan)
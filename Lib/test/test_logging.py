@@ -851,6 +851,56 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+        h.addFilter(lambda record: record.msg != 'skipped')
+        records = [logging.makeLogRecord({'msg': msg, 'levelname': 'INFO'})
+                   for msg in ('spam', 'skipped', 'eggs')]
+        emitted = h.handleBatch(records)
+        self.assertEqual(emitted, [records[0], records[2]])
+        self.assertEqual(stream.getvalue(), 'INFO:spam\nINFO:eggs\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(stream.flushes, 1)
+        self.assertEqual(h.handleBatch([records[1]]), [])
+        self.assertEqual(stream.writes, 1)
+        h.close()
+
+    def test_handle_batch_error_handling(self):
+        stream = io.StringIO()
+        h = TestStreamHandler(stream)
+        bad = logging.makeLogRecord({'msg': '%d', 'args': ('spam',)})
+        good = logging.makeLogRecord({'msg': 'eggs'})
+        h.handleBatch([bad, good])
+        self.assertIs(h.error_record, bad)
+        self.assertEqual(stream.getvalue(), 'eggs\n')
+
+        h = TestStreamHandler(BadStream())
+        h.handleBatch([good, good])
+        self.assertIs(h.error_record, good)
+
+    def test_handle_batch_emit_override(self):
+        class EmitHandler(logging.StreamHandler):
+            def emit(self, record):
+                self.stream.write('<%s>' % record.msg)
+        stream = CountingStream()
+        h = EmitHandler(stream)
+        h.handleBatch([logging.makeLogRecord({'msg': msg})
+                       for msg in ('spam', 'eggs')])
+        self.assertEqual(stream.getvalue(), '<spam><eggs>')
+        self.assertEqual(stream.writes, 2)
+
+class CountingStream(io.StringIO):
+    writes = flushes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+    def flush(self):
+        self.flushes += 1
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -1904,6 +1954,23 @@ def test_output(self):
         self.handled.acquire()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_handle_batch(self):
+        if self.server_exception:
+            self.skipTest(self.server_exception)
+        sent = []
+        send = self.sock_hdlr.send
+        def counting_send(s):
+            sent.append(s)
+            send(s)
+        self.sock_hdlr.send = counting_send
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'eggs', 'ham')]
+        self.sock_hdlr.handleBatch(records)
+        for _ in records:
+            self.handled.acquire()
+        self.assertEqual(self.log_output, "spam\neggs\nham\n")
+        self.assertEqual(len(sent), 1)
+
     def test_noserver(self):
         if self.server_exception:
             self.skipTest(self.server_exception)
@@ -3949,6 +4016,20 @@ def test_config_queue_handler(self):
             msg = str(ctx.exception)
             self.assertEqual(msg, "Unable to configure handler 'ah'")
 
+    def test_config_queue_handler_batch_size(self):
+        self.apply_config({
+            "version": 1,
+            "handlers": {
+                "ah": {
+                    "class": "logging.handlers.QueueHandler",
+                    "batch_size": 10,
+                },
+            },
+        })
+        qh = logging.getHandlerByName('ah')
+        self.assertEqual(qh.listener.batch_size, 10)
+        self.assertIsNone(qh.listener._thread)
+
     def _apply_simple_queue_listener_configuration(self, qspec):
         self.apply_config({
             "version": 1,
@@ -4363,6 +4444,68 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_size(self):
+        class BatchHandler(TestHandler):
+            def handleBatch(self, records):
+                self.batches.append(len(records))
+                return super().handleBatch(records)
+
+        handler = BatchHandler(support.Matcher())
+        handler.batches = []
+        low = BatchHandler(support.Matcher())
+        low.batches = []
+        handler.setLevel(logging.ERROR)
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, low, respect_handler_level=True,
+            batch_size=3)
+        # The records are already waiting when the listener starts.
+        for level in (logging.WARNING, logging.ERROR, logging.ERROR,
+                      logging.CRITICAL, logging.WARNING):
+            self.que_logger.log(level, self.next_message())
+        listener.start()
+        listener.stop()
+        self.assertEqual(low.batches, [3, 2])
+        self.assertEqual(handler.batches, [2, 1])
+        self.assertEqual([r['message'] for r in low.buffer],
+                         ['1', '2', '3', '4', '5'])
+        self.assertEqual([r['message'] for r in handler.buffer],
+                         ['2', '3', '4'])
+        self.queue.join()
+        handler.close()
+        low.close()
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch_size_handle_override(self):
+        class Handler(TestHandler):
+            def handle(self, record):
+                # Custom filtering in handle()
+                if record.levelno >= logging.ERROR:
+                    return super().handle(record)
+                return False
+
+        handler = Handler(support.Matcher())
+        listener = logging.handlers.QueueListener(self.queue, handler,
+                                                  batch_size=10)
+        for level in (logging.WARNING, logging.ERROR, logging.WARNING,
+                      logging.CRITICAL):
+            self.que_logger.log(level, self.next_message())
+        listener.start()
+        listener.stop()
+        self.assertEqual([r['message'] for r in handler.buffer], ['2', '4'])
+        self.queue.join()
+        handler.close()
+
+    def test_queue_listener_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            logging.handlers.QueueListener(self.queue, batch_size=0)
+        with self.assertRaises(TypeError):
+            logging.handlers.QueueListener(self.queue, batch_size=2.5)
+        with self.assertRaises(TypeError):
+            logging.handlers.QueueListener(self.queue, batch_size=None)
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -6201,6 +6344,17 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+    def test_handle_batch_delay(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        self.assertIsNone(fh.stream)
+        fh.handleBatch([self.next_rec(), self.next_rec()])
+        self.assertIsNotNone(fh.stream)
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), '1\n2\n')
+
     def test_emit_after_closing_in_write_mode(self):
         # Issue #42378
         os.unlink(self.fn)
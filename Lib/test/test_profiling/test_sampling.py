@@ -0,0 +1,184 @@
+import contextlib
+import io
+import marshal
+import os
+import pstats
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from test.support import SHORT_TIMEOUT, import_helper, os_helper
+from test.support.script_helper import make_script
+
+_remote_debugging = import_helper.import_module('_remote_debugging')
+
+from profiling.sampling import (
+    CollapsedStackCollector, PstatsCollector, SampleProfiler, sample)
+from profiling.sampling.sample import main
+
+
+FOO = ('a.py', 10, 'foo')
+BAR = ('a.py', 20, 'bar')
+BAZ = ('b.py', 1, 'baz')
+
+skip_if_not_supported = unittest.skipIf(
+    (sys.platform != "darwin" and sys.platform != "linux") or
+    (sys.platform == "linux" and
+     not _remote_debugging.PROCESS_VM_READV_SUPPORTED),
+    "Test only runs on Linux with process_vm_readv support and on macOS")
+
+
+class TestPstatsCollector(unittest.TestCase):
+
+    def test_create_stats(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, [FOO, BAR])])
+        collector.collect([(1, [FOO, BAR]), (2, [BAZ])])
+        collector.collect([(1, [BAR])])
+        collector.collect([(1, [])])
+        collector.create_stats()
+        stats = collector.stats
+        self.assertEqual(set(stats), {FOO, BAR, BAZ})
+        self.assertEqual(stats[FOO],
+                         (2, 2, 0.002, 0.002, {BAR: (2, 2, 0.002, 0.002)}))
+        self.assertEqual(stats[BAR], (3, 3, 0.001, 0.003, {}))
+        self.assertEqual(stats[BAZ], (1, 1, 0.001, 0.001, {}))
+
+    def test_recursion(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, [FOO, FOO, FOO, BAR])])
+        collector.create_stats()
+        self.assertEqual(collector.stats[FOO][:4], (1, 1, 0.001, 0.001))
+        self.assertEqual(collector.stats[FOO][4],
+                         {FOO: (1, 1, 0.001, 0.001), BAR: (1, 1, 0, 0.001)})
+
+    def test_pstats(self):
+        collector = PstatsCollector(sample_interval_usec=500)
+        collector.collect([(1, [FOO, BAR])])
+        stream = io.StringIO()
+        stats = pstats.Stats(collector, stream=stream)
+        stats.sort_stats('tottime').print_stats()
+        self.assertIn('a.py:10(foo)', stream.getvalue())
+
+    def test_export(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, [FOO, BAR])])
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        collector.export(filename)
+        with open(filename, 'rb') as f:
+            self.assertEqual(marshal.load(f), collector.stats)
+        stats = pstats.Stats(filename, stream=io.StringIO())
+        self.assertEqual(stats.total_calls, 2)
+
+
+class TestCollapsedStackCollector(unittest.TestCase):
+
+    def test_export(self):
+        collector = CollapsedStackCollector()
+        collector.collect([(1, [FOO, BAR]), (2, [BAZ])])
+        collector.collect([(1, [FOO, BAR])])
+        collector.collect([(1, [])])
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        collector.export(filename)
+        with open(filename, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(sorted(lines),
+                         ['a.py:bar:20;a.py:foo:10 2', 'b.py:baz:1 1'])
+
+
+@skip_if_not_supported
+class TestSampleProfiler(unittest.TestCase):
+
+    @contextlib.contextmanager
+    def target_process(self):
+        script = textwrap.dedent("""\
+            import sys
+            def busy_function():
+                while True:
+                    pass
+            def main():
+                sys.stdout.write("ready\\n")
+                sys.stdout.flush()
+                busy_function()
+            main()
+            """)
+        with os_helper.temp_dir() as work_dir:
+            script_name = make_script(work_dir, 'script', script)
+            p = subprocess.Popen([sys.executable, script_name],
+                                 stdout=subprocess.PIPE)
+            try:
+                self.assertEqual(p.stdout.readline(), b'ready\n')
+                yield p
+            finally:
+                p.kill()
+                p.wait(timeout=SHORT_TIMEOUT)
+                p.stdout.close()
+
+    def make_profiler(self, pid, **kwargs):
+        try:
+            return SampleProfiler(pid, 1000, **kwargs)
+        except PermissionError:
+            self.skipTest("Insufficient permissions to read the stacks")
+
+    def test_sample(self):
+        with self.target_process() as p:
+            profiler = self.make_profiler(p.pid)
+            collector = CollapsedStackCollector()
+            num_samples, num_errors = profiler.sample(collector, 0.2)
+        self.assertGreater(num_samples, 0)
+        self.assertLessEqual(num_errors, num_samples)
+        self.assertTrue(collector.stack_counter)
+        names = [[name for _, _, name in stack]
+                 for stack in collector.stack_counter]
+        self.assertIn(['<module>', 'main', 'busy_function'], names)
+
+    def test_all_threads(self):
+        with self.target_process() as p:
+            profiler = self.make_profiler(p.pid, all_threads=True)
+            stack_frames = profiler.unwinder.get_stack_trace()
+        self.assertEqual(len(stack_frames), 1)
+        thread_id, frames = stack_frames[0]
+        names = [name for _, _, name in frames]
+        self.assertEqual(names[-2:], ['main', '<module>'])
+
+    def test_process_exit(self):
+        with self.target_process() as p:
+            profiler = self.make_profiler(p.pid)
+            p.kill()
+            p.wait(timeout=SHORT_TIMEOUT)
+            # Sampling stops when the process is gone.
+            num_samples, num_errors = profiler.sample(
+                CollapsedStackCollector(), SHORT_TIMEOUT)
+            self.assertEqual(num_samples, 0)
+
+    def test_sample_function(self):
+        with self.target_process() as p:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    sample(p.pid, duration_sec=0.2, sort='tottime', limit=3)
+            except PermissionError:
+                self.skipTest("Insufficient permissions to read the stacks")
+        self.assertIn('(busy_function)', stdout.getvalue())
+        self.assertIn('samples', stdout.getvalue())
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        for args in (['-i', '0', '1'], ['--pstats', '--collapsed', '1'],
+                     ['-s', 'spam', '1'], []):
+            with self.subTest(args=args):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit):
+                        main(args)
+
+    def test_invalid_output_format(self):
+        with self.assertRaises(ValueError):
+            sample(os.getpid(), output_format='spam')
+
+
+if __name__ == '__main__':
+    unittest.main()
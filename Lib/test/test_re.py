@@ -2,11 +2,14 @@
                           cpython_only, captured_stdout,
                           check_disallow_instantiation, is_emscripten, is_wasi,
                           warnings_helper, SHORT_TIMEOUT, CPUStopwatch, requires_resource)
+from test.support import os_helper
+import io
 import locale
 import re
 import string
 import sys
 import unittest
+from unittest import mock
 import warnings
 from re import Scanner
 from weakref import proxy
@@ -2893,6 +2896,150 @@ def test_flags_repr(self):
                          "re.ASCII|re.LOCALE|re.UNICODE|re.MULTILINE|re.DEBUG|0xffe01")
 
 
+class CacheFileTests(unittest.TestCase):
+    def setUp(self):
+        re.purge()
+        self.addCleanup(re.purge)
+
+    def roundtrip(self, patterns=None):
+        f = io.BytesIO()
+        re.save_cache(f, patterns)
+        re.purge()
+        f.seek(0)
+        return re.load_cache(f)
+
+    def test_save_load(self):
+        patterns = [r'(?P<year>\d{4})-(?P<month>\d\d)', (r'a+b', re.I),
+                    (br'(x)(y)?', 0), (r'[\u0100-\u0200]+', re.ASCII)]
+        self.assertEqual(self.roundtrip(patterns), 4)
+        self.assertEqual(len(re._code_cache), 4)
+        # Patterns are not parsed again.
+        with mock.patch.object(re._compiler, 'compile_args',
+                               side_effect=AssertionError):
+            p = re.compile(r'(?P<year>\d{4})-(?P<month>\d\d)')
+            self.assertEqual(p.groupindex, {'year': 1, 'month': 2})
+            self.assertEqual(p.match('2024-05').group('month'), '05')
+            p = re.compile(r'a+b', re.I)
+            self.assertEqual(p.flags, re.I | re.U)
+            self.assertTrue(p.fullmatch('AaB'))
+            self.assertEqual(re.fullmatch(br'(x)(y)?', b'x').groups(),
+                             (b'x', None))
+            self.assertEqual(re.compile(r'[\u0100-\u0200]+', re.ASCII).flags,
+                             re.ASCII)
+        # Other flags are compiled as usual.
+        self.assertFalse(re.fullmatch(r'a+b', 'AaB'))
+
+    def test_save_from_cache(self):
+        re.compile(r'spam+')
+        re.compile(r'ham', re.M)
+        self.assertEqual(self.roundtrip(), 2)
+        self.assertIn((str, r'ham', re.M.value), re._code_cache)
+
+    def test_save_file_name(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        re.save_cache(filename, ['abc'])
+        re.purge()
+        self.assertEqual(re.load_cache(filename), 1)
+        self.assertTrue(re.match('abc', 'abcd'))
+
+    def test_version_mismatch(self):
+        f = io.BytesIO()
+        with mock.patch('sys.hexversion', 0):
+            re.save_cache(f, ['abc'])
+        f.seek(0)
+        self.assertEqual(re.load_cache(f), 0)
+        self.assertEqual(re._code_cache, {})
+
+    def test_bad_file(self):
+        for data in (b'', b'spam', b'\xe9', b'N'):
+            with self.assertRaises(ValueError):
+                re.load_cache(io.BytesIO(data))
+        with self.assertRaises(TypeError):
+            re.save_cache(io.BytesIO(), [42])
+
+    def test_debug_not_saved(self):
+        self.assertEqual(self.roundtrip([('a', re.DEBUG)]), 0)
+
+
+class RegexSetTests(unittest.TestCase):
+    def check(self, patterns, strings, flags=0):
+        rs = re.RegexSet(patterns, flags)
+        compiled = [re.compile(p, flags) for p in patterns]
+        for string in strings:
+            with self.subTest(string=string):
+                for method in 'search', 'match', 'fullmatch':
+                    self.assertEqual(
+                        getattr(rs, method)(string),
+                        [i for i, p in enumerate(compiled)
+                         if getattr(p, method)(string)])
+        return rs
+
+    def test_search(self):
+        rs = re.RegexSet([r'error: (\w+)', r'\d+', r'^warning', r'disk full$'])
+        self.assertEqual(rs.search('error: disk full'), [0, 3])
+        self.assertEqual(rs.search('warning: 42 errors'), [1, 2])
+        self.assertEqual(rs.search(''), [])
+        self.assertEqual(rs.match('error: 1'), [0])
+        self.assertEqual(rs.fullmatch('123'), [1])
+        self.assertEqual(len(rs), 4)
+        self.assertEqual(rs.patterns[1], re.compile(r'\d+'))
+        self.assertEqual(repr(rs), '<re.RegexSet with 4 patterns>')
+
+    def test_same_results(self):
+        patterns = [r'abc', r'a(bc|d)', r'(?:xy)+z', r'x*yz', r'(?i)AbC',
+                    r'a(?i:b)c', r'1(?=2)2', r'\bfoo\b', r'(?>ab)c', r'a{2}b',
+                    r'a{0,2}b', r'.', r'', r'[ab]c', r'(a)\1', r'-\d-',
+                    r'(?i)1-2', r'a++b']
+        strings = ['abc', 'ABC', 'aBc', 'ad', 'xyxyz', 'yz', '12', 'foo bar',
+                   'abc abd', 'aab', 'b', '', 'aa', '-1-', '1-2', 'aaab']
+        self.check(patterns, strings)
+        self.check(patterns, strings, re.I)
+        self.check(patterns, strings, re.A)
+
+    def test_bytes(self):
+        patterns = [rb'abc', rb'\d+x', rb'(?i)k', rb'.']
+        strings = [b'abc', b'12x', b'K', b'', bytearray(b'1x'),
+                   memoryview(b'abc')]
+        self.check(patterns, strings)
+        self.check(patterns, strings, re.L)
+        with self.assertRaises(TypeError):
+            re.RegexSet([rb'abc']).search('abc')
+        with self.assertRaises(TypeError):
+            re.RegexSet([r'abc']).search(b'abc')
+
+    def test_compiled_patterns(self):
+        rs = re.RegexSet([re.compile('a', re.I), 'b'])
+        self.assertEqual(rs.search('A b'), [0, 1])
+        self.assertEqual(rs.patterns[0], re.compile('a', re.I))
+        with self.assertRaises(ValueError):
+            re.RegexSet([re.compile('a')], re.I)
+
+    def test_mixed_types(self):
+        with self.assertRaises(TypeError):
+            re.RegexSet(['a', b'b'])
+
+    def test_empty(self):
+        rs = re.RegexSet([])
+        self.assertEqual(rs.search('abc'), [])
+        self.assertEqual(len(rs), 0)
+
+    def test_required_literal(self):
+        def literal(pattern, flags=0):
+            p = re._parser.parse(pattern, flags)
+            codes = re._compiler._get_required_literal(p, flags | p.state.flags)
+            return ''.join(map(chr, codes))
+        self.assertEqual(literal(r'abc'), 'abc')
+        self.assertEqual(literal(r'ab\d+cdef'), 'cdef')
+        self.assertEqual(literal(r'a(bc)d'), 'abcd')
+        self.assertEqual(literal(r'x(?:ab)+y'), 'ab')
+        self.assertEqual(literal(r'x(?:ab)*y'), 'x')
+        self.assertEqual(literal(r'ab|cd'), '')
+        self.assertEqual(literal(r'\bab\b'), 'ab')
+        self.assertEqual(literal(r'(?i)a-1b'), '-1')
+        self.assertEqual(literal(r'a(?i:bcd)ef'), 'ef')
+
+
 class ImplementationTest(unittest.TestCase):
     """
     Test implementation details of the re module.
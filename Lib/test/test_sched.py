@@ -168,6 +168,19 @@ def test_cancel_correct_event(self):
         scheduler.run()
         self.assertEqual(events, ["a", "c"])
 
+    def test_cancel_not_in_queue(self):
+        events = []
+        scheduler = sched.scheduler()
+        a = scheduler.enterabs(1, 1, events.append, ("a",))
+        b = scheduler.enterabs(2, 1, events.append, ("b",))
+        scheduler.cancel(b)
+        self.assertRaises(ValueError, scheduler.cancel, b)
+        scheduler.run()
+        self.assertEqual(events, ["a"])
+        self.assertRaises(ValueError, scheduler.cancel, a)
+        self.assertRaises(ValueError, scheduler.cancel,
+                          sched.Event(1, 1, 5, events.append, (), {}))
+
     def test_empty(self):
         l = []
         fun = lambda x: l.append(x)
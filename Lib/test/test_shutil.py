@@ -158,6 +158,22 @@ def supports_file2file_sendfile():
 
 SUPPORTS_SENDFILE = supports_file2file_sendfile()
 
+
+def supports_ficlone():
+    if not shutil._USE_CP_FICLONE:
+        return False
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp_dir:
+        srcname = os.path.join(tmp_dir, 'src')
+        create_file(srcname, b"0123456789")
+        with open(srcname, "rb") as src:
+            with open(os.path.join(tmp_dir, 'dst'), "wb") as dst:
+                try:
+                    shutil._fastcopy_ficlone(src, dst)
+                except shutil._GiveupOnFastCopy:
+                    return False
+                else:
+                    return True
+
 # AIX 32-bit mode, by default, lacks enough memory for the xz/lzma compiler test
 # The AIX command 'dump -o program' gives XCOFF header information
 # The second word of the last line in the maxdata value
@@ -1089,6 +1105,76 @@ def test_copytree_return_value(self):
         rv = shutil.copytree(src_dir, dst_dir)
         self.assertEqual(['foo'], os.listdir(rv))
 
+    def test_copytree_workers(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        for i in range(5):
+            subdir = os.path.join(src_dir, *[f'dir{j}' for j in range(i)])
+            os.makedirs(subdir, exist_ok=True)
+            for j in range(20):
+                create_file((subdir, f'file{j}'), f'{i} {j}' * j)
+        restrictive = os.path.join(src_dir, 'dir0', 'restrictive')
+        create_file(restrictive, 'secret')
+        os.chmod(restrictive, 0o600)
+        # The metadata of the directories is copied after their files.
+        os.utime(os.path.join(src_dir, 'dir0'), ns=(10**18, 10**18))
+        os.chmod(os.path.join(src_dir, 'dir0', 'dir1'), 0o500)
+        self.addCleanup(os.chmod, os.path.join(src_dir, 'dir0', 'dir1'),
+                        0o700)
+        self.addCleanup(os.chmod, os.path.join(dst_dir, 'dir0', 'dir1'),
+                        0o700)
+
+        self.assertEqual(shutil.copytree(src_dir, dst_dir, workers=4), dst_dir)
+        for dirpath, dirnames, filenames in os.walk(src_dir):
+            dstpath = os.path.join(dst_dir, os.path.relpath(dirpath, src_dir))
+            self.assertEqual(sorted(os.listdir(dstpath)),
+                             sorted(dirnames + filenames))
+            src_st = os.stat(dirpath)
+            dst_st = os.stat(dstpath)
+            self.assertEqual(src_st.st_mode, dst_st.st_mode)
+            self.assertEqual(src_st.st_mtime_ns, dst_st.st_mtime_ns)
+            for name in filenames:
+                srcname = os.path.join(dirpath, name)
+                dstname = os.path.join(dstpath, name)
+                self.assertEqual(read_file(srcname), read_file(dstname))
+                self.assertEqual(os.stat(srcname).st_mode,
+                                 os.stat(dstname).st_mode)
+
+    def test_copytree_workers_custom_copy_function(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        create_file((src_dir, 'test.txt'), '123')
+        os.mkdir(os.path.join(src_dir, 'test_dir'))
+        create_file((src_dir, 'test_dir', 'test.txt'), '456')
+        create_file((src_dir, 'test_dir', 'fail.txt'), '789')
+
+        copied = []
+        def _copy(src, dst):
+            if os.path.basename(src) == 'fail.txt':
+                raise OSError(errno.EIO, 'deliberate failure')
+            copied.append((src, dst))
+
+        with self.assertRaises(shutil.Error) as cm:
+            shutil.copytree(src_dir, dst_dir, copy_function=_copy, workers=2)
+        self.assertEqual(sorted(copied), [
+            (os.path.join(src_dir, 'test.txt'),
+             os.path.join(dst_dir, 'test.txt')),
+            (os.path.join(src_dir, 'test_dir', 'test.txt'),
+             os.path.join(dst_dir, 'test_dir', 'test.txt')),
+        ])
+        [(src, dst, msg)] = cm.exception.args[0]
+        self.assertEqual(src, os.path.join(src_dir, 'test_dir', 'fail.txt'))
+        self.assertEqual(dst, os.path.join(dst_dir, 'test_dir', 'fail.txt'))
+        self.assertIn('deliberate failure', msg)
+
+    def test_copytree_workers_errors(self):
+        src_dir = self.mkdtemp()
+        dst_dir = self.mkdtemp()
+        with self.assertRaises(ValueError):
+            shutil.copytree(src_dir, dst_dir, workers=0)
+        with self.assertRaises(FileExistsError):
+            shutil.copytree(src_dir, dst_dir, workers=2)
+
     def test_copytree_subdirectory(self):
         # copytree where dst is a subdirectory of src, see Issue 38688
         base_dir = self.mkdtemp()
@@ -3239,10 +3325,88 @@ def test_filesystem_full(self):
                 self.assertRaises(OSError, self.zerocopy_fun, src, dst)
 
 
+@unittest.skipUnless(supports_ficlone(), 'FICLONE not supported')
+class TestZeroCopyFiclone(_ZeroCopyFileTest, unittest.TestCase):
+    PATCHPOINT = "fcntl.ioctl"
+
+    def zerocopy_fun(self, fsrc, fdst):
+        return shutil._fastcopy_ficlone(fsrc, fdst)
+
+
+@unittest.skipIf(not hasattr(os, 'copy_file_range'),
+                 'os.copy_file_range() not supported')
+class TestZeroCopyCopyFileRange(_ZeroCopyFileTest, unittest.TestCase):
+    PATCHPOINT = "os.copy_file_range"
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(unittest.mock.patch('shutil._USE_CP_FICLONE', False))
+
+    def zerocopy_fun(self, fsrc, fdst):
+        return shutil._fastcopy_copy_file_range(fsrc, fdst)
+
+    def test_empty_file(self):
+        srcname = TESTFN + 'src'
+        dstname = TESTFN + 'dst'
+        self.addCleanup(lambda: os_helper.unlink(srcname))
+        self.addCleanup(lambda: os_helper.unlink(dstname))
+        create_file(srcname)
+
+        with open(srcname, "rb") as src:
+            with open(dstname, "wb") as dst:
+                # An empty file cannot be told apart from a file whose
+                # size is not reported, like the files of /proc, so
+                # copy_file_range() gives up and lets sendfile() copy it.
+                with self.assertRaises(_GiveupOnFastCopy):
+                    self.zerocopy_fun(src, dst)
+
+        shutil.copyfile(srcname, dstname)
+        self.assertEqual(read_file(dstname, binary=True), b"")
+
+    def test_exception_on_second_call(self):
+        def copy_file_range(*args, **kwargs):
+            if not flag:
+                flag.append(None)
+                return orig_copy_file_range(*args, **kwargs)
+            else:
+                raise OSError(errno.EBADF, "yo")
+
+        flag = []
+        orig_copy_file_range = os.copy_file_range
+        mock = unittest.mock.Mock()
+        mock.st_size = 65536 + 1
+        with unittest.mock.patch('os.fstat', return_value=mock), \
+             unittest.mock.patch('os.copy_file_range',
+                                 side_effect=copy_file_range):
+            with self.get_files() as (src, dst):
+                with self.assertRaises(OSError) as cm:
+                    shutil._fastcopy_copy_file_range(src, dst)
+        assert flag
+        self.assertEqual(cm.exception.errno, errno.EBADF)
+
+    def test_copy_nothing(self):
+        # copy_file_range() copying nothing on the first call, like with
+        # files of /proc, lets copyfile() fall back to another method.
+        with unittest.mock.patch('os.copy_file_range',
+                                 return_value=0) as m:
+            with self.get_files() as (src, dst):
+                with self.assertRaises(_GiveupOnFastCopy):
+                    shutil._fastcopy_copy_file_range(src, dst)
+            shutil.copyfile(TESTFN, TESTFN2)
+            assert m.called
+        self.assertEqual(read_file(TESTFN2, binary=True), self.FILEDATA)
+
+
 @unittest.skipIf(not SUPPORTS_SENDFILE, 'os.sendfile() not supported')
 class TestZeroCopySendfile(_ZeroCopyFileTest, unittest.TestCase):
     PATCHPOINT = "os.sendfile"
 
+    def setUp(self):
+        super().setUp()
+        self.enterContext(unittest.mock.patch('shutil._USE_CP_FICLONE', False))
+        self.enterContext(
+            unittest.mock.patch('shutil._USE_CP_COPY_FILE_RANGE', False))
+
     def zerocopy_fun(self, fsrc, fdst):
         return shutil._fastcopy_sendfile(fsrc, fdst)
 
@@ -0,0 +1,691 @@
+import contextlib
+import copy
+import itertools
+import operator
+import pickle
+import random
+import sys
+import unittest
+import weakref
+from collections.abc import MutableMapping, MutableSet, Sequence
+from test import support
+from test.support import import_helper
+
+
+py_coll = import_helper.import_fresh_module('collections',
+                                            blocked=['_collections'])
+c_coll = import_helper.import_fresh_module('collections',
+                                           fresh=['_collections'])
+
+
+@contextlib.contextmanager
+def replaced_module(name, replacement):
+    original_module = sys.modules[name]
+    sys.modules[name] = replacement
+    try:
+        yield
+    finally:
+        sys.modules[name] = original_module
+
+class SortedListTests:
+
+    def test_init(self):
+        SortedList = self.SortedList
+        sl = SortedList([3, 1, 2])
+        self.assertEqual(list(sl), [1, 2, 3])
+        self.assertEqual(len(sl), 3)
+        self.assertIsNone(sl.key)
+        self.assertEqual(list(SortedList()), [])
+        self.assertEqual(list(SortedList(iterable='cab')), ['a', 'b', 'c'])
+        sl = SortedList(range(5), key=lambda x: -x)
+        self.assertEqual(list(sl), [4, 3, 2, 1, 0])
+        sl.__init__([2, 1])
+        self.assertEqual(list(sl), [1, 2])
+        self.assertIsNone(sl.key)
+        with self.assertRaises(TypeError):
+            SortedList([], 1)
+        with self.assertRaises(TypeError):
+            SortedList(1)
+        with self.assertRaises(TypeError):
+            SortedList([1, 'a'])
+        with self.assertRaises(AttributeError):
+            sl.key = abs
+
+    def test_add(self):
+        sl = self.SortedList()
+        for x in [5, 1, 4, 1, 3]:
+            sl.add(x)
+        self.assertEqual(list(sl), [1, 1, 3, 4, 5])
+        with self.assertRaises(TypeError):
+            sl.add('a')
+        self.assertEqual(list(sl), [1, 1, 3, 4, 5])
+
+    def test_stable(self):
+        # Values with equal keys are kept in insertion order.
+        key = lambda x: x[0]
+        sl = self.SortedList([(1, 'a'), (0, 'b'), (1, 'c')], key=key)
+        sl.add((1, 'd'))
+        sl.add((0, 'e'))
+        sl.update([(1, 'f'), (0, 'g')])
+        self.assertEqual(list(sl), [(0, 'b'), (0, 'e'), (0, 'g'),
+                                    (1, 'a'), (1, 'c'), (1, 'd'), (1, 'f')])
+
+    def test_update(self):
+        sl = self.SortedList(range(0, 2000, 2))
+        sl.update(range(1, 10, 2))
+        sl.update(range(1999, 0, -2))
+        self.assertEqual(list(sl), sorted([*range(2000), *range(1, 10, 2)]))
+        sl.update(sl)
+        self.assertEqual(len(sl), 2 * (2000 + 5))
+        sl.update([])
+        self.assertEqual(len(sl), 2 * (2000 + 5))
+        with self.assertRaises(TypeError):
+            sl.update(1)
+
+    def test_remove(self):
+        sl = self.SortedList([1, 2, 2, 3])
+        sl.remove(2)
+        self.assertEqual(list(sl), [1, 2, 3])
+        sl.discard(2)
+        sl.discard(2)
+        self.assertEqual(list(sl), [1, 3])
+        with self.assertRaises(ValueError):
+            sl.remove(2)
+        with self.assertRaises(ValueError):
+            sl.remove(4)
+        sl.remove(3.0)
+        self.assertEqual(list(sl), [1])
+
+    def test_remove_key(self):
+        sl = self.SortedList(['ab', 'b', 'cd', 'ef', 'g'], key=len)
+        sl.remove('ef')
+        self.assertEqual(list(sl), ['b', 'g', 'ab', 'cd'])
+        with self.assertRaises(ValueError):
+            sl.remove('xy')
+        sl.discard('x')
+        self.assertEqual(list(sl), ['b', 'g', 'ab', 'cd'])
+
+    def test_pop(self):
+        sl = self.SortedList([3, 1, 2, 0])
+        self.assertEqual(sl.pop(), 3)
+        self.assertEqual(sl.pop(0), 0)
+        self.assertEqual(sl.pop(-2), 1)
+        with self.assertRaises(IndexError):
+            sl.pop(1)
+        self.assertEqual(sl.pop(), 2)
+        with self.assertRaises(IndexError):
+            sl.pop()
+
+    def test_clear(self):
+        sl = self.SortedList(range(10), key=lambda x: -x)
+        sl.clear()
+        self.assertEqual(list(sl), [])
+        self.assertIsNotNone(sl.key)
+        sl.update([1, 2])
+        self.assertEqual(list(sl), [2, 1])
+
+    def test_getitem(self):
+        values = [random.randrange(1000) for i in range(3000)]
+        sl = self.SortedList(values)
+        values.sort()
+        for i in range(-len(values), len(values), 7):
+            self.assertEqual(sl[i], values[i])
+        for s in (slice(None), slice(10, 2000), slice(-5, None),
+                  slice(None, None, -1), slice(1, 2500, 9), slice(5, 1),
+                  slice(2900, 10, -13)):
+            self.assertEqual(sl[s], values[s])
+        self.assertEqual(sl[True], values[1])
+        for i in (3000, -3001, sys.maxsize):
+            with self.assertRaises(IndexError):
+                sl[i]
+        with self.assertRaises(TypeError):
+            sl['a']
+        with self.assertRaises(TypeError):
+            sl[0] = 1
+
+    def test_delitem(self):
+        values = list(range(3000))
+        sl = self.SortedList(values)
+        for index in (0, -1, 1500, slice(10, 20), slice(-100, None),
+                      slice(None, None, 3), slice(1000, 100, -7),
+                      slice(300, 2000), slice(5, 1), slice(None)):
+            del sl[index]
+            del values[index]
+            self.assertEqual(list(sl), values)
+        with self.assertRaises(IndexError):
+            del sl[0]
+
+    def test_delitem_slice_key(self):
+        values = list(range(1000))
+        sl = self.SortedList(values, key=operator.neg)
+        values.reverse()
+        for index in (slice(10, 300), slice(-200, -199), slice(None, None, -2),
+                      slice(7, 100, 5), slice(100, 0, -1), slice(None, 50)):
+            del sl[index]
+            del values[index]
+            self.assertEqual(list(sl), values)
+            self.assertEqual(list(reversed(sl)), values[::-1])
+            self.assertEqual([sl[i] for i in range(len(sl))], values)
+
+    def test_mutation_during_iteration(self):
+        for method, args in [('add', (1,)), ('remove', (5,)),
+                             ('pop', ()), ('clear', ()),
+                             ('update', ([1, 2],)), ('__delitem__', (0,)),
+                             ('__delitem__', (slice(2, 4),)),
+                             ('__delitem__', (slice(None, None, 2),))]:
+            for make_iter in (iter, reversed,
+                              lambda sl: sl.irange(2, 8),
+                              lambda sl: sl.irange(reverse=True)):
+                with self.subTest(method=method, args=args,
+                                  make_iter=make_iter):
+                    sl = self.SortedList(range(10))
+                    it = make_iter(sl)
+                    next(it)
+                    getattr(sl, method)(*args)
+                    with self.assertRaises(RuntimeError):
+                        next(it)
+        sl = self.SortedList(range(10))
+        it = iter(sl)
+        sl.discard(100)
+        del sl[5:5]
+        self.assertEqual(list(it), list(range(10)))
+        # The mutation is detected after the last value too.
+        it = iter(sl)
+        self.assertEqual(list(itertools.islice(it, 10)), list(range(10)))
+        sl.add(10)
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+    def test_contains_index_count(self):
+        sl = self.SortedList([1, 2, 2, 2, 3, 5])
+        self.assertIn(2, sl)
+        self.assertIn(2.0, sl)
+        self.assertNotIn(4, sl)
+        self.assertNotIn(0, sl)
+        self.assertNotIn(6, sl)
+        self.assertEqual(sl.index(2), 1)
+        self.assertEqual(sl.index(2, 2), 2)
+        self.assertEqual(sl.index(2, -4), 2)
+        self.assertEqual(sl.index(5), 5)
+        with self.assertRaises(ValueError):
+            sl.index(2, 4)
+        with self.assertRaises(ValueError):
+            sl.index(2, 0, 1)
+        with self.assertRaises(ValueError):
+            sl.index(4)
+        self.assertEqual(sl.count(2), 3)
+        self.assertEqual(sl.count(4), 0)
+        self.assertEqual(sl.count(5), 1)
+
+    def test_contains_index_count_key(self):
+        sl = self.SortedList(['a', 'bc', 'b', 'de', 'bc', 'fgh'], key=len)
+        self.assertEqual(list(sl), ['a', 'b', 'bc', 'de', 'bc', 'fgh'])
+        self.assertIn('bc', sl)
+        self.assertIn('de', sl)
+        self.assertNotIn('xy', sl)
+        self.assertNotIn('wxyz', sl)
+        self.assertEqual(sl.index('de'), 3)
+        self.assertEqual(sl.index('bc'), 2)
+        self.assertEqual(sl.index('bc', 3), 4)
+        with self.assertRaises(ValueError):
+            sl.index('xy')
+        self.assertEqual(sl.count('bc'), 2)
+        self.assertEqual(sl.count('xy'), 0)
+
+    def test_identity(self):
+        nan = float('nan')
+        sl = self.SortedList([nan])
+        self.assertIn(nan, sl)
+        self.assertEqual(sl.index(nan), 0)
+        sl.remove(nan)
+        self.assertEqual(len(sl), 0)
+
+    def test_bisect(self):
+        sl = self.SortedList([10, 20, 20, 30])
+        for value, left, right in [(5, 0, 0), (10, 0, 1), (15, 1, 1),
+                                   (20, 1, 3), (30, 3, 4), (35, 4, 4)]:
+            self.assertEqual(sl.bisect_left(value), left)
+            self.assertEqual(sl.bisect_right(value), right)
+            self.assertEqual(sl.bisect_key_left(value), left)
+            self.assertEqual(sl.bisect_key_right(value), right)
+        sl = self.SortedList(['a', 'bb', 'cc', 'ddd'], key=len)
+        self.assertEqual(sl.bisect_left('xx'), 1)
+        self.assertEqual(sl.bisect_right('xx'), 3)
+        self.assertEqual(sl.bisect_key_left(2), 1)
+        self.assertEqual(sl.bisect_key_right(2), 3)
+        with self.assertRaises(TypeError):
+            sl.bisect_left(1)
+
+    def test_irange(self):
+        sl = self.SortedList(range(0, 100, 10))
+        self.assertEqual(list(sl.irange(20, 50)), [20, 30, 40, 50])
+        self.assertEqual(list(sl.irange(15, 55)), [20, 30, 40, 50])
+        self.assertEqual(list(sl.irange(20, 50, (False, False))), [30, 40])
+        self.assertEqual(list(sl.irange(20, 50, inclusive=(True, False))),
+                         [20, 30, 40])
+        self.assertEqual(list(sl.irange(20, 50, reverse=True)),
+                         [50, 40, 30, 20])
+        self.assertEqual(list(sl.irange(maximum=20)), [0, 10, 20])
+        self.assertEqual(list(sl.irange(minimum=75)), [80, 90])
+        self.assertEqual(list(sl.irange()), list(sl))
+        self.assertEqual(list(sl.irange(50, 20)), [])
+        self.assertEqual(list(sl.irange(100, 200)), [])
+        self.assertEqual(list(sl.irange(30, 30, (False, True))), [])
+        with self.assertRaises(ValueError):
+            sl.irange(1, 2, (True,))
+        with self.assertRaises(TypeError):
+            sl.irange('a')
+
+    def test_irange_key(self):
+        sl = self.SortedList(range(10), key=lambda x: -x)
+        self.assertEqual(list(sl.irange(7, 4)), [7, 6, 5, 4])
+        self.assertEqual(list(sl.irange(7, 4, reverse=True)), [4, 5, 6, 7])
+        self.assertEqual(list(sl.irange_key(-7, -4)), [7, 6, 5, 4])
+        self.assertEqual(list(sl.irange_key(-7, -4, (False, False))), [6, 5])
+        self.assertEqual(list(sl.irange_key(max_key=-8)), [9, 8])
+
+    def test_iter(self):
+        values = [random.random() for i in range(2500)]
+        sl = self.SortedList(values)
+        values.sort()
+        self.assertEqual(list(sl), values)
+        self.assertEqual(list(reversed(sl)), values[::-1])
+        self.assertEqual(list(sl.irange(values[100], values[2000])),
+                         values[100:2001])
+        self.assertEqual(list(sl.irange(values[100], values[2000],
+                                        reverse=True)),
+                         values[2000:99:-1])
+
+    def test_random(self):
+        for key in (None, lambda x: -x, lambda x: x // 10):
+            k = key or (lambda x: x)
+            sl = self.SortedList(key=key)
+            values = []
+            for i in range(3000):
+                op = random.random()
+                if op < 0.5 or not values:
+                    x = random.randrange(500)
+                    sl.add(x)
+                    values.append(x)
+                elif op < 0.7:
+                    x = random.choice(values)
+                    sl.remove(x)
+                    values.remove(x)
+                elif op < 0.8:
+                    i = random.randrange(-len(values), len(values))
+                    self.assertEqual(sl.pop(i), values.pop(i))
+                elif op < 0.85:
+                    xs = [random.randrange(500)
+                          for i in range(random.randrange(100))]
+                    sl.update(xs)
+                    values.extend(xs)
+                else:
+                    i = random.randrange(len(values))
+                    j = random.randrange(len(values))
+                    step = random.choice([None, 2, -1])
+                    del sl[i:j:step]
+                    del values[i:j:step]
+                values.sort(key=k)
+                self.assertEqual(len(sl), len(values))
+            self.assertEqual(list(sl), values)
+            self.assertEqual(list(reversed(sl)), values[::-1])
+            self.assertEqual([sl[i] for i in range(len(sl))], values)
+
+    def test_copy(self):
+        for key in (None, abs):
+            sl = self.SortedList(range(-1000, 1000), key=key)
+            for c in (sl.copy(), copy.copy(sl)):
+                self.assertEqual(list(c), list(sl))
+                self.assertIs(c.key, key)
+                self.assertIs(type(c), self.SortedList)
+                c.add(5000)
+                self.assertNotIn(5000, sl)
+            sl = self.SortedList([[1]])
+            c = copy.deepcopy(sl)
+            self.assertEqual(c, sl)
+            self.assertIsNot(c[0], sl[0])
+
+    def test_pickle(self):
+        for key in (None, abs):
+            sl = self.SortedList([-3, 1, 2], key=key)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(key=key, proto=proto):
+                    with replaced_module('collections', self.module):
+                        sl2 = pickle.loads(pickle.dumps(sl, proto))
+                    self.assertEqual(list(sl2), list(sl))
+                    self.assertEqual(sl2.key, key)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.SortedList([2, 1])), 'SortedList([1, 2])')
+        self.assertEqual(repr(self.SortedList(key=abs)),
+                         'SortedList([], key=<built-in function abs>)')
+        sl = self.SortedList(key=id)
+        sl.add(sl)
+        self.assertEqual(repr(sl), 'SortedList([...], key=<built-in function id>)')
+
+    def test_compare(self):
+        SortedList = self.SortedList
+        self.assertEqual(SortedList([2, 1]), SortedList([1, 2]))
+        self.assertNotEqual(SortedList([1, 2]), SortedList([1, 2, 3]))
+        self.assertNotEqual(SortedList([1, 2]), [1, 2])
+        self.assertNotEqual(SortedList([1, 2], key=lambda x: -x),
+                            SortedList([1, 2]))
+        self.assertEqual(SortedList([4, -2], key=abs), SortedList([-2, 4]))
+        with self.assertRaises(TypeError):
+            SortedList() < SortedList()
+        with self.assertRaises(TypeError):
+            hash(SortedList())
+
+    def test_abc(self):
+        sl = self.SortedList()
+        self.assertIsInstance(sl, Sequence)
+        self.assertEqual(self.SortedList[int].__origin__, self.SortedList)
+
+    def test_weakref(self):
+        sl = self.SortedList()
+        ref = weakref.ref(sl)
+        self.assertIs(ref(), sl)
+        del sl
+        support.gc_collect()
+        self.assertIsNone(ref())
+
+    def test_subclass(self):
+        class MySortedList(self.SortedList):
+            pass
+        sl = MySortedList([2, 1])
+        sl.x = 5
+        self.assertEqual(repr(sl), 'MySortedList([1, 2])')
+        c = sl.copy()
+        self.assertIs(type(c), MySortedList)
+        self.assertEqual(list(c), [1, 2])
+        self.assertEqual(sl.__reduce__(), (MySortedList, ([1, 2], None), {'x': 5}))
+
+
+class PurePythonSortedListTests(SortedListTests, unittest.TestCase):
+    module = py_coll
+    SortedList = py_coll.SortedList
+
+    def setUp(self):
+        # Use short chunks to exercise splitting and merging them.
+        self.enterContext(support.swap_attr(py_coll, '_SORTED_LOAD', 8))
+
+    def test_delitem_slice_by_chunks(self):
+        values = list(range(1000))
+        sl = self.SortedList(values)
+        calls = 0
+        locate = self.SortedList._locate
+        def counting_locate(self, index):
+            nonlocal calls
+            calls += 1
+            return locate(self, index)
+        with support.swap_attr(self.SortedList, '_locate', counting_locate):
+            del sl[100:900]
+        del values[100:900]
+        self.assertEqual(list(sl), values)
+        self.assertLessEqual(calls, 2)
+
+
+@unittest.skipUnless(c_coll, 'requires the C version of the collections module')
+class CPythonSortedListTests(SortedListTests, unittest.TestCase):
+    module = c_coll
+    SortedList = c_coll.SortedList if c_coll else None
+
+    def test_large(self):
+        values = list(range(20000))
+        random.shuffle(values)
+        sl = self.SortedList()
+        for x in values:
+            sl.add(x)
+        self.assertEqual(list(sl), sorted(values))
+        for x in values[::2]:
+            sl.remove(x)
+        self.assertEqual(list(sl), sorted(values[1::2]))
+        self.assertEqual([sl[i] for i in range(0, len(sl), 97)],
+                         sorted(values[1::2])[::97])
+
+    def test_mutation_during_comparison(self):
+        sl = self.SortedList()
+        mutate = None
+
+        class Key:
+            def __init__(self, value):
+                self.value = value
+            def __lt__(self, other):
+                nonlocal mutate
+                if mutate is not None:
+                    method, mutate = mutate, None
+                    method()
+                return self.value < other.value
+            def __eq__(self, other):
+                return self.value == other.value
+
+        sl.update([Key(1), Key(3)])
+        for method in (sl.pop, sl.clear, lambda: sl.add(Key(0)),
+                       lambda: sl.__init__()):
+            mutate = method
+            with self.assertRaisesRegex(RuntimeError, 'comparison'):
+                sl.add(Key(2))
+            mutate = method
+            with self.assertRaisesRegex(RuntimeError, 'comparison'):
+                sl.update([Key(2), Key(4), Key(5)])
+            mutate = method
+            with self.assertRaisesRegex(RuntimeError, 'comparison'):
+                sl.remove(Key(1))
+        self.assertEqual([key.value for key in sl], [1, 3])
+
+    def test_sizeof(self):
+        sl = self.SortedList()
+        size = sys.getsizeof(sl)
+        sl.update(range(10000))
+        self.assertGreater(sys.getsizeof(sl), size + 10000 * 8)
+
+    def test_iterator_length_hint(self):
+        sl = self.SortedList(range(10))
+        it = sl.irange(2, 7)
+        self.assertEqual(it.__length_hint__(), 6)
+        next(it)
+        self.assertEqual(it.__length_hint__(), 5)
+
+
+class SortedDictTests:
+
+    def test_basic(self):
+        d = self.SortedDict({'b': 2, 'a': 1})
+        d['c'] = 3
+        d['aa'] = 0
+        self.assertIsInstance(d, MutableMapping)
+        self.assertEqual(list(d), ['a', 'aa', 'b', 'c'])
+        self.assertEqual(list(d.keys()), ['a', 'aa', 'b', 'c'])
+        self.assertEqual(list(d.values()), [1, 0, 2, 3])
+        self.assertEqual(list(d.items()),
+                         [('a', 1), ('aa', 0), ('b', 2), ('c', 3)])
+        self.assertEqual(list(reversed(d)), ['c', 'b', 'aa', 'a'])
+        self.assertEqual(len(d), 4)
+        self.assertIn('aa', d)
+        self.assertEqual(d['b'], 2)
+        self.assertEqual(d.get('x'), None)
+        d['b'] = 5
+        self.assertEqual(list(d.items()),
+                         [('a', 1), ('aa', 0), ('b', 5), ('c', 3)])
+        del d['aa']
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+        with self.assertRaises(KeyError):
+            del d['aa']
+        with self.assertRaises(KeyError):
+            d['aa']
+        with self.assertRaises(TypeError):
+            d[1] = 1
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+        self.assertEqual(d, {'a': 1, 'b': 5, 'c': 3})
+
+    def test_key(self):
+        d = self.SortedDict({1: 'a', -2: 'b', 3: 'c'}, key=abs)
+        self.assertIs(d.key, abs)
+        self.assertEqual(list(d), [1, -2, 3])
+        self.assertEqual(list(d.irange(-1, 2)), [1, -2])
+        self.assertEqual(d.bisect_left(2), 1)
+        self.assertEqual(d.bisect_right(2), 2)
+
+    def test_pop_methods(self):
+        d = self.SortedDict(zip('dcba', range(4)))
+        self.assertEqual(d.pop('b'), 2)
+        self.assertEqual(d.pop('b', None), None)
+        with self.assertRaises(KeyError):
+            d.pop('b')
+        self.assertEqual(d.popitem(), ('d', 0))
+        self.assertEqual(d.popitem(0), ('a', 3))
+        self.assertEqual(d.peekitem(), ('c', 1))
+        self.assertEqual(d.setdefault('c', 5), 1)
+        self.assertEqual(d.setdefault('e', 5), 5)
+        self.assertEqual(d.peekitem(0), ('c', 1))
+        self.assertEqual(d.peekitem(-1), ('e', 5))
+        d.clear()
+        with self.assertRaises(KeyError):
+            d.popitem()
+        with self.assertRaises(IndexError):
+            d.peekitem()
+
+    def test_index_and_irange(self):
+        d = self.SortedDict.fromkeys(range(0, 100, 10))
+        self.assertEqual(d.index(30), 3)
+        with self.assertRaises(ValueError):
+            d.index(35)
+        self.assertEqual(d.bisect_left(35), 4)
+        self.assertEqual(list(d.irange(25, 55)), [30, 40, 50])
+        self.assertEqual(list(d.irange(30, 50, (False, True), reverse=True)),
+                         [50, 40])
+
+    def test_update_and_or(self):
+        d = self.SortedDict({3: 'c'})
+        d.update({1: 'a'})
+        d.update([(2, 'b'), (3, 'C')])
+        self.assertEqual(list(d.items()), [(1, 'a'), (2, 'b'), (3, 'C')])
+        self.assertEqual(list((d | {0: 'z'}).items()),
+                         [(0, 'z'), (1, 'a'), (2, 'b'), (3, 'C')])
+        self.assertIsInstance({0: 'z'} | d, self.SortedDict)
+        d |= {5: 'e'}
+        self.assertEqual(list(d), [1, 2, 3, 5])
+        d = self.SortedDict()
+        d.update({'b': 2}, a=1)
+        self.assertEqual(list(d.items()), [('a', 1), ('b', 2)])
+
+    def test_copy_and_pickle(self):
+        d = self.SortedDict({2: 'b', 1: 'a'}, key=lambda x: -x)
+        for c in (d.copy(), copy.copy(d)):
+            self.assertEqual(list(c.items()), [(2, 'b'), (1, 'a')])
+            c[3] = 'c'
+            self.assertNotIn(3, d)
+        d = self.SortedDict({2: 'b', 1: 'a'})
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with replaced_module('collections', self.module):
+                d2 = pickle.loads(pickle.dumps(d, proto))
+            self.assertEqual(list(d2.items()), [(1, 'a'), (2, 'b')])
+            d2[0] = 'z'
+            self.assertEqual(list(d2), [0, 1, 2])
+
+    def test_repr(self):
+        self.assertEqual(repr(self.SortedDict({2: 'b', 1: 'a'})),
+                         "SortedDict({1: 'a', 2: 'b'})")
+        self.assertEqual(repr(self.SortedDict(key=abs)),
+                         'SortedDict({}, key=<built-in function abs>)')
+
+
+class PurePythonSortedDictTests(SortedDictTests, unittest.TestCase):
+    module = py_coll
+    SortedDict = py_coll.SortedDict
+
+
+@unittest.skipUnless(c_coll, 'requires the C version of the collections module')
+class CPythonSortedDictTests(SortedDictTests, unittest.TestCase):
+    module = c_coll
+    SortedDict = c_coll.SortedDict if c_coll else None
+
+
+class SortedSetTests:
+
+    def test_basic(self):
+        s = self.SortedSet([3, 1, 2, 1])
+        self.assertIsInstance(s, MutableSet)
+        self.assertEqual(list(s), [1, 2, 3])
+        self.assertEqual(list(reversed(s)), [3, 2, 1])
+        self.assertEqual(len(s), 3)
+        self.assertIn(2, s)
+        s.add(0)
+        s.add(2)
+        s.discard(3)
+        s.discard(5)
+        self.assertEqual(list(s), [0, 1, 2])
+        s.remove(1)
+        with self.assertRaises(KeyError):
+            s.remove(1)
+        self.assertEqual(s, {0, 2})
+        with self.assertRaises(TypeError):
+            s.add('a')
+        self.assertEqual(list(s), [0, 2])
+
+    def test_positions(self):
+        s = self.SortedSet(range(0, 100, 10))
+        self.assertEqual(s[0], 0)
+        self.assertEqual(s[-1], 90)
+        self.assertEqual(s[2:5], [20, 30, 40])
+        self.assertEqual(s.index(30), 3)
+        with self.assertRaises(ValueError):
+            s.index(35)
+        self.assertEqual(s.count(30), 1)
+        self.assertEqual(s.count(35), 0)
+        self.assertEqual(s.bisect_left(30), 3)
+        self.assertEqual(s.bisect_right(30), 4)
+        self.assertEqual(list(s.irange(25, 55)), [30, 40, 50])
+        self.assertEqual(s.pop(), 90)
+        self.assertEqual(s.pop(0), 0)
+        del s[0]
+        del s[1:3]
+        self.assertEqual(list(s), [20, 50, 60, 70, 80])
+        self.assertNotIn(30, s)
+        s.clear()
+        with self.assertRaises(IndexError):
+            s.pop()
+
+    def test_operators(self):
+        s = self.SortedSet([3, 1, 2], key=lambda x: -x)
+        for result, expected in [(s | {5}, [5, 3, 2, 1]), (s & {1, 2}, [2, 1]),
+                                 (s - {1}, [3, 2]), (s ^ {1, 4}, [4, 3, 2])]:
+            self.assertIsInstance(result, self.SortedSet)
+            self.assertEqual(list(result), expected)
+            self.assertIs(result.key, s.key)
+        s |= {0, 4}
+        self.assertEqual(list(s), [4, 3, 2, 1, 0])
+        s.update([7], (8, 1))
+        self.assertEqual(list(s), [8, 7, 4, 3, 2, 1, 0])
+        s -= {8, 7}
+        self.assertEqual(list(s), [4, 3, 2, 1, 0])
+        self.assertTrue(s <= {0, 1, 2, 3, 4, 5})
+
+    def test_copy_pickle_repr(self):
+        s = self.SortedSet('bca')
+        c = copy.copy(s)
+        c.add('d')
+        self.assertEqual(list(s), ['a', 'b', 'c'])
+        self.assertEqual(list(s.copy()), ['a', 'b', 'c'])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with replaced_module('collections', self.module):
+                s2 = pickle.loads(pickle.dumps(s, proto))
+            self.assertEqual(list(s2), ['a', 'b', 'c'])
+        self.assertEqual(repr(s), "SortedSet(['a', 'b', 'c'])")
+        self.assertEqual(repr(self.SortedSet(key=abs)),
+                         'SortedSet([], key=<built-in function abs>)')
+
+
+class PurePythonSortedSetTests(SortedSetTests, unittest.TestCase):
+    module = py_coll
+    SortedSet = py_coll.SortedSet
+
+
+@unittest.skipUnless(c_coll, 'requires the C version of the collections module')
+class CPythonSortedSetTests(SortedSetTests, unittest.TestCase):
+    module = c_coll
+    SortedSet = c_coll.SortedSet if c_coll else None
+
+
+if __name__ == '__main__':
+    unittest.main()
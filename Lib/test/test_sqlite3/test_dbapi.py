@@ -20,6 +20,7 @@
 #    misrepresented as being the original software.
 # 3. This notice may not be removed or altered from any source distribution.
 
+import array
 import contextlib
 import os
 import sqlite3 as sqlite
@@ -1099,6 +1100,75 @@ def test_fetchall(self):
         res = self.cu.fetchall()
         self.assertEqual(res, [])
 
+    def test_fetchcolumns(self):
+        self.cu.executemany("insert into test(name, income) values (?, ?)",
+                            [("bar", 1.5), ("baz", 2.5)])
+        self.cu.execute("select id, name, income from test order by id")
+        ids, names, incomes = self.cu.fetchcolumns()
+        self.assertIsInstance(ids, array.array)
+        self.assertEqual(ids.typecode, "q")
+        self.assertEqual(ids.tolist(), [1, 2, 3])
+        self.assertEqual(names, ["foo", "bar", "baz"])
+        # The first value is NULL.
+        self.assertEqual(incomes, [None, 1.5, 2.5])
+        self.assertEqual(self.cu.fetchcolumns(), ())
+
+    def test_fetchcolumns_size(self):
+        self.cu.executemany("insert into test(name, income) values (?, ?)",
+                            [(str(i), i / 2) for i in range(1000)])
+        # The income column has numeric affinity: whole numbers are stored
+        # as integers.
+        self.cu.execute("select id, income + 0.25 from test "
+                        "where income not null order by id")
+        ids = []
+        incomes = []
+        while columns := self.cu.fetchcolumns(size=300):
+            self.assertLessEqual(len(columns[0]), 300)
+            self.assertEqual(columns[1].typecode, "d")
+            ids.extend(columns[0])
+            incomes.extend(columns[1])
+        self.assertEqual(ids, list(range(2, 1002)))
+        self.assertEqual(incomes, [i / 2 + 0.25 for i in range(1000)])
+        self.assertEqual(self.cu.fetchcolumns(size=300), ())
+
+        self.cu.execute("select id from test")
+        self.assertEqual(self.cu.fetchcolumns(0), ())
+        self.assertEqual(len(self.cu.fetchcolumns(1)[0]), 1)
+        self.assertEqual(len(self.cu.fetchcolumns()[0]), 1000)
+
+    def test_fetchcolumns_mixed_types(self):
+        query = ("select column1 from (values (1), (2), (?)) "
+                 "order by rowid")
+        for value in (3.5, "3", b"3", None, 2**62):
+            with self.subTest(value=value):
+                self.cu.execute(query, (value,))
+                column, = self.cu.fetchcolumns()
+                expected = [1, 2, value]
+                if value == 2**62:
+                    self.assertEqual(column.tolist(), expected)
+                else:
+                    self.assertIsInstance(column, list)
+                    self.assertEqual(column, expected)
+
+    def test_fetchcolumns_factories(self):
+        self.cx.row_factory = sqlite.Row
+        self.cx.text_factory = bytes
+        cu = self.cx.cursor()
+        cu.execute("select id, name from test")
+        ids, names = cu.fetchcolumns()
+        self.assertEqual(ids.tolist(), [1])
+        self.assertEqual(names, [b"foo"])
+
+    def test_fetchcolumns_converters(self):
+        sqlite.register_converter("twice", lambda b: int(b) * 2)
+        self.addCleanup(sqlite.converters.pop, "TWICE")
+        with memory_database(detect_types=sqlite.PARSE_DECLTYPES) as cx:
+            cx.execute("create table t(x integer, y twice)")
+            cx.execute("insert into t values (1, 2)")
+            x, y = cx.execute("select x, y from t").fetchcolumns()
+        self.assertEqual(x.tolist(), [1])
+        self.assertEqual(y, [4])
+
     def test_setinputsizes(self):
         self.cu.setinputsizes([3, 4, 5])
 
@@ -1757,7 +1827,7 @@ def test_closed(self):
         cur = self.cx.cursor()
         cur.close()
 
-        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone"):
+        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone", "fetchcolumns"):
             if method_name in ("execute", "executescript"):
                 params = ("select 4 union select 5",)
             elif method_name == "executemany":
@@ -0,0 +1,170 @@
+import asyncio
+import sqlite3 as sqlite
+import threading
+import unittest
+
+from test.support import threading_helper
+from test.support.script_helper import assert_python_ok
+from test.support.os_helper import TESTFN, unlink
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(self.remove_database)
+        self.pool = sqlite.ConnectionPool(TESTFN, max_readers=2, timeout=0.5)
+        self.addCleanup(self.pool.close)
+        with self.pool.writer() as cx:
+            cx.execute("create table t(x)")
+
+    def remove_database(self):
+        for suffix in ("", "-wal", "-shm"):
+            unlink(TESTFN + suffix)
+
+    def test_read_write(self):
+        with self.pool.writer() as cx:
+            cx.executemany("insert into t values (?)", [(1,), (2,)])
+        with self.pool.reader() as cx:
+            self.assertEqual(cx.execute("select sum(x) from t").fetchone(),
+                             (3,))
+        with self.pool.reader() as cx:
+            self.assertEqual(cx.execute("pragma journal_mode").fetchone(),
+                             ("wal",))
+
+    def test_reader_is_read_only(self):
+        with self.pool.reader() as cx:
+            with self.assertRaises(sqlite.OperationalError):
+                cx.execute("insert into t values (1)")
+
+    def test_writer_rollback(self):
+        with self.assertRaises(ZeroDivisionError):
+            with self.pool.writer() as cx:
+                cx.execute("insert into t values (1)")
+                1/0
+        self.assertEqual(self.pool.read(
+            lambda cx: cx.execute("select count(*) from t").fetchone()), (0,))
+
+    def test_read_write_functions(self):
+        def insert(cx, *values):
+            cx.executemany("insert into t values (?)", [(v,) for v in values])
+            return len(values)
+        self.assertEqual(self.pool.write(insert, 1, 2, 3), 3)
+        self.assertEqual(self.pool.read(
+            lambda cx: cx.execute("select count(*) from t").fetchone()), (3,))
+
+    def test_reuse(self):
+        with self.pool.reader() as cx1:
+            pass
+        with self.pool.reader() as cx2:
+            self.assertIs(cx2, cx1)
+        with self.pool.writer() as cx1:
+            pass
+        with self.pool.writer() as cx2:
+            self.assertIs(cx2, cx1)
+
+    def test_max_readers(self):
+        with self.pool.reader() as cx1, self.pool.reader() as cx2:
+            self.assertIsNot(cx1, cx2)
+            with self.assertRaises(sqlite.OperationalError):
+                with self.pool.reader(timeout=0.01):
+                    pass
+        with self.pool.reader() as cx3:
+            self.assertIn(cx3, (cx1, cx2))
+
+    def test_single_writer(self):
+        errors = []
+        with self.pool.writer():
+            def target():
+                try:
+                    with self.pool.writer(timeout=0.01):
+                        pass
+                except sqlite.OperationalError as exc:
+                    errors.append(exc)
+            thread = threading.Thread(target=target)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_readers_with_writer(self):
+        # In WAL mode, readers see the last committed data while a write
+        # transaction is in progress.
+        with self.pool.writer() as cx:
+            cx.execute("insert into t values (1)")
+            with self.pool.reader() as reader:
+                self.assertEqual(
+                    reader.execute("select count(*) from t").fetchone(), (0,))
+        with self.pool.reader() as reader:
+            self.assertEqual(
+                reader.execute("select count(*) from t").fetchone(), (1,))
+
+    @threading_helper.requires_working_threading()
+    def test_threads(self):
+        def work(i):
+            self.pool.write(
+                lambda cx: cx.execute("insert into t values (?)", (i,)))
+            return self.pool.read(
+                lambda cx: cx.execute("select count(*) from t").fetchone()[0])
+
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(work(i)))
+                   for i in range(10)]
+        with threading_helper.start_threads(threads):
+            pass
+        self.assertEqual(len(results), 10)
+        self.assertEqual(max(results), 10)
+        self.assertLessEqual(self.pool._num_readers, 2)
+
+    def test_asyncio(self):
+        async def main():
+            await asyncio.gather(*[
+                asyncio.to_thread(self.pool.write, lambda cx, i=i:
+                                  cx.execute("insert into t values (?)", (i,)))
+                for i in range(5)])
+            return await asyncio.to_thread(
+                self.pool.read,
+                lambda cx: cx.execute("select sum(x) from t").fetchone())
+        try:
+            self.assertEqual(asyncio.run(main()), (10,))
+        finally:
+            asyncio._set_event_loop_policy(None)
+
+    def test_prepare(self):
+        with sqlite.ConnectionPool(TESTFN, prepare=["select x from t"]) as pool:
+            with pool.reader() as cx:
+                self.assertEqual(cx.execute("select x from t").fetchall(), [])
+
+        # The statements are compiled when the connections are opened.
+        with self.assertRaises(sqlite.OperationalError):
+            sqlite.ConnectionPool(TESTFN, prepare=["select spam from t"])
+
+    def test_close(self):
+        with self.pool.reader() as cx:
+            self.pool.close()
+            self.assertEqual(cx.execute("select 1").fetchone(), (1,))
+        with self.assertRaises(sqlite.ProgrammingError):
+            cx.execute("select 1")
+        with self.assertRaises(sqlite.ProgrammingError):
+            with self.pool.reader():
+                pass
+        with self.assertRaises(sqlite.ProgrammingError):
+            with self.pool.writer():
+                pass
+
+    def test_bad_arguments(self):
+        for database in (":memory:", ""):
+            with self.assertRaises(ValueError):
+                sqlite.ConnectionPool(database)
+        with self.assertRaises(ValueError):
+            sqlite.ConnectionPool(TESTFN, max_readers=0)
+
+    def test_lazy_import(self):
+        code = ("import sys, sqlite3; "
+                "assert 'sqlite3.pool' not in sys.modules; "
+                "assert 'ConnectionPool' in dir(sqlite3); "
+                "from sqlite3 import ConnectionPool; "
+                "from sqlite3.pool import ConnectionPool as cp; "
+                "assert ConnectionPool is cp")
+        assert_python_ok("-c", code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -825,6 +825,86 @@ def test_next_on_empty_tarfile(self):
         with tarfile.open(fileobj=fd, mode="r") as tf:
             self.assertEqual(tf.next(), None)
 
+    def test_index(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            index = tarfile.TarIndex.build(tar)
+            members = tar.getmembers()
+        self.assertEqual(len(index), len({t.name for t in members}))
+        self.assertIn("ustar/regtype", index)
+        self.assertIn("ustar/dirtype/", index)
+        self.assertNotIn("spam", index)
+
+        f = io.BytesIO()
+        index.save(f)
+        f.seek(0)
+        index = tarfile.TarIndex.load(f)
+        with tarfile.open(self.tarname, mode=self.mode, index=index,
+                          encoding="iso8859-1") as tar:
+            for name in ("ustar/regtype", "ustar/dirtype/", "misc/eof",
+                         "pax/umlauts-\xc4\xd6\xdc\xe4\xf6\xfc\xdf"):
+                with self.subTest(name=name):
+                    tarinfo = tar.getmember(name)
+                    expected = [t for t in members
+                                if t.name == name.rstrip("/")][-1]
+                    self.assertEqual(tarinfo.offset, expected.offset)
+                    self.assertEqual(tarinfo.get_info(), expected.get_info())
+            with tar.extractfile("ustar/regtype") as f:
+                self.assertEqual(sha256sum(f.read()), sha256_regtype)
+            self.assertRaises(KeyError, tar.getmember, "spam")
+            # The index does not prevent reading the archive sequentially.
+            self.assertEqual(tar.getnames(), [t.name for t in members])
+
+    def test_index_file(self):
+        index = tarfile.TarIndex.build(self.tarname)
+        filename = os.path.join(TEMPDIR, "index")
+        self.addCleanup(os_helper.unlink, filename)
+        index.save(os_helper.FakePath(filename))
+        index = tarfile.TarIndex.load(filename)
+        with tarfile.open(self.tarname, mode=self.mode, index=index) as tar:
+            self.assertEqual(tar.getmember("ustar/regtype").size, 7011)
+
+        with open(filename, "wb") as f:
+            f.write(b"spam")
+        self.assertRaises(ValueError, tarfile.TarIndex.load, filename)
+
+    def test_index_mismatch(self):
+        index = tarfile.TarIndex({"ustar/regtype": (0, 7011)})
+        with tarfile.open(self.tarname, mode=self.mode, index=index) as tar:
+            self.assertRaises(tarfile.ReadError, tar.getmember,
+                              "ustar/regtype")
+
+    @os_helper.skip_unless_working_chmod
+    def test_extractall_workers(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            members = [t for t in tar if t.isreg() or t.isdir()]
+        expected_dir = os.path.join(TEMPDIR, "extractall-serial")
+        workers_dir = os.path.join(TEMPDIR, "extractall-workers")
+        with os_helper.temp_dir(expected_dir), \
+             os_helper.temp_dir(workers_dir):
+            with tarfile.open(self.tarname, mode=self.mode,
+                              encoding="iso8859-1") as tar:
+                tar.extractall(expected_dir, [t.name for t in members],
+                               filter="fully_trusted")
+            with tarfile.open(self.tarname, mode=self.mode,
+                              encoding="iso8859-1") as tar:
+                tar.extractall(workers_dir, [t.name for t in members],
+                               filter="fully_trusted", workers=4)
+            for tarinfo in members:
+                expected = os.path.join(expected_dir, tarinfo.name)
+                path = os.path.join(workers_dir, tarinfo.name)
+                with self.subTest(name=tarinfo.name):
+                    self.assertEqual(os.stat(path).st_mode,
+                                     os.stat(expected).st_mode)
+                    self.assertEqual(os.path.getmtime(path), tarinfo.mtime)
+                    if tarinfo.isreg():
+                        with open(path, "rb") as f1, open(expected, "rb") as f2:
+                            self.assertEqual(f1.read(), f2.read())
+
+        with tarfile.open(self.tarname, mode=self.mode) as tar:
+            self.assertRaises(ValueError, tar.extractall, TEMPDIR, workers=0)
+
 class MiscReadTest(MiscReadTestBase, unittest.TestCase):
     test_fail_comp = None
 
@@ -1588,6 +1668,43 @@ def test_extractall_symlinks(self):
             os_helper.unlink(temparchive)
             os_helper.rmtree(tempdir)
 
+    @os_helper.skip_unless_symlink
+    def test_extractall_workers_order(self):
+        # Later members replace earlier ones, and links are created after
+        # the files they refer to, as with serial extraction.
+        def add(tar, name, data=None, linkname=None, type=tarfile.REGTYPE):
+            tarinfo = tarfile.TarInfo(name)
+            tarinfo.type = type
+            if linkname is not None:
+                tarinfo.linkname = linkname
+            if data is not None:
+                tarinfo.size = len(data)
+                data = io.BytesIO(data)
+            tar.addfile(tarinfo, data)
+
+        with tarfile.open(tmpname, "w") as tar:
+            add(tar, "dir", type=tarfile.DIRTYPE)
+            for i in range(20):
+                add(tar, f"dir/file{i}", b"x" * i * 1000)
+            add(tar, "dir/file0", b"replaced")
+            add(tar, "hardlink", linkname="dir/file1", type=tarfile.LNKTYPE)
+            add(tar, "symlink", linkname="dir/file2", type=tarfile.SYMTYPE)
+            add(tar, "symlink", b"replaced")
+            add(tar, "dir/file3", b"after")
+
+        tempdir = os.path.join(TEMPDIR, "extractall-workers")
+        with os_helper.temp_dir(tempdir), tarfile.open(tmpname) as tar:
+            tar.extractall(tempdir, filter="data", workers=3)
+            def read(name):
+                with open(os.path.join(tempdir, name), "rb") as f:
+                    return f.read()
+            self.assertEqual(read("dir/file0"), b"replaced")
+            self.assertEqual(read("hardlink"), b"x" * 1000)
+            self.assertEqual(read("symlink"), b"replaced")
+            self.assertEqual(read("dir/file3"), b"after")
+            for i in range(4, 20):
+                self.assertEqual(read(f"dir/file{i}"), b"x" * i * 1000)
+
     def test_pathnames(self):
         self._test_pathname("foo")
         self._test_pathname(os.path.join("foo", ".", "bar"))
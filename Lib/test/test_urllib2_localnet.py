@@ -4,8 +4,10 @@
 import urllib.parse
 import urllib.request
 import http.server
+import socket
 import threading
 import unittest
+import unittest.mock
 import hashlib
 
 from test import support
@@ -665,6 +667,181 @@ def test_issue16464(self):
         self.assertEqual(b"1234567890", request.data)
         self.assertEqual("10", request.get_header("Content-length"))
 
+class KeepAliveRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    timeout = support.SHORT_TIMEOUT
+
+    def do_GET(self):
+        self.server.requests.append(
+            (self.client_address[1], self.path, self.headers["Connection"]))
+        body = self.path.encode("ascii")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path.startswith("/close"):
+            # Close the connection without telling the client.
+            self.close_connection = True
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['NO_PROXY'] = '*'
+        self.addCleanup(os.environ.pop, 'NO_PROXY', None)
+        self.pool = urllib.request.HTTPConnectionPool()
+        self.addCleanup(self.pool.close)
+
+    def start_server(self, context=None):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                                 KeepAliveRequestHandler)
+        server.daemon_threads = True
+        server.requests = []
+        if context is not None:
+            server.socket = context.wrap_socket(server.socket,
+                                                server_side=True)
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.start()
+        def stop():
+            self.pool.close()
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop)
+        return server
+
+    def open(self, url, data=None, read=True, opener=None):
+        if opener is None:
+            opener = urllib.request.build_opener(
+                urllib.request.HTTPHandler(pool=self.pool))
+        with opener.open(url, data) as f:
+            return f.read() if read else None
+
+    def ports(self, server):
+        return [port for port, _, _ in server.requests]
+
+    def test_reuse(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        self.assertEqual(self.open(url + "/a"), b"/a")
+        self.assertEqual(self.open(url + "/b"), b"/b")
+        self.assertEqual(self.open(url + "/c", b"data"), b"/c")
+        ports = self.ports(server)
+        self.assertEqual(len(ports), 3)
+        self.assertEqual(len(set(ports)), 1)
+        self.assertEqual([header for _, _, header in server.requests],
+                         [None, None, None])
+
+    def test_unread_response(self):
+        # The connection of a response closed before the end of its body
+        # cannot be reused.
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        self.open(url + "/a", read=False)
+        self.open(url + "/b")
+        self.open(url + "/c")
+        ports = self.ports(server)
+        self.assertNotEqual(ports[0], ports[1])
+        self.assertEqual(ports[1], ports[2])
+
+    def test_server_closed_connection(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        for path in "/close1", "/close2", "/a", "/b":
+            self.assertEqual(self.open(url + path), path.encode())
+        ports = self.ports(server)
+        self.assertEqual(len(set(ports)), 3)
+        self.assertEqual(ports[2], ports[3])
+
+    def test_stale_connection_retried(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        self.open(url + "/a")
+        with unittest.mock.patch('urllib.request._is_connection_dropped',
+                                 return_value=False):
+            # The idle connection seems alive, but the server closes it
+            # before the request is sent.
+            [(conn, _)] = next(iter(self.pool._idle.values()))
+            conn.sock.shutdown(socket.SHUT_WR)
+            self.assertEqual(self.open(url + "/b"), b"/b")
+        self.assertEqual(len(set(self.ports(server))), 2)
+
+    def test_maxsize(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        self.pool.maxsize = 1
+        opener = urllib.request.build_opener(
+            urllib.request.HTTPHandler(pool=self.pool))
+        with opener.open(url + "/a") as f1, opener.open(url + "/b") as f2:
+            f1.read()
+            f2.read()
+        self.assertEqual(sum(map(len, self.pool._idle.values())), 1)
+        self.open(url + "/c")
+        ports = self.ports(server)
+        self.assertEqual(len(set(ports)), 2)
+        self.assertIn(ports[2], ports[:2])
+
+    def test_idle_timeout(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        now = 0.0
+        with unittest.mock.patch('time.monotonic', lambda: now):
+            self.pool.idle_timeout = 10
+            self.open(url + "/a")
+            now = 5.0
+            self.open(url + "/b")
+            now = 20.0
+            self.open(url + "/c")
+        ports = self.ports(server)
+        self.assertEqual(ports[0], ports[1])
+        self.assertNotEqual(ports[1], ports[2])
+
+    def test_close(self):
+        server = self.start_server()
+        url = "http://localhost:%s" % server.server_port
+        self.open(url + "/a")
+        [[(conn, _)]] = self.pool._idle.values()
+        self.pool.close()
+        self.assertIsNone(conn.sock)
+        self.assertEqual(self.pool._idle, {})
+        # A closed pool does not keep connections.
+        self.open(url + "/b")
+        self.assertEqual(self.pool._idle, {})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            urllib.request.HTTPConnectionPool(maxsize=0)
+        with self.assertRaises(ValueError):
+            urllib.request.HTTPConnectionPool(idle_timeout=0)
+
+    @unittest.skipIf(ssl is None, "ssl module required")
+    def test_https_session_resumption(self):
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(CERT_localhost)
+        server = self.start_server(server_context)
+        url = "https://localhost:%s" % server.server_port
+        context = ssl.create_default_context(cafile=CERT_localhost)
+        opener = urllib.request.build_opener(
+            urllib.request.HTTPSHandler(context=context, pool=self.pool))
+        self.assertEqual(self.open(url + "/close", opener=opener), b"/close")
+        [[(conn, _)]] = self.pool._idle.values()
+        self.assertFalse(conn.sock.session_reused)
+        self.assertEqual(self.open(url + "/a", opener=opener), b"/a")
+        self.assertEqual(self.open(url + "/b", opener=opener), b"/b")
+        [[(conn, _)]] = self.pool._idle.values()
+        self.assertTrue(conn.sock.session_reused)
+        ports = self.ports(server)
+        self.assertNotEqual(ports[0], ports[1])
+        self.assertEqual(ports[1], ports[2])
+
+
 def setUpModule():
     thread_info = threading_helper.threading_setup()
     unittest.addModuleCleanup(threading_helper.threading_cleanup, *thread_info)
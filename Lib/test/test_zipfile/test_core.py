@@ -467,6 +467,54 @@ def test_zipextfile_attrs(self):
             self.assertIs(fid.writable(), False)
             self.assertRaises(ValueError, fid.seekable)
 
+    def test_writeall(self):
+        with temp_dir() as srcdir:
+            emptyname = os.path.join(srcdir, 'empty')
+            open(emptyname, 'wb').close()
+            subdir = os.path.join(srcdir, 'subdir')
+            os.mkdir(subdir)
+            files = [TESTFN, (TESTFN, 'another.name'), (emptyname, 'empty'),
+                     (subdir, 'subdir'), (TESTFN, 'subdir/last')]
+            for workers in 1, 3:
+                for f in get_files(self):
+                    with self.subTest(f=f, workers=workers):
+                        with zipfile.ZipFile(f, "w", self.compression) as zipfp:
+                            zipfp.writeall(files, workers=workers)
+                        with zipfile.ZipFile(f, "r") as zipfp:
+                            self.assertIsNone(zipfp.testzip())
+                            self.assertEqual(zipfp.namelist(),
+                                             [TESTFN, 'another.name', 'empty',
+                                              'subdir/', 'subdir/last'])
+                            for name in TESTFN, 'another.name', 'subdir/last':
+                                zinfo = zipfp.getinfo(name)
+                                self.assertEqual(zinfo.compress_type,
+                                                 self.compression)
+                                self.assertEqual(zinfo.file_size,
+                                                 len(self.data))
+                                self.assertEqual(zipfp.read(name), self.data)
+                            self.assertEqual(zipfp.read('empty'), b'')
+                            self.assertTrue(zipfp.getinfo('subdir/').is_dir())
+
+    def test_writeall_unseekable(self):
+        f = Unseekable(io.BytesIO())
+        with zipfile.ZipFile(f, "w", self.compression) as zipfp:
+            zipfp.writeall([(TESTFN, 'a'), (TESTFN, 'b')], workers=2)
+        with zipfile.ZipFile(io.BytesIO(f.fp.getvalue())) as zipfp:
+            self.assertIsNone(zipfp.testzip())
+            self.assertEqual(zipfp.read('a'), self.data)
+            self.assertEqual(zipfp.read('b'), self.data)
+
+    def test_writeall_error(self):
+        with zipfile.ZipFile(TESTFN2, "w", self.compression) as zipfp:
+            with self.assertRaises(FileNotFoundError):
+                zipfp.writeall([(TESTFN, 'a'), TESTFN + '.missing',
+                                (TESTFN, 'b')], workers=2)
+            self.assertEqual(zipfp.namelist(), ['a'])
+            with self.assertRaises(ValueError):
+                zipfp.writeall([TESTFN], workers=0)
+        with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            self.assertEqual(zipfp.read('a'), self.data)
+
     def tearDown(self):
         unlink(TESTFN)
         unlink(TESTFN2)
@@ -1619,6 +1667,56 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
 
+    @requires_zlib()
+    def test_extract_all_workers(self):
+        contents = {f'dir{i % 3}/file{i}': randbytes(randint(0, 10000)) * 5
+                    for i in range(50)}
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.mkdir('dir0')
+            for name, data in contents.items():
+                zipfp.writestr(name, data)
+            # The last member of a given name is extracted.
+            with self.assertWarns(UserWarning):
+                zipfp.writestr('dir1/file1', b'overwritten')
+        contents['dir1/file1'] = b'overwritten'
+        with open(TESTFN2, 'wb') as f:
+            f.write(buf.getvalue())
+        self.addCleanup(unlink, TESTFN2)
+
+        # The archive is opened by name, or from a file object.
+        for file in TESTFN2, buf:
+            with self.subTest(file=file), temp_dir() as extdir:
+                with zipfile.ZipFile(file) as zipfp:
+                    zipfp.extractall(extdir, workers=4)
+                for name, data in contents.items():
+                    self.check_file(os.path.join(extdir, name), data)
+                self.assertEqual(sorted(os.listdir(extdir)),
+                                 ['dir0', 'dir1', 'dir2'])
+
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(TESTFN2) as zipfp:
+                zipfp.extractall(extdir, members=['dir2/file2', 'dir0/file3'],
+                                 workers=2)
+            self.assertEqual(sorted(os.listdir(extdir)), ['dir0', 'dir2'])
+            self.check_file(os.path.join(extdir, 'dir2', 'file2'),
+                            contents['dir2/file2'])
+            self.assertFalse(os.path.exists(os.path.join(extdir, 'dir1')))
+
+    def test_extract_all_workers_error(self):
+        self.make_test_file()
+        self.addCleanup(unlink, TESTFN2)
+        with temp_dir() as extdir, zipfile.ZipFile(TESTFN2) as zipfp:
+            with self.assertRaises(KeyError):
+                zipfp.extractall(extdir, members=['_ziptest1', 'missing'],
+                                 workers=2)
+            with self.assertRaises(ValueError):
+                zipfp.extractall(extdir, workers=0)
+            # A corrupted member.
+            zipfp.getinfo('_ziptest1').CRC ^= 1
+            with self.assertRaises(zipfile.BadZipFile):
+                zipfp.extractall(extdir, workers=2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -90,9 +90,11 @@
 import io
 import os
 import re
+import select
 import socket
 import string
 import sys
+import threading
 import time
 import tempfile
 
@@ -121,7 +123,7 @@
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
-    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
+    'HTTPConnectionPool', 'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
     'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
@@ -1223,10 +1225,147 @@ def http_error_407(self, req, fp, code, msg, headers):
         self.reset_retry_count()
         return retry
 
+class HTTPConnectionPool:
+    """Pool of persistent HTTP connections.
+
+    HTTP handlers created with a pool keep their connections open after a
+    response has been read entirely, and reuse them for the next requests
+    to the same host.  At most maxsize idle connections are kept per host,
+    and connections idle for more than idle_timeout seconds are closed.
+    The TLS sessions of HTTPS connections are resumed by the new
+    connections to the same host.
+
+    A pool can be shared by several handlers and threads.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=60.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive or None")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        # Connections may be released by the finalizer of a response.
+        self._lock = threading.RLock()
+        self._idle = {}         # key -> [(connection, release time)]
+        self._sessions = {}     # key -> last TLS session
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the idle connections.
+
+        The connections in use are closed once their response is read.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+            self._sessions.clear()
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+    def _evict(self, now):
+        # Close the connections idle for too long, with the lock held.
+        if self.idle_timeout is None:
+            return
+        deadline = now - self.idle_timeout
+        for key, connections in list(self._idle.items()):
+            # Connections are sorted by release time.
+            while connections and connections[0][1] <= deadline:
+                conn, _ = connections.pop(0)
+                conn.close()
+            if not connections:
+                del self._idle[key]
+
+    def _acquire(self, key):
+        # Return an idle connection for key, or None.
+        while True:
+            with self._lock:
+                self._evict(time.monotonic())
+                connections = self._idle.get(key)
+                if not connections:
+                    return None
+                conn, _ = connections.pop()
+            if not _is_connection_dropped(conn):
+                return conn
+            conn.close()
+
+    def _prepare(self, key, conn):
+        # Set up a new connection for key.
+        session = self._sessions.get(key)
+        if session is not None:
+            conn._ssl_session = session
+
+    def _release(self, key, conn, reusable):
+        # Give back a connection whose response was closed.
+        if conn.sock is not None:
+            session = getattr(conn.sock, 'session', None)
+            with self._lock:
+                if session is not None and not self._closed:
+                    self._sessions[key] = session
+                connections = self._idle.setdefault(key, [])
+                if reusable and not self._closed and len(connections) < self.maxsize:
+                    connections.append((conn, time.monotonic()))
+                    return
+                if not connections:
+                    del self._idle[key]
+        conn.close()
+
+
+def _is_connection_dropped(conn):
+    # An idle connection which is readable was closed by the server, or is
+    # out of sync.
+    sock = conn.sock
+    if sock is None:
+        return True
+    if getattr(sock, 'pending', None) is not None and sock.pending():
+        return True
+    try:
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+    except (OSError, ValueError):
+        return True
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    # Response giving its connection back to a pool once closed.
+
+    _pool = None
+    _body_complete = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self._body_complete = True
+
+    def _close_conn(self):
+        super()._close_conn()
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            # The connection can only be reused if the whole body was
+            # received.
+            pool._release(self._pool_key, self._pool_conn,
+                          not self.will_close and
+                          (self.length == 0 or self._body_complete))
+            self._pool_conn = None
+
+
 class AbstractHTTPHandler(BaseHandler):
 
-    def __init__(self, debuglevel=None):
+    _pool = None
+
+    def __init__(self, debuglevel=None, *, pool=None):
         self._debuglevel = debuglevel if debuglevel is not None else http.client.HTTPConnection.debuglevel
+        self._pool = pool
 
     def set_http_debuglevel(self, level):
         self._debuglevel = level
@@ -1283,23 +1422,24 @@ def do_open(self, http_class, req, **http_conn_args):
         if not host:
             raise URLError('no host given')
 
+        pool = self._pool
+        if pool is not None:
+            return self._do_open_pooled(pool, http_class, req,
+                                        http_conn_args)
+
         # will parse host:port
         h = http_class(host, timeout=req.timeout, **http_conn_args)
         h.set_debuglevel(self._debuglevel)
 
-        headers = dict(req.unredirected_hdrs)
-        headers.update({k: v for k, v in req.headers.items()
-                        if k not in headers})
-
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
+        headers = self._get_request_headers(req)
 
         # We want to make an HTTP/1.1 request, but the addinfourl
         # class isn't prepared to deal with a persistent connection.
         # It will try to read all remaining data from the socket,
         # which will block while the server waits for the next request.
         # So make sure the connection gets closed after the (only)
-        # request.
+        # request.  Persistent connections are handled by
+        # _do_open_pooled().
         headers["Connection"] = "close"
         headers = {name.title(): val for name, val in headers.items()}
 
@@ -1340,6 +1480,75 @@ def do_open(self, http_class, req, **http_conn_args):
         r.msg = r.reason
         return r
 
+    def _get_request_headers(self, req):
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items()
+                        if k not in headers})
+        return headers
+
+    def _do_open_pooled(self, pool, http_class, req, http_conn_args):
+        host = req.host
+        headers = self._get_request_headers(req)
+        headers = {name.title(): val for name, val in headers.items()}
+        tunnel_headers = {}
+        proxy_auth_hdr = "Proxy-Authorization"
+        if req._tunnel_host and proxy_auth_hdr in headers:
+            tunnel_headers[proxy_auth_hdr] = headers.pop(proxy_auth_hdr)
+        key = (http_class, host, req._tunnel_host,
+               tuple(sorted(http_conn_args.items())))
+        if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+            timeout = socket.getdefaulttimeout()
+        else:
+            timeout = req.timeout
+        # A request sent on an idle connection can fail because the server
+        # closed it in the meantime.  It is then sent again on a new
+        # connection if its body can be sent again.
+        replayable = req.data is None or isinstance(req.data, bytes)
+
+        while True:
+            h = pool._acquire(key)
+            reused = h is not None
+            if reused:
+                h.timeout = req.timeout
+                h.sock.settimeout(timeout)
+            else:
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                h.set_debuglevel(self._debuglevel)
+                h.response_class = _PooledHTTPResponse
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+                pool._prepare(key, h)
+            retry = reused and replayable
+            try:
+                try:
+                    h.request(req.get_method(), req.selector, req.data,
+                              headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err: # timeout error
+                    if not (retry and isinstance(err, ConnectionError)):
+                        raise URLError(err)
+                    r = None
+                else:
+                    try:
+                        r = h.getresponse()
+                    except ConnectionError:
+                        if not retry:
+                            raise
+                        r = None
+            except:
+                h.close()
+                raise
+            if r is not None:
+                break
+            h.close()
+
+        r._pool = pool
+        r._pool_key = key
+        r._pool_conn = h
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
 
 class HTTPHandler(AbstractHTTPHandler):
 
@@ -1352,9 +1561,10 @@ def http_open(self, req):
 
     class HTTPSHandler(AbstractHTTPHandler):
 
-        def __init__(self, debuglevel=None, context=None, check_hostname=None):
+        def __init__(self, debuglevel=None, context=None, check_hostname=None,
+                     *, pool=None):
             debuglevel = debuglevel if debuglevel is not None else http.client.HTTPSConnection.debuglevel
-            AbstractHTTPHandler.__init__(self, debuglevel)
+            AbstractHTTPHandler.__init__(self, debuglevel, pool=pool)
             if context is None:
                 http_version = http.client.HTTPSConnection._http_vsn
                 context = http.client._create_https_context(http_version)
@@ -840,6 +840,40 @@ def close(self):
             self._file = None
             self._close(fileobj)
 
+# Size of the chunks read by the workers compressing files in parallel
+_COMPRESS_CHUNK_SIZE = 1024 * 1024
+# Compressed data larger than this is spooled to disk by the workers
+_COMPRESS_SPOOL_SIZE = 16 * 1024 * 1024
+
+def _compress_file(filename, zinfo):
+    """Compress the file filename as described by zinfo.
+
+    Set the CRC and sizes of zinfo and return a temporary file holding the
+    compressed data, positioned at its start.
+    """
+    import tempfile
+    compressor = _get_compressor(zinfo.compress_type, zinfo.compress_level)
+    spool = tempfile.SpooledTemporaryFile(max_size=_COMPRESS_SPOOL_SIZE)
+    try:
+        crc = file_size = 0
+        with open(filename, "rb") as src:
+            while data := src.read(_COMPRESS_CHUNK_SIZE):
+                file_size += len(data)
+                crc = crc32(data, crc)
+                if compressor:
+                    data = compressor.compress(data)
+                spool.write(data)
+        if compressor:
+            spool.write(compressor.flush())
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = spool.tell()
+        spool.seek(0)
+    except:
+        spool.close()
+        raise
+    return spool
+
 # Provide the tell method for unseekable stream
 class _Tellable:
     def __init__(self, fp):
@@ -1648,6 +1682,11 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
+        return self._open_member(zef_file, zinfo, name, pwd)
+
+    def _open_member(self, zef_file, zinfo, name, pwd):
+        """Return a ZipExtFile reading the member zinfo from zef_file,
+        a _SharedFile positioned at its header."""
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1697,7 +1736,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
             else:
                 pwd = None
 
-            return ZipExtFile(zef_file, mode + 'b', zinfo, pwd, True)
+            return ZipExtFile(zef_file, 'rb', zinfo, pwd, True)
         except:
             zef_file.close()
             raise
@@ -1758,13 +1797,16 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=1):
         """Extract all members from the archive to the current working
            directory. 'path' specifies a different directory to extract to.
            'members' is optional and must be a subset of the list returned
            by namelist(). You can specify the password to decrypt all files
-           using 'pwd'.
+           using 'pwd'. If 'workers' is greater than 1, members are
+           extracted concurrently by that many threads.
         """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         if members is None:
             members = self.namelist()
 
@@ -1773,8 +1815,49 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
-        for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+        if workers == 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+        else:
+            self._extractall_parallel(members, path, pwd, workers)
+
+    def _extractall_parallel(self, members, path, pwd, workers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        members = [m if isinstance(m, ZipInfo) else self.getinfo(m)
+                   for m in members]
+        # Only extract the last member of a given name, which would
+        # overwrite the previous ones.
+        last = {m.filename: i for i, m in enumerate(members)}
+        members = [m for i, m in enumerate(members) if last[m.filename] == i]
+
+        # If the archive was opened by name, each worker reads it through
+        # its own file object rather than sharing self.fp and its lock.
+        reopen = not self._filePassed and self.mode == 'r'
+        local = threading.local()
+        files = []
+
+        def extract(member):
+            fp = None
+            if reopen:
+                fp = getattr(local, 'fp', None)
+                if fp is None:
+                    fp = local.fp = io.open(self.filename, 'rb')
+                    files.append(fp)
+            return self._extract_member(member, path, pwd, fp)
+
+        try:
+            with ThreadPoolExecutor(workers) as executor:
+                futures = [executor.submit(extract, m) for m in members]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            for fp in files:
+                fp.close()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1791,9 +1874,10 @@ def _sanitize_windows_name(cls, arcname, pathsep):
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
+    def _extract_member(self, member, targetpath, pwd, fp=None):
         """Extract the ZipInfo object 'member' to a physical
-           file on the path targetpath.
+           file on the path targetpath.  The member is read from the
+           file object 'fp' if given, instead of the archive's own.
         """
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
@@ -1834,8 +1918,14 @@ def _extract_member(self, member, targetpath, pwd):
                         raise
             return targetpath
 
-        with self.open(member, pwd=pwd) as source, \
-             open(targetpath, "wb") as target:
+        if fp is None:
+            source = self.open(member, pwd=pwd)
+        else:
+            zef_file = _SharedFile(fp, member.header_offset,
+                                   lambda fp: None, threading.Lock(),
+                                   lambda: False)
+            source = self._open_member(zef_file, member, member.filename, pwd)
+        with source, open(targetpath, "wb") as target:
             shutil.copyfileobj(source, target)
 
         return targetpath
@@ -1875,13 +1965,22 @@ def write(self, filename, arcname=None,
                 "Can't write to ZIP archive while an open writing handle exists"
             )
 
+        zinfo = self._zinfo_from_file(filename, arcname,
+                                      compress_type, compresslevel)
+        if zinfo.is_dir():
+            self.mkdir(zinfo)
+        else:
+            with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
+                shutil.copyfileobj(src, dest, 1024*8)
+
+    def _zinfo_from_file(self, filename, arcname, compress_type,
+                         compresslevel):
         zinfo = ZipInfo.from_file(filename, arcname,
                                   strict_timestamps=self._strict_timestamps)
 
         if zinfo.is_dir():
             zinfo.compress_size = 0
             zinfo.CRC = 0
-            self.mkdir(zinfo)
         else:
             if compress_type is not None:
                 zinfo.compress_type = compress_type
@@ -1892,9 +1991,100 @@ def write(self, filename, arcname=None,
                 zinfo.compress_level = compresslevel
             else:
                 zinfo.compress_level = self.compresslevel
+        return zinfo
 
-            with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
-                shutil.copyfileobj(src, dest, 1024*8)
+    def writeall(self, files, compress_type=None, compresslevel=None, *,
+                 workers=1):
+        """Put several files into the archive, in order.
+
+        'files' is an iterable of file names, or of (filename, arcname)
+        pairs.  If 'workers' is greater than 1, the files are compressed
+        concurrently by that many threads, then appended to the archive.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists"
+            )
+
+        def entries():
+            for entry in files:
+                if isinstance(entry, tuple):
+                    filename, arcname = entry
+                else:
+                    filename, arcname = entry, None
+                yield filename, arcname
+
+        if workers == 1:
+            for filename, arcname in entries():
+                self.write(filename, arcname, compress_type, compresslevel)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        pending = []
+        with ThreadPoolExecutor(workers) as executor:
+            try:
+                for filename, arcname in entries():
+                    try:
+                        zinfo = self._zinfo_from_file(filename, arcname,
+                                                      compress_type,
+                                                      compresslevel)
+                        _check_compression(zinfo.compress_type)
+                    except BaseException:
+                        # Write the previous files, as write() would have.
+                        while pending:
+                            self._write_compressed(*pending.pop(0))
+                        raise
+                    if zinfo.is_dir():
+                        future = None
+                    else:
+                        future = executor.submit(_compress_file, filename,
+                                                 zinfo)
+                    pending.append((zinfo, future))
+                    # Bound the amount of compressed data waiting to be
+                    # written.
+                    if len(pending) > 2 * workers:
+                        self._write_compressed(*pending.pop(0))
+                while pending:
+                    self._write_compressed(*pending.pop(0))
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                for zinfo, future in pending:
+                    if (future is not None and not future.cancelled()
+                            and future.exception() is None):
+                        future.result().close()
+                raise
+
+    def _write_compressed(self, zinfo, future):
+        # Append a member compressed by _compress_file().
+        if future is None:
+            self.mkdir(zinfo)
+            return
+        with future.result() as spool:
+            zinfo.flag_bits = 0x00
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+            zip64 = (zinfo.file_size > ZIP64_LIMIT or
+                     zinfo.compress_size > ZIP64_LIMIT)
+            if not self._allowZip64 and zip64:
+                raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+            with self._lock:
+                if self._seekable:
+                    self.fp.seek(self.start_dir)
+                zinfo.header_offset = self.fp.tell()
+                self._writecheck(zinfo)
+                self._didModify = True
+                self.fp.write(zinfo.FileHeader(zip64))
+                shutil.copyfileobj(spool, self.fp)
+                self.start_dir = self.fp.tell()
+                self.filelist.append(zinfo)
+                self.NameToInfo[zinfo.filename] = zinfo
 
     def writestr(self, zinfo_or_arcname, data,
                  compress_type=None, compresslevel=None):
@@ -14,6 +14,8 @@ typedef struct {
     PyTypeObject *dequeiter_type;
     PyTypeObject *dequereviter_type;
     PyTypeObject *tuplegetter_type;
+    PyTypeObject *sortedlist_type;
+    PyTypeObject *sortedlistiter_type;
 } collections_state;
 
 static inline collections_state *
@@ -46,10 +48,12 @@ find_module_state_by_def(PyTypeObject *type)
 module _collections
 class _tuplegetter "_tuplegetterobject *" "clinic_state()->tuplegetter_type"
 class _collections.deque "dequeobject *" "clinic_state()->deque_type"
+class _collections.SortedList "sortedlistobject *" "clinic_state()->sortedlist_type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=a033cc2a8476b3f1]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=23a76bb5e617a428]*/
 
 typedef struct dequeobject dequeobject;
+typedef struct sortedlistobject sortedlistobject;
 
 /* We can safely assume type to be the defining class,
  * since tuplegetter is not a base type */
@@ -2473,6 +2477,2074 @@ static PyType_Spec defdict_spec = {
     .slots = defdict_slots,
 };
 
+/* sortedlist object ********************************************************/
+
+/* A SortedList stores its values in an array of sorted chunks holding
+ * between SORTED_LOAD/2 and 2*SORTED_LOAD values (unless the list is
+ * small), so that inserting or deleting a value only moves the pointers of
+ * one chunk.  The chunk where a key belongs is found by bisecting the last
+ * keys of the chunks, and the chunk holding an index by a Fenwick tree of
+ * the chunk sizes, which is rebuilt lazily when chunks are split or merged.
+ *
+ * Comparisons and key functions can run arbitrary code.  Keys are computed
+ * before the chunks are searched, and mutating the list while one of its
+ * comparisons runs raises RuntimeError, so that the positions found by a
+ * search stay valid.  References to removed values are released once the
+ * list is consistent again.
+ */
+
+#define SORTED_LOAD 512
+
+typedef struct {
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+    PyObject **values;
+    PyObject **keys;            /* NULL if the list has no key function */
+} sortedchunk;
+
+struct sortedlistobject {
+    PyObject_HEAD
+    sortedchunk *chunks;
+    Py_ssize_t nchunks;
+    Py_ssize_t allocated;       /* number of allocated chunks */
+    Py_ssize_t len;
+    Py_ssize_t *tree;           /* Fenwick tree of the chunk sizes */
+    Py_ssize_t tree_allocated;
+    int tree_valid;
+    PyObject *key;              /* key function or NULL */
+    size_t state;               /* incremented on every mutation */
+    Py_ssize_t comparing;       /* number of running comparisons */
+    PyObject *weakreflist;
+};
+
+#define CHUNK_KEYS(c) ((c)->keys != NULL ? (c)->keys : (c)->values)
+#define CHUNK_LASTKEY(c) (CHUNK_KEYS(c)[(c)->size - 1])
+
+static int
+sortedlist_compare(sortedlistobject *sl, PyObject *v, PyObject *w, int op)
+{
+    int res;
+    sl->comparing++;
+    res = PyObject_RichCompareBool(v, w, op);
+    sl->comparing--;
+    return res;
+}
+
+static int
+sortedlist_check_mutable(sortedlistobject *sl)
+{
+    if (sl->comparing) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "SortedList changed during a comparison");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+sortedlist_getkey(sortedlistobject *sl, PyObject *value)
+{
+    if (sl->key == NULL) {
+        return Py_NewRef(value);
+    }
+    return PyObject_CallOneArg(sl->key, value);
+}
+
+static void
+sortedlist_free_chunks(sortedchunk *chunks, Py_ssize_t nchunks)
+{
+    for (Py_ssize_t pos = 0; pos < nchunks; pos++) {
+        sortedchunk *c = &chunks[pos];
+        for (Py_ssize_t idx = 0; idx < c->size; idx++) {
+            Py_DECREF(c->values[idx]);
+            if (c->keys != NULL) {
+                Py_DECREF(c->keys[idx]);
+            }
+        }
+        PyMem_Free(c->values);
+        PyMem_Free(c->keys);
+    }
+    PyMem_Free(chunks);
+}
+
+static void
+sortedlist_clear_values(sortedlistobject *sl)
+{
+    sortedchunk *chunks = sl->chunks;
+    Py_ssize_t nchunks = sl->nchunks;
+
+    sl->chunks = NULL;
+    sl->nchunks = 0;
+    sl->allocated = 0;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(sl->len, 0);
+    sl->tree_valid = 0;
+    sl->state++;
+    sortedlist_free_chunks(chunks, nchunks);
+}
+
+/* Fenwick tree of the chunk sizes */
+
+static int
+sortedlist_build_tree(sortedlistobject *sl)
+{
+    Py_ssize_t n = sl->nchunks;
+    Py_ssize_t *tree = sl->tree;
+
+    if (sl->tree_allocated < n + 1) {
+        tree = PyMem_Realloc(tree, (sl->allocated + 1) * sizeof(Py_ssize_t));
+        if (tree == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        sl->tree = tree;
+        sl->tree_allocated = sl->allocated + 1;
+    }
+    tree[0] = 0;
+    for (Py_ssize_t i = 1; i <= n; i++) {
+        tree[i] = sl->chunks[i - 1].size;
+    }
+    for (Py_ssize_t i = 1; i <= n; i++) {
+        Py_ssize_t j = i + (i & -i);
+        if (j <= n) {
+            tree[j] += tree[i];
+        }
+    }
+    sl->tree_valid = 1;
+    return 0;
+}
+
+static void
+sortedlist_tree_add(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t delta)
+{
+    if (sl->tree_valid) {
+        for (Py_ssize_t i = pos + 1; i <= sl->nchunks; i += i & -i) {
+            sl->tree[i] += delta;
+        }
+    }
+}
+
+/* Return the index of the first value of the chunk pos. */
+static Py_ssize_t
+sortedlist_offset(sortedlistobject *sl, Py_ssize_t pos)
+{
+    Py_ssize_t offset = 0;
+
+    if (pos == sl->nchunks) {
+        return sl->len;
+    }
+    if (!sl->tree_valid && sortedlist_build_tree(sl) < 0) {
+        return -1;
+    }
+    for (; pos > 0; pos &= pos - 1) {
+        offset += sl->tree[pos];
+    }
+    return offset;
+}
+
+/* Find the chunk and the index in the chunk of the value at index. */
+static int
+sortedlist_locate(sortedlistobject *sl, Py_ssize_t index,
+                  Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t n = sl->nchunks, pos = 0, step, last;
+
+    assert(0 <= index && index < sl->len);
+    /* Fast paths for the first and the last chunks */
+    if (index < sl->chunks[0].size) {
+        *ppos = 0;
+        *pidx = index;
+        return 0;
+    }
+    last = sl->len - sl->chunks[n - 1].size;
+    if (index >= last) {
+        *ppos = n - 1;
+        *pidx = index - last;
+        return 0;
+    }
+    if (!sl->tree_valid && sortedlist_build_tree(sl) < 0) {
+        return -1;
+    }
+    for (step = 1; step <= n / 2; step *= 2)
+        ;
+    for (; step > 0; step /= 2) {
+        if (pos + step <= n && sl->tree[pos + step] <= index) {
+            pos += step;
+            index -= sl->tree[pos];
+        }
+    }
+    *ppos = pos;
+    *pidx = index;
+    return 0;
+}
+
+/* Chunk management.  Splitting and merging chunks is only done to keep
+ * the operations fast: allocation failures leave the chunks unbalanced
+ * but the list valid. */
+
+static int
+sortedchunk_resize(sortedchunk *c, Py_ssize_t allocated, int keyed)
+{
+    PyObject **values, **keys;
+
+    values = PyMem_Realloc(c->values, allocated * sizeof(PyObject *));
+    if (values == NULL) {
+        return -1;
+    }
+    c->values = values;
+    if (keyed) {
+        keys = PyMem_Realloc(c->keys, allocated * sizeof(PyObject *));
+        if (keys == NULL) {
+            return -1;
+        }
+        c->keys = keys;
+    }
+    c->allocated = allocated;
+    return 0;
+}
+
+/* Insert an empty chunk at pos. */
+static int
+sortedlist_insert_chunk(sortedlistobject *sl, Py_ssize_t pos)
+{
+    if (sl->nchunks == sl->allocated) {
+        Py_ssize_t allocated = sl->allocated + (sl->allocated >> 1) + 4;
+        sortedchunk *chunks = PyMem_Realloc(sl->chunks,
+                                            allocated * sizeof(sortedchunk));
+        if (chunks == NULL) {
+            return -1;
+        }
+        sl->chunks = chunks;
+        sl->allocated = allocated;
+    }
+    memmove(&sl->chunks[pos + 1], &sl->chunks[pos],
+            (sl->nchunks - pos) * sizeof(sortedchunk));
+    memset(&sl->chunks[pos], 0, sizeof(sortedchunk));
+    sl->nchunks++;
+    sl->tree_valid = 0;
+    return 0;
+}
+
+/* Remove the chunk at pos, without releasing the references it holds. */
+static void
+sortedlist_remove_chunk(sortedlistobject *sl, Py_ssize_t pos)
+{
+    PyMem_Free(sl->chunks[pos].values);
+    PyMem_Free(sl->chunks[pos].keys);
+    memmove(&sl->chunks[pos], &sl->chunks[pos + 1],
+            (sl->nchunks - pos - 1) * sizeof(sortedchunk));
+    sl->nchunks--;
+    sl->tree_valid = 0;
+}
+
+static void
+sortedlist_split(sortedlistobject *sl, Py_ssize_t pos)
+{
+    sortedchunk new = {0}, *c;
+    Py_ssize_t size = sl->chunks[pos].size - SORTED_LOAD;
+    int keyed = sl->key != NULL;
+
+    if (sortedchunk_resize(&new, size, keyed) < 0 ||
+        sortedlist_insert_chunk(sl, pos + 1) < 0)
+    {
+        PyMem_Free(new.values);
+        PyMem_Free(new.keys);
+        return;
+    }
+    c = &sl->chunks[pos];
+    memcpy(new.values, c->values + SORTED_LOAD, size * sizeof(PyObject *));
+    if (keyed) {
+        memcpy(new.keys, c->keys + SORTED_LOAD, size * sizeof(PyObject *));
+    }
+    new.size = size;
+    c->size = SORTED_LOAD;
+    sl->chunks[pos + 1] = new;
+}
+
+static void
+sortedlist_merge(sortedlistobject *sl, Py_ssize_t pos)
+{
+    sortedchunk *left = &sl->chunks[pos], *right = &sl->chunks[pos + 1];
+    Py_ssize_t size = left->size + right->size;
+
+    if (size > left->allocated &&
+        sortedchunk_resize(left, size, sl->key != NULL) < 0)
+    {
+        return;
+    }
+    memcpy(left->values + left->size, right->values,
+           right->size * sizeof(PyObject *));
+    if (right->keys != NULL) {
+        memcpy(left->keys + left->size, right->keys,
+               right->size * sizeof(PyObject *));
+    }
+    left->size = size;
+    sortedlist_remove_chunk(sl, pos + 1);
+}
+
+/* Rebalance the chunk at pos after values were removed from it. */
+static void
+sortedlist_balance(sortedlistobject *sl, Py_ssize_t pos)
+{
+    if (pos >= sl->nchunks) {
+        return;
+    }
+    if (sl->chunks[pos].size == 0) {
+        sortedlist_remove_chunk(sl, pos);
+        return;
+    }
+    if (sl->chunks[pos].size < SORTED_LOAD / 2 && sl->nchunks > 1) {
+        if (pos == sl->nchunks - 1) {
+            pos--;
+        }
+        sortedlist_merge(sl, pos);
+        if (sl->chunks[pos].size > 2 * SORTED_LOAD) {
+            sortedlist_split(sl, pos);
+        }
+    }
+}
+
+/* Insert value with key at idx in the chunk pos, or at the end of the list
+ * if pos is nchunks. */
+static int
+sortedlist_insert(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx,
+                  PyObject *value, PyObject *key)
+{
+    sortedchunk *c;
+    int keyed = sl->key != NULL;
+
+    if (sl->nchunks == 0) {
+        if (sortedlist_insert_chunk(sl, 0) < 0) {
+            goto nomemory;
+        }
+        pos = idx = 0;
+    }
+    else if (pos == sl->nchunks) {
+        pos--;
+        idx = sl->chunks[pos].size;
+    }
+    c = &sl->chunks[pos];
+    if (c->size == c->allocated) {
+        Py_ssize_t allocated = c->allocated + (c->allocated >> 1) + 8;
+        if (allocated > 2 * SORTED_LOAD + 1 && c->size <= 2 * SORTED_LOAD) {
+            allocated = 2 * SORTED_LOAD + 1;
+        }
+        if (sortedchunk_resize(c, allocated, keyed) < 0) {
+            if (c->size == 0) {
+                sortedlist_remove_chunk(sl, pos);
+            }
+            goto nomemory;
+        }
+    }
+    memmove(&c->values[idx + 1], &c->values[idx],
+            (c->size - idx) * sizeof(PyObject *));
+    c->values[idx] = Py_NewRef(value);
+    if (keyed) {
+        memmove(&c->keys[idx + 1], &c->keys[idx],
+                (c->size - idx) * sizeof(PyObject *));
+        c->keys[idx] = Py_NewRef(key);
+    }
+    c->size++;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(sl->len, sl->len + 1);
+    sl->state++;
+    sortedlist_tree_add(sl, pos, 1);
+    if (c->size > 2 * SORTED_LOAD) {
+        sortedlist_split(sl, pos);
+    }
+    return 0;
+
+nomemory:
+    PyErr_NoMemory();
+    return -1;
+}
+
+/* Remove the value at idx in the chunk pos.  The references to the value
+ * and its key (NULL if there is no key function) are passed to the caller,
+ * who releases them. */
+static void
+sortedlist_delete(sortedlistobject *sl, Py_ssize_t pos, Py_ssize_t idx,
+                  PyObject **pvalue, PyObject **pkey)
+{
+    sortedchunk *c = &sl->chunks[pos];
+
+    *pvalue = c->values[idx];
+    memmove(&c->values[idx], &c->values[idx + 1],
+            (c->size - idx - 1) * sizeof(PyObject *));
+    if (c->keys != NULL) {
+        *pkey = c->keys[idx];
+        memmove(&c->keys[idx], &c->keys[idx + 1],
+                (c->size - idx - 1) * sizeof(PyObject *));
+    }
+    else {
+        *pkey = NULL;
+    }
+    c->size--;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(sl->len, sl->len - 1);
+    sl->state++;
+    sortedlist_tree_add(sl, pos, -1);
+    sortedlist_balance(sl, pos);
+}
+
+/* Remove the values from start to stop, 0 <= start < stop <= len. */
+static int
+sortedlist_delete_range(sortedlistobject *sl, Py_ssize_t start,
+                        Py_ssize_t stop)
+{
+    Py_ssize_t n = stop - start, first, pos, idx, count = 0;
+    int keyed = sl->key != NULL;
+    PyObject **garbage;
+
+    garbage = PyMem_New(PyObject *, keyed ? 2 * n : n);
+    if (garbage == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (sortedlist_locate(sl, start, &pos, &idx) < 0) {
+        PyMem_Free(garbage);
+        return -1;
+    }
+    first = pos;
+    while (n > 0) {
+        sortedchunk *c = &sl->chunks[pos];
+        Py_ssize_t k = Py_MIN(c->size - idx, n);
+        memcpy(&garbage[count], &c->values[idx], k * sizeof(PyObject *));
+        memmove(&c->values[idx], &c->values[idx + k],
+                (c->size - idx - k) * sizeof(PyObject *));
+        count += k;
+        if (keyed) {
+            memcpy(&garbage[count], &c->keys[idx], k * sizeof(PyObject *));
+            memmove(&c->keys[idx], &c->keys[idx + k],
+                    (c->size - idx - k) * sizeof(PyObject *));
+            count += k;
+        }
+        c->size -= k;
+        n -= k;
+        if (c->size == 0) {
+            sortedlist_remove_chunk(sl, pos);
+        }
+        else {
+            pos++;
+        }
+        idx = 0;
+    }
+    FT_ATOMIC_STORE_SSIZE_RELAXED(sl->len, sl->len - (stop - start));
+    sl->state++;
+    sl->tree_valid = 0;
+    sortedlist_balance(sl, first + 1);
+    sortedlist_balance(sl, first);
+
+    while (count > 0) {
+        Py_DECREF(garbage[--count]);
+    }
+    PyMem_Free(garbage);
+    return 0;
+}
+
+/* Searching.  The functions return -1 on error. */
+
+/* Find where key would be inserted: before the values with an equal key
+ * if right is false, after them otherwise.  Set *ppos to the chunk (or to
+ * nchunks if key is greater than all the keys) and *pidx to the index
+ * in the chunk. */
+static int
+sortedlist_bisect(sortedlistobject *sl, PyObject *key, int right,
+                  Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t lo = 0, hi = sl->nchunks, pos, mid;
+    PyObject **keys;
+    int res;
+
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (right) {
+            res = sortedlist_compare(sl, key,
+                                     CHUNK_LASTKEY(&sl->chunks[mid]), Py_LT);
+        }
+        else {
+            res = sortedlist_compare(sl, CHUNK_LASTKEY(&sl->chunks[mid]),
+                                     key, Py_LT);
+        }
+        if (res < 0) {
+            return -1;
+        }
+        if (right ? res : !res) {
+            hi = mid;
+        }
+        else {
+            lo = mid + 1;
+        }
+    }
+    pos = lo;
+    *ppos = pos;
+    *pidx = 0;
+    if (pos == sl->nchunks) {
+        return 0;
+    }
+    keys = CHUNK_KEYS(&sl->chunks[pos]);
+    lo = 0;
+    hi = sl->chunks[pos].size;
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (right) {
+            res = sortedlist_compare(sl, key, keys[mid], Py_LT);
+        }
+        else {
+            res = sortedlist_compare(sl, keys[mid], key, Py_LT);
+        }
+        if (res < 0) {
+            return -1;
+        }
+        if (right ? res : !res) {
+            hi = mid;
+        }
+        else {
+            lo = mid + 1;
+        }
+    }
+    *pidx = lo;
+    return 0;
+}
+
+static Py_ssize_t
+sortedlist_bisect_index(sortedlistobject *sl, PyObject *key, int right)
+{
+    Py_ssize_t pos, idx, offset;
+
+    if (sortedlist_bisect(sl, key, right, &pos, &idx) < 0) {
+        return -1;
+    }
+    offset = sortedlist_offset(sl, pos);
+    if (offset < 0) {
+        return -1;
+    }
+    return offset + idx;
+}
+
+/* Find a value equal to value, whose key is key.  Return 1 and set *ppos
+ * and *pidx if it is found, 0 if it is not found. */
+static int
+sortedlist_find(sortedlistobject *sl, PyObject *value, PyObject *key,
+                Py_ssize_t *ppos, Py_ssize_t *pidx)
+{
+    Py_ssize_t pos, idx;
+    int res;
+
+    if (sortedlist_bisect(sl, key, 0, &pos, &idx) < 0) {
+        return -1;
+    }
+    for (; pos < sl->nchunks; pos++, idx = 0) {
+        sortedchunk *c = &sl->chunks[pos];
+        for (; idx < c->size; idx++) {
+            if (c->keys != NULL) {
+                res = sortedlist_compare(sl, key, c->keys[idx], Py_LT);
+                if (res != 0) {
+                    return res < 0 ? -1 : 0;
+                }
+            }
+            res = sortedlist_compare(sl, c->values[idx], value, Py_EQ);
+            if (res != 0) {
+                *ppos = pos;
+                *pidx = idx;
+                return res;
+            }
+            if (c->keys == NULL) {
+                return 0;
+            }
+        }
+    }
+    return 0;
+}
+
+/* Count the values equal to value from start to stop, and stop at the
+ * first one if first is true.  Set *pindex to its index. */
+static Py_ssize_t
+sortedlist_count_range(sortedlistobject *sl, PyObject *value,
+                       Py_ssize_t start, Py_ssize_t stop, int first,
+                       Py_ssize_t *pindex)
+{
+    Py_ssize_t pos, idx, count = 0;
+    int res;
+
+    if (start >= stop) {
+        return 0;
+    }
+    if (sortedlist_locate(sl, start, &pos, &idx) < 0) {
+        return -1;
+    }
+    for (Py_ssize_t i = start; i < stop; i++) {
+        sortedchunk *c = &sl->chunks[pos];
+        res = sortedlist_compare(sl, c->values[idx], value, Py_EQ);
+        if (res < 0) {
+            return -1;
+        }
+        if (res) {
+            count++;
+            if (first) {
+                *pindex = i;
+                break;
+            }
+        }
+        if (++idx == c->size) {
+            pos++;
+            idx = 0;
+        }
+    }
+    return count;
+}
+
+static int
+sortedlist_add_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    PyObject *key;
+    int res = -1;
+
+    key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    if (sortedlist_bisect(sl, key, 1, &pos, &idx) == 0 &&
+        sortedlist_check_mutable(sl) == 0)
+    {
+        res = sortedlist_insert(sl, pos, idx, value, key);
+    }
+    Py_DECREF(key);
+    return res;
+}
+
+/* Replace the values by the values of the chunks of the lists values and
+ * keys (NULL if there is no key function), sorted by key. */
+static int
+sortedlist_set_sorted(sortedlistobject *sl, PyObject *values, PyObject *keys)
+{
+    Py_ssize_t n = PyList_GET_SIZE(values);
+    Py_ssize_t nchunks = (n + SORTED_LOAD - 1) / SORTED_LOAD;
+    sortedchunk *chunks, *oldchunks = sl->chunks;
+    Py_ssize_t oldnchunks = sl->nchunks;
+
+    chunks = PyMem_New(sortedchunk, nchunks);
+    if (chunks == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (Py_ssize_t pos = 0; pos < nchunks; pos++) {
+        sortedchunk *c = &chunks[pos];
+        Py_ssize_t start = pos * SORTED_LOAD;
+        Py_ssize_t size = Py_MIN(n - start, SORTED_LOAD);
+        c->size = c->allocated = 0;
+        c->values = c->keys = NULL;
+        if (sortedchunk_resize(c, size, keys != NULL) < 0) {
+            PyMem_Free(c->values);
+            sortedlist_free_chunks(chunks, pos);
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = 0; i < size; i++) {
+            c->values[i] = Py_NewRef(PyList_GET_ITEM(values, start + i));
+            if (keys != NULL) {
+                c->keys[i] = Py_NewRef(PyList_GET_ITEM(keys, start + i));
+            }
+        }
+        c->size = size;
+    }
+    sl->chunks = chunks;
+    sl->nchunks = sl->allocated = nchunks;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(sl->len, n);
+    sl->tree_valid = 0;
+    sl->state++;
+    sortedlist_free_chunks(oldchunks, oldnchunks);
+    return 0;
+}
+
+/* Add the values of the list values by sorting all the values again. */
+static int
+sortedlist_rebuild(sortedlistobject *sl, PyObject *values)
+{
+    Py_ssize_t n = PyList_GET_SIZE(values), total, i;
+    PyObject *allvalues = NULL, *allkeys = NULL, *newkeys = NULL;
+    PyObject *order = NULL, *getitem = NULL, *kwnames = NULL, *res, *tmp;
+    int result = -1;
+
+    if (sl->key != NULL) {
+        newkeys = PyList_New(n);
+        if (newkeys == NULL) {
+            return -1;
+        }
+        for (i = 0; i < n; i++) {
+            /* The key function can change the length of values */
+            if (i >= PyList_GET_SIZE(values)) {
+                break;
+            }
+            PyObject *key = PyObject_CallOneArg(sl->key,
+                                                PyList_GET_ITEM(values, i));
+            if (key == NULL) {
+                goto done;
+            }
+            PyList_SET_ITEM(newkeys, i, key);
+        }
+        if (sl->key == NULL || PyList_GET_SIZE(values) != n) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "SortedList changed during update");
+            goto done;
+        }
+    }
+    if (sortedlist_check_mutable(sl) < 0) {
+        goto done;
+    }
+
+    /* Existing values first: the sort is stable. */
+    total = sl->len + n;
+    allvalues = PyList_New(total);
+    if (allvalues == NULL) {
+        goto done;
+    }
+    if (newkeys != NULL) {
+        allkeys = PyList_New(total);
+        if (allkeys == NULL) {
+            goto done;
+        }
+    }
+    i = 0;
+    for (Py_ssize_t pos = 0; pos < sl->nchunks; pos++) {
+        sortedchunk *c = &sl->chunks[pos];
+        for (Py_ssize_t idx = 0; idx < c->size; idx++, i++) {
+            PyList_SET_ITEM(allvalues, i, Py_NewRef(c->values[idx]));
+            if (allkeys != NULL) {
+                PyList_SET_ITEM(allkeys, i, Py_NewRef(c->keys[idx]));
+            }
+        }
+    }
+    for (Py_ssize_t j = 0; j < n; j++, i++) {
+        PyList_SET_ITEM(allvalues, i, Py_NewRef(PyList_GET_ITEM(values, j)));
+        if (allkeys != NULL) {
+            PyList_SET_ITEM(allkeys, i, Py_NewRef(PyList_GET_ITEM(newkeys, j)));
+        }
+    }
+
+    sl->comparing++;
+    if (allkeys == NULL) {
+        res = PyList_Sort(allvalues) < 0 ? NULL : Py_None;
+    }
+    else {
+        /* Sort the indices of the values by key, then permute the values
+           and the keys. */
+        order = PyList_New(total);
+        getitem = PyObject_GetAttr(allkeys, &_Py_ID(__getitem__));
+        kwnames = PyTuple_Pack(1, &_Py_ID(key));
+        res = NULL;
+        if (order != NULL && getitem != NULL && kwnames != NULL) {
+            for (i = 0; i < total; i++) {
+                tmp = PyLong_FromSsize_t(i);
+                if (tmp == NULL) {
+                    break;
+                }
+                PyList_SET_ITEM(order, i, tmp);
+            }
+            if (i == total) {
+                PyObject *args[2] = {order, getitem};
+                res = PyObject_VectorcallMethod(&_Py_ID(sort), args, 1,
+                                                kwnames);
+            }
+        }
+    }
+    sl->comparing--;
+    if (res == NULL) {
+        goto done;
+    }
+    if (res != Py_None) {
+        Py_DECREF(res);
+    }
+    if (order != NULL) {
+        PyObject *sortedvalues = PyList_New(total);
+        PyObject *sortedkeys = PyList_New(total);
+        if (sortedvalues == NULL || sortedkeys == NULL) {
+            Py_XDECREF(sortedvalues);
+            Py_XDECREF(sortedkeys);
+            goto done;
+        }
+        for (i = 0; i < total; i++) {
+            Py_ssize_t j = PyLong_AsSsize_t(PyList_GET_ITEM(order, i));
+            assert(0 <= j && j < total);
+            PyList_SET_ITEM(sortedvalues, i,
+                            Py_NewRef(PyList_GET_ITEM(allvalues, j)));
+            PyList_SET_ITEM(sortedkeys, i,
+                            Py_NewRef(PyList_GET_ITEM(allkeys, j)));
+        }
+        Py_SETREF(allvalues, sortedvalues);
+        Py_SETREF(allkeys, sortedkeys);
+    }
+    if (sortedlist_check_mutable(sl) < 0) {
+        goto done;
+    }
+    result = sortedlist_set_sorted(sl, allvalues, allkeys);
+
+done:
+    Py_XDECREF(newkeys);
+    Py_XDECREF(allvalues);
+    Py_XDECREF(allkeys);
+    Py_XDECREF(order);
+    Py_XDECREF(getitem);
+    Py_XDECREF(kwnames);
+    return result;
+}
+
+static int
+sortedlist_extend(sortedlistobject *sl, PyObject *values)
+{
+    Py_ssize_t n = PyList_GET_SIZE(values);
+
+    if (n == 0) {
+        return 0;
+    }
+    if (n < sl->len / 32) {
+        for (Py_ssize_t i = 0; i < n; i++) {
+            if (sortedlist_add_lock_held(sl, PyList_GET_ITEM(values, i)) < 0) {
+                return -1;
+            }
+        }
+        return 0;
+    }
+    return sortedlist_rebuild(sl, values);
+}
+
+static PyObject *
+sortedlist_iter_range(sortedlistobject *sl, Py_ssize_t start,
+                      Py_ssize_t stop, int reverse);
+
+/*[clinic input]
+@critical_section
+@text_signature "(iterable=(), key=None)"
+_collections.SortedList.__init__ as sortedlist_init
+
+    iterable: object = NULL
+    key: object = None
+
+List which keeps its values sorted.
+
+The values are ordered by key(value) if key is not None, and values
+with equal keys are kept in insertion order.  Adding, removing and
+locating values take logarithmic time on average.
+[clinic start generated code]*/
+
+static int
+sortedlist_init_impl(sortedlistobject *self, PyObject *iterable,
+                     PyObject *key)
+/*[clinic end generated code: output=08490e655c48466f input=2a0a38be0200a72a]*/
+{
+    sortedchunk *chunks = self->chunks;
+    Py_ssize_t nchunks = self->nchunks;
+    PyObject *oldkey = self->key, *values;
+    int res;
+
+    if (key == Py_None) {
+        key = NULL;
+    }
+    else if (!PyCallable_Check(key)) {
+        PyErr_SetString(PyExc_TypeError, "key must be callable or None");
+        return -1;
+    }
+    if (sortedlist_check_mutable(self) < 0) {
+        return -1;
+    }
+    /* Change the key function only when the list is empty */
+    self->chunks = NULL;
+    self->nchunks = 0;
+    self->allocated = 0;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->len, 0);
+    self->tree_valid = 0;
+    self->state++;
+    self->key = Py_XNewRef(key);
+    sortedlist_free_chunks(chunks, nchunks);
+    Py_XDECREF(oldkey);
+
+    if (iterable == NULL) {
+        return 0;
+    }
+    values = PySequence_List(iterable);
+    if (values == NULL) {
+        return -1;
+    }
+    res = sortedlist_extend(self, values);
+    Py_DECREF(values);
+    return res;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.add as sortedlist_add
+
+    value: object
+    /
+
+Add value to the list, after the values with the same key.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_add_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=ffd96e7466eb6100 input=82f71484b0e6cd48]*/
+{
+    if (sortedlist_add_lock_held(self, value) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.update as sortedlist_update
+
+    iterable: object
+    /
+
+Add the values of iterable to the list.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_update_impl(sortedlistobject *self, PyObject *iterable)
+/*[clinic end generated code: output=770ec8595fc76697 input=013feda4733d09b0]*/
+{
+    PyObject *values = PySequence_List(iterable);
+    int res;
+
+    if (values == NULL) {
+        return NULL;
+    }
+    res = sortedlist_extend(self, values);
+    Py_DECREF(values);
+    if (res < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static int
+sortedlist_discard_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    PyObject *key, *oldvalue = NULL, *oldkey = NULL;
+    int res;
+
+    key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    res = sortedlist_find(sl, value, key, &pos, &idx);
+    if (res > 0) {
+        if (sortedlist_check_mutable(sl) < 0) {
+            res = -1;
+        }
+        else {
+            sortedlist_delete(sl, pos, idx, &oldvalue, &oldkey);
+        }
+    }
+    Py_DECREF(key);
+    Py_XDECREF(oldvalue);
+    Py_XDECREF(oldkey);
+    return res;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.remove as sortedlist_remove
+
+    value: object
+    /
+
+Remove a value equal to value.
+
+Raise ValueError if the value is not present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_remove_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=ba82c1161cc2d5c4 input=376ac3f573b179dc]*/
+{
+    int res = sortedlist_discard_lock_held(self, value);
+    if (res < 0) {
+        return NULL;
+    }
+    if (res == 0) {
+        PyErr_Format(PyExc_ValueError, "%R not in SortedList", value);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.discard as sortedlist_discard
+
+    value: object
+    /
+
+Remove a value equal to value if it is present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_discard_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=c8bd10e8f495fc7d input=1c100f1da92e3738]*/
+{
+    if (sortedlist_discard_lock_held(self, value) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.pop as sortedlist_pop
+
+    index: Py_ssize_t = -1
+    /
+
+Remove and return the value at index (default last).
+
+Raise IndexError if the list is empty or index is out of range.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_pop_impl(sortedlistobject *self, Py_ssize_t index)
+/*[clinic end generated code: output=955d4810c78aa1f5 input=a7c489a190467646]*/
+{
+    Py_ssize_t pos, idx;
+    PyObject *value, *key;
+
+    if (self->len == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty SortedList");
+        return NULL;
+    }
+    if (index < 0) {
+        index += self->len;
+    }
+    if (index < 0 || index >= self->len) {
+        PyErr_SetString(PyExc_IndexError, "SortedList index out of range");
+        return NULL;
+    }
+    if (sortedlist_check_mutable(self) < 0 ||
+        sortedlist_locate(self, index, &pos, &idx) < 0)
+    {
+        return NULL;
+    }
+    sortedlist_delete(self, pos, idx, &value, &key);
+    Py_XDECREF(key);
+    return value;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.clear as sortedlist_clear
+
+Remove all values from the list.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_clear_impl(sortedlistobject *self)
+/*[clinic end generated code: output=9b66ecc43da56ca8 input=e226f20100042a63]*/
+{
+    if (sortedlist_check_mutable(self) < 0) {
+        return NULL;
+    }
+    sortedlist_clear_values(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.index as sortedlist_index
+
+    value: object
+    start: slice_index(accept={int}) = 0
+    stop: slice_index(accept={int}, c_default="PY_SSIZE_T_MAX") = sys.maxsize
+    /
+
+Return the first index of a value equal to value.
+
+Raise ValueError if the value is not present.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_index_impl(sortedlistobject *self, PyObject *value,
+                      Py_ssize_t start, Py_ssize_t stop)
+/*[clinic end generated code: output=a895777f523533df input=ca3efe46775ff95a]*/
+{
+    Py_ssize_t lo, hi = -1, index = -1, count = -1;
+    PyObject *key;
+
+    if (start < 0) {
+        start = Py_MAX(start + self->len, 0);
+    }
+    if (stop < 0) {
+        stop = Py_MAX(stop + self->len, 0);
+    }
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    lo = sortedlist_bisect_index(self, key, 0);
+    if (lo >= 0) {
+        hi = sortedlist_bisect_index(self, key, 1);
+    }
+    if (hi >= 0) {
+        count = sortedlist_count_range(self, value, Py_MAX(lo, start),
+                                       Py_MIN(hi, stop), 1, &index);
+    }
+    Py_DECREF(key);
+    if (count < 0) {
+        return NULL;
+    }
+    if (count == 0) {
+        PyErr_Format(PyExc_ValueError, "%R is not in SortedList", value);
+        return NULL;
+    }
+    return PyLong_FromSsize_t(index);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.count as sortedlist_count
+
+    value: object
+    /
+
+Return the number of values equal to value.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_count_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=3a130b083f3d68d7 input=3f77d57e86805329]*/
+{
+    Py_ssize_t lo, hi = -1, count = -1;
+    PyObject *key;
+
+    key = sortedlist_getkey(self, value);
+    if (key == NULL) {
+        return NULL;
+    }
+    lo = sortedlist_bisect_index(self, key, 0);
+    if (lo >= 0) {
+        hi = sortedlist_bisect_index(self, key, 1);
+    }
+    if (hi >= 0) {
+        if (self->key == NULL) {
+            count = hi - lo;
+        }
+        else {
+            count = sortedlist_count_range(self, value, lo, hi, 0, NULL);
+        }
+    }
+    Py_DECREF(key);
+    if (count < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(count);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_key_left as sortedlist_bisect_key_left
+
+    key: object
+    /
+
+Return the index of the first value whose key is not less than key.
+
+The index where a value with this key would be inserted before the
+values with the same key.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_key_left_impl(sortedlistobject *self, PyObject *key)
+/*[clinic end generated code: output=4c0c27930995e362 input=e51145e2a6078430]*/
+{
+    Py_ssize_t index = sortedlist_bisect_index(self, key, 0);
+    if (index < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(index);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_key_right as sortedlist_bisect_key_right
+
+    key: object
+    /
+
+Return the index of the first value whose key is greater than key.
+
+The index where a value with this key would be inserted after the
+values with the same key.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_key_right_impl(sortedlistobject *self, PyObject *key)
+/*[clinic end generated code: output=16e7e4ea7949580a input=723c65fd9dd1aa55]*/
+{
+    Py_ssize_t index = sortedlist_bisect_index(self, key, 1);
+    if (index < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(index);
+}
+
+static PyObject *
+sortedlist_bisect_value(sortedlistobject *sl, PyObject *value, int right)
+{
+    Py_ssize_t index;
+    PyObject *key = sortedlist_getkey(sl, value);
+
+    if (key == NULL) {
+        return NULL;
+    }
+    index = sortedlist_bisect_index(sl, key, right);
+    Py_DECREF(key);
+    if (index < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(index);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_left as sortedlist_bisect_left
+
+    value: object
+    /
+
+Like bisect_key_left(), but take a value rather than a key.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_left_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=0246e33e31ba78e9 input=2e80ad357ba48d86]*/
+{
+    return sortedlist_bisect_value(self, value, 0);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.bisect_right as sortedlist_bisect_right
+
+    value: object
+    /
+
+Like bisect_key_right(), but take a value rather than a key.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_bisect_right_impl(sortedlistobject *self, PyObject *value)
+/*[clinic end generated code: output=c88a5ccaf8b15423 input=8741eee4332279be]*/
+{
+    return sortedlist_bisect_value(self, value, 1);
+}
+
+static PyObject *
+sortedlist_irange_lock_held(sortedlistobject *sl, PyObject *min_key,
+                            PyObject *max_key, PyObject *inclusive,
+                            int reverse)
+{
+    int min_inclusive = 1, max_inclusive = 1;
+    Py_ssize_t start = 0, stop;
+
+    if (inclusive != NULL) {
+        PyObject *pair = PySequence_Tuple(inclusive);
+        if (pair == NULL) {
+            return NULL;
+        }
+        if (PyTuple_GET_SIZE(pair) != 2) {
+            Py_DECREF(pair);
+            PyErr_SetString(PyExc_ValueError,
+                            "inclusive must be a pair of booleans");
+            return NULL;
+        }
+        min_inclusive = PyObject_IsTrue(PyTuple_GET_ITEM(pair, 0));
+        if (min_inclusive >= 0) {
+            max_inclusive = PyObject_IsTrue(PyTuple_GET_ITEM(pair, 1));
+        }
+        Py_DECREF(pair);
+        if (min_inclusive < 0 || max_inclusive < 0) {
+            return NULL;
+        }
+    }
+    if (min_key != Py_None) {
+        start = sortedlist_bisect_index(sl, min_key, !min_inclusive);
+        if (start < 0) {
+            return NULL;
+        }
+    }
+    if (max_key != Py_None) {
+        stop = sortedlist_bisect_index(sl, max_key, max_inclusive);
+        if (stop < 0) {
+            return NULL;
+        }
+    }
+    else {
+        stop = sl->len;
+    }
+    return sortedlist_iter_range(sl, start, stop, reverse);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.irange as sortedlist_irange
+
+    minimum: object = None
+    maximum: object = None
+    inclusive: object(c_default="NULL") = (True, True)
+    reverse: bool = False
+
+Return an iterator over the values between minimum and maximum.
+
+The bounds are values, compared by their keys.  None means no bound.
+inclusive is a pair of booleans telling whether the values equal to
+minimum and maximum are included.  If reverse is true, iterate in
+descending order.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_irange_impl(sortedlistobject *self, PyObject *minimum,
+                       PyObject *maximum, PyObject *inclusive, int reverse)
+/*[clinic end generated code: output=0b2af160f64e6b94 input=00abd7dbe6a70eea]*/
+{
+    PyObject *min_key = NULL, *max_key = NULL, *result = NULL;
+
+    if (self->key == NULL || minimum == Py_None) {
+        min_key = Py_NewRef(minimum);
+    }
+    else {
+        min_key = PyObject_CallOneArg(self->key, minimum);
+    }
+    if (min_key == NULL) {
+        return NULL;
+    }
+    if (self->key == NULL || maximum == Py_None) {
+        max_key = Py_NewRef(maximum);
+    }
+    else {
+        max_key = PyObject_CallOneArg(self->key, maximum);
+    }
+    if (max_key != NULL) {
+        result = sortedlist_irange_lock_held(self, min_key, max_key,
+                                             inclusive, reverse);
+    }
+    Py_DECREF(min_key);
+    Py_XDECREF(max_key);
+    return result;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.irange_key as sortedlist_irange_key
+
+    min_key: object = None
+    max_key: object = None
+    inclusive: object(c_default="NULL") = (True, True)
+    reverse: bool = False
+
+Like irange(), but the bounds are keys rather than values.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_irange_key_impl(sortedlistobject *self, PyObject *min_key,
+                           PyObject *max_key, PyObject *inclusive,
+                           int reverse)
+/*[clinic end generated code: output=eb07000fe247a3f8 input=c858c01d3509d008]*/
+{
+    return sortedlist_irange_lock_held(self, min_key, max_key, inclusive,
+                                       reverse);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.copy as sortedlist_copy
+
+Return a shallow copy of the list.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist_copy_impl(sortedlistobject *self)
+/*[clinic end generated code: output=aacdca77ac81989e input=e01a6bc490267ca8]*/
+{
+    collections_state *state = find_module_state_by_def(Py_TYPE(self));
+    PyTypeObject *type = state->sortedlist_type;
+    sortedlistobject *new;
+
+    if (!Py_IS_TYPE(self, type)) {
+        return PyObject_CallFunctionObjArgs((PyObject *)Py_TYPE(self), self,
+                                            self->key ? self->key : Py_None,
+                                            NULL);
+    }
+    new = (sortedlistobject *)type->tp_alloc(type, 0);
+    if (new == NULL) {
+        return NULL;
+    }
+    new->key = Py_XNewRef(self->key);
+    if (self->nchunks == 0) {
+        return (PyObject *)new;
+    }
+    new->chunks = PyMem_New(sortedchunk, self->nchunks);
+    if (new->chunks == NULL) {
+        Py_DECREF(new);
+        return PyErr_NoMemory();
+    }
+    new->allocated = self->nchunks;
+    for (Py_ssize_t pos = 0; pos < self->nchunks; pos++) {
+        sortedchunk *c = &self->chunks[pos], *newc = &new->chunks[pos];
+        newc->size = newc->allocated = 0;
+        newc->values = newc->keys = NULL;
+        if (sortedchunk_resize(newc, c->size, c->keys != NULL) < 0) {
+            PyMem_Free(newc->values);
+            Py_DECREF(new);
+            return PyErr_NoMemory();
+        }
+        for (Py_ssize_t idx = 0; idx < c->size; idx++) {
+            newc->values[idx] = Py_NewRef(c->values[idx]);
+            if (c->keys != NULL) {
+                newc->keys[idx] = Py_NewRef(c->keys[idx]);
+            }
+        }
+        newc->size = c->size;
+        new->nchunks++;
+    }
+    new->len = self->len;
+    return (PyObject *)new;
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.__copy__ as sortedlist___copy__ = _collections.SortedList.copy
+
+Return a shallow copy of the list.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___copy___impl(sortedlistobject *self)
+/*[clinic end generated code: output=095c50a06faa52fd input=df61d94d6de597ac]*/
+{
+    return sortedlist_copy_impl(self);
+}
+
+/*[clinic input]
+_collections.SortedList.__reduce__ as sortedlist___reduce__
+
+Return state information for pickling.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___reduce___impl(sortedlistobject *self)
+/*[clinic end generated code: output=c757ecb38221c425 input=e6cc53941c57ca6d]*/
+{
+    PyObject *state, *values, *key;
+
+    state = _PyObject_GetState((PyObject *)self);
+    if (state == NULL) {
+        return NULL;
+    }
+    values = PySequence_List((PyObject *)self);
+    if (values == NULL) {
+        Py_DECREF(state);
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    key = self->key != NULL ? Py_NewRef(self->key) : Py_None;
+    Py_END_CRITICAL_SECTION();
+    return Py_BuildValue("O(NN)N", Py_TYPE(self), values, key, state);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.__reversed__ as sortedlist___reversed__
+
+Return a reverse iterator over the list.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___reversed___impl(sortedlistobject *self)
+/*[clinic end generated code: output=ddd9346585193c8c input=659726d7b716ff62]*/
+{
+    return sortedlist_iter_range(self, 0, self->len, 1);
+}
+
+/*[clinic input]
+@critical_section
+_collections.SortedList.__sizeof__ as sortedlist___sizeof__
+
+Return the size of the list in memory, in bytes.
+[clinic start generated code]*/
+
+static PyObject *
+sortedlist___sizeof___impl(sortedlistobject *self)
+/*[clinic end generated code: output=1ace03772c77869f input=00f32e90ec0d1379]*/
+{
+    size_t res = _PyObject_SIZE(Py_TYPE(self));
+    size_t width = self->key != NULL ? 2 : 1;
+
+    res += (size_t)self->allocated * sizeof(sortedchunk);
+    res += (size_t)self->tree_allocated * sizeof(Py_ssize_t);
+    for (Py_ssize_t pos = 0; pos < self->nchunks; pos++) {
+        res += (size_t)self->chunks[pos].allocated * width * sizeof(PyObject *);
+    }
+    return PyLong_FromSize_t(res);
+}
+
+static PyObject *
+sortedlist_get_key(sortedlistobject *sl, void *Py_UNUSED(ignored))
+{
+    PyObject *key;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    key = sl->key != NULL ? Py_NewRef(sl->key) : Py_None;
+    Py_END_CRITICAL_SECTION();
+    return key;
+}
+
+static Py_ssize_t
+sortedlist_len(PyObject *sl)
+{
+    return FT_ATOMIC_LOAD_SSIZE_RELAXED(((sortedlistobject *)sl)->len);
+}
+
+static int
+sortedlist_contains_lock_held(sortedlistobject *sl, PyObject *value)
+{
+    Py_ssize_t pos, idx;
+    PyObject *key;
+    int res;
+
+    key = sortedlist_getkey(sl, value);
+    if (key == NULL) {
+        return -1;
+    }
+    res = sortedlist_find(sl, value, key, &pos, &idx);
+    Py_DECREF(key);
+    return res;
+}
+
+static int
+sortedlist_contains(PyObject *sl, PyObject *value)
+{
+    int result;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    result = sortedlist_contains_lock_held((sortedlistobject *)sl, value);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_item_lock_held(sortedlistobject *sl, Py_ssize_t i)
+{
+    Py_ssize_t pos, idx;
+
+    if (i < 0 || i >= sl->len) {
+        PyErr_SetString(PyExc_IndexError, "SortedList index out of range");
+        return NULL;
+    }
+    if (sortedlist_locate(sl, i, &pos, &idx) < 0) {
+        return NULL;
+    }
+    return Py_NewRef(sl->chunks[pos].values[idx]);
+}
+
+static PyObject *
+sortedlist_item(PyObject *sl, Py_ssize_t i)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    result = sortedlist_item_lock_held((sortedlistobject *)sl, i);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_subscript_lock_held(sortedlistobject *sl, PyObject *item)
+{
+    Py_ssize_t start, stop, step, slicelength, pos, idx;
+    PyObject *result;
+
+    if (PyIndex_Check(item)) {
+        Py_ssize_t i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (i < 0) {
+            i += sl->len;
+        }
+        return sortedlist_item_lock_held(sl, i);
+    }
+    if (!PySlice_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "SortedList indices must be integers or slices, not %.200s",
+                     Py_TYPE(item)->tp_name);
+        return NULL;
+    }
+    if (PySlice_Unpack(item, &start, &stop, &step) < 0) {
+        return NULL;
+    }
+    slicelength = PySlice_AdjustIndices(sl->len, &start, &stop, step);
+    result = PyList_New(slicelength);
+    if (result == NULL || slicelength == 0) {
+        return result;
+    }
+    if (step == 1) {
+        if (sortedlist_locate(sl, start, &pos, &idx) < 0) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < slicelength; i++) {
+            sortedchunk *c = &sl->chunks[pos];
+            PyList_SET_ITEM(result, i, Py_NewRef(c->values[idx]));
+            if (++idx == c->size) {
+                pos++;
+                idx = 0;
+            }
+        }
+        return result;
+    }
+    for (Py_ssize_t i = 0; i < slicelength; i++, start += step) {
+        if (sortedlist_locate(sl, start, &pos, &idx) < 0) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyList_SET_ITEM(result, i, Py_NewRef(sl->chunks[pos].values[idx]));
+    }
+    return result;
+}
+
+static PyObject *
+sortedlist_subscript(PyObject *sl, PyObject *item)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    result = sortedlist_subscript_lock_held((sortedlistobject *)sl, item);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+sortedlist_ass_subscript_lock_held(sortedlistobject *sl, PyObject *item,
+                                   PyObject *value)
+{
+    Py_ssize_t start, stop, step, slicelength, pos, idx;
+    PyObject *oldvalue, *oldkey, **garbage;
+
+    if (value != NULL) {
+        PyErr_SetString(PyExc_TypeError,
+                        "'SortedList' object does not support item assignment");
+        return -1;
+    }
+    if (PyIndex_Check(item)) {
+        Py_ssize_t i = PyNumber_AsSsize_t(item, PyExc_IndexError);
+        if (i == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (i < 0) {
+            i += sl->len;
+        }
+        if (i < 0 || i >= sl->len) {
+            PyErr_SetString(PyExc_IndexError, "SortedList index out of range");
+            return -1;
+        }
+        if (sortedlist_check_mutable(sl) < 0 ||
+            sortedlist_locate(sl, i, &pos, &idx) < 0)
+        {
+            return -1;
+        }
+        sortedlist_delete(sl, pos, idx, &oldvalue, &oldkey);
+        Py_DECREF(oldvalue);
+        Py_XDECREF(oldkey);
+        return 0;
+    }
+    if (!PySlice_Check(item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "SortedList indices must be integers or slices, not %.200s",
+                     Py_TYPE(item)->tp_name);
+        return -1;
+    }
+    if (PySlice_Unpack(item, &start, &stop, &step) < 0) {
+        return -1;
+    }
+    slicelength = PySlice_AdjustIndices(sl->len, &start, &stop, step);
+    if (slicelength == 0) {
+        return 0;
+    }
+    if (sortedlist_check_mutable(sl) < 0) {
+        return -1;
+    }
+    if (step < 0) {
+        start += step * (slicelength - 1);
+        step = -step;
+    }
+    if (step == 1) {
+        return sortedlist_delete_range(sl, start, start + slicelength);
+    }
+    /* Delete from the end, so that the indices of the values left to
+       delete do not change. */
+    garbage = PyMem_New(PyObject *, 2 * slicelength);
+    if (garbage == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    Py_ssize_t i, n = slicelength;
+    int result = 0;
+    for (i = slicelength - 1; i >= 0; i--) {
+        if (sortedlist_locate(sl, start + i * step, &pos, &idx) < 0) {
+            result = -1;
+            break;
+        }
+        sortedlist_delete(sl, pos, idx, &garbage[2 * i], &garbage[2 * i + 1]);
+    }
+    for (i++; i < n; i++) {
+        Py_DECREF(garbage[2 * i]);
+        Py_XDECREF(garbage[2 * i + 1]);
+    }
+    PyMem_Free(garbage);
+    return result;
+}
+
+static int
+sortedlist_ass_subscript(PyObject *sl, PyObject *item, PyObject *value)
+{
+    int result;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    result = sortedlist_ass_subscript_lock_held((sortedlistobject *)sl, item,
+                                                value);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static PyObject *
+sortedlist_repr(PyObject *sl)
+{
+    PyObject *aslist, *key, *result;
+    int i;
+
+    i = Py_ReprEnter(sl);
+    if (i != 0) {
+        if (i < 0) {
+            return NULL;
+        }
+        return PyUnicode_FromString("...");
+    }
+    aslist = PySequence_List(sl);
+    if (aslist == NULL) {
+        Py_ReprLeave(sl);
+        return NULL;
+    }
+    key = sortedlist_get_key((sortedlistobject *)sl, NULL);
+    if (key == Py_None) {
+        result = PyUnicode_FromFormat("%s(%R)", _PyType_Name(Py_TYPE(sl)),
+                                      aslist);
+    }
+    else {
+        result = PyUnicode_FromFormat("%s(%R, key=%R)",
+                                      _PyType_Name(Py_TYPE(sl)), aslist, key);
+    }
+    Py_ReprLeave(sl);
+    Py_DECREF(aslist);
+    Py_DECREF(key);
+    return result;
+}
+
+static PyObject *
+sortedlist_richcompare(PyObject *v, PyObject *w, int op)
+{
+    PyObject *list1, *list2, *result;
+
+    collections_state *state = find_module_state_by_def(Py_TYPE(v));
+    if ((op != Py_EQ && op != Py_NE) ||
+        !PyObject_TypeCheck(w, state->sortedlist_type))
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    list1 = PySequence_List(v);
+    if (list1 == NULL) {
+        return NULL;
+    }
+    list2 = PySequence_List(w);
+    if (list2 == NULL) {
+        Py_DECREF(list1);
+        return NULL;
+    }
+    result = PyObject_RichCompare(list1, list2, op);
+    Py_DECREF(list1);
+    Py_DECREF(list2);
+    return result;
+}
+
+static PyObject *
+sortedlist_iter(PyObject *sl)
+{
+    PyObject *result;
+    Py_BEGIN_CRITICAL_SECTION(sl);
+    result = sortedlist_iter_range((sortedlistobject *)sl, 0,
+                                   ((sortedlistobject *)sl)->len, 0);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+sortedlist_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    sortedlistobject *sl = (sortedlistobject *)op;
+    Py_VISIT(Py_TYPE(sl));
+    Py_VISIT(sl->key);
+    for (Py_ssize_t pos = 0; pos < sl->nchunks; pos++) {
+        sortedchunk *c = &sl->chunks[pos];
+        for (Py_ssize_t idx = 0; idx < c->size; idx++) {
+            Py_VISIT(c->values[idx]);
+            if (c->keys != NULL) {
+                Py_VISIT(c->keys[idx]);
+            }
+        }
+    }
+    return 0;
+}
+
+static int
+sortedlist_tp_clear(PyObject *op)
+{
+    sortedlistobject *sl = (sortedlistobject *)op;
+    sortedlist_clear_values(sl);
+    Py_CLEAR(sl->key);
+    return 0;
+}
+
+static void
+sortedlist_dealloc(PyObject *op)
+{
+    sortedlistobject *sl = (sortedlistobject *)op;
+    PyTypeObject *tp = Py_TYPE(sl);
+
+    PyObject_GC_UnTrack(sl);
+    if (sl->weakreflist != NULL) {
+        PyObject_ClearWeakRefs(op);
+    }
+    (void)sortedlist_tp_clear(op);
+    PyMem_Free(sl->tree);
+    tp->tp_free(sl);
+    Py_DECREF(tp);
+}
+
+static PyGetSetDef sortedlist_getset[] = {
+    {"key", (getter)sortedlist_get_key, (setter)NULL,
+     "function computing the sort key of the values, or None"},
+    {0}
+};
+
+static PyMethodDef sortedlist_methods[] = {
+    SORTEDLIST_ADD_METHODDEF
+    SORTEDLIST_BISECT_KEY_LEFT_METHODDEF
+    SORTEDLIST_BISECT_KEY_RIGHT_METHODDEF
+    SORTEDLIST_BISECT_LEFT_METHODDEF
+    SORTEDLIST_BISECT_RIGHT_METHODDEF
+    SORTEDLIST_CLEAR_METHODDEF
+    SORTEDLIST___COPY___METHODDEF
+    SORTEDLIST_COPY_METHODDEF
+    SORTEDLIST_COUNT_METHODDEF
+    SORTEDLIST_DISCARD_METHODDEF
+    SORTEDLIST_INDEX_METHODDEF
+    SORTEDLIST_IRANGE_METHODDEF
+    SORTEDLIST_IRANGE_KEY_METHODDEF
+    SORTEDLIST_POP_METHODDEF
+    SORTEDLIST___REDUCE___METHODDEF
+    SORTEDLIST_REMOVE_METHODDEF
+    SORTEDLIST___REVERSED___METHODDEF
+    SORTEDLIST___SIZEOF___METHODDEF
+    SORTEDLIST_UPDATE_METHODDEF
+    {"__class_getitem__",       Py_GenericAlias,
+        METH_O|METH_CLASS,       PyDoc_STR("See PEP 585")},
+    {NULL,              NULL}   /* sentinel */
+};
+
+static PyMemberDef sortedlist_members[] = {
+    {"__weaklistoffset__", Py_T_PYSSIZET, offsetof(sortedlistobject, weakreflist), Py_READONLY},
+    {NULL},
+};
+
+static PyType_Slot sortedlist_slots[] = {
+    {Py_tp_dealloc, sortedlist_dealloc},
+    {Py_tp_repr, sortedlist_repr},
+    {Py_tp_hash, PyObject_HashNotImplemented},
+    {Py_tp_doc, (void *)sortedlist_init__doc__},
+    {Py_tp_traverse, sortedlist_traverse},
+    {Py_tp_clear, sortedlist_tp_clear},
+    {Py_tp_richcompare, sortedlist_richcompare},
+    {Py_tp_iter, sortedlist_iter},
+    {Py_tp_getset, sortedlist_getset},
+    {Py_tp_init, sortedlist_init},
+    {Py_tp_new, PyType_GenericNew},
+    {Py_tp_methods, sortedlist_methods},
+    {Py_tp_members, sortedlist_members},
+
+    // Sequence and mapping protocols
+    {Py_sq_length, sortedlist_len},
+    {Py_sq_item, sortedlist_item},
+    {Py_sq_contains, sortedlist_contains},
+    {Py_mp_length, sortedlist_len},
+    {Py_mp_subscript, sortedlist_subscript},
+    {Py_mp_ass_subscript, sortedlist_ass_subscript},
+    {0, NULL},
+};
+
+static PyType_Spec sortedlist_spec = {
+    .name = "collections.SortedList",
+    .basicsize = sizeof(sortedlistobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+              Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_SEQUENCE |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = sortedlist_slots,
+};
+
+/*********************** SortedList Iterator **************************/
+
+typedef struct {
+    PyObject_HEAD
+    sortedlistobject *sl;
+    Py_ssize_t pos;             /* chunk of the next value */
+    Py_ssize_t idx;             /* index of the next value in the chunk */
+    Py_ssize_t remaining;       /* number of values remaining */
+    int reverse;
+    size_t state;               /* state when the iterator is created */
+} sortedlistiterobject;
+
+/* Return an iterator over the values from start to stop. */
+static PyObject *
+sortedlist_iter_range(sortedlistobject *sl, Py_ssize_t start,
+                      Py_ssize_t stop, int reverse)
+{
+    sortedlistiterobject *it;
+    Py_ssize_t pos = 0, idx = 0;
+
+    if (start < stop &&
+        sortedlist_locate(sl, reverse ? stop - 1 : start, &pos, &idx) < 0)
+    {
+        return NULL;
+    }
+    collections_state *state = find_module_state_by_def(Py_TYPE(sl));
+    it = PyObject_GC_New(sortedlistiterobject, state->sortedlistiter_type);
+    if (it == NULL) {
+        return NULL;
+    }
+    it->sl = (sortedlistobject *)Py_NewRef(sl);
+    it->pos = pos;
+    it->idx = idx;
+    it->remaining = Py_MAX(stop - start, 0);
+    it->reverse = reverse;
+    it->state = sl->state;
+    PyObject_GC_Track(it);
+    return (PyObject *)it;
+}
+
+static int
+sortedlistiter_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    sortedlistiterobject *it = (sortedlistiterobject *)op;
+    Py_VISIT(Py_TYPE(it));
+    Py_VISIT(it->sl);
+    return 0;
+}
+
+static int
+sortedlistiter_clear(PyObject *op)
+{
+    sortedlistiterobject *it = (sortedlistiterobject *)op;
+    Py_CLEAR(it->sl);
+    return 0;
+}
+
+static void
+sortedlistiter_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)sortedlistiter_clear(op);
+    PyObject_GC_Del(op);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+sortedlistiter_next_lock_held(sortedlistiterobject *it, sortedlistobject *sl)
+{
+    sortedchunk *c;
+    PyObject *item;
+
+    if (sl->state != it->state) {
+        it->remaining = 0;
+        PyErr_SetString(PyExc_RuntimeError,
+                        "SortedList mutated during iteration");
+        return NULL;
+    }
+    if (it->remaining == 0) {
+        return NULL;
+    }
+    c = &sl->chunks[it->pos];
+    item = c->values[it->idx];
+    it->remaining--;
+    if (it->remaining > 0) {
+        if (!it->reverse) {
+            if (++it->idx == c->size) {
+                it->pos++;
+                it->idx = 0;
+            }
+        }
+        else if (it->idx > 0) {
+            it->idx--;
+        }
+        else {
+            it->pos--;
+            it->idx = sl->chunks[it->pos].size - 1;
+        }
+    }
+    return Py_NewRef(item);
+}
+
+static PyObject *
+sortedlistiter_next(PyObject *op)
+{
+    sortedlistiterobject *it = (sortedlistiterobject *)op;
+    PyObject *result;
+    // It's safe to access it->sl without holding the per-object lock for it
+    // here; it->sl is only assigned during construction of it.
+    sortedlistobject *sl = it->sl;
+    if (sl == NULL) {
+        return NULL;
+    }
+    Py_BEGIN_CRITICAL_SECTION2(it, sl);
+    result = sortedlistiter_next_lock_held(it, sl);
+    Py_END_CRITICAL_SECTION2();
+    return result;
+}
+
+static PyObject *
+sortedlistiter_len(PyObject *op, PyObject *Py_UNUSED(ignored))
+{
+    sortedlistiterobject *it = (sortedlistiterobject *)op;
+    Py_ssize_t len = FT_ATOMIC_LOAD_SSIZE(it->remaining);
+    return PyLong_FromSsize_t(len);
+}
+
+static PyMethodDef sortedlistiter_methods[] = {
+    {"__length_hint__", sortedlistiter_len, METH_NOARGS, length_hint_doc},
+    {NULL,              NULL}           /* sentinel */
+};
+
+static PyType_Slot sortedlistiter_slots[] = {
+    {Py_tp_dealloc, sortedlistiter_dealloc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_traverse, sortedlistiter_traverse},
+    {Py_tp_clear, sortedlistiter_clear},
+    {Py_tp_iter, PyObject_SelfIter},
+    {Py_tp_iternext, sortedlistiter_next},
+    {Py_tp_methods, sortedlistiter_methods},
+    {0, NULL},
+};
+
+static PyType_Spec sortedlistiter_spec = {
+    .name = "collections._sortedlist_iterator",
+    .basicsize = sizeof(sortedlistiterobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = sortedlistiter_slots,
+};
+
 /* helper function for Counter  *********************************************/
 
 /*[clinic input]
@@ -2752,6 +4824,8 @@ collections_traverse(PyObject *mod, visitproc visit, void *arg)
     Py_VISIT(state->dequeiter_type);
     Py_VISIT(state->dequereviter_type);
     Py_VISIT(state->tuplegetter_type);
+    Py_VISIT(state->sortedlist_type);
+    Py_VISIT(state->sortedlistiter_type);
     return 0;
 }
 
@@ -2764,6 +4838,8 @@ collections_clear(PyObject *mod)
     Py_CLEAR(state->dequeiter_type);
     Py_CLEAR(state->dequereviter_type);
     Py_CLEAR(state->tuplegetter_type);
+    Py_CLEAR(state->sortedlist_type);
+    Py_CLEAR(state->sortedlistiter_type);
     return 0;
 }
 
@@ -2777,6 +4853,7 @@ PyDoc_STRVAR(collections_doc,
 "High performance data structures.\n\
 - deque:        ordered collection accessible from endpoints only\n\
 - defaultdict:  dict subclass with a default value factory\n\
+- SortedList:   list which keeps its values sorted\n\
 ");
 
 static struct PyMethodDef collections_methods[] = {
@@ -2803,6 +4880,8 @@ collections_exec(PyObject *module) {
     ADD_TYPE(module, &dequeiter_spec, state->dequeiter_type, NULL);
     ADD_TYPE(module, &dequereviter_spec, state->dequereviter_type, NULL);
     ADD_TYPE(module, &tuplegetter_spec, state->tuplegetter_type, NULL);
+    ADD_TYPE(module, &sortedlist_spec, state->sortedlist_type, NULL);
+    ADD_TYPE(module, &sortedlistiter_spec, state->sortedlistiter_type, NULL);
 
     if (PyModule_AddType(module, &PyODict_Type) < 0) {
         return -1;
@@ -12,14 +12,51 @@ annotated by François Pinard, and converted to C by Raymond Hettinger.
 
 #include "Python.h"
 #include "pycore_list.h"          // _PyList_ITEMS()
+#include "pycore_moduleobject.h"  // _PyModule_GetState()
+#include "pycore_pyatomic_ft_wrappers.h" // FT_ATOMIC_LOAD_SSIZE_RELAXED()
+
+#include <stddef.h>               // offsetof()
+
+typedef struct {
+    PyTypeObject *IndexedHeapType;
+    PyTypeObject *HeapHandleType;
+} heapq_state;
+
+static inline heapq_state *
+get_heapq_state(PyObject *module)
+{
+    void *state = _PyModule_GetState(module);
+    assert(state != NULL);
+    return (heapq_state *)state;
+}
+
+static struct PyModuleDef _heapqmodule;
+#define get_heapq_state_by_type(type) \
+    (get_heapq_state(PyType_GetModuleByDef(type, &_heapqmodule)))
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *priority;
+    PyObject *value;
+    Py_ssize_t index;           /* position in the heap, or -1 */
+} heaphandleobject;
+
+typedef struct {
+    PyObject_HEAD
+    heaphandleobject **items;
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+    int comparing;              /* a comparison of priorities is running */
+} indexedheapobject;
 
 #include "clinic/_heapqmodule.c.h"
 
 
 /*[clinic input]
 module _heapq
+class _heapq.IndexedHeap "indexedheapobject *" "get_heapq_state_by_type(type)->IndexedHeapType"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=d7cca0a2e4c0ceb3]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=c32ce97559215739]*/
 
 static int
 siftdown(PyListObject *heap, Py_ssize_t startpos, Py_ssize_t pos)
@@ -531,6 +568,478 @@ _heapq__heapify_max_impl(PyObject *module, PyObject *heap)
     return heapify_internal(heap, siftup_max);
 }
 
+/* IndexedHeap: a heap of handles ordered by their priority.  Each handle
+   knows its position in the heap so that it can be moved or removed in
+   O(log n) time. */
+
+static int
+indexedheap_lt(indexedheapobject *self, heaphandleobject *a,
+               heaphandleobject *b)
+{
+    PyObject *x = Py_NewRef(a->priority);
+    PyObject *y = Py_NewRef(b->priority);
+    self->comparing = 1;
+    int cmp = PyObject_RichCompareBool(x, y, Py_LT);
+    self->comparing = 0;
+    Py_DECREF(x);
+    Py_DECREF(y);
+    return cmp;
+}
+
+/* Variant of siftdown() moving the handle at pos towards the root. */
+static int
+indexedheap_siftdown(indexedheapobject *self, Py_ssize_t startpos,
+                     Py_ssize_t pos)
+{
+    heaphandleobject **arr = self->items;
+    heaphandleobject *newitem = arr[pos];
+    int cmp = 0;
+
+    while (pos > startpos) {
+        Py_ssize_t parentpos = (pos - 1) >> 1;
+        heaphandleobject *parent = arr[parentpos];
+        cmp = indexedheap_lt(self, newitem, parent);
+        if (cmp <= 0) {
+            break;
+        }
+        arr[pos] = parent;
+        parent->index = pos;
+        pos = parentpos;
+    }
+    arr[pos] = newitem;
+    newitem->index = pos;
+    return cmp < 0 ? -1 : 0;
+}
+
+/* Variant of siftup() moving the handle at pos towards the leaves. */
+static int
+indexedheap_siftup(indexedheapobject *self, Py_ssize_t pos)
+{
+    heaphandleobject **arr = self->items;
+    Py_ssize_t endpos = self->size;
+    Py_ssize_t startpos = pos;
+    Py_ssize_t limit = endpos >> 1;
+    heaphandleobject *newitem = arr[pos];
+
+    /* Bubble up the smaller child until hitting a leaf. */
+    while (pos < limit) {
+        Py_ssize_t childpos = 2*pos + 1;
+        if (childpos + 1 < endpos) {
+            int cmp = indexedheap_lt(self, arr[childpos], arr[childpos + 1]);
+            if (cmp < 0) {
+                arr[pos] = newitem;
+                newitem->index = pos;
+                return -1;
+            }
+            childpos += ((unsigned)cmp ^ 1);
+        }
+        arr[pos] = arr[childpos];
+        arr[pos]->index = pos;
+        pos = childpos;
+    }
+    arr[pos] = newitem;
+    newitem->index = pos;
+    return indexedheap_siftdown(self, startpos, pos);
+}
+
+/* Move the handle at pos up, or else down, to its place. */
+static int
+indexedheap_resift(indexedheapobject *self, Py_ssize_t pos)
+{
+    heaphandleobject *item = self->items[pos];
+    if (indexedheap_siftdown(self, 0, pos) < 0) {
+        return -1;
+    }
+    if (item->index == pos) {
+        return indexedheap_siftup(self, pos);
+    }
+    return 0;
+}
+
+/* Remove the handle at pos and return it (a new reference). */
+static heaphandleobject *
+indexedheap_remove_at(indexedheapobject *self, Py_ssize_t pos)
+{
+    heaphandleobject *handle = self->items[pos];
+    heaphandleobject *lastelt = self->items[--self->size];
+    handle->index = -1;
+    if (lastelt != handle) {
+        self->items[pos] = lastelt;
+        lastelt->index = pos;
+        if (indexedheap_resift(self, pos) < 0) {
+            Py_DECREF(handle);
+            return NULL;
+        }
+    }
+    return handle;
+}
+
+static int
+indexedheap_check_mutable(indexedheapobject *self)
+{
+    if (self->comparing) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "IndexedHeap changed during a comparison");
+        return -1;
+    }
+    return 0;
+}
+
+/* Return the position of handle in the heap, or -1 with an exception. */
+static Py_ssize_t
+indexedheap_getindex(indexedheapobject *self, PyObject *handle)
+{
+    heapq_state *state = get_heapq_state_by_type(Py_TYPE(self));
+    if (!Py_IS_TYPE(handle, state->HeapHandleType)) {
+        PyErr_Format(PyExc_TypeError, "expected a HeapHandle, got %T",
+                     handle);
+        return -1;
+    }
+    Py_ssize_t pos = ((heaphandleobject *)handle)->index;
+    if (pos < 0 || pos >= self->size ||
+        self->items[pos] != (heaphandleobject *)handle)
+    {
+        PyErr_SetString(PyExc_ValueError, "handle is not in the heap");
+        return -1;
+    }
+    return pos;
+}
+
+/*[clinic input]
+@classmethod
+_heapq.IndexedHeap.__new__ as indexedheap_new
+
+Min-heap of values ordered by priority.
+
+push() returns a handle which can be passed to update() to change the
+priority of the value, or to remove() to remove it from the heap, in
+O(log n) time.
+[clinic start generated code]*/
+
+static PyObject *
+indexedheap_new_impl(PyTypeObject *type)
+/*[clinic end generated code: output=9517808fcfa084aa input=192bde9c20fd8e02]*/
+{
+    indexedheapobject *self = (indexedheapobject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->items = NULL;
+    self->size = 0;
+    self->allocated = 0;
+    self->comparing = 0;
+    return (PyObject *)self;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.push
+
+    priority: object
+    value: object
+    /
+
+Push value with the given priority and return its handle.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_push_impl(indexedheapobject *self, PyObject *priority,
+                             PyObject *value)
+/*[clinic end generated code: output=afad069e156e8fe0 input=3069266b44a98929]*/
+{
+    if (indexedheap_check_mutable(self) < 0) {
+        return NULL;
+    }
+    if (self->size == self->allocated) {
+        Py_ssize_t allocated = self->allocated ? self->allocated * 2 : 8;
+        heaphandleobject **items = PyMem_Resize(self->items,
+                                                heaphandleobject *, allocated);
+        if (items == NULL) {
+            return PyErr_NoMemory();
+        }
+        self->items = items;
+        self->allocated = allocated;
+    }
+
+    heapq_state *state = get_heapq_state_by_type(Py_TYPE(self));
+    heaphandleobject *handle = PyObject_GC_New(heaphandleobject,
+                                               state->HeapHandleType);
+    if (handle == NULL) {
+        return NULL;
+    }
+    handle->priority = Py_NewRef(priority);
+    handle->value = Py_NewRef(value);
+    handle->index = self->size;
+    PyObject_GC_Track(handle);
+
+    self->items[self->size++] = (heaphandleobject *)Py_NewRef(handle);
+    if (indexedheap_siftdown(self, 0, handle->index) < 0) {
+        Py_DECREF(handle);
+        return NULL;
+    }
+    return (PyObject *)handle;
+}
+
+static PyObject *
+handle_pair(heaphandleobject *handle)
+{
+    return PyTuple_Pack(2, handle->priority, handle->value);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.pop
+
+Remove and return the (priority, value) pair with the lowest priority.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self)
+/*[clinic end generated code: output=31b324b9574aed67 input=0a70664dfcdc3513]*/
+{
+    if (indexedheap_check_mutable(self) < 0) {
+        return NULL;
+    }
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from an empty heap");
+        return NULL;
+    }
+    heaphandleobject *handle = indexedheap_remove_at(self, 0);
+    if (handle == NULL) {
+        return NULL;
+    }
+    PyObject *result = handle_pair(handle);
+    Py_DECREF(handle);
+    return result;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.peek
+
+Return the (priority, value) pair with the lowest priority.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self)
+/*[clinic end generated code: output=8c427b24020f8892 input=f8222aebb3159146]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "peek at an empty heap");
+        return NULL;
+    }
+    return handle_pair(self->items[0]);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.update
+
+    handle: object
+    priority: object
+    /
+
+Change the priority of the value of handle.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *priority)
+/*[clinic end generated code: output=7009c805594e4864 input=24983cef4e5f9537]*/
+{
+    if (indexedheap_check_mutable(self) < 0) {
+        return NULL;
+    }
+    Py_ssize_t pos = indexedheap_getindex(self, handle);
+    if (pos < 0) {
+        return NULL;
+    }
+    /* Keep the old priority alive until the heap is consistent again: its
+       destructor could modify the heap. */
+    PyObject *old = ((heaphandleobject *)handle)->priority;
+    ((heaphandleobject *)handle)->priority = Py_NewRef(priority);
+    int res = indexedheap_resift(self, pos);
+    Py_DECREF(old);
+    if (res < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.IndexedHeap.remove
+
+    handle: object
+    /
+
+Remove the value of handle from the heap.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_IndexedHeap_remove_impl(indexedheapobject *self, PyObject *handle)
+/*[clinic end generated code: output=0e42bbcb747368e5 input=1ca9d800f6e473f0]*/
+{
+    if (indexedheap_check_mutable(self) < 0) {
+        return NULL;
+    }
+    Py_ssize_t pos = indexedheap_getindex(self, handle);
+    if (pos < 0) {
+        return NULL;
+    }
+    heaphandleobject *removed = indexedheap_remove_at(self, pos);
+    if (removed == NULL) {
+        return NULL;
+    }
+    Py_DECREF(removed);
+    Py_RETURN_NONE;
+}
+
+static Py_ssize_t
+indexedheap_len(PyObject *op)
+{
+    indexedheapobject *self = (indexedheapobject *)op;
+    return FT_ATOMIC_LOAD_SSIZE_RELAXED(self->size);
+}
+
+static int
+indexedheap_contains(PyObject *op, PyObject *handle)
+{
+    indexedheapobject *self = (indexedheapobject *)op;
+    heapq_state *state = get_heapq_state_by_type(Py_TYPE(self));
+    if (!Py_IS_TYPE(handle, state->HeapHandleType)) {
+        return 0;
+    }
+    int result;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    Py_ssize_t pos = ((heaphandleobject *)handle)->index;
+    result = (pos >= 0 && pos < self->size &&
+              self->items[pos] == (heaphandleobject *)handle);
+    Py_END_CRITICAL_SECTION();
+    return result;
+}
+
+static int
+indexedheap_clear(PyObject *op)
+{
+    indexedheapobject *self = (indexedheapobject *)op;
+    heaphandleobject **items = self->items;
+    Py_ssize_t size = self->size;
+    self->items = NULL;
+    self->size = 0;
+    self->allocated = 0;
+    for (Py_ssize_t i = 0; i < size; i++) {
+        items[i]->index = -1;
+        Py_DECREF(items[i]);
+    }
+    PyMem_Free(items);
+    return 0;
+}
+
+static int
+indexedheap_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    indexedheapobject *self = (indexedheapobject *)op;
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_VISIT(self->items[i]);
+    }
+    Py_VISIT(Py_TYPE(self));
+    return 0;
+}
+
+static void
+indexedheap_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)indexedheap_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef indexedheap_methods[] = {
+    _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF
+    _HEAPQ_INDEXEDHEAP_POP_METHODDEF
+    _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF
+    _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF
+    _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF
+    {NULL, NULL}           /* sentinel */
+};
+
+static PyType_Slot indexedheap_slots[] = {
+    {Py_tp_dealloc, indexedheap_dealloc},
+    {Py_tp_doc, (void *)indexedheap_new__doc__},
+    {Py_tp_traverse, indexedheap_traverse},
+    {Py_tp_clear, indexedheap_clear},
+    {Py_tp_methods, indexedheap_methods},
+    {Py_tp_new, indexedheap_new},
+    {Py_sq_length, indexedheap_len},
+    {Py_sq_contains, indexedheap_contains},
+    {0, NULL},
+};
+
+static PyType_Spec indexedheap_spec = {
+    .name = "_heapq.IndexedHeap",
+    .basicsize = sizeof(indexedheapobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = indexedheap_slots,
+};
+
+static int
+heaphandle_clear(PyObject *op)
+{
+    heaphandleobject *self = (heaphandleobject *)op;
+    Py_CLEAR(self->priority);
+    Py_CLEAR(self->value);
+    return 0;
+}
+
+static int
+heaphandle_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    heaphandleobject *self = (heaphandleobject *)op;
+    Py_VISIT(self->priority);
+    Py_VISIT(self->value);
+    Py_VISIT(Py_TYPE(self));
+    return 0;
+}
+
+static void
+heaphandle_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)heaphandle_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyMemberDef heaphandle_members[] = {
+    {"priority", _Py_T_OBJECT, offsetof(heaphandleobject, priority),
+     Py_READONLY, PyDoc_STR("The priority of the value.")},
+    {"value", _Py_T_OBJECT, offsetof(heaphandleobject, value),
+     Py_READONLY, PyDoc_STR("The value pushed on the heap.")},
+    {NULL}
+};
+
+static PyType_Slot heaphandle_slots[] = {
+    {Py_tp_dealloc, heaphandle_dealloc},
+    {Py_tp_doc, (void *)PyDoc_STR("Handle of a value pushed on an IndexedHeap.")},
+    {Py_tp_traverse, heaphandle_traverse},
+    {Py_tp_clear, heaphandle_clear},
+    {Py_tp_members, heaphandle_members},
+    {0, NULL},
+};
+
+static PyType_Spec heaphandle_spec = {
+    .name = "_heapq.HeapHandle",
+    .basicsize = sizeof(heaphandleobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = heaphandle_slots,
+};
+
 static PyMethodDef heapq_methods[] = {
     _HEAPQ_HEAPPUSH_METHODDEF
     _HEAPQ_HEAPPUSHPOP_METHODDEF
@@ -672,12 +1181,54 @@ From all times, sorting has always been a Great Art! :-)\n");
 static int
 heapq_exec(PyObject *m)
 {
+    heapq_state *state = get_heapq_state(m);
+
     if (PyModule_Add(m, "__about__", PyUnicode_FromString(__about__)) < 0) {
         return -1;
     }
+    state->HeapHandleType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &heaphandle_spec, NULL);
+    if (state->HeapHandleType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->HeapHandleType) < 0) {
+        return -1;
+    }
+    state->IndexedHeapType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &indexedheap_spec, NULL);
+    if (state->IndexedHeapType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->IndexedHeapType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+heapq_traverse(PyObject *m, visitproc visit, void *arg)
+{
+    heapq_state *state = get_heapq_state(m);
+    Py_VISIT(state->IndexedHeapType);
+    Py_VISIT(state->HeapHandleType);
+    return 0;
+}
+
+static int
+heapq_clear(PyObject *m)
+{
+    heapq_state *state = get_heapq_state(m);
+    Py_CLEAR(state->IndexedHeapType);
+    Py_CLEAR(state->HeapHandleType);
     return 0;
 }
 
+static void
+heapq_free(void *m)
+{
+    (void)heapq_clear((PyObject *)m);
+}
+
 static struct PyModuleDef_Slot heapq_slots[] = {
     {Py_mod_exec, heapq_exec},
     {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
@@ -689,12 +1240,12 @@ static struct PyModuleDef _heapqmodule = {
     PyModuleDef_HEAD_INIT,
     "_heapq",
     module_doc,
-    0,
+    sizeof(heapq_state),
     heapq_methods,
     heapq_slots,
-    NULL,
-    NULL,
-    NULL
+    heapq_traverse,
+    heapq_clear,
+    heapq_free
 };
 
 PyMODINIT_FUNC
@@ -51,6 +51,19 @@ typedef struct _PyEncoderObject {
     PyCFunction fast_encode;
 } PyEncoderObject;
 
+/* Output of the encoder.  PyUnicodeWriter functions are called with a pointer
+ * to it.  When encoding for Encoder.dump(), the text accumulated in the
+ * writer is passed to the write callable each time it exceeds chunk_size
+ * characters, so that a large document is never built as a single string.
+ */
+typedef struct {
+    _PyUnicodeWriter writer;    /* must be the first member */
+    PyObject *write;            /* borrowed reference, NULL if not streaming */
+    Py_ssize_t chunk_size;
+} EncoderOutput;
+
+#define ENCODER_CHUNK_SIZE (64 * 1024)
+
 static PyMemberDef encoder_members[] = {
     {"markers", _Py_T_OBJECT, offsetof(PyEncoderObject, markers), Py_READONLY, "markers"},
     {"default", _Py_T_OBJECT, offsetof(PyEncoderObject, defaultfn), Py_READONLY, "default"},
@@ -70,7 +83,7 @@ ascii_escape_unicode(PyObject *pystr);
 static PyObject *
 py_encode_basestring_ascii(PyObject* Py_UNUSED(self), PyObject *pystr);
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr);
+scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan);
 static PyObject *
 _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx);
 static PyObject *
@@ -316,6 +329,23 @@ raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end)
     }
 }
 
+static void
+raise_errmsg_format(PyObject *s, Py_ssize_t end, const char *format, ...)
+{
+    va_list vargs;
+    va_start(vargs, format);
+    PyObject *msg = PyUnicode_FromFormatV(format, vargs);
+    va_end(vargs);
+    if (msg == NULL) {
+        return;
+    }
+    const char *utf8 = PyUnicode_AsUTF8(msg);
+    if (utf8 != NULL) {
+        raise_errmsg(utf8, s, end);
+    }
+    Py_DECREF(msg);
+}
+
 static void
 raise_stop_iteration(Py_ssize_t idx)
 {
@@ -645,13 +675,113 @@ scanner_clear(PyScannerObject *self)
     return 0;
 }
 
+/* Typed decoding.
+ *
+ * A plan describes the type a JSON term is decoded to.  It is built by
+ * json.decoder._make_plan() as a list [kind, factory, table, extra]
+ * (a list, so that plans of recursive types can refer to themselves).
+ * None stands for any JSON term.
+ *
+ * PLAN_OBJECT:   table is a dict mapping keys to the plans of their values
+ *                and extra a tuple of the required keys.  The result is
+ *                factory(**object), or the dict itself if factory is None.
+ * PLAN_DICT:     table is the plan of all values.
+ * PLAN_ARRAY:    table is the plan of all items.  The result is
+ *                factory(list), or the list itself if factory is None.
+ * PLAN_TUPLE:    table is a tuple of the plans of the items.
+ * PLAN_SCALAR:   table is a tuple of the exact types accepted and extra the
+ *                name of the expected type.  The result is factory(term),
+ *                unless factory is None or the type of term.
+ * PLAN_OPTIONAL: table is the plan of the term if it is not null.
+ */
+#define PLAN_OBJECT 0
+#define PLAN_DICT 1
+#define PLAN_ARRAY 2
+#define PLAN_TUPLE 3
+#define PLAN_SCALAR 4
+#define PLAN_OPTIONAL 5
+
+#define PLAN_KIND(plan) PyLong_AsLong(PyList_GET_ITEM(plan, 0))
+#define PLAN_FACTORY(plan) PyList_GET_ITEM(plan, 1)
+#define PLAN_TABLE(plan) PyList_GET_ITEM(plan, 2)
+#define PLAN_EXTRA(plan) PyList_GET_ITEM(plan, 3)
+
+static long
+check_plan(PyObject *plan)
+{
+    /* Return the kind of plan, or -1 with an exception set if it is
+       malformed. */
+    if (!PyList_CheckExact(plan) || PyList_GET_SIZE(plan) != 4 ||
+        !PyLong_CheckExact(PyList_GET_ITEM(plan, 0)))
+    {
+        goto error;
+    }
+    long kind = PLAN_KIND(plan);
+    PyObject *table = PLAN_TABLE(plan);
+    PyObject *extra = PLAN_EXTRA(plan);
+    switch (kind) {
+        case PLAN_OBJECT:
+            if (PyDict_Check(table) && PyTuple_Check(extra)) {
+                return kind;
+            }
+            break;
+        case PLAN_TUPLE:
+            if (PyTuple_Check(table)) {
+                return kind;
+            }
+            break;
+        case PLAN_SCALAR:
+            if (PyTuple_Check(table) && PyUnicode_Check(extra)) {
+                return kind;
+            }
+            break;
+        case PLAN_DICT:
+        case PLAN_ARRAY:
+        case PLAN_OPTIONAL:
+            return kind;
+    }
+error:
+    if (!PyErr_Occurred()) {
+        PyErr_SetString(PyExc_TypeError, "invalid decoding plan");
+    }
+    return -1;
+}
+
 static PyObject *
-_parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+_finish_typed_object(PyObject *pystr, Py_ssize_t start, PyObject *rval,
+                     PyObject *plan)
+{
+    /* Check the required keys of the object rval decoded with plan and
+       build the result.  Steals the reference to rval. */
+    PyObject *required = PLAN_EXTRA(plan);
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(required); i++) {
+        PyObject *key = PyTuple_GET_ITEM(required, i);
+        int contains = PyDict_Contains(rval, key);
+        if (contains <= 0) {
+            if (contains == 0) {
+                raise_errmsg_format(pystr, start, "Missing key %R", key);
+            }
+            Py_DECREF(rval);
+            return NULL;
+        }
+    }
+    PyObject *factory = PLAN_FACTORY(plan);
+    if (factory == Py_None) {
+        return rval;
+    }
+    PyObject *res = PyObject_VectorcallDict(factory, NULL, 0, rval);
+    Py_DECREF(rval);
+    return res;
+}
+
+static PyObject *
+_parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan)
 {
     /* Read a JSON object from PyUnicode pystr.
     idx is the index of the first character after the opening curly brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing curly brace.
+    plan is NULL, or a plan of kind PLAN_OBJECT or PLAN_DICT.
 
     Returns a new PyObject (usually a dict, but object_hook can change that)
     */
@@ -661,10 +791,23 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
-    int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    int has_pairs_hook = (plan == NULL && s->object_pairs_hook != Py_None);
+    PyObject *fields = NULL;
+    PyObject *val_plan = NULL;
+    Py_ssize_t start = idx - 1;
+    Py_ssize_t key_idx;
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
 
+    if (plan != NULL) {
+        if (PLAN_KIND(plan) == PLAN_OBJECT) {
+            fields = PLAN_TABLE(plan);
+        }
+        else {
+            val_plan = PLAN_TABLE(plan);
+        }
+    }
+
     str = PyUnicode_DATA(pystr);
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
@@ -689,6 +832,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
                 raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
                 goto bail;
             }
+            key_idx = idx;
             key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
             if (key == NULL)
                 goto bail;
@@ -707,8 +851,20 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
             idx++;
             while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
+            if (fields != NULL) {
+                /* borrowed reference, kept alive by the plan */
+                val_plan = PyDict_GetItemWithError(fields, key);
+                if (val_plan == NULL) {
+                    if (!PyErr_Occurred()) {
+                        raise_errmsg_format(pystr, key_idx,
+                                            "Unexpected key %R", key);
+                    }
+                    goto bail;
+                }
+            }
+
             /* read any JSON term */
-            val = scan_once_unicode(s, memo, pystr, idx, &next_idx);
+            val = scan_once_unicode(s, memo, pystr, idx, &next_idx, val_plan);
             if (val == NULL)
                 goto bail;
 
@@ -757,6 +913,13 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
 
     *next_idx_ptr = idx + 1;
 
+    if (plan != NULL) {
+        if (fields != NULL) {
+            return _finish_typed_object(pystr, start, rval, plan);
+        }
+        return rval;
+    }
+
     if (has_pairs_hook) {
         val = PyObject_CallOneArg(s->object_pairs_hook, rval);
         Py_DECREF(rval);
@@ -778,22 +941,35 @@ _parse_object_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ss
 }
 
 static PyObject *
-_parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr) {
+_parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan) {
     /* Read a JSON array from PyUnicode pystr.
     idx is the index of the first character after the opening brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing brace.
+    plan is NULL, or a plan of kind PLAN_ARRAY or PLAN_TUPLE.
 
-    Returns a new PyList
+    Returns a new PyList, or the result of the factory of plan
     */
     const void *str;
     int kind;
     Py_ssize_t end_idx;
     PyObject *val = NULL;
     PyObject *rval;
+    PyObject *item_plan = NULL;
+    PyObject *item_plans = NULL;
+    Py_ssize_t start = idx - 1;
     Py_ssize_t next_idx;
     Py_ssize_t comma_idx;
 
+    if (plan != NULL) {
+        if (PLAN_KIND(plan) == PLAN_TUPLE) {
+            item_plans = PLAN_TABLE(plan);
+        }
+        else {
+            item_plan = PLAN_TABLE(plan);
+        }
+    }
+
     rval = PyList_New(0);
     if (rval == NULL)
         return NULL;
@@ -809,8 +985,18 @@ _parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssi
     if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ']') {
         while (1) {
 
+            if (item_plans != NULL) {
+                Py_ssize_t i = PyList_GET_SIZE(rval);
+                if (i >= PyTuple_GET_SIZE(item_plans)) {
+                    raise_errmsg_format(pystr, start, "Expecting %zd items",
+                                        PyTuple_GET_SIZE(item_plans));
+                    goto bail;
+                }
+                item_plan = PyTuple_GET_ITEM(item_plans, i);
+            }
+
             /* read any JSON term  */
-            val = scan_once_unicode(s, memo, pystr, idx, &next_idx);
+            val = scan_once_unicode(s, memo, pystr, idx, &next_idx, item_plan);
             if (val == NULL)
                 goto bail;
 
@@ -849,6 +1035,17 @@ _parse_array_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssi
         goto bail;
     }
     *next_idx_ptr = idx + 1;
+    if (item_plans != NULL) {
+        if (PyList_GET_SIZE(rval) != PyTuple_GET_SIZE(item_plans)) {
+            raise_errmsg_format(pystr, start, "Expecting %zd items",
+                                PyTuple_GET_SIZE(item_plans));
+            goto bail;
+        }
+        Py_SETREF(rval, PyList_AsTuple(rval));
+    }
+    else if (plan != NULL && PLAN_FACTORY(plan) != Py_None) {
+        Py_SETREF(rval, PyObject_CallOneArg(PLAN_FACTORY(plan), rval));
+    }
     return rval;
 bail:
     Py_XDECREF(val);
@@ -997,12 +1194,104 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
 }
 
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+scan_once_typed(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan)
+{
+    /* Read one JSON term of the type described by plan from PyUnicode
+    pystr.  idx is a valid index of the first character of the term.
+    */
+    PyObject *res;
+    const void *str = PyUnicode_DATA(pystr);
+    int kind = PyUnicode_KIND(pystr);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(pystr);
+    Py_UCS4 c = PyUnicode_READ(kind, str, idx);
+
+    switch (check_plan(plan)) {
+        case PLAN_OBJECT:
+        case PLAN_DICT:
+            if (c != '{') {
+                raise_errmsg("Expecting object", pystr, idx);
+                return NULL;
+            }
+            if (_Py_EnterRecursiveCall(" while decoding a JSON object "
+                                       "from a unicode string"))
+                return NULL;
+            res = _parse_object_unicode(s, memo, pystr, idx + 1, next_idx_ptr,
+                                        plan);
+            _Py_LeaveRecursiveCall();
+            return res;
+        case PLAN_ARRAY:
+        case PLAN_TUPLE:
+            if (c != '[') {
+                raise_errmsg("Expecting array", pystr, idx);
+                return NULL;
+            }
+            if (_Py_EnterRecursiveCall(" while decoding a JSON array "
+                                       "from a unicode string"))
+                return NULL;
+            res = _parse_array_unicode(s, memo, pystr, idx + 1, next_idx_ptr,
+                                       plan);
+            _Py_LeaveRecursiveCall();
+            return res;
+        case PLAN_OPTIONAL:
+            if (c == 'n' && (idx + 3 < length) &&
+                PyUnicode_READ(kind, str, idx + 1) == 'u' &&
+                PyUnicode_READ(kind, str, idx + 2) == 'l' &&
+                PyUnicode_READ(kind, str, idx + 3) == 'l')
+            {
+                *next_idx_ptr = idx + 4;
+                Py_RETURN_NONE;
+            }
+            return scan_once_unicode(s, memo, pystr, idx, next_idx_ptr,
+                                     PLAN_TABLE(plan));
+        case PLAN_SCALAR: {
+            res = scan_once_unicode(s, memo, pystr, idx, next_idx_ptr, NULL);
+            if (res == NULL) {
+                return NULL;
+            }
+            PyObject *types = PLAN_TABLE(plan);
+            Py_ssize_t i;
+            for (i = 0; i < PyTuple_GET_SIZE(types); i++) {
+                if ((PyObject *)Py_TYPE(res) == PyTuple_GET_ITEM(types, i)) {
+                    break;
+                }
+            }
+            if (i == PyTuple_GET_SIZE(types)) {
+                raise_errmsg_format(pystr, idx, "Expecting %U",
+                                    PLAN_EXTRA(plan));
+                Py_DECREF(res);
+                return NULL;
+            }
+            PyObject *factory = PLAN_FACTORY(plan);
+            if (factory != Py_None && (PyObject *)Py_TYPE(res) != factory) {
+                Py_SETREF(res, PyObject_CallOneArg(factory, res));
+                if (res == NULL &&
+                    (PyErr_ExceptionMatches(PyExc_ValueError) ||
+                     PyErr_ExceptionMatches(PyExc_OverflowError)))
+                {
+                    /* Not a member of the enum, or too large for a float */
+                    PyObject *exc = PyErr_GetRaisedException();
+                    PyObject *msg = PyObject_Str(exc);
+                    if (msg != NULL) {
+                        raise_errmsg_format(pystr, idx, "%U", msg);
+                        Py_DECREF(msg);
+                    }
+                    _PyErr_ChainExceptions1(exc);
+                }
+            }
+            return res;
+        }
+    }
+    return NULL;
+}
+
+static PyObject *
+scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr, PyObject *plan)
 {
     /* Read one JSON term (of any kind) from PyUnicode pystr.
     idx is the index of the first character of the term
     *next_idx_ptr is a return-by-reference index to the first character after
         the number.
+    plan is NULL or None to read any JSON term, or the plan of its type.
 
     Returns a new PyObject representation of the term.
     */
@@ -1023,6 +1312,9 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
         raise_stop_iteration(idx);
         return NULL;
     }
+    if (plan != NULL && plan != Py_None) {
+        return scan_once_typed(s, memo, pystr, idx, next_idx_ptr, plan);
+    }
 
     switch (PyUnicode_READ(kind, str, idx)) {
         case '"':
@@ -1033,7 +1325,8 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
             if (_Py_EnterRecursiveCall(" while decoding a JSON object "
                                        "from a unicode string"))
                 return NULL;
-            res = _parse_object_unicode(s, memo, pystr, idx + 1, next_idx_ptr);
+            res = _parse_object_unicode(s, memo, pystr, idx + 1, next_idx_ptr,
+                                        NULL);
             _Py_LeaveRecursiveCall();
             return res;
         case '[':
@@ -1041,7 +1334,8 @@ scan_once_unicode(PyScannerObject *s, PyObject *memo, PyObject *pystr, Py_ssize_
             if (_Py_EnterRecursiveCall(" while decoding a JSON array "
                                        "from a unicode string"))
                 return NULL;
-            res = _parse_array_unicode(s, memo, pystr, idx + 1, next_idx_ptr);
+            res = _parse_array_unicode(s, memo, pystr, idx + 1, next_idx_ptr,
+                                       NULL);
             _Py_LeaveRecursiveCall();
             return res;
         case 'n':
@@ -1113,8 +1407,10 @@ scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
     PyObject *rval;
     Py_ssize_t idx;
     Py_ssize_t next_idx = -1;
-    static char *kwlist[] = {"string", "idx", NULL};
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:scan_once", kwlist, &pystr, &idx))
+    PyObject *plan = NULL;
+    static char *kwlist[] = {"string", "idx", "plan", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:scan_once", kwlist,
+                                     &pystr, &idx, &plan))
         return NULL;
 
     if (!PyUnicode_Check(pystr)) {
@@ -1128,7 +1424,7 @@ scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
     if (memo == NULL) {
         return NULL;
     }
-    rval = scan_once_unicode(self, memo, pystr, idx, &next_idx);
+    rval = scan_once_unicode(self, memo, pystr, idx, &next_idx, plan);
     Py_DECREF(memo);
     if (rval == NULL)
         return NULL;
@@ -1338,6 +1634,66 @@ write_newline_indent(PyUnicodeWriter *writer,
 }
 
 
+static void
+encoder_output_init(EncoderOutput *out, PyObject *write, Py_ssize_t chunk_size)
+{
+    _PyUnicodeWriter_Init(&out->writer);
+    out->writer.overallocate = 1;
+    out->write = write;
+    out->chunk_size = chunk_size;
+}
+
+/* Pass the text accumulated in the output to the write callable. */
+static int
+encoder_output_flush(EncoderOutput *out)
+{
+    assert(out->write != NULL);
+    if (out->writer.pos == 0) {
+        return 0;
+    }
+    PyObject *chunk = _PyUnicodeWriter_Finish(&out->writer);
+    encoder_output_init(out, out->write, out->chunk_size);
+    if (chunk == NULL) {
+        return -1;
+    }
+    PyObject *res = PyObject_CallOneArg(out->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+/* Flush the output if it is streamed and holds at least chunk_size
+ * characters.  Called between the items of arrays and objects. */
+static int
+encoder_maybe_flush(PyUnicodeWriter *writer)
+{
+    EncoderOutput *out = (EncoderOutput *)writer;
+    if (out->write == NULL || out->writer.pos < out->chunk_size) {
+        return 0;
+    }
+    return encoder_output_flush(out);
+}
+
+static int
+encoder_encode(PyEncoderObject *self, EncoderOutput *out, PyObject *obj,
+               Py_ssize_t indent_level)
+{
+    PyObject *indent_cache = NULL;
+    if (self->indent != Py_None) {
+        indent_cache = create_indent_cache(self, indent_level);
+        if (indent_cache == NULL) {
+            return -1;
+        }
+    }
+    int rv = encoder_listencode_obj(self, (PyUnicodeWriter *)out, obj,
+                                    indent_level, indent_cache);
+    Py_XDECREF(indent_cache);
+    return rv;
+}
+
 static PyObject *
 encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
 {
@@ -1345,32 +1701,19 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     static char *kwlist[] = {"obj", "_current_indent_level", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
+    EncoderOutput out;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
                                      &obj, &indent_level))
         return NULL;
 
-    PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
-    if (writer == NULL) {
+    encoder_output_init(&out, NULL, 0);
+    if (encoder_encode(self, &out, obj, indent_level)) {
+        _PyUnicodeWriter_Dealloc(&out.writer);
         return NULL;
     }
 
-    PyObject *indent_cache = NULL;
-    if (self->indent != Py_None) {
-        indent_cache = create_indent_cache(self, indent_level);
-        if (indent_cache == NULL) {
-            PyUnicodeWriter_Discard(writer);
-            return NULL;
-        }
-    }
-    if (encoder_listencode_obj(self, writer, obj, indent_level, indent_cache)) {
-        PyUnicodeWriter_Discard(writer);
-        Py_XDECREF(indent_cache);
-        return NULL;
-    }
-    Py_XDECREF(indent_cache);
-
-    PyObject *str = PyUnicodeWriter_Finish(writer);
+    PyObject *str = _PyUnicodeWriter_Finish(&out.writer);
     if (str == NULL) {
         return NULL;
     }
@@ -1379,6 +1722,38 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     return result;
 }
 
+static PyObject *
+encoder_dump(PyEncoderObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"obj", "write", "chunk_size", NULL};
+    PyObject *obj, *write;
+    Py_ssize_t chunk_size = ENCODER_CHUNK_SIZE;
+    EncoderOutput out;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|n:dump", kwlist,
+                                     &obj, &write, &chunk_size))
+        return NULL;
+    if (chunk_size <= 0) {
+        PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
+        return NULL;
+    }
+
+    encoder_output_init(&out, write, chunk_size);
+    if (encoder_encode(self, &out, obj, 0) || encoder_output_flush(&out)) {
+        _PyUnicodeWriter_Dealloc(&out.writer);
+        return NULL;
+    }
+    _PyUnicodeWriter_Dealloc(&out.writer);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(encoder_dump_doc,
+"dump($self, obj, write, chunk_size=65536)\n"
+"--\n"
+"\n"
+"Encode obj and pass the JSON text to write() in chunks of about\n"
+"chunk_size characters.");
+
 static PyObject *
 _encoded_const(PyObject *obj)
 {
@@ -1621,7 +1996,7 @@ encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *firs
         _PyErr_FormatNote("when serializing %T item %R", dct, key);
         return -1;
     }
-    return 0;
+    return encoder_maybe_flush(writer);
 }
 
 static int
@@ -1694,12 +2069,24 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
         Py_CLEAR(items);
 
     } else {
-        Py_ssize_t pos = 0;
+        /* write() is called when the output is streamed: it can modify
+           the dict, like a default() function. */
+        Py_ssize_t pos = 0, size = PyDict_GET_SIZE(dct);
         while (PyDict_Next(dct, &pos, &key, &value)) {
-            if (encoder_encode_key_value(s, writer, &first, dct, key, value,
-                                         indent_level, indent_cache,
-                                         separator) < 0)
+            Py_INCREF(key);
+            Py_INCREF(value);
+            int rv = encoder_encode_key_value(s, writer, &first, dct, key,
+                                              value, indent_level,
+                                              indent_cache, separator);
+            Py_DECREF(key);
+            Py_DECREF(value);
+            if (rv < 0)
                 goto bail;
+            if (PyDict_GET_SIZE(dct) != size) {
+                PyErr_SetString(PyExc_RuntimeError,
+                                "dictionary changed size during iteration");
+                goto bail;
+            }
         }
     }
 
@@ -1780,10 +2167,17 @@ encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
             if (PyUnicodeWriter_WriteStr(writer, separator) < 0)
                 goto bail;
         }
-        if (encoder_listencode_obj(s, writer, obj, indent_level, indent_cache)) {
+        Py_INCREF(obj);
+        int rv = encoder_listencode_obj(s, writer, obj, indent_level,
+                                        indent_cache);
+        Py_DECREF(obj);
+        if (rv) {
             _PyErr_FormatNote("when serializing %T item %zd", seq, i);
             goto bail;
         }
+        if (encoder_maybe_flush(writer) < 0) {
+            goto bail;
+        }
     }
     if (ident != NULL) {
         if (PyDict_DelItem(s->markers, ident))
@@ -1847,6 +2241,12 @@ encoder_clear(PyEncoderObject *self)
     return 0;
 }
 
+static PyMethodDef encoder_methods[] = {
+    {"dump", _PyCFunction_CAST(encoder_dump), METH_VARARGS | METH_KEYWORDS,
+     encoder_dump_doc},
+    {NULL, NULL}
+};
+
 PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan)");
 
 static PyType_Slot PyEncoderType_slots[] = {
@@ -1856,6 +2256,7 @@ static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_traverse, encoder_traverse},
     {Py_tp_clear, encoder_clear},
     {Py_tp_members, encoder_members},
+    {Py_tp_methods, encoder_methods},
     {Py_tp_new, encoder_new},
     {0, 0}
 };
@@ -0,0 +1,1001 @@
+#ifndef _GNU_SOURCE
+#  define _GNU_SOURCE
+#endif
+
+#ifdef __linux__
+#    include <elf.h>
+#    include <sys/uio.h>
+#    if INTPTR_MAX == INT64_MAX
+#        define Elf_Ehdr Elf64_Ehdr
+#        define Elf_Shdr Elf64_Shdr
+#        define Elf_Phdr Elf64_Phdr
+#    else
+#        define Elf_Ehdr Elf32_Ehdr
+#        define Elf_Shdr Elf32_Shdr
+#        define Elf_Phdr Elf32_Phdr
+#    endif
+#    include <sys/mman.h>
+#endif
+
+#if defined(__APPLE__)
+#  include <TargetConditionals.h>
+// Older macOS SDKs do not define TARGET_OS_OSX
+#  if !defined(TARGET_OS_OSX)
+#     define TARGET_OS_OSX 1
+#  endif
+#  if TARGET_OS_OSX
+#    include <libproc.h>
+#    include <mach-o/fat.h>
+#    include <mach-o/loader.h>
+#    include <mach-o/nlist.h>
+#    include <mach/mach.h>
+#    include <mach/mach_vm.h>
+#    include <mach/machine.h>
+#    include <sys/mman.h>
+#    include <sys/proc.h>
+#    include <sys/sysctl.h>
+#  endif
+#endif
+
+#include <errno.h>
+#include <fcntl.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/param.h>
+#include <sys/stat.h>
+#include <sys/types.h>
+#include <unistd.h>
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#    define Py_BUILD_CORE_MODULE 1
+#endif
+#include "Python.h"
+#include <internal/pycore_debug_offsets.h>  // _Py_DebugOffsets
+#include <internal/pycore_frame.h>          // FRAME_OWNED_BY_CSTACK
+#include <internal/pycore_stackref.h>       // Py_TAG_BITS
+
+#ifndef HAVE_PROCESS_VM_READV
+#    define HAVE_PROCESS_VM_READV 0
+#endif
+
+#if defined(__APPLE__) && TARGET_OS_OSX
+static void*
+analyze_macho64(mach_port_t proc_ref, void* base, void* map)
+{
+    struct mach_header_64* hdr = (struct mach_header_64*)map;
+    int ncmds = hdr->ncmds;
+
+    int cmd_cnt = 0;
+    struct segment_command_64* cmd = map + sizeof(struct mach_header_64);
+
+    mach_vm_size_t size = 0;
+    mach_msg_type_number_t count = sizeof(vm_region_basic_info_data_64_t);
+    mach_vm_address_t address = (mach_vm_address_t)base;
+    vm_region_basic_info_data_64_t region_info;
+    mach_port_t object_name;
+
+    for (int i = 0; cmd_cnt < 2 && i < ncmds; i++) {
+        if (cmd->cmd == LC_SEGMENT_64 && strcmp(cmd->segname, "__DATA") == 0) {
+            while (cmd->filesize != size) {
+                address += size;
+                if (mach_vm_region(
+                            proc_ref,
+                            &address,
+                            &size,
+                            VM_REGION_BASIC_INFO_64,
+                            (vm_region_info_t)&region_info,  // cppcheck-suppress [uninitvar]
+                            &count,
+                            &object_name)
+                    != KERN_SUCCESS)
+                {
+                    PyErr_SetString(PyExc_RuntimeError, "Cannot get any more VM maps.\n");
+                    return NULL;
+                }
+            }
+            base = (void*)address - cmd->vmaddr;
+
+            int nsects = cmd->nsects;
+            struct section_64* sec =
+                    (struct section_64*)((void*)cmd + sizeof(struct segment_command_64));
+            for (int j = 0; j < nsects; j++) {
+                if (strcmp(sec[j].sectname, "PyRuntime") == 0) {
+                    return base + sec[j].addr;
+                }
+            }
+            cmd_cnt++;
+        }
+
+        cmd = (struct segment_command_64*)((void*)cmd + cmd->cmdsize);
+    }
+    return NULL;
+}
+
+static void*
+analyze_macho(char* path, void* base, mach_vm_size_t size, mach_port_t proc_ref)
+{
+    int fd = open(path, O_RDONLY);
+    if (fd == -1) {
+        PyErr_Format(PyExc_RuntimeError, "Cannot open binary %s\n", path);
+        return NULL;
+    }
+
+    struct stat fs;
+    if (fstat(fd, &fs) == -1) {
+        PyErr_Format(PyExc_RuntimeError, "Cannot get size of binary %s\n", path);
+        close(fd);
+        return NULL;
+    }
+
+    void* map = mmap(0, fs.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    if (map == MAP_FAILED) {
+        PyErr_Format(PyExc_RuntimeError, "Cannot map binary %s\n", path);
+        close(fd);
+        return NULL;
+    }
+
+    void* result = NULL;
+
+    struct mach_header_64* hdr = (struct mach_header_64*)map;
+    switch (hdr->magic) {
+        case MH_MAGIC:
+        case MH_CIGAM:
+        case FAT_MAGIC:
+        case FAT_CIGAM:
+            PyErr_SetString(PyExc_RuntimeError, "32-bit Mach-O binaries are not supported");
+            break;
+        case MH_MAGIC_64:
+        case MH_CIGAM_64:
+            result = analyze_macho64(proc_ref, base, map);
+            break;
+        default:
+            PyErr_SetString(PyExc_RuntimeError, "Unknown Mach-O magic");
+            break;
+    }
+
+    munmap(map, fs.st_size);
+    if (close(fd) != 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+    }
+    return result;
+}
+
+static mach_port_t
+pid_to_task(pid_t pid)
+{
+    mach_port_t task;
+    kern_return_t result;
+
+    result = task_for_pid(mach_task_self(), pid, &task);
+    if (result != KERN_SUCCESS) {
+        PyErr_Format(PyExc_PermissionError, "Cannot get task for PID %d", pid);
+        return 0;
+    }
+    return task;
+}
+
+static void*
+get_py_runtime_macos(pid_t pid)
+{
+    mach_vm_address_t address = 0;
+    mach_vm_size_t size = 0;
+    mach_msg_type_number_t count = sizeof(vm_region_basic_info_data_64_t);
+    vm_region_basic_info_data_64_t region_info;
+    mach_port_t object_name;
+
+    mach_port_t proc_ref = pid_to_task(pid);
+    if (proc_ref == 0) {
+        PyErr_SetString(PyExc_PermissionError, "Cannot get task for PID");
+        return NULL;
+    }
+
+    int match_found = 0;
+    char map_filename[MAXPATHLEN + 1];
+    void* result_address = NULL;
+    while (mach_vm_region(
+                   proc_ref,
+                   &address,
+                   &size,
+                   VM_REGION_BASIC_INFO_64,
+                   (vm_region_info_t)&region_info,
+                   &count,
+                   &object_name)
+           == KERN_SUCCESS)
+    {
+        int path_len = proc_regionfilename(pid, address, map_filename, MAXPATHLEN);
+        if (path_len == 0) {
+            address += size;
+            continue;
+        }
+
+        char* filename = strrchr(map_filename, '/');
+        if (filename != NULL) {
+            filename++;  // Move past the '/'
+        } else {
+            filename = map_filename;  // No path, use the whole string
+        }
+
+        // Check if the filename starts with "python" or "libpython"
+        if (!match_found && strncmp(filename, "python", 6) == 0) {
+            match_found = 1;
+            result_address = analyze_macho(map_filename, (void*)address, size, proc_ref);
+        }
+        if (strncmp(filename, "libpython", 9) == 0) {
+            match_found = 1;
+            result_address = analyze_macho(map_filename, (void*)address, size, proc_ref);
+            break;
+        }
+
+        address += size;
+    }
+    return result_address;
+}
+#endif
+
+#ifdef __linux__
+static void*
+find_python_map_start_address(pid_t pid, char* result_filename)
+{
+    char maps_file_path[64];
+    sprintf(maps_file_path, "/proc/%d/maps", pid);
+
+    FILE* maps_file = fopen(maps_file_path, "r");
+    if (maps_file == NULL) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+
+    int match_found = 0;
+
+    char line[256];
+    char map_filename[PATH_MAX];
+    void* result_address = 0;
+    while (fgets(line, sizeof(line), maps_file) != NULL) {
+        unsigned long start_address = 0;
+        sscanf(line, "%lx-%*x %*s %*s %*s %*s %s", &start_address, map_filename);
+        char* filename = strrchr(map_filename, '/');
+        if (filename != NULL) {
+            filename++;  // Move past the '/'
+        } else {
+            filename = map_filename;  // No path, use the whole string
+        }
+
+        // Check if the filename starts with "python" or "libpython"
+        if (!match_found && strncmp(filename, "python", 6) == 0) {
+            match_found = 1;
+            result_address = (void*)start_address;
+            strcpy(result_filename, map_filename);
+        }
+        if (strncmp(filename, "libpython", 9) == 0) {
+            match_found = 1;
+            result_address = (void*)start_address;
+            strcpy(result_filename, map_filename);
+            break;
+        }
+    }
+
+    fclose(maps_file);
+
+    if (!match_found) {
+        map_filename[0] = '\0';
+    }
+
+    return result_address;
+}
+
+static void*
+get_py_runtime_linux(pid_t pid)
+{
+    char elf_file[256];
+    void* start_address = (void*)find_python_map_start_address(pid, elf_file);
+
+    if (start_address == 0) {
+        PyErr_SetString(PyExc_RuntimeError, "No memory map associated with python or libpython found");
+        return NULL;
+    }
+
+    void* result = NULL;
+    void* file_memory = NULL;
+
+    int fd = open(elf_file, O_RDONLY);
+    if (fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto exit;
+    }
+
+    struct stat file_stats;
+    if (fstat(fd, &file_stats) != 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto exit;
+    }
+
+    file_memory = mmap(NULL, file_stats.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    if (file_memory == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto exit;
+    }
+
+    Elf_Ehdr* elf_header = (Elf_Ehdr*)file_memory;
+
+    Elf_Shdr* section_header_table = (Elf_Shdr*)(file_memory + elf_header->e_shoff);
+
+    Elf_Shdr* shstrtab_section = &section_header_table[elf_header->e_shstrndx];
+    char* shstrtab = (char*)(file_memory + shstrtab_section->sh_offset);
+
+    Elf_Shdr* py_runtime_section = NULL;
+    for (int i = 0; i < elf_header->e_shnum; i++) {
+        if (strcmp(".PyRuntime", shstrtab + section_header_table[i].sh_name) == 0) {
+            py_runtime_section = &section_header_table[i];
+            break;
+        }
+    }
+
+    Elf_Phdr* program_header_table = (Elf_Phdr*)(file_memory + elf_header->e_phoff);
+    // Find the first PT_LOAD segment
+    Elf_Phdr* first_load_segment = NULL;
+    for (int i = 0; i < elf_header->e_phnum; i++) {
+        if (program_header_table[i].p_type == PT_LOAD) {
+            first_load_segment = &program_header_table[i];
+            break;
+        }
+    }
+
+    if (py_runtime_section != NULL && first_load_segment != NULL) {
+        uintptr_t elf_load_addr = first_load_segment->p_vaddr
+                                  - (first_load_segment->p_vaddr % first_load_segment->p_align);
+        result = start_address + py_runtime_section->sh_addr - elf_load_addr;
+    }
+
+exit:
+    if (close(fd) != 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+    }
+    if (file_memory != NULL) {
+        munmap(file_memory, file_stats.st_size);
+    }
+    return result;
+}
+#endif
+
+static ssize_t
+read_memory(pid_t pid, void* remote_address, size_t len, void* dst)
+{
+    ssize_t total_bytes_read = 0;
+#if defined(__linux__) && HAVE_PROCESS_VM_READV
+    struct iovec local[1];
+    struct iovec remote[1];
+    ssize_t result = 0;
+    ssize_t read = 0;
+
+    do {
+        local[0].iov_base = dst + result;
+        local[0].iov_len = len - result;
+        remote[0].iov_base = (void*)(remote_address + result);
+        remote[0].iov_len = len - result;
+
+        read = process_vm_readv(pid, local, 1, remote, 1, 0);
+        if (read < 0) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+
+        result += read;
+    } while ((size_t)read != local[0].iov_len);
+    total_bytes_read = result;
+#elif defined(__APPLE__) && TARGET_OS_OSX
+    ssize_t result = -1;
+    kern_return_t kr = mach_vm_read_overwrite(
+            pid_to_task(pid),
+            (mach_vm_address_t)remote_address,
+            len,
+            (mach_vm_address_t)dst,
+            (mach_vm_size_t*)&result);
+
+    if (kr != KERN_SUCCESS) {
+        switch (kr) {
+            case KERN_PROTECTION_FAILURE:
+                PyErr_SetString(PyExc_PermissionError, "Not enough permissions to read memory");
+                break;
+            case KERN_INVALID_ARGUMENT:
+                PyErr_SetString(PyExc_PermissionError, "Invalid argument to mach_vm_read_overwrite");
+                break;
+            default:
+                PyErr_SetString(PyExc_RuntimeError, "Unknown error reading memory");
+        }
+        return -1;
+    }
+    total_bytes_read = len;
+#else
+    return -1;
+#endif
+    return total_bytes_read;
+}
+
+static void*
+get_py_runtime(pid_t pid)
+{
+#if defined(__linux__)
+    return get_py_runtime_linux(pid);
+#elif defined(__APPLE__) && TARGET_OS_OSX
+    return get_py_runtime_macos(pid);
+#else
+    return NULL;
+#endif
+}
+
+/* Upper bounds protecting against reading garbage from a process which
+   mutates its structures while they are being read. */
+#define MAX_STRUCT_SIZE 4096
+#define MAX_STRING_LENGTH (64 * 1024)
+#define MAX_STACK_DEPTH 10000
+#define MAX_THREADS 100000
+#define MAX_CODE_CACHE_SIZE 100000
+
+typedef struct {
+    PyTypeObject *RemoteUnwinder_Type;
+} RemoteDebuggingState;
+
+static inline RemoteDebuggingState *
+get_module_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (RemoteDebuggingState *)state;
+}
+
+typedef struct {
+    PyObject_HEAD
+    pid_t pid;
+    void *runtime_start_address;
+    struct _Py_DebugOffsets debug_offsets;
+    int all_threads;
+    /* Map of code object addresses to tuples (filename address, name
+       address, first line number, frame information) */
+    PyObject *code_cache;
+} RemoteUnwinderObject;
+
+#define RemoteUnwinderObject_CAST(op) ((RemoteUnwinderObject *)(op))
+
+/*[clinic input]
+module _remote_debugging
+class _remote_debugging.RemoteUnwinder "RemoteUnwinderObject *" "clinic_state()->RemoteUnwinder_Type"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=48e9073a78452857]*/
+
+static int
+read_pointer(pid_t pid, uintptr_t address, uintptr_t *result)
+{
+    if (read_memory(pid, (void *)address, sizeof(void *), result) < 0) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "Reading memory is not supported on this platform");
+        }
+        return -1;
+    }
+    return 0;
+}
+
+static int
+read_struct(pid_t pid, uintptr_t address, uint64_t size, char *buffer)
+{
+    assert(size <= MAX_STRUCT_SIZE);
+    if (read_memory(pid, (void *)address, (size_t)size, buffer) < 0) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "Reading memory is not supported on this platform");
+        }
+        return -1;
+    }
+    return 0;
+}
+
+#define GET_FIELD(buffer, offset, type) (*(type *)((buffer) + (offset)))
+
+static PyObject *
+read_string(pid_t pid, struct _Py_DebugOffsets *offsets, uintptr_t address)
+{
+    /* The target runs the same Python version, so the layout of compact
+       strings is known. */
+    char header[sizeof(PyCompactUnicodeObject)];
+    if (read_struct(pid, address, sizeof(header), header) < 0) {
+        return NULL;
+    }
+    PyASCIIObject *ascii = (PyASCIIObject *)header;
+    Py_ssize_t length = GET_FIELD(header, offsets->unicode_object.length,
+                                  Py_ssize_t);
+    int kind = ascii->state.kind;
+    if (!ascii->state.compact || length < 0 || length > MAX_STRING_LENGTH
+        || (kind != PyUnicode_1BYTE_KIND && kind != PyUnicode_2BYTE_KIND
+            && kind != PyUnicode_4BYTE_KIND))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Invalid string in remote process");
+        return NULL;
+    }
+    size_t data_offset = ascii->state.ascii ? sizeof(PyASCIIObject)
+                                            : sizeof(PyCompactUnicodeObject);
+    size_t size = (size_t)length * kind;
+    char *data = PyMem_Malloc(size + 1);
+    if (data == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    PyObject *result = NULL;
+    if (size == 0 ||
+        read_memory(pid, (void *)(address + data_offset), size, data) >= 0)
+    {
+        result = PyUnicode_FromKindAndData(kind, data, length);
+    }
+    PyMem_Free(data);
+    return result;
+}
+
+/* Return a new reference to the (filename, firstlineno, name) tuple
+   describing the code object at the given address. */
+static PyObject *
+parse_code_object(RemoteUnwinderObject *self, uintptr_t address)
+{
+    struct _Py_DebugOffsets *offsets = &self->debug_offsets;
+    char code[MAX_STRUCT_SIZE];
+    if (read_struct(self->pid, address, offsets->code_object.size, code) < 0) {
+        return NULL;
+    }
+    uintptr_t filename = GET_FIELD(code, offsets->code_object.filename,
+                                   uintptr_t);
+    uintptr_t name = GET_FIELD(code, offsets->code_object.name, uintptr_t);
+    int firstlineno = GET_FIELD(code, offsets->code_object.firstlineno, int);
+
+    /* A cached entry is only valid if the code object at that address
+       still has the same name, filename and first line. */
+    PyObject *key = PyLong_FromVoidPtr((void *)address);
+    if (key == NULL) {
+        return NULL;
+    }
+    PyObject *entry;
+    if (PyDict_GetItemRef(self->code_cache, key, &entry) < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (entry != NULL) {
+        if (PyLong_AsVoidPtr(PyTuple_GET_ITEM(entry, 0)) == (void *)filename
+            && PyLong_AsVoidPtr(PyTuple_GET_ITEM(entry, 1)) == (void *)name
+            && PyLong_AsLong(PyTuple_GET_ITEM(entry, 2)) == firstlineno)
+        {
+            PyObject *info = Py_NewRef(PyTuple_GET_ITEM(entry, 3));
+            Py_DECREF(entry);
+            Py_DECREF(key);
+            return info;
+        }
+        Py_DECREF(entry);
+    }
+
+    PyObject *info = NULL;
+    entry = NULL;
+    PyObject *py_filename = read_string(self->pid, offsets, filename);
+    if (py_filename == NULL) {
+        goto done;
+    }
+    PyObject *py_name = read_string(self->pid, offsets, name);
+    if (py_name == NULL) {
+        Py_DECREF(py_filename);
+        goto done;
+    }
+    info = Py_BuildValue("(NiN)", py_filename, firstlineno, py_name);
+    if (info == NULL) {
+        goto done;
+    }
+    entry = Py_BuildValue("(NNiO)", PyLong_FromVoidPtr((void *)filename),
+                          PyLong_FromVoidPtr((void *)name), firstlineno, info);
+    if (entry == NULL) {
+        Py_CLEAR(info);
+        goto done;
+    }
+    if (PyDict_GET_SIZE(self->code_cache) >= MAX_CODE_CACHE_SIZE) {
+        PyDict_Clear(self->code_cache);
+    }
+    if (PyDict_SetItem(self->code_cache, key, entry) < 0) {
+        Py_CLEAR(info);
+    }
+done:
+    Py_XDECREF(entry);
+    Py_DECREF(key);
+    return info;
+}
+
+/* Return a new list of the frames of the thread state at the given address,
+   innermost first, and store the address of the next thread state. */
+static PyObject *
+unwind_thread(RemoteUnwinderObject *self, uintptr_t tstate_address,
+              unsigned long *thread_id, uintptr_t *next)
+{
+    struct _Py_DebugOffsets *offsets = &self->debug_offsets;
+    char tstate[MAX_STRUCT_SIZE];
+    if (read_struct(self->pid, tstate_address, offsets->thread_state.size,
+                    tstate) < 0)
+    {
+        return NULL;
+    }
+    *thread_id = GET_FIELD(tstate, offsets->thread_state.thread_id,
+                           unsigned long);
+    *next = GET_FIELD(tstate, offsets->thread_state.next, uintptr_t);
+    uintptr_t address = GET_FIELD(tstate, offsets->thread_state.current_frame,
+                                  uintptr_t);
+
+    PyObject *result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    char frame[MAX_STRUCT_SIZE];
+    for (int depth = 0; address != 0; depth++) {
+        if (depth >= MAX_STACK_DEPTH) {
+            PyErr_SetString(PyExc_RuntimeError, "Remote stack is too deep");
+            goto error;
+        }
+        if (read_struct(self->pid, address,
+                        offsets->interpreter_frame.localsplus, frame) < 0)
+        {
+            goto error;
+        }
+        address = GET_FIELD(frame, offsets->interpreter_frame.previous,
+                            uintptr_t);
+        if (GET_FIELD(frame, offsets->interpreter_frame.owner, char)
+            == FRAME_OWNED_BY_CSTACK)
+        {
+            continue;
+        }
+        uintptr_t code = GET_FIELD(frame,
+                                   offsets->interpreter_frame.executable,
+                                   uintptr_t);
+        code &= ~Py_TAG_BITS;
+        if (code == 0) {
+            continue;
+        }
+        PyObject *info = parse_code_object(self, code);
+        if (info == NULL) {
+            goto error;
+        }
+        if (PyList_Append(result, info) < 0) {
+            Py_DECREF(info);
+            goto error;
+        }
+        Py_DECREF(info);
+    }
+    return result;
+
+error:
+    Py_DECREF(result);
+    return NULL;
+}
+
+static int
+unwinder_init(RemoteUnwinderObject *self, int pid, int all_threads)
+{
+#if (!defined(__linux__) && !defined(__APPLE__)) || (defined(__linux__) && !HAVE_PROCESS_VM_READV)
+    PyErr_SetString(PyExc_RuntimeError,
+                    "Remote stack unwinding is not supported on this platform");
+    return -1;
+#endif
+    self->pid = pid;
+    self->all_threads = all_threads;
+    self->runtime_start_address = get_py_runtime(pid);
+    if (self->runtime_start_address == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_RuntimeError, "Failed to get .PyRuntime address");
+        }
+        return -1;
+    }
+    struct _Py_DebugOffsets *offsets = &self->debug_offsets;
+    if (read_memory(pid, self->runtime_start_address, sizeof(*offsets),
+                    offsets) < 0)
+    {
+        return -1;
+    }
+    /* The layouts of frames, code objects and strings are assumed to match
+       the ones of the current interpreter. */
+    if (memcmp(offsets->cookie, _Py_Debug_Cookie, sizeof(offsets->cookie)) != 0
+        || offsets->version != PY_VERSION_HEX
+        || offsets->free_threaded != _Py_Debug_Free_Threaded
+        || offsets->unicode_object.asciiobject_size != sizeof(PyASCIIObject))
+    {
+        PyErr_Format(PyExc_RuntimeError,
+                     "Process %d does not run the same Python version", pid);
+        return -1;
+    }
+    if (offsets->thread_state.size > MAX_STRUCT_SIZE
+        || offsets->interpreter_frame.localsplus > MAX_STRUCT_SIZE
+        || offsets->code_object.size > MAX_STRUCT_SIZE)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Unexpected structure sizes");
+        return -1;
+    }
+    Py_XSETREF(self->code_cache, PyDict_New());
+    if (self->code_cache == NULL) {
+        return -1;
+    }
+    return 0;
+}
+
+/* Return a new list of (thread_id, frames) pairs. */
+static PyObject *
+unwinder_get_stack_trace(RemoteUnwinderObject *self)
+{
+    struct _Py_DebugOffsets *offsets = &self->debug_offsets;
+    uintptr_t runtime = (uintptr_t)self->runtime_start_address;
+    uintptr_t interp;
+    if (read_pointer(self->pid,
+                     runtime + offsets->runtime_state.interpreters_head,
+                     &interp) < 0)
+    {
+        return NULL;
+    }
+    if (interp == 0) {
+        PyErr_SetString(PyExc_RuntimeError, "No interpreter state found");
+        return NULL;
+    }
+    uintptr_t tstate = 0;
+    if (!self->all_threads) {
+        if (read_pointer(self->pid,
+                         interp + offsets->interpreter_state.threads_main,
+                         &tstate) < 0)
+        {
+            return NULL;
+        }
+    }
+    if (tstate == 0) {
+        if (read_pointer(self->pid,
+                         interp + offsets->interpreter_state.threads_head,
+                         &tstate) < 0)
+        {
+            return NULL;
+        }
+    }
+
+    PyObject *result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    // No Python frames are available for us (can happen at tear-down).
+    for (int count = 0; tstate != 0; count++) {
+        if (count >= MAX_THREADS) {
+            PyErr_SetString(PyExc_RuntimeError, "Too many remote threads");
+            goto error;
+        }
+        unsigned long thread_id;
+        PyObject *frames = unwind_thread(self, tstate, &thread_id, &tstate);
+        if (frames == NULL) {
+            goto error;
+        }
+        PyObject *item = Py_BuildValue("(kN)", thread_id, frames);
+        if (item == NULL) {
+            goto error;
+        }
+        if (PyList_Append(result, item) < 0) {
+            Py_DECREF(item);
+            goto error;
+        }
+        Py_DECREF(item);
+        if (!self->all_threads) {
+            break;
+        }
+    }
+    return result;
+
+error:
+    Py_DECREF(result);
+    return NULL;
+}
+
+/*[clinic input]
+_remote_debugging.RemoteUnwinder.__init__
+
+    pid: int
+    *
+    all_threads: bool = False
+
+Object reading the Python stacks of a running process.
+
+The target process must run the same version of Python.  With all_threads
+true, the stacks of all its threads are read, otherwise only the stack of
+its main thread is.
+[clinic start generated code]*/
+
+static int
+_remote_debugging_RemoteUnwinder___init___impl(RemoteUnwinderObject *self,
+                                               int pid, int all_threads)
+/*[clinic end generated code: output=b8027cb247092081 input=653cf9174c66e636]*/
+{
+    return unwinder_init(self, pid, all_threads);
+}
+
+/*[clinic input]
+_remote_debugging.RemoteUnwinder.get_stack_trace
+
+Return the current stacks of the target process.
+
+The result is a list of (thread_id, frames) pairs.  frames lists the
+(filename, firstlineno, function_name) triples of the Python functions
+being executed, innermost first.
+[clinic start generated code]*/
+
+static PyObject *
+_remote_debugging_RemoteUnwinder_get_stack_trace_impl(RemoteUnwinderObject *self)
+/*[clinic end generated code: output=666192b90c69d567 input=1f491e304615bcab]*/
+{
+    if (self->code_cache == NULL) {
+        PyErr_SetString(PyExc_ValueError, "RemoteUnwinder is not initialized");
+        return NULL;
+    }
+    return unwinder_get_stack_trace(self);
+}
+
+static int
+RemoteUnwinder_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    RemoteUnwinderObject *self = RemoteUnwinderObject_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    Py_VISIT(self->code_cache);
+    return 0;
+}
+
+static int
+RemoteUnwinder_clear(PyObject *op)
+{
+    RemoteUnwinderObject *self = RemoteUnwinderObject_CAST(op);
+    Py_CLEAR(self->code_cache);
+    return 0;
+}
+
+static void
+RemoteUnwinder_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)RemoteUnwinder_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+#include "clinic/_remote_debuggingmodule.c.h"
+
+static PyMethodDef RemoteUnwinder_methods[] = {
+    _REMOTE_DEBUGGING_REMOTEUNWINDER_GET_STACK_TRACE_METHODDEF
+    {NULL, NULL}
+};
+
+static PyType_Slot RemoteUnwinder_slots[] = {
+    {Py_tp_doc, (void *)_remote_debugging_RemoteUnwinder___init____doc__},
+    {Py_tp_methods, RemoteUnwinder_methods},
+    {Py_tp_init, _remote_debugging_RemoteUnwinder___init__},
+    {Py_tp_traverse, RemoteUnwinder_traverse},
+    {Py_tp_clear, RemoteUnwinder_clear},
+    {Py_tp_dealloc, RemoteUnwinder_dealloc},
+    {0, NULL}
+};
+
+static PyType_Spec RemoteUnwinder_spec = {
+    .name = "_remote_debugging.RemoteUnwinder",
+    .basicsize = sizeof(RemoteUnwinderObject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC
+              | Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = RemoteUnwinder_slots,
+};
+
+/*[clinic input]
+_remote_debugging.get_stack_trace
+
+    pid: int
+    /
+
+Return the names of the functions executed by the main thread of a process.
+
+The innermost function comes first.
+[clinic start generated code]*/
+
+static PyObject *
+_remote_debugging_get_stack_trace_impl(PyObject *module, int pid)
+/*[clinic end generated code: output=7531148c66891829 input=287639d72a1fab34]*/
+{
+    RemoteDebuggingState *state = get_module_state(module);
+    RemoteUnwinderObject *unwinder = (RemoteUnwinderObject *)
+        PyType_GenericAlloc(state->RemoteUnwinder_Type, 0);
+    if (unwinder == NULL) {
+        return NULL;
+    }
+    PyObject *result = NULL;
+    PyObject *threads = NULL;
+    if (unwinder_init(unwinder, pid, 0) < 0) {
+        goto done;
+    }
+    threads = unwinder_get_stack_trace(unwinder);
+    if (threads == NULL) {
+        goto done;
+    }
+    result = PyList_New(0);
+    if (result == NULL || PyList_GET_SIZE(threads) == 0) {
+        goto done;
+    }
+    PyObject *frames = PyTuple_GET_ITEM(PyList_GET_ITEM(threads, 0), 1);
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(frames); i++) {
+        PyObject *name = PyTuple_GET_ITEM(PyList_GET_ITEM(frames, i), 2);
+        if (PyList_Append(result, name) < 0) {
+            Py_CLEAR(result);
+            goto done;
+        }
+    }
+done:
+    Py_XDECREF(threads);
+    Py_DECREF(unwinder);
+    return result;
+}
+
+static PyMethodDef remote_debugging_methods[] = {
+    _REMOTE_DEBUGGING_GET_STACK_TRACE_METHODDEF
+    {NULL, NULL, 0, NULL},
+};
+
+static int
+remote_debugging_exec(PyObject *module)
+{
+    RemoteDebuggingState *state = get_module_state(module);
+    state->RemoteUnwinder_Type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &RemoteUnwinder_spec, NULL);
+    if (state->RemoteUnwinder_Type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->RemoteUnwinder_Type) < 0) {
+        return -1;
+    }
+    if (PyModule_AddIntConstant(module, "PROCESS_VM_READV_SUPPORTED",
+                                HAVE_PROCESS_VM_READV) < 0)
+    {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+remote_debugging_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    RemoteDebuggingState *state = get_module_state(module);
+    Py_VISIT(state->RemoteUnwinder_Type);
+    return 0;
+}
+
+static int
+remote_debugging_clear(PyObject *module)
+{
+    RemoteDebuggingState *state = get_module_state(module);
+    Py_CLEAR(state->RemoteUnwinder_Type);
+    return 0;
+}
+
+static void
+remote_debugging_free(void *module)
+{
+    (void)remote_debugging_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot remote_debugging_slots[] = {
+    {Py_mod_exec, remote_debugging_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL},
+};
+
+static struct PyModuleDef remote_debugging_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_remote_debugging",
+    .m_size = sizeof(RemoteDebuggingState),
+    .m_methods = remote_debugging_methods,
+    .m_slots = remote_debugging_slots,
+    .m_traverse = remote_debugging_traverse,
+    .m_clear = remote_debugging_clear,
+    .m_free = remote_debugging_free,
+};
+
+PyMODINIT_FUNC
+PyInit__remote_debugging(void)
+{
+    return PyModuleDef_Init(&remote_debugging_module);
+}
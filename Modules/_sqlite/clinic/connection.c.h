@@ -1213,6 +1213,38 @@ pysqlite_connection_interrupt(pysqlite_Connection *self, PyObject *Py_UNUSED(ign
     return pysqlite_connection_interrupt_impl(self);
 }
 
+PyDoc_STRVAR(pysqlite_connection_prepare__doc__,
+"_prepare($self, sql, /)\n"
+"--\n"
+"\n"
+"Compile the SQL statement and store it in the statement cache.\n"
+"\n"
+"The statement is not executed.  Used to warm the cache of pooled\n"
+"connections.");
+
+#define PYSQLITE_CONNECTION_PREPARE_METHODDEF    \
+    {"_prepare", (PyCFunction)pysqlite_connection_prepare, METH_O, pysqlite_connection_prepare__doc__},
+
+static PyObject *
+pysqlite_connection_prepare_impl(pysqlite_Connection *self, PyObject *sql);
+
+static PyObject *
+pysqlite_connection_prepare(pysqlite_Connection *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *sql;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("_prepare", "argument", "str", arg);
+        goto exit;
+    }
+    sql = arg;
+    return_value = pysqlite_connection_prepare_impl(self, sql);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(pysqlite_connection_iterdump__doc__,
 "iterdump($self, /, *, filter=None)\n"
 "--\n"
@@ -1881,4 +1913,4 @@ exit:
 #ifndef DESERIALIZE_METHODDEF
     #define DESERIALIZE_METHODDEF
 #endif /* !defined(DESERIALIZE_METHODDEF) */
-/*[clinic end generated code: output=a8fd19301c7390cc input=a9049054013a1b77]*/
+/*[clinic end generated code: output=2a3bcb1caef1facc input=a9049054013a1b77]*/
@@ -253,6 +253,78 @@ pysqlite_cursor_fetchall(pysqlite_Cursor *self, PyObject *Py_UNUSED(ignored))
     return pysqlite_cursor_fetchall_impl(self);
 }
 
+PyDoc_STRVAR(pysqlite_cursor_fetchcolumns__doc__,
+"fetchcolumns($self, /, size=-1)\n"
+"--\n"
+"\n"
+"Fetches rows from the resultset as a tuple of columns.\n"
+"\n"
+"  size\n"
+"    The maximum number of rows to fetch.  If negative, all the\n"
+"    remaining rows are fetched.\n"
+"\n"
+"Columns of integers or of floats are returned as array.array objects of\n"
+"typecode \'q\' or \'d\', other columns as lists.  An empty tuple is returned\n"
+"when no rows remain.");
+
+#define PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF    \
+    {"fetchcolumns", _PyCFunction_CAST(pysqlite_cursor_fetchcolumns), METH_FASTCALL|METH_KEYWORDS, pysqlite_cursor_fetchcolumns__doc__},
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows);
+
+static PyObject *
+pysqlite_cursor_fetchcolumns(pysqlite_Cursor *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(size), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"size", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "fetchcolumns",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int maxrows = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    maxrows = PyLong_AsInt(args[0]);
+    if (maxrows == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = pysqlite_cursor_fetchcolumns_impl(self, maxrows);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(pysqlite_cursor_setinputsizes__doc__,
 "setinputsizes($self, sizes, /)\n"
 "--\n"
@@ -314,4 +386,4 @@ pysqlite_cursor_close(pysqlite_Cursor *self, PyObject *Py_UNUSED(ignored))
 {
     return pysqlite_cursor_close_impl(self);
 }
-/*[clinic end generated code: output=f0804afc5f8646c1 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=901c72a4d7a84b89 input=a9049054013a1b77]*/
@@ -1972,6 +1972,37 @@ pysqlite_connection_interrupt_impl(pysqlite_Connection *self)
     return retval;
 }
 
+/*[clinic input]
+_sqlite3.Connection._prepare as pysqlite_connection_prepare
+
+    sql: unicode
+    /
+
+Compile the SQL statement and store it in the statement cache.
+
+The statement is not executed.  Used to warm the cache of pooled
+connections.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_connection_prepare_impl(pysqlite_Connection *self, PyObject *sql)
+/*[clinic end generated code: output=fb4453c4f82775d2 input=f12a205cdd2fd5c5]*/
+{
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    PyObject *args[] = { NULL, sql, };  // Borrowed ref.
+    size_t nargsf = 1 | PY_VECTORCALL_ARGUMENTS_OFFSET;
+    PyObject *statement = PyObject_Vectorcall(self->statement_cache,
+                                              args + 1, nargsf, NULL);
+    if (statement == NULL) {
+        return NULL;
+    }
+    Py_DECREF(statement);
+    Py_RETURN_NONE;
+}
+
 /* Function author: Paul Kippes <kippesp@gmail.com>
  * Class method of Connection to call the Python function _iterdump
  * of the sqlite3 module.
@@ -2597,6 +2628,7 @@ static PyMethodDef connection_methods[] = {
     PYSQLITE_CONNECTION_INTERRUPT_METHODDEF
     PYSQLITE_CONNECTION_ITERDUMP_METHODDEF
     PYSQLITE_CONNECTION_LOAD_EXTENSION_METHODDEF
+    PYSQLITE_CONNECTION_PREPARE_METHODDEF
     PYSQLITE_CONNECTION_ROLLBACK_METHODDEF
     PYSQLITE_CONNECTION_SET_AUTHORIZER_METHODDEF
     PYSQLITE_CONNECTION_SET_PROGRESS_HANDLER_METHODDEF
@@ -30,6 +30,7 @@
 #include "module.h"
 #include "util.h"
 
+#include "pycore_import.h"        // _PyImport_GetModuleAttrString()
 #include "pycore_pyerrors.h"      // _PyErr_FormatFromCause()
 
 typedef enum {
@@ -315,17 +316,28 @@ _pysqlite_build_column_name(pysqlite_Cursor *self, const char *colname)
     return PyUnicode_FromStringAndSize(colname, len);
 }
 
+static PyObject *
+get_column_converter(pysqlite_Cursor *self, int i)
+{
+    if (self->connection->detect_types
+            && self->row_cast_map != NULL
+            && i < PyList_GET_SIZE(self->row_cast_map))
+    {
+        return PyList_GET_ITEM(self->row_cast_map, i);
+    }
+    return Py_None;
+}
+
 /*
- * Returns a row from the currently active SQLite statement
+ * Returns the value of column i of the current row of the active SQLite
+ * statement, converted as described by detect_types and text_factory.
  *
  * Precondidition:
  * - sqlite3_step() has been called before and it returned SQLITE_ROW.
  */
 static PyObject *
-_pysqlite_fetch_one_row(pysqlite_Cursor* self)
+_pysqlite_fetch_column(pysqlite_Cursor *self, int i)
 {
-    int i, numcols;
-    PyObject* row;
     int coltype;
     PyObject* converter;
     PyObject* converted;
@@ -334,109 +346,117 @@ _pysqlite_fetch_one_row(pysqlite_Cursor* self)
     const char* colname;
     PyObject* error_msg;
 
-    Py_BEGIN_ALLOW_THREADS
-    numcols = sqlite3_data_count(self->statement->st);
-    Py_END_ALLOW_THREADS
-
-    row = PyTuple_New(numcols);
-    if (!row)
-        return NULL;
-
     sqlite3 *db = self->connection->db;
-    for (i = 0; i < numcols; i++) {
-        if (self->connection->detect_types
-                && self->row_cast_map != NULL
-                && i < PyList_GET_SIZE(self->row_cast_map))
-        {
-            converter = PyList_GET_ITEM(self->row_cast_map, i);
+    converter = get_column_converter(self, i);
+
+    /*
+     * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
+     * or sqlite3_column_text().
+     *
+     * See https://sqlite.org/c3ref/column_blob.html for details.
+     */
+    if (converter != Py_None) {
+        const void *blob = sqlite3_column_blob(self->statement->st, i);
+        if (blob == NULL) {
+            if (sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+            converted = Py_NewRef(Py_None);
         }
         else {
-            converter = Py_None;
-        }
-
-        /*
-         * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
-         * or sqlite3_column_text().
-         *
-         * See https://sqlite.org/c3ref/column_blob.html for details.
-         */
-        if (converter != Py_None) {
-            const void *blob = sqlite3_column_blob(self->statement->st, i);
-            if (blob == NULL) {
-                if (sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-                converted = Py_NewRef(Py_None);
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
+            if (item == NULL) {
+                return NULL;
             }
-            else {
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
-                if (item == NULL) {
-                    goto error;
-                }
-                converted = PyObject_CallOneArg(converter, item);
-                Py_DECREF(item);
+            converted = PyObject_CallOneArg(converter, item);
+            Py_DECREF(item);
+        }
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        coltype = sqlite3_column_type(self->statement->st, i);
+        Py_END_ALLOW_THREADS
+        if (coltype == SQLITE_NULL) {
+            converted = Py_NewRef(Py_None);
+        } else if (coltype == SQLITE_INTEGER) {
+            converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
+        } else if (coltype == SQLITE_FLOAT) {
+            converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
+        } else if (coltype == SQLITE_TEXT) {
+            const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
+            if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
             }
-        } else {
-            Py_BEGIN_ALLOW_THREADS
-            coltype = sqlite3_column_type(self->statement->st, i);
-            Py_END_ALLOW_THREADS
-            if (coltype == SQLITE_NULL) {
-                converted = Py_NewRef(Py_None);
-            } else if (coltype == SQLITE_INTEGER) {
-                converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
-            } else if (coltype == SQLITE_FLOAT) {
-                converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
-            } else if (coltype == SQLITE_TEXT) {
-                const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
-                if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
 
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
-                    converted = PyUnicode_FromStringAndSize(text, nbytes);
-                    if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
-                        PyErr_Clear();
-                        colname = sqlite3_column_name(self->statement->st, i);
-                        if (colname == NULL) {
-                            PyErr_NoMemory();
-                            goto error;
-                        }
-                        PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
-                                     colname , text);
-                        error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
-
-                        PyObject *exc = self->connection->OperationalError;
-                        if (!error_msg) {
-                            PyErr_SetString(exc, "Could not decode to UTF-8");
-                        } else {
-                            PyErr_SetObject(exc, error_msg);
-                            Py_DECREF(error_msg);
-                        }
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
+                converted = PyUnicode_FromStringAndSize(text, nbytes);
+                if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
+                    PyErr_Clear();
+                    colname = sqlite3_column_name(self->statement->st, i);
+                    if (colname == NULL) {
+                        PyErr_NoMemory();
+                        return NULL;
+                    }
+                    PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
+                                 colname , text);
+                    error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
+
+                    PyObject *exc = self->connection->OperationalError;
+                    if (!error_msg) {
+                        PyErr_SetString(exc, "Could not decode to UTF-8");
+                    } else {
+                        PyErr_SetObject(exc, error_msg);
+                        Py_DECREF(error_msg);
                     }
-                } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
-                    converted = PyBytes_FromStringAndSize(text, nbytes);
-                } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
-                    converted = PyByteArray_FromStringAndSize(text, nbytes);
-                } else {
-                    converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
                 }
+            } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
+                converted = PyBytes_FromStringAndSize(text, nbytes);
+            } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
+                converted = PyByteArray_FromStringAndSize(text, nbytes);
             } else {
-                /* coltype == SQLITE_BLOB */
-                const void *blob = sqlite3_column_blob(self->statement->st, i);
-                if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                converted = PyBytes_FromStringAndSize(blob, nbytes);
+                converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
             }
+        } else {
+            /* coltype == SQLITE_BLOB */
+            const void *blob = sqlite3_column_blob(self->statement->st, i);
+            if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            converted = PyBytes_FromStringAndSize(blob, nbytes);
         }
+    }
+    return converted;
+}
+
+/*
+ * Returns a row from the currently active SQLite statement
+ *
+ * Precondidition:
+ * - sqlite3_step() has been called before and it returned SQLITE_ROW.
+ */
+static PyObject *
+_pysqlite_fetch_one_row(pysqlite_Cursor* self)
+{
+    int i, numcols;
+    PyObject* row;
+    PyObject* converted;
+
+    Py_BEGIN_ALLOW_THREADS
+    numcols = sqlite3_data_count(self->statement->st);
+    Py_END_ALLOW_THREADS
 
+    row = PyTuple_New(numcols);
+    if (!row)
+        return NULL;
+
+    for (i = 0; i < numcols; i++) {
+        converted = _pysqlite_fetch_column(self, i);
         if (!converted) {
             goto error;
         }
@@ -1086,6 +1106,33 @@ pysqlite_cursor_executescript_impl(pysqlite_Cursor *self,
     return NULL;
 }
 
+/*
+ * Steps to the next row of the active statement once the current row has
+ * been fetched.  The statement is released when it is done.
+ *
+ * Returns 0 on success, -1 with an exception set on error.
+ */
+static int
+cursor_step(pysqlite_Cursor *self)
+{
+    int rc = stmt_step(self->statement->st);
+    if (rc == SQLITE_DONE) {
+        if (self->statement->is_dml) {
+            self->rowcount = (long)sqlite3_changes(self->connection->db);
+        }
+        (void)stmt_reset(self->statement);
+        Py_CLEAR(self->statement);
+    }
+    else if (rc != SQLITE_ROW) {
+        (void)_pysqlite_seterror(self->connection->state,
+                                 self->connection->db);
+        (void)stmt_reset(self->statement);
+        Py_CLEAR(self->statement);
+        return -1;
+    }
+    return 0;
+}
+
 static PyObject *
 pysqlite_cursor_iternext(pysqlite_Cursor *self)
 {
@@ -1097,9 +1144,8 @@ pysqlite_cursor_iternext(pysqlite_Cursor *self)
         return NULL;
     }
 
-    sqlite3_stmt *stmt = self->statement->st;
-    assert(stmt != NULL);
-    assert(sqlite3_data_count(stmt) != 0);
+    assert(self->statement->st != NULL);
+    assert(sqlite3_data_count(self->statement->st) != 0);
 
     self->locked = 1;  // GH-80254: Prevent recursive use of cursors.
     PyObject *row = _pysqlite_fetch_one_row(self);
@@ -1107,19 +1153,7 @@ pysqlite_cursor_iternext(pysqlite_Cursor *self)
     if (row == NULL) {
         return NULL;
     }
-    int rc = stmt_step(stmt);
-    if (rc == SQLITE_DONE) {
-        if (self->statement->is_dml) {
-            self->rowcount = (long)sqlite3_changes(self->connection->db);
-        }
-        (void)stmt_reset(self->statement);
-        Py_CLEAR(self->statement);
-    }
-    else if (rc != SQLITE_ROW) {
-        (void)_pysqlite_seterror(self->connection->state,
-                                 self->connection->db);
-        (void)stmt_reset(self->statement);
-        Py_CLEAR(self->statement);
+    if (cursor_step(self) < 0) {
         Py_DECREF(row);
         return NULL;
     }
@@ -1228,6 +1262,229 @@ pysqlite_cursor_fetchall_impl(pysqlite_Cursor *self)
     }
 }
 
+/* A column being fetched by fetchcolumns(). */
+typedef struct {
+    enum {
+        COLUMN_UNSET,
+        COLUMN_INT64,
+        COLUMN_DOUBLE,
+        COLUMN_LIST,
+    } kind;
+    /* Values of COLUMN_INT64 and COLUMN_DOUBLE columns. */
+    union {
+        sqlite3_int64 *ints;
+        double *doubles;
+        void *ptr;
+    } data;
+    Py_ssize_t len;
+    Py_ssize_t allocated;
+    /* Values of COLUMN_LIST columns. */
+    PyObject *list;
+} fetch_column;
+
+static_assert(sizeof(sqlite3_int64) == sizeof(double),
+              "fetch_column stores 64-bit integers and doubles");
+
+static int
+column_to_list(fetch_column *col)
+{
+    PyObject *list = PyList_New(col->len);
+    if (list == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t k = 0; k < col->len; k++) {
+        PyObject *item;
+        if (col->kind == COLUMN_INT64) {
+            item = PyLong_FromLongLong(col->data.ints[k]);
+        }
+        else {
+            item = PyFloat_FromDouble(col->data.doubles[k]);
+        }
+        if (item == NULL) {
+            Py_DECREF(list);
+            return -1;
+        }
+        PyList_SET_ITEM(list, k, item);
+    }
+    PyMem_Free(col->data.ptr);
+    col->data.ptr = NULL;
+    col->kind = COLUMN_LIST;
+    col->list = list;
+    return 0;
+}
+
+/*
+ * Appends the value of column i of the current row to col.  Numbers are
+ * stored unboxed as long as all the values of the column have the same
+ * type, otherwise the column falls back to a list of Python objects.
+ */
+static int
+column_append(pysqlite_Cursor *self, fetch_column *col, int i)
+{
+    if (col->kind != COLUMN_LIST) {
+        sqlite3_stmt *st = self->statement->st;
+        int coltype = sqlite3_column_type(st, i);
+        if (col->kind == COLUMN_UNSET) {
+            int convert = get_column_converter(self, i) != Py_None;
+            if (!convert && coltype == SQLITE_INTEGER) {
+                col->kind = COLUMN_INT64;
+            }
+            else if (!convert && coltype == SQLITE_FLOAT) {
+                col->kind = COLUMN_DOUBLE;
+            }
+            else {
+                col->list = PyList_New(0);
+                if (col->list == NULL) {
+                    return -1;
+                }
+                col->kind = COLUMN_LIST;
+            }
+        }
+        if ((col->kind == COLUMN_INT64 && coltype == SQLITE_INTEGER)
+            || (col->kind == COLUMN_DOUBLE && coltype == SQLITE_FLOAT))
+        {
+            if (col->len == col->allocated) {
+                Py_ssize_t allocated = col->allocated ? col->allocated * 2 : 64;
+                void *ptr = PyMem_Realloc(col->data.ptr,
+                                          allocated * sizeof(double));
+                if (ptr == NULL) {
+                    PyErr_NoMemory();
+                    return -1;
+                }
+                col->data.ptr = ptr;
+                col->allocated = allocated;
+            }
+            if (col->kind == COLUMN_INT64) {
+                col->data.ints[col->len++] = sqlite3_column_int64(st, i);
+            }
+            else {
+                col->data.doubles[col->len++] = sqlite3_column_double(st, i);
+            }
+            return 0;
+        }
+        if (col->kind != COLUMN_LIST && column_to_list(col) < 0) {
+            return -1;
+        }
+    }
+
+    PyObject *value = _pysqlite_fetch_column(self, i);
+    if (value == NULL) {
+        return -1;
+    }
+    int rc = PyList_Append(col->list, value);
+    Py_DECREF(value);
+    return rc;
+}
+
+static PyObject *
+column_finish(fetch_column *col, PyObject *array_type)
+{
+    if (col->kind == COLUMN_LIST) {
+        return Py_NewRef(col->list);
+    }
+    assert(col->kind == COLUMN_INT64 || col->kind == COLUMN_DOUBLE);
+    PyObject *array = PyObject_CallFunction(
+        array_type, "s", col->kind == COLUMN_INT64 ? "q" : "d");
+    if (array == NULL) {
+        return NULL;
+    }
+    PyObject *view = PyMemoryView_FromMemory(col->data.ptr,
+                                             col->len * sizeof(double),
+                                             PyBUF_READ);
+    if (view == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    PyObject *res = PyObject_CallMethod(array, "frombytes", "O", view);
+    Py_DECREF(view);
+    if (res == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return array;
+}
+
+/*[clinic input]
+_sqlite3.Cursor.fetchcolumns as pysqlite_cursor_fetchcolumns
+
+    size as maxrows: int = -1
+        The maximum number of rows to fetch.  If negative, all the
+        remaining rows are fetched.
+
+Fetches rows from the resultset as a tuple of columns.
+
+Columns of integers or of floats are returned as array.array objects of
+typecode 'q' or 'd', other columns as lists.  An empty tuple is returned
+when no rows remain.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows)
+/*[clinic end generated code: output=781d71c1122c0ace input=6d3e74e1cbccbc79]*/
+{
+    if (!check_cursor(self)) {
+        return NULL;
+    }
+    if (self->statement == NULL || maxrows == 0) {
+        return PyTuple_New(0);
+    }
+
+    PyObject *array_type = _PyImport_GetModuleAttrString("array", "array");
+    if (array_type == NULL) {
+        return NULL;
+    }
+
+    int numcols = sqlite3_data_count(self->statement->st);
+    fetch_column *columns = PyMem_Calloc(Py_MAX(numcols, 1),
+                                         sizeof(fetch_column));
+    if (columns == NULL) {
+        Py_DECREF(array_type);
+        return PyErr_NoMemory();
+    }
+
+    PyObject *result = NULL;
+    int counter = 0;
+    while (self->statement != NULL) {
+        self->locked = 1;  // GH-80254: Prevent recursive use of cursors.
+        for (int i = 0; i < numcols; i++) {
+            if (column_append(self, &columns[i], i) < 0) {
+                self->locked = 0;
+                goto exit;
+            }
+        }
+        self->locked = 0;
+        if (cursor_step(self) < 0) {
+            goto exit;
+        }
+        if (++counter == maxrows) {
+            break;
+        }
+    }
+
+    result = PyTuple_New(numcols);
+    if (result == NULL) {
+        goto exit;
+    }
+    for (int i = 0; i < numcols; i++) {
+        PyObject *column = column_finish(&columns[i], array_type);
+        if (column == NULL) {
+            Py_CLEAR(result);
+            goto exit;
+        }
+        PyTuple_SET_ITEM(result, i, column);
+    }
+
+exit:
+    for (int i = 0; i < numcols; i++) {
+        PyMem_Free(columns[i].data.ptr);
+        Py_XDECREF(columns[i].list);
+    }
+    PyMem_Free(columns);
+    Py_DECREF(array_type);
+    return result;
+}
+
 /*[clinic input]
 _sqlite3.Cursor.setinputsizes as pysqlite_cursor_setinputsizes
 
@@ -1303,6 +1560,7 @@ static PyMethodDef cursor_methods[] = {
     PYSQLITE_CURSOR_EXECUTESCRIPT_METHODDEF
     PYSQLITE_CURSOR_EXECUTE_METHODDEF
     PYSQLITE_CURSOR_FETCHALL_METHODDEF
+    PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF
     PYSQLITE_CURSOR_FETCHMANY_METHODDEF
     PYSQLITE_CURSOR_FETCHONE_METHODDEF
     PYSQLITE_CURSOR_SETINPUTSIZES_METHODDEF
@@ -0,0 +1,1449 @@
+/* Linux io_uring interface, used by asyncio's IoUringEventLoop.
+
+   A Ring object wraps one io_uring instance.  Operations are appended to
+   the submission queue and are only handed to the kernel by Ring.wait(),
+   so a whole event loop iteration costs a single io_uring_enter() call.
+
+   Every operation owns the Python objects it needs (the completion key,
+   pinned buffers, the bytes object being filled) until the kernel posts
+   its completion; a ring is never torn down while the kernel may still
+   touch that memory. */
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_hashtable.h"     // _Py_hashtable_new()
+#include "pycore_time.h"          // _PyTime_FromSecondsObject()
+
+#include <errno.h>
+#include <linux/io_uring.h>
+#include <poll.h>                 // POLLIN, POLLOUT
+#include <stddef.h>               // offsetof()
+#include <sys/mman.h>             // mmap()
+#include <sys/syscall.h>          // __NR_io_uring_setup
+#include <sys/uio.h>              // struct iovec
+#include <unistd.h>               // syscall()
+
+
+typedef struct {
+    PyTypeObject *RingType;
+} uring_state;
+
+static inline uring_state *
+get_uring_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != NULL);
+    return (uring_state *)state;
+}
+
+
+/* Completion token of the internal cancellation requests: their
+   completions are not reported to the caller. */
+#define CANCEL_TOKEN 0
+
+#define OP_HAS_VIEW     0x01    /* op->view holds a pinned buffer */
+#define OP_WRITE_ALL    0x02    /* resubmit short writes until done */
+#define OP_POLLING      0x04    /* waiting for readiness before a retry */
+#define OP_CANCELLED    0x08    /* Ring.cancel() was called */
+#define OP_DISCARDED    0x10    /* cancelled before the kernel saw it */
+#define OP_FIXED        0x20    /* uses a registered buffer */
+
+typedef struct {
+    PyObject *key;              /* object reported with the completion */
+    PyObject *data;             /* bytes object filled by recv()/read() */
+    Py_buffer view;             /* buffer pinned while the kernel uses it */
+    struct io_uring_sqe sqe;    /* the request, kept to resubmit it */
+    uint64_t token;
+    uint32_t sq_pos;            /* SQ position of the last queued SQE */
+    uint32_t poll_events;       /* readiness to wait for on EAGAIN */
+    int64_t done;               /* bytes already written */
+    int flags;
+} uring_op;
+
+typedef struct {
+    PyObject_HEAD
+    int fd;
+
+    /* Submission queue */
+    void *sq_ptr;
+    size_t sq_size;
+    uint32_t *sq_head;
+    uint32_t *sq_tail;
+    uint32_t *sq_array;
+    uint32_t sq_mask;
+    uint32_t sq_entries;
+    uint32_t sq_pending;        /* queued SQEs not consumed by the kernel */
+    struct io_uring_sqe *sqes;
+    size_t sqes_size;
+
+    /* Completion queue */
+    void *cq_ptr;
+    size_t cq_size;
+    uint32_t *cq_head;
+    uint32_t *cq_tail;
+    uint32_t cq_mask;
+    struct io_uring_cqe *cqes;
+
+    /* Operations in flight, keyed by token */
+    _Py_hashtable_t *ops;
+    uint64_t next_token;
+
+    /* Registered buffers */
+    Py_buffer *fixed;
+    Py_ssize_t nfixed;
+    Py_ssize_t fixed_inflight;
+
+    PyObject *weakreflist;
+} RingObject;
+
+#define TOKEN_KEY(token) ((const void *)(uintptr_t)(token))
+
+static struct PyModuleDef uringmodule;
+
+/*[clinic input]
+module _uring
+class _uring.Ring "RingObject *" "get_uring_state(PyType_GetModuleByDef(type, &uringmodule))->RingType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=d0359731286eea0b]*/
+
+
+/* poll32_events is stored word-swapped on big endian platforms */
+static inline uint32_t
+poll_mask(uint32_t events)
+{
+#if PY_BIG_ENDIAN
+    return (events << 16) | (events >> 16);
+#else
+    return events;
+#endif
+}
+
+static int
+sys_io_uring_enter(int fd, unsigned int to_submit, unsigned int min_complete,
+                   unsigned int flags, struct io_uring_getevents_arg *arg)
+{
+    if (arg != NULL) {
+        flags |= IORING_ENTER_EXT_ARG;
+    }
+    return (int)syscall(__NR_io_uring_enter, fd, to_submit, min_complete,
+                        flags, arg, arg != NULL ? sizeof(*arg) : 0);
+}
+
+static PyObject *
+ring_err_closed(void)
+{
+    PyErr_SetString(PyExc_ValueError, "I/O operation on closed ring");
+    return NULL;
+}
+
+/* Hand the queued SQEs to the kernel without waiting.
+   Return 0 on success, or -1 and set errno. */
+static int
+ring_flush(RingObject *self)
+{
+    while (self->sq_pending > 0) {
+        int ret = sys_io_uring_enter(self->fd, self->sq_pending, 0, 0, NULL);
+        if (ret < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            return -1;
+        }
+        self->sq_pending -= (uint32_t)ret;
+        if (ret == 0) {
+            errno = EBUSY;
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Append the request of op to the submission queue.
+   Return 0 on success, or -1 and set errno. */
+static int
+ring_push(RingObject *self, uring_op *op)
+{
+    uint32_t tail = *self->sq_tail;
+    uint32_t head = _Py_atomic_load_uint32_acquire(self->sq_head);
+    if (tail - head >= self->sq_entries) {
+        if (ring_flush(self) < 0) {
+            return -1;
+        }
+        head = _Py_atomic_load_uint32_acquire(self->sq_head);
+        if (tail - head >= self->sq_entries) {
+            errno = EBUSY;
+            return -1;
+        }
+    }
+    uint32_t index = tail & self->sq_mask;
+    struct io_uring_sqe *sqe = &self->sqes[index];
+    if (op->flags & OP_POLLING) {
+        memset(sqe, 0, sizeof(*sqe));
+        sqe->opcode = IORING_OP_POLL_ADD;
+        sqe->fd = op->sqe.fd;
+        sqe->poll32_events = poll_mask(op->poll_events);
+    }
+    else {
+        *sqe = op->sqe;
+    }
+    sqe->user_data = op->token;
+    self->sq_array[index] = index;
+    op->sq_pos = tail;
+    _Py_atomic_store_uint32_release(self->sq_tail, tail + 1);
+    self->sq_pending++;
+    return 0;
+}
+
+/* Return 1 if the last SQE queued for op was not consumed by the kernel. */
+static inline int
+ring_is_unsubmitted(RingObject *self, uring_op *op)
+{
+    uint32_t distance = *self->sq_tail - op->sq_pos;
+    return distance >= 1 && distance <= self->sq_pending;
+}
+
+/* Ask the kernel to cancel op.  Return 0 on success, or -1 and set errno. */
+static int
+ring_cancel_op(RingObject *self, uring_op *op)
+{
+    op->flags |= OP_CANCELLED;
+    if (ring_is_unsubmitted(self, op)) {
+        /* The kernel has not seen the request yet: replace it with a no-op
+           so that the resources it refers to are never used. */
+        struct io_uring_sqe *sqe = &self->sqes[op->sq_pos & self->sq_mask];
+        memset(sqe, 0, sizeof(*sqe));
+        sqe->opcode = IORING_OP_NOP;
+        sqe->fd = -1;
+        sqe->user_data = op->token;
+        op->flags |= OP_DISCARDED;
+        return 0;
+    }
+
+    uring_op cancel;
+    memset(&cancel, 0, sizeof(cancel));
+    cancel.sqe.opcode = IORING_OP_ASYNC_CANCEL;
+    cancel.sqe.fd = -1;
+    cancel.sqe.addr = op->token;
+    cancel.token = CANCEL_TOKEN;
+    return ring_push(self, &cancel);
+}
+
+static uring_op *
+ring_new_op(RingObject *self, PyObject *key, uint8_t opcode, int fd)
+{
+    uring_op *op = PyMem_Calloc(1, sizeof(uring_op));
+    if (op == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    op->key = Py_NewRef(key);
+    op->token = self->next_token++;
+    op->sqe.opcode = opcode;
+    op->sqe.fd = fd;
+    return op;
+}
+
+static void
+ring_free_op(RingObject *self, uring_op *op)
+{
+    if (op->flags & OP_HAS_VIEW) {
+        PyBuffer_Release(&op->view);
+    }
+    if (op->flags & OP_FIXED) {
+        self->fixed_inflight--;
+    }
+    Py_XDECREF(op->data);
+    Py_XDECREF(op->key);
+    PyMem_Free(op);
+}
+
+/* Queue a new operation and return its token. */
+static PyObject *
+ring_submit_op(RingObject *self, uring_op *op)
+{
+    if (_Py_hashtable_set(self->ops, TOKEN_KEY(op->token), op) < 0) {
+        ring_free_op(self, op);
+        return PyErr_NoMemory();
+    }
+    if (ring_push(self, op) < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        _Py_hashtable_steal(self->ops, TOKEN_KEY(op->token));
+        ring_free_op(self, op);
+        return NULL;
+    }
+    if (op->flags & OP_FIXED) {
+        self->fixed_inflight++;
+    }
+    return PyLong_FromUnsignedLongLong(op->token);
+}
+
+/* Process the completion of op.  Return 1 if it is finished and should
+   be reported, 0 if it was resubmitted.  *pres is updated with the result
+   to report. */
+static int
+ring_handle_completion(RingObject *self, uring_op *op, int32_t *pres)
+{
+    int32_t res = *pres;
+    int cancelled = op->flags & OP_CANCELLED;
+
+    if (op->flags & OP_DISCARDED) {
+        *pres = -ECANCELED;
+        return 1;
+    }
+    if (op->flags & OP_POLLING) {
+        /* Readiness was reported: retry the request itself. */
+        if (res < 0) {
+            return 1;
+        }
+        if (cancelled) {
+            *pres = -ECANCELED;
+            return 1;
+        }
+        op->flags &= ~OP_POLLING;
+        goto resubmit;
+    }
+    if (res == -EAGAIN && op->poll_events != 0 && !cancelled) {
+        /* The file descriptor is in non-blocking mode and the kernel
+           returned EAGAIN instead of waiting: poll it, then retry. */
+        op->flags |= OP_POLLING;
+        goto resubmit;
+    }
+    if ((op->flags & OP_WRITE_ALL) && res > 0) {
+        op->done += res;
+        if ((uint32_t)res < op->sqe.len && !cancelled) {
+            op->sqe.addr += (uint32_t)res;
+            op->sqe.len -= (uint32_t)res;
+            if (op->sqe.off != (uint64_t)-1) {
+                op->sqe.off += (uint32_t)res;
+            }
+            goto resubmit;
+        }
+        *pres = (int32_t)Py_MIN(op->done, INT32_MAX);
+    }
+    return 1;
+
+resubmit:
+    if (ring_push(self, op) < 0) {
+        *pres = -errno;
+        return 1;
+    }
+    return 0;
+}
+
+/* Build the (key, result, data) tuple reported for a finished operation. */
+static PyObject *
+ring_report(uring_op *op, int32_t res)
+{
+    PyObject *data = Py_None;
+    if (op->data != NULL && res >= 0) {
+        if (res != PyBytes_GET_SIZE(op->data)) {
+            if (_PyBytes_Resize(&op->data, res) < 0) {
+                return NULL;
+            }
+        }
+        data = op->data;
+    }
+    return Py_BuildValue("OiO", op->key, res, data);
+}
+
+/* Consume the available completions.  Finished operations are appended
+   to results, or dropped if results is NULL.  Return the number of
+   finished operations, or -1 with an exception set. */
+static Py_ssize_t
+ring_reap(RingObject *self, PyObject *results)
+{
+    Py_ssize_t count = 0;
+    int error = 0;
+    uint32_t head = *self->cq_head;
+    uint32_t tail = _Py_atomic_load_uint32_acquire(self->cq_tail);
+
+    for (; head != tail; head++) {
+        struct io_uring_cqe *cqe = &self->cqes[head & self->cq_mask];
+        uint64_t token = cqe->user_data;
+        int32_t res = cqe->res;
+
+        if (token == CANCEL_TOKEN) {
+            continue;
+        }
+        uring_op *op = _Py_hashtable_get(self->ops, TOKEN_KEY(token));
+        if (op == NULL) {
+            continue;
+        }
+        if (!ring_handle_completion(self, op, &res)) {
+            continue;
+        }
+        _Py_hashtable_steal(self->ops, TOKEN_KEY(token));
+        count++;
+        if (results != NULL && op->key != NULL && !error) {
+            PyObject *item = ring_report(op, res);
+            if (item == NULL || PyList_Append(results, item) < 0) {
+                error = 1;
+            }
+            Py_XDECREF(item);
+        }
+        ring_free_op(self, op);
+    }
+    _Py_atomic_store_uint32_release(self->cq_head, head);
+    return error ? -1 : count;
+}
+
+static int
+ring_cancel_foreach(_Py_hashtable_t *ht, const void *key, const void *value,
+                    void *arg)
+{
+    uring_op *op = (uring_op *)value;
+    if (!(op->flags & OP_CANCELLED)) {
+        (void)ring_cancel_op((RingObject *)arg, op);
+    }
+    return 0;
+}
+
+static void
+ring_release_fixed(RingObject *self)
+{
+    for (Py_ssize_t i = 0; i < self->nfixed; i++) {
+        PyBuffer_Release(&self->fixed[i]);
+    }
+    PyMem_Free(self->fixed);
+    self->fixed = NULL;
+    self->nfixed = 0;
+}
+
+/* Cancel the operations in flight, wait until the kernel is done with
+   them and release the ring. */
+static void
+ring_close(RingObject *self)
+{
+    if (self->fd < 0) {
+        return;
+    }
+
+    _Py_hashtable_foreach(self->ops, ring_cancel_foreach, self);
+    while (_Py_hashtable_len(self->ops) > 0) {
+        int ret;
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->fd, self->sq_pending, 1,
+                                 IORING_ENTER_GETEVENTS, NULL);
+        Py_END_ALLOW_THREADS
+        if (ret < 0) {
+            if (errno == EINTR || errno == EAGAIN || errno == EBUSY) {
+                continue;
+            }
+            /* Operations the kernel may still be using are leaked rather
+               than freed. */
+            break;
+        }
+        self->sq_pending -= (uint32_t)ret;
+        (void)ring_reap(self, NULL);
+    }
+
+    if (_Py_hashtable_len(self->ops) == 0) {
+        ring_release_fixed(self);
+    }
+    if (self->sqes != NULL) {
+        munmap(self->sqes, self->sqes_size);
+        self->sqes = NULL;
+    }
+    if (self->cq_ptr != NULL && self->cq_ptr != self->sq_ptr) {
+        munmap(self->cq_ptr, self->cq_size);
+    }
+    self->cq_ptr = NULL;
+    if (self->sq_ptr != NULL) {
+        munmap(self->sq_ptr, self->sq_size);
+        self->sq_ptr = NULL;
+    }
+    close(self->fd);
+    self->fd = -1;
+}
+
+static int
+ring_setup(RingObject *self, unsigned int entries)
+{
+    struct io_uring_params p;
+    int fd;
+
+    memset(&p, 0, sizeof(p));
+    p.flags = IORING_SETUP_CLAMP;
+#ifdef IORING_SETUP_COOP_TASKRUN
+    /* Completions are only consumed from io_uring_enter(): the kernel
+       doesn't need to interrupt the thread to run completion work. */
+    p.flags |= IORING_SETUP_COOP_TASKRUN;
+#endif
+    fd = (int)syscall(__NR_io_uring_setup, entries, &p);
+#ifdef IORING_SETUP_COOP_TASKRUN
+    if (fd < 0 && errno == EINVAL) {
+        /* Linux older than 5.19 */
+        memset(&p, 0, sizeof(p));
+        p.flags = IORING_SETUP_CLAMP;
+        fd = (int)syscall(__NR_io_uring_setup, entries, &p);
+    }
+#endif
+    if (fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    self->fd = fd;
+
+    if (!(p.features & IORING_FEAT_EXT_ARG) ||
+        !(p.features & IORING_FEAT_NODROP))
+    {
+        errno = ENOSYS;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+
+    self->sq_size = p.sq_off.array + p.sq_entries * sizeof(uint32_t);
+    self->cq_size = p.cq_off.cqes + p.cq_entries * sizeof(struct io_uring_cqe);
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->sq_size = self->cq_size = Py_MAX(self->sq_size, self->cq_size);
+    }
+    self->sq_ptr = mmap(NULL, self->sq_size, PROT_READ | PROT_WRITE,
+                        MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_SQ_RING);
+    if (self->sq_ptr == MAP_FAILED) {
+        self->sq_ptr = NULL;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->cq_ptr = self->sq_ptr;
+    }
+    else {
+        self->cq_ptr = mmap(NULL, self->cq_size, PROT_READ | PROT_WRITE,
+                            MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_CQ_RING);
+        if (self->cq_ptr == MAP_FAILED) {
+            self->cq_ptr = NULL;
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+    }
+    self->sqes_size = p.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+                      MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_SQES);
+    if (self->sqes == MAP_FAILED) {
+        self->sqes = NULL;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+
+    char *sq = self->sq_ptr;
+    self->sq_head = (uint32_t *)(sq + p.sq_off.head);
+    self->sq_tail = (uint32_t *)(sq + p.sq_off.tail);
+    self->sq_array = (uint32_t *)(sq + p.sq_off.array);
+    self->sq_mask = *(uint32_t *)(sq + p.sq_off.ring_mask);
+    self->sq_entries = *(uint32_t *)(sq + p.sq_off.ring_entries);
+
+    char *cq = self->cq_ptr;
+    self->cq_head = (uint32_t *)(cq + p.cq_off.head);
+    self->cq_tail = (uint32_t *)(cq + p.cq_off.tail);
+    self->cq_mask = *(uint32_t *)(cq + p.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq + p.cq_off.cqes);
+    return 0;
+}
+
+/*[clinic input]
+@classmethod
+_uring.Ring.__new__
+
+    entries: unsigned_int(bitwise=False) = 256
+
+io_uring instance.
+
+*entries* is the size of the submission queue.  It is rounded up to a
+power of two and clamped to the maximum supported by the kernel.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_impl(PyTypeObject *type, unsigned int entries)
+/*[clinic end generated code: output=ec37bfaec3b9f3e6 input=89230c0cf7bf205d]*/
+{
+    if (entries == 0) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+
+    RingObject *self = (RingObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->fd = -1;
+    self->next_token = CANCEL_TOKEN + 1;
+    self->ops = _Py_hashtable_new(_Py_hashtable_hash_ptr,
+                                  _Py_hashtable_compare_direct);
+    if (self->ops == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    if (ring_setup(self, entries) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static int
+ring_traverse_foreach(_Py_hashtable_t *ht, const void *key,
+                      const void *value, void *user_data)
+{
+    struct {
+        visitproc visit;
+        void *arg;
+    } *ctx = user_data;
+    uring_op *op = (uring_op *)value;
+    visitproc visit = ctx->visit;
+    void *arg = ctx->arg;
+    Py_VISIT(op->key);
+    if (op->flags & OP_HAS_VIEW) {
+        Py_VISIT(op->view.obj);
+    }
+    return 0;
+}
+
+static int
+ring_traverse(RingObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(Py_TYPE(self));
+    if (self->ops != NULL) {
+        struct {
+            visitproc visit;
+            void *arg;
+        } ctx = {visit, arg};
+        int res = _Py_hashtable_foreach(self->ops, ring_traverse_foreach,
+                                        &ctx);
+        if (res) {
+            return res;
+        }
+    }
+    return 0;
+}
+
+static int
+ring_clear_foreach(_Py_hashtable_t *ht, const void *key, const void *value,
+                   void *arg)
+{
+    /* Pinned buffers must outlive the operation: only drop the keys,
+       their completions are not reported anymore. */
+    uring_op *op = (uring_op *)value;
+    Py_CLEAR(op->key);
+    return 0;
+}
+
+static int
+ring_clear(RingObject *self)
+{
+    if (self->ops != NULL) {
+        _Py_hashtable_foreach(self->ops, ring_clear_foreach, NULL);
+    }
+    return 0;
+}
+
+static void
+ring_dealloc(RingObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    if (self->weakreflist != NULL) {
+        PyObject_ClearWeakRefs((PyObject *)self);
+    }
+    ring_close(self);
+    if (self->ops != NULL) {
+        /* Operations still referenced here are leaked on purpose, see
+           ring_close(). */
+        _Py_hashtable_destroy(self->ops);
+        self->ops = NULL;
+    }
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+static int
+ring_check_buffer_len(Py_ssize_t len)
+{
+    if ((size_t)len > UINT32_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "buffer is too large");
+        return -1;
+    }
+    return 0;
+}
+
+/* Queue a request which reads into a new bytes object of nbytes. */
+static PyObject *
+ring_read_op(RingObject *self, PyObject *key, uint8_t opcode, int fd,
+             Py_ssize_t nbytes, uint64_t off, uint32_t msg_flags)
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (nbytes < 0) {
+        PyErr_SetString(PyExc_ValueError, "negative buffersize");
+        return NULL;
+    }
+    if (ring_check_buffer_len(nbytes) < 0) {
+        return NULL;
+    }
+    uring_op *op = ring_new_op(self, key, opcode, fd);
+    if (op == NULL) {
+        return NULL;
+    }
+    op->data = PyBytes_FromStringAndSize(NULL, nbytes);
+    if (op->data == NULL) {
+        ring_free_op(self, op);
+        return NULL;
+    }
+    op->sqe.addr = (uint64_t)(uintptr_t)PyBytes_AS_STRING(op->data);
+    op->sqe.len = (uint32_t)nbytes;
+    op->sqe.off = off;
+    op->sqe.msg_flags = msg_flags;
+    op->poll_events = POLLIN;
+    return ring_submit_op(self, op);
+}
+
+/* Queue a request using the caller's buffer. */
+static PyObject *
+ring_buffer_op(RingObject *self, PyObject *key, uint8_t opcode, int fd,
+               Py_buffer *buffer, uint64_t off, uint32_t msg_flags,
+               int writing)
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (ring_check_buffer_len(buffer->len) < 0) {
+        return NULL;
+    }
+    uring_op *op = ring_new_op(self, key, opcode, fd);
+    if (op == NULL) {
+        return NULL;
+    }
+    /* Take over the buffer: it stays pinned until the completion. */
+    op->view = *buffer;
+    memset(buffer, 0, sizeof(*buffer));
+    op->flags |= OP_HAS_VIEW;
+    op->sqe.addr = (uint64_t)(uintptr_t)op->view.buf;
+    op->sqe.len = (uint32_t)op->view.len;
+    op->sqe.off = off;
+    op->sqe.msg_flags = msg_flags;
+    if (writing) {
+        op->flags |= OP_WRITE_ALL;
+        op->poll_events = POLLOUT;
+    }
+    else {
+        op->poll_events = POLLIN;
+    }
+    return ring_submit_op(self, op);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.recv
+
+    key: object
+    fd: fildes
+    nbytes: Py_ssize_t
+    flags: int = 0
+    /
+
+Queue the reception of up to nbytes bytes from the socket fd.
+
+Return the token of the operation.  On completion, the received data
+is reported as a bytes object.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, PyObject *key, int fd,
+                      Py_ssize_t nbytes, int flags)
+/*[clinic end generated code: output=7f9e4f473ba7ae46 input=700968d5c64ca894]*/
+{
+    return ring_read_op(self, key, IORING_OP_RECV, fd, nbytes, 0,
+                        (uint32_t)flags);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.recv_into
+
+    key: object
+    fd: fildes
+    buffer: Py_buffer(accept={rwbuffer})
+    flags: int = 0
+    /
+
+Queue the reception of data from the socket fd into buffer.
+
+Return the token of the operation.  The buffer must not be used until
+the operation is completed.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_recv_into_impl(RingObject *self, PyObject *key, int fd,
+                           Py_buffer *buffer, int flags)
+/*[clinic end generated code: output=e9e94316f805e9de input=613c9535ab3f4edb]*/
+{
+    return ring_buffer_op(self, key, IORING_OP_RECV, fd, buffer, 0,
+                          (uint32_t)flags, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.send
+
+    key: object
+    fd: fildes
+    buffer: Py_buffer
+    flags: int = 0
+    /
+
+Queue sending the whole content of buffer to the socket fd.
+
+Return the token of the operation.  On completion, the number of bytes
+sent is reported.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, PyObject *key, int fd,
+                      Py_buffer *buffer, int flags)
+/*[clinic end generated code: output=333575eb7c775560 input=a6102341c4f9fe50]*/
+{
+    return ring_buffer_op(self, key, IORING_OP_SEND, fd, buffer, 0,
+                          (uint32_t)flags, 1);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.read
+
+    key: object
+    fd: fildes
+    nbytes: Py_ssize_t
+    offset: long_long = -1
+    /
+
+Queue reading up to nbytes bytes from the file descriptor fd.
+
+Read at the current file position if offset is -1.  Return the token
+of the operation.  On completion, the data is reported as a bytes
+object.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, PyObject *key, int fd,
+                      Py_ssize_t nbytes, long long offset)
+/*[clinic end generated code: output=f9d26f77048d2c58 input=13937c7955dc4a11]*/
+{
+    return ring_read_op(self, key, IORING_OP_READ, fd, nbytes,
+                        (uint64_t)offset, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.readinto
+
+    key: object
+    fd: fildes
+    buffer: Py_buffer(accept={rwbuffer})
+    offset: long_long = -1
+    /
+
+Queue reading from the file descriptor fd into buffer.
+
+Read at the current file position if offset is -1.  Return the token
+of the operation.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_readinto_impl(RingObject *self, PyObject *key, int fd,
+                          Py_buffer *buffer, long long offset)
+/*[clinic end generated code: output=edb2163d2fa868b0 input=95292eeeda22ceab]*/
+{
+    return ring_buffer_op(self, key, IORING_OP_READ, fd, buffer,
+                          (uint64_t)offset, 0, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.write
+
+    key: object
+    fd: fildes
+    buffer: Py_buffer
+    offset: long_long = -1
+    /
+
+Queue writing the whole content of buffer to the file descriptor fd.
+
+Write at the current file position if offset is -1.  Return the token
+of the operation.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, PyObject *key, int fd,
+                       Py_buffer *buffer, long long offset)
+/*[clinic end generated code: output=9e9ce6809beeb7a5 input=86cc7f77a5cb49ff]*/
+{
+    return ring_buffer_op(self, key, IORING_OP_WRITE, fd, buffer,
+                          (uint64_t)offset, 0, 1);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.accept
+
+    key: object
+    fd: fildes
+    flags: int = 0
+    /
+
+Queue accepting a connection on the listening socket fd.
+
+flags are passed to accept4(), for example SOCK_NONBLOCK | SOCK_CLOEXEC.
+Return the token of the operation.  On completion, the file descriptor
+of the new connection is reported.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, PyObject *key, int fd, int flags)
+/*[clinic end generated code: output=4e11dc687d8b862b input=d1eaaef4828dcc27]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    uring_op *op = ring_new_op(self, key, IORING_OP_ACCEPT, fd);
+    if (op == NULL) {
+        return NULL;
+    }
+    op->sqe.accept_flags = (uint32_t)flags;
+    op->poll_events = POLLIN;
+    return ring_submit_op(self, op);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.poll
+
+    key: object
+    fd: fildes
+    events: unsigned_int(bitwise=True)
+    /
+
+Queue waiting until the file descriptor fd is ready for events.
+
+Return the token of the operation.  On completion, the mask of ready
+events is reported.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, PyObject *key, int fd,
+                      unsigned int events)
+/*[clinic end generated code: output=96169bf88a62b325 input=cfc813a612ef9897]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    uring_op *op = ring_new_op(self, key, IORING_OP_POLL_ADD, fd);
+    if (op == NULL) {
+        return NULL;
+    }
+    op->sqe.poll32_events = poll_mask(events);
+    return ring_submit_op(self, op);
+}
+
+static PyObject *
+ring_fixed_op(RingObject *self, PyObject *key, uint8_t opcode, int fd,
+              Py_ssize_t index, Py_ssize_t nbytes, long long offset,
+              int writing)
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (index < 0 || index >= self->nfixed) {
+        PyErr_SetString(PyExc_IndexError,
+                        "registered buffer index out of range");
+        return NULL;
+    }
+    Py_buffer *buffer = &self->fixed[index];
+    if (nbytes < 0) {
+        nbytes = buffer->len;
+    }
+    if (nbytes > buffer->len) {
+        PyErr_SetString(PyExc_ValueError,
+                        "nbytes is larger than the registered buffer");
+        return NULL;
+    }
+    uring_op *op = ring_new_op(self, key, opcode, fd);
+    if (op == NULL) {
+        return NULL;
+    }
+    op->flags |= OP_FIXED;
+    op->sqe.addr = (uint64_t)(uintptr_t)buffer->buf;
+    op->sqe.len = (uint32_t)nbytes;
+    op->sqe.off = (uint64_t)offset;
+    op->sqe.buf_index = (uint16_t)index;
+    if (writing) {
+        op->flags |= OP_WRITE_ALL;
+        op->poll_events = POLLOUT;
+    }
+    else {
+        op->poll_events = POLLIN;
+    }
+    return ring_submit_op(self, op);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.read_fixed
+
+    key: object
+    fd: fildes
+    index: Py_ssize_t
+    nbytes: Py_ssize_t = -1
+    offset: long_long = -1
+    /
+
+Queue reading from fd into the registered buffer at index.
+
+Read up to nbytes bytes, or the size of the buffer if nbytes is -1.
+Return the token of the operation.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_read_fixed_impl(RingObject *self, PyObject *key, int fd,
+                            Py_ssize_t index, Py_ssize_t nbytes,
+                            long long offset)
+/*[clinic end generated code: output=1dc49efa9d9088b7 input=ee682b3808ed8d99]*/
+{
+    return ring_fixed_op(self, key, IORING_OP_READ_FIXED, fd, index, nbytes,
+                         offset, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.write_fixed
+
+    key: object
+    fd: fildes
+    index: Py_ssize_t
+    nbytes: Py_ssize_t
+    offset: long_long = -1
+    /
+
+Queue writing nbytes bytes of the registered buffer at index to fd.
+
+Return the token of the operation.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_write_fixed_impl(RingObject *self, PyObject *key, int fd,
+                             Py_ssize_t index, Py_ssize_t nbytes,
+                             long long offset)
+/*[clinic end generated code: output=96cdfdeafadd5a62 input=65f9c5eca7644439]*/
+{
+    if (nbytes < 0) {
+        PyErr_SetString(PyExc_ValueError, "nbytes must not be negative");
+        return NULL;
+    }
+    return ring_fixed_op(self, key, IORING_OP_WRITE_FIXED, fd, index, nbytes,
+                         offset, 1);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.register_buffers
+
+    buffers: object
+    /
+
+Register writable buffers with the kernel.
+
+Registered buffers are pinned in memory once instead of for each
+operation; use them with read_fixed() and write_fixed().
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_register_buffers_impl(RingObject *self, PyObject *buffers)
+/*[clinic end generated code: output=94d6044b7fa20302 input=22d9b132563ba26c]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (self->nfixed > 0) {
+        PyErr_SetString(PyExc_RuntimeError, "buffers are already registered");
+        return NULL;
+    }
+    PyObject *seq = PySequence_Fast(buffers, "buffers must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    if (n == 0 || n > UINT16_MAX) {
+        Py_DECREF(seq);
+        PyErr_SetString(PyExc_ValueError, "invalid number of buffers");
+        return NULL;
+    }
+
+    Py_buffer *views = PyMem_Calloc(n, sizeof(Py_buffer));
+    struct iovec *iov = PyMem_Calloc(n, sizeof(struct iovec));
+    Py_ssize_t i = 0;
+    if (views == NULL || iov == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    for (; i < n; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        if (PyObject_GetBuffer(item, &views[i], PyBUF_WRITABLE) < 0) {
+            goto error;
+        }
+        iov[i].iov_base = views[i].buf;
+        iov[i].iov_len = (size_t)views[i].len;
+    }
+    if (syscall(__NR_io_uring_register, self->fd, IORING_REGISTER_BUFFERS,
+                iov, (unsigned int)n) < 0)
+    {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+
+    PyMem_Free(iov);
+    Py_DECREF(seq);
+    self->fixed = views;
+    self->nfixed = n;
+    Py_RETURN_NONE;
+
+error:
+    while (--i >= 0) {
+        PyBuffer_Release(&views[i]);
+    }
+    PyMem_Free(views);
+    PyMem_Free(iov);
+    Py_DECREF(seq);
+    return NULL;
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.unregister_buffers
+
+Unregister the buffers registered by register_buffers().
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_unregister_buffers_impl(RingObject *self)
+/*[clinic end generated code: output=bb473a8e0d139f9e input=c59e3d2b9f061d36]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (self->nfixed == 0) {
+        Py_RETURN_NONE;
+    }
+    if (self->fixed_inflight > 0) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "registered buffers are in use");
+        return NULL;
+    }
+    if (syscall(__NR_io_uring_register, self->fd, IORING_UNREGISTER_BUFFERS,
+                NULL, 0) < 0)
+    {
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+    ring_release_fixed(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.cancel
+
+    token: unsigned_long_long(bitwise=False)
+    /
+
+Request the cancellation of an operation.
+
+The cancelled operation is still reported by wait(), usually with
+-ECANCELED as result.  Unknown or finished tokens are ignored.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long token)
+/*[clinic end generated code: output=9d4dbdbca6cfce87 input=892d96e4d0fd00c3]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    uring_op *op = _Py_hashtable_get(self->ops, TOKEN_KEY(token));
+    if (op == NULL || (op->flags & OP_CANCELLED)) {
+        Py_RETURN_NONE;
+    }
+    if (ring_cancel_op(self, op) < 0) {
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.wait
+
+    timeout as timeout_obj: object = None
+
+Submit the queued operations and wait for completions.
+
+Wait at most timeout seconds for at least one operation to complete,
+or forever if timeout is None.  Return a list of (key, result, data)
+tuples.  result is the result of the system call, a negative errno
+value on failure.  data is the bytes object read by recv() and read(),
+or None.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout_obj)
+/*[clinic end generated code: output=480a97563d86ffbc input=178414cb3ca61d72]*/
+{
+    PyTime_t timeout = -1, deadline = 0;
+    struct __kernel_timespec ts;
+    struct io_uring_getevents_arg arg;
+
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            return NULL;
+        }
+        if (timeout < 0) {
+            timeout = 0;
+        }
+        deadline = _PyDeadline_Init(timeout);
+    }
+
+    PyObject *results = PyList_New(0);
+    if (results == NULL) {
+        return NULL;
+    }
+
+    while (1) {
+        unsigned int min_complete = 1;
+        unsigned int flags = IORING_ENTER_GETEVENTS;
+        struct io_uring_getevents_arg *parg = NULL;
+        int ret;
+
+        if (timeout == 0) {
+            min_complete = 0;
+        }
+        else if (timeout > 0) {
+            struct timespec t;
+            _PyTime_AsTimespec_clamp(timeout, &t);
+            ts.tv_sec = t.tv_sec;
+            ts.tv_nsec = t.tv_nsec;
+            memset(&arg, 0, sizeof(arg));
+            arg.ts = (uint64_t)(uintptr_t)&ts;
+            parg = &arg;
+        }
+        /* Don't block if completions are already available */
+        if (*self->cq_head != _Py_atomic_load_uint32_acquire(self->cq_tail)) {
+            min_complete = 0;
+            parg = NULL;
+        }
+
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->fd, self->sq_pending, min_complete,
+                                 flags, parg);
+        Py_END_ALLOW_THREADS
+
+        if (ret >= 0) {
+            self->sq_pending -= (uint32_t)ret;
+        }
+        else if (errno == EINTR) {
+            /* io_uring_enter() was interrupted by a signal */
+            if (PyErr_CheckSignals()) {
+                goto error;
+            }
+        }
+        else if (errno != ETIME && errno != EAGAIN && errno != EBUSY) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            goto error;
+        }
+
+        Py_ssize_t n = ring_reap(self, results);
+        if (n < 0) {
+            goto error;
+        }
+        if (n > 0 || timeout == 0) {
+            break;
+        }
+        /* Only resubmissions were reaped, or the wait was interrupted */
+        if (timeout > 0) {
+            timeout = _PyDeadline_Get(deadline);
+            if (timeout <= 0) {
+                break;
+            }
+        }
+    }
+    return results;
+
+error:
+    Py_DECREF(results);
+    return NULL;
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.fileno
+
+Return the file descriptor of the ring.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self)
+/*[clinic end generated code: output=773263c5ad53ca3d input=ececdb4cb6c95cce]*/
+{
+    if (self->fd < 0) {
+        return ring_err_closed();
+    }
+    return PyLong_FromLong(self->fd);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.close
+
+Cancel the pending operations and close the ring.
+
+Block until the kernel reports that all operations are finished.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self)
+/*[clinic end generated code: output=447415269da3419f input=b5a1f069cf96af88]*/
+{
+    ring_close(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+ring_get_closed(RingObject *self, void *Py_UNUSED(ignored))
+{
+    return PyBool_FromLong(self->fd < 0);
+}
+
+#include "clinic/_uringmodule.c.h"
+
+static PyMethodDef ring_methods[] = {
+    _URING_RING_ACCEPT_METHODDEF
+    _URING_RING_CANCEL_METHODDEF
+    _URING_RING_CLOSE_METHODDEF
+    _URING_RING_FILENO_METHODDEF
+    _URING_RING_POLL_METHODDEF
+    _URING_RING_READ_METHODDEF
+    _URING_RING_READ_FIXED_METHODDEF
+    _URING_RING_READINTO_METHODDEF
+    _URING_RING_RECV_METHODDEF
+    _URING_RING_RECV_INTO_METHODDEF
+    _URING_RING_REGISTER_BUFFERS_METHODDEF
+    _URING_RING_SEND_METHODDEF
+    _URING_RING_UNREGISTER_BUFFERS_METHODDEF
+    _URING_RING_WAIT_METHODDEF
+    _URING_RING_WRITE_METHODDEF
+    _URING_RING_WRITE_FIXED_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef ring_getsets[] = {
+    {"closed", (getter)ring_get_closed, NULL,
+     PyDoc_STR("True if the ring is closed.")},
+    {NULL},
+};
+
+static PyMemberDef ring_members[] = {
+    {"__weaklistoffset__", Py_T_PYSSIZET, offsetof(RingObject, weakreflist),
+     Py_READONLY},
+    {NULL},
+};
+
+static PyType_Slot ring_slots[] = {
+    {Py_tp_dealloc, ring_dealloc},
+    {Py_tp_doc, (void *)_uring_Ring__doc__},
+    {Py_tp_traverse, ring_traverse},
+    {Py_tp_clear, ring_clear},
+    {Py_tp_methods, ring_methods},
+    {Py_tp_getset, ring_getsets},
+    {Py_tp_members, ring_members},
+    {Py_tp_new, _uring_Ring},
+    {0, NULL},
+};
+
+static PyType_Spec ring_spec = {
+    .name = "_uring.Ring",
+    .basicsize = sizeof(RingObject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = ring_slots,
+};
+
+
+static int
+uring_exec(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+
+    state->RingType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &ring_spec, NULL);
+    if (state->RingType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->RingType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+uring_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    uring_state *state = get_uring_state(module);
+    Py_VISIT(state->RingType);
+    return 0;
+}
+
+static int
+uring_clear(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+    Py_CLEAR(state->RingType);
+    return 0;
+}
+
+static void
+uring_free(void *module)
+{
+    (void)uring_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot uring_slots[] = {
+    {Py_mod_exec, uring_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL}
+};
+
+PyDoc_STRVAR(uring_doc,
+"Linux io_uring interface for asyncio.\n\
+This module is an implementation detail, please do not use it directly.");
+
+static struct PyModuleDef uringmodule = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "_uring",
+    .m_doc = uring_doc,
+    .m_size = sizeof(uring_state),
+    .m_slots = uring_slots,
+    .m_traverse = uring_traverse,
+    .m_clear = uring_clear,
+    .m_free = uring_free,
+};
+
+PyMODINIT_FUNC
+PyInit__uring(void)
+{
+    return PyModuleDef_Init(&uringmodule);
+}
@@ -563,6 +563,721 @@ deque___reversed__(dequeobject *deque, PyObject *Py_UNUSED(ignored))
     return deque___reversed___impl(deque);
 }
 
+PyDoc_STRVAR(sortedlist_init__doc__,
+"SortedList(iterable=(), key=None)\n"
+"--\n"
+"\n"
+"List which keeps its values sorted.\n"
+"\n"
+"The values are ordered by key(value) if key is not None, and values\n"
+"with equal keys are kept in insertion order.  Adding, removing and\n"
+"locating values take logarithmic time on average.");
+
+static int
+sortedlist_init_impl(sortedlistobject *self, PyObject *iterable,
+                     PyObject *key);
+
+static int
+sortedlist_init(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(iterable), &_Py_ID(key), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"iterable", "key", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "SortedList",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    PyObject *iterable = NULL;
+    PyObject *key = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 2, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (fastargs[0]) {
+        iterable = fastargs[0];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    key = fastargs[1];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_init_impl((sortedlistobject *)self, iterable, key);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_add__doc__,
+"add($self, value, /)\n"
+"--\n"
+"\n"
+"Add value to the list, after the values with the same key.");
+
+#define SORTEDLIST_ADD_METHODDEF    \
+    {"add", (PyCFunction)sortedlist_add, METH_O, sortedlist_add__doc__},
+
+static PyObject *
+sortedlist_add_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_add(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_add_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_update__doc__,
+"update($self, iterable, /)\n"
+"--\n"
+"\n"
+"Add the values of iterable to the list.");
+
+#define SORTEDLIST_UPDATE_METHODDEF    \
+    {"update", (PyCFunction)sortedlist_update, METH_O, sortedlist_update__doc__},
+
+static PyObject *
+sortedlist_update_impl(sortedlistobject *self, PyObject *iterable);
+
+static PyObject *
+sortedlist_update(sortedlistobject *self, PyObject *iterable)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_update_impl(self, iterable);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_remove__doc__,
+"remove($self, value, /)\n"
+"--\n"
+"\n"
+"Remove a value equal to value.\n"
+"\n"
+"Raise ValueError if the value is not present.");
+
+#define SORTEDLIST_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)sortedlist_remove, METH_O, sortedlist_remove__doc__},
+
+static PyObject *
+sortedlist_remove_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_remove(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_remove_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_discard__doc__,
+"discard($self, value, /)\n"
+"--\n"
+"\n"
+"Remove a value equal to value if it is present.");
+
+#define SORTEDLIST_DISCARD_METHODDEF    \
+    {"discard", (PyCFunction)sortedlist_discard, METH_O, sortedlist_discard__doc__},
+
+static PyObject *
+sortedlist_discard_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_discard(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_discard_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_pop__doc__,
+"pop($self, index=-1, /)\n"
+"--\n"
+"\n"
+"Remove and return the value at index (default last).\n"
+"\n"
+"Raise IndexError if the list is empty or index is out of range.");
+
+#define SORTEDLIST_POP_METHODDEF    \
+    {"pop", _PyCFunction_CAST(sortedlist_pop), METH_FASTCALL, sortedlist_pop__doc__},
+
+static PyObject *
+sortedlist_pop_impl(sortedlistobject *self, Py_ssize_t index);
+
+static PyObject *
+sortedlist_pop(sortedlistobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    Py_ssize_t index = -1;
+
+    if (!_PyArg_CheckPositional("pop", nargs, 0, 1)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        index = ival;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_pop_impl(self, index);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_clear__doc__,
+"clear($self, /)\n"
+"--\n"
+"\n"
+"Remove all values from the list.");
+
+#define SORTEDLIST_CLEAR_METHODDEF    \
+    {"clear", (PyCFunction)sortedlist_clear, METH_NOARGS, sortedlist_clear__doc__},
+
+static PyObject *
+sortedlist_clear_impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist_clear(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_clear_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_index__doc__,
+"index($self, value, start=0, stop=sys.maxsize, /)\n"
+"--\n"
+"\n"
+"Return the first index of a value equal to value.\n"
+"\n"
+"Raise ValueError if the value is not present.");
+
+#define SORTEDLIST_INDEX_METHODDEF    \
+    {"index", _PyCFunction_CAST(sortedlist_index), METH_FASTCALL, sortedlist_index__doc__},
+
+static PyObject *
+sortedlist_index_impl(sortedlistobject *self, PyObject *value,
+                      Py_ssize_t start, Py_ssize_t stop);
+
+static PyObject *
+sortedlist_index(sortedlistobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *value;
+    Py_ssize_t start = 0;
+    Py_ssize_t stop = PY_SSIZE_T_MAX;
+
+    if (!_PyArg_CheckPositional("index", nargs, 1, 3)) {
+        goto exit;
+    }
+    value = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    if (!_PyEval_SliceIndexNotNone(args[1], &start)) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    if (!_PyEval_SliceIndexNotNone(args[2], &stop)) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_index_impl(self, value, start, stop);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_count__doc__,
+"count($self, value, /)\n"
+"--\n"
+"\n"
+"Return the number of values equal to value.");
+
+#define SORTEDLIST_COUNT_METHODDEF    \
+    {"count", (PyCFunction)sortedlist_count, METH_O, sortedlist_count__doc__},
+
+static PyObject *
+sortedlist_count_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_count(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_count_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_key_left__doc__,
+"bisect_key_left($self, key, /)\n"
+"--\n"
+"\n"
+"Return the index of the first value whose key is not less than key.\n"
+"\n"
+"The index where a value with this key would be inserted before the\n"
+"values with the same key.");
+
+#define SORTEDLIST_BISECT_KEY_LEFT_METHODDEF    \
+    {"bisect_key_left", (PyCFunction)sortedlist_bisect_key_left, METH_O, sortedlist_bisect_key_left__doc__},
+
+static PyObject *
+sortedlist_bisect_key_left_impl(sortedlistobject *self, PyObject *key);
+
+static PyObject *
+sortedlist_bisect_key_left(sortedlistobject *self, PyObject *key)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_key_left_impl(self, key);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_key_right__doc__,
+"bisect_key_right($self, key, /)\n"
+"--\n"
+"\n"
+"Return the index of the first value whose key is greater than key.\n"
+"\n"
+"The index where a value with this key would be inserted after the\n"
+"values with the same key.");
+
+#define SORTEDLIST_BISECT_KEY_RIGHT_METHODDEF    \
+    {"bisect_key_right", (PyCFunction)sortedlist_bisect_key_right, METH_O, sortedlist_bisect_key_right__doc__},
+
+static PyObject *
+sortedlist_bisect_key_right_impl(sortedlistobject *self, PyObject *key);
+
+static PyObject *
+sortedlist_bisect_key_right(sortedlistobject *self, PyObject *key)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_key_right_impl(self, key);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_left__doc__,
+"bisect_left($self, value, /)\n"
+"--\n"
+"\n"
+"Like bisect_key_left(), but take a value rather than a key.");
+
+#define SORTEDLIST_BISECT_LEFT_METHODDEF    \
+    {"bisect_left", (PyCFunction)sortedlist_bisect_left, METH_O, sortedlist_bisect_left__doc__},
+
+static PyObject *
+sortedlist_bisect_left_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_bisect_left(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_left_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_bisect_right__doc__,
+"bisect_right($self, value, /)\n"
+"--\n"
+"\n"
+"Like bisect_key_right(), but take a value rather than a key.");
+
+#define SORTEDLIST_BISECT_RIGHT_METHODDEF    \
+    {"bisect_right", (PyCFunction)sortedlist_bisect_right, METH_O, sortedlist_bisect_right__doc__},
+
+static PyObject *
+sortedlist_bisect_right_impl(sortedlistobject *self, PyObject *value);
+
+static PyObject *
+sortedlist_bisect_right(sortedlistobject *self, PyObject *value)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_bisect_right_impl(self, value);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_irange__doc__,
+"irange($self, /, minimum=None, maximum=None, inclusive=(True, True),\n"
+"       reverse=False)\n"
+"--\n"
+"\n"
+"Return an iterator over the values between minimum and maximum.\n"
+"\n"
+"The bounds are values, compared by their keys.  None means no bound.\n"
+"inclusive is a pair of booleans telling whether the values equal to\n"
+"minimum and maximum are included.  If reverse is true, iterate in\n"
+"descending order.");
+
+#define SORTEDLIST_IRANGE_METHODDEF    \
+    {"irange", _PyCFunction_CAST(sortedlist_irange), METH_FASTCALL|METH_KEYWORDS, sortedlist_irange__doc__},
+
+static PyObject *
+sortedlist_irange_impl(sortedlistobject *self, PyObject *minimum,
+                       PyObject *maximum, PyObject *inclusive, int reverse);
+
+static PyObject *
+sortedlist_irange(sortedlistobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(minimum), &_Py_ID(maximum), &_Py_ID(inclusive), &_Py_ID(reverse), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"minimum", "maximum", "inclusive", "reverse", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "irange",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *minimum = Py_None;
+    PyObject *maximum = Py_None;
+    PyObject *inclusive = NULL;
+    int reverse = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        minimum = args[0];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[1]) {
+        maximum = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        inclusive = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    reverse = PyObject_IsTrue(args[3]);
+    if (reverse < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_irange_impl(self, minimum, maximum, inclusive, reverse);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_irange_key__doc__,
+"irange_key($self, /, min_key=None, max_key=None,\n"
+"           inclusive=(True, True), reverse=False)\n"
+"--\n"
+"\n"
+"Like irange(), but the bounds are keys rather than values.");
+
+#define SORTEDLIST_IRANGE_KEY_METHODDEF    \
+    {"irange_key", _PyCFunction_CAST(sortedlist_irange_key), METH_FASTCALL|METH_KEYWORDS, sortedlist_irange_key__doc__},
+
+static PyObject *
+sortedlist_irange_key_impl(sortedlistobject *self, PyObject *min_key,
+                           PyObject *max_key, PyObject *inclusive,
+                           int reverse);
+
+static PyObject *
+sortedlist_irange_key(sortedlistobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(min_key), &_Py_ID(max_key), &_Py_ID(inclusive), &_Py_ID(reverse), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"min_key", "max_key", "inclusive", "reverse", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "irange_key",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *min_key = Py_None;
+    PyObject *max_key = Py_None;
+    PyObject *inclusive = NULL;
+    int reverse = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 4, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        min_key = args[0];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[1]) {
+        max_key = args[1];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[2]) {
+        inclusive = args[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    reverse = PyObject_IsTrue(args[3]);
+    if (reverse < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_irange_key_impl(self, min_key, max_key, inclusive, reverse);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist_copy__doc__,
+"copy($self, /)\n"
+"--\n"
+"\n"
+"Return a shallow copy of the list.");
+
+#define SORTEDLIST_COPY_METHODDEF    \
+    {"copy", (PyCFunction)sortedlist_copy, METH_NOARGS, sortedlist_copy__doc__},
+
+static PyObject *
+sortedlist_copy_impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist_copy(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist_copy_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist___copy____doc__,
+"__copy__($self, /)\n"
+"--\n"
+"\n"
+"Return a shallow copy of the list.");
+
+#define SORTEDLIST___COPY___METHODDEF    \
+    {"__copy__", (PyCFunction)sortedlist___copy__, METH_NOARGS, sortedlist___copy____doc__},
+
+static PyObject *
+sortedlist___copy___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___copy__(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist___copy___impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist___reduce____doc__,
+"__reduce__($self, /)\n"
+"--\n"
+"\n"
+"Return state information for pickling.");
+
+#define SORTEDLIST___REDUCE___METHODDEF    \
+    {"__reduce__", (PyCFunction)sortedlist___reduce__, METH_NOARGS, sortedlist___reduce____doc__},
+
+static PyObject *
+sortedlist___reduce___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___reduce__(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return sortedlist___reduce___impl(self);
+}
+
+PyDoc_STRVAR(sortedlist___reversed____doc__,
+"__reversed__($self, /)\n"
+"--\n"
+"\n"
+"Return a reverse iterator over the list.");
+
+#define SORTEDLIST___REVERSED___METHODDEF    \
+    {"__reversed__", (PyCFunction)sortedlist___reversed__, METH_NOARGS, sortedlist___reversed____doc__},
+
+static PyObject *
+sortedlist___reversed___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___reversed__(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist___reversed___impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(sortedlist___sizeof____doc__,
+"__sizeof__($self, /)\n"
+"--\n"
+"\n"
+"Return the size of the list in memory, in bytes.");
+
+#define SORTEDLIST___SIZEOF___METHODDEF    \
+    {"__sizeof__", (PyCFunction)sortedlist___sizeof__, METH_NOARGS, sortedlist___sizeof____doc__},
+
+static PyObject *
+sortedlist___sizeof___impl(sortedlistobject *self);
+
+static PyObject *
+sortedlist___sizeof__(sortedlistobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = sortedlist___sizeof___impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
 PyDoc_STRVAR(_collections__count_elements__doc__,
 "_count_elements($module, mapping, iterable, /)\n"
 "--\n"
@@ -630,4 +1345,4 @@ tuplegetter_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=65f896fb13902f6d input=a9049054013a1b77]*/
+/*[clinic end generated code: output=adae93819f22d397 input=a9049054013a1b77]*/
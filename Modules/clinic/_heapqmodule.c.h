@@ -2,6 +2,7 @@
 preserve
 [clinic start generated code]*/
 
+#include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_modsupport.h"    // _PyArg_CheckPositional()
 
 PyDoc_STRVAR(_heapq_heappush__doc__,
@@ -267,4 +268,175 @@ _heapq__heapify_max(PyObject *module, PyObject *arg)
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=05f2afdf3bc54c9d input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(indexedheap_new__doc__,
+"IndexedHeap()\n"
+"--\n"
+"\n"
+"Min-heap of values ordered by priority.\n"
+"\n"
+"push() returns a handle which can be passed to update() to change the\n"
+"priority of the value, or to remove() to remove it from the heap, in\n"
+"O(log n) time.");
+
+static PyObject *
+indexedheap_new_impl(PyTypeObject *type);
+
+static PyObject *
+indexedheap_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    PyTypeObject *base_tp = get_heapq_state_by_type(type)->IndexedHeapType;
+
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoPositional("IndexedHeap", args)) {
+        goto exit;
+    }
+    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
+        !_PyArg_NoKeywords("IndexedHeap", kwargs)) {
+        goto exit;
+    }
+    return_value = indexedheap_new_impl(type);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_push__doc__,
+"push($self, priority, value, /)\n"
+"--\n"
+"\n"
+"Push value with the given priority and return its handle.");
+
+#define _HEAPQ_INDEXEDHEAP_PUSH_METHODDEF    \
+    {"push", _PyCFunction_CAST(_heapq_IndexedHeap_push), METH_FASTCALL, _heapq_IndexedHeap_push__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_push_impl(indexedheapobject *self, PyObject *priority,
+                             PyObject *value);
+
+static PyObject *
+_heapq_IndexedHeap_push(indexedheapobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *priority;
+    PyObject *value;
+
+    if (!_PyArg_CheckPositional("push", nargs, 2, 2)) {
+        goto exit;
+    }
+    priority = args[0];
+    value = args[1];
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_push_impl(self, priority, value);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_pop__doc__,
+"pop($self, /)\n"
+"--\n"
+"\n"
+"Remove and return the (priority, value) pair with the lowest priority.");
+
+#define _HEAPQ_INDEXEDHEAP_POP_METHODDEF    \
+    {"pop", (PyCFunction)_heapq_IndexedHeap_pop, METH_NOARGS, _heapq_IndexedHeap_pop__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_pop_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_pop(indexedheapobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_pop_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_peek__doc__,
+"peek($self, /)\n"
+"--\n"
+"\n"
+"Return the (priority, value) pair with the lowest priority.");
+
+#define _HEAPQ_INDEXEDHEAP_PEEK_METHODDEF    \
+    {"peek", (PyCFunction)_heapq_IndexedHeap_peek, METH_NOARGS, _heapq_IndexedHeap_peek__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_peek_impl(indexedheapobject *self);
+
+static PyObject *
+_heapq_IndexedHeap_peek(indexedheapobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_peek_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_update__doc__,
+"update($self, handle, priority, /)\n"
+"--\n"
+"\n"
+"Change the priority of the value of handle.");
+
+#define _HEAPQ_INDEXEDHEAP_UPDATE_METHODDEF    \
+    {"update", _PyCFunction_CAST(_heapq_IndexedHeap_update), METH_FASTCALL, _heapq_IndexedHeap_update__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_update_impl(indexedheapobject *self, PyObject *handle,
+                               PyObject *priority);
+
+static PyObject *
+_heapq_IndexedHeap_update(indexedheapobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *handle;
+    PyObject *priority;
+
+    if (!_PyArg_CheckPositional("update", nargs, 2, 2)) {
+        goto exit;
+    }
+    handle = args[0];
+    priority = args[1];
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_update_impl(self, handle, priority);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_IndexedHeap_remove__doc__,
+"remove($self, handle, /)\n"
+"--\n"
+"\n"
+"Remove the value of handle from the heap.");
+
+#define _HEAPQ_INDEXEDHEAP_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)_heapq_IndexedHeap_remove, METH_O, _heapq_IndexedHeap_remove__doc__},
+
+static PyObject *
+_heapq_IndexedHeap_remove_impl(indexedheapobject *self, PyObject *handle);
+
+static PyObject *
+_heapq_IndexedHeap_remove(indexedheapobject *self, PyObject *handle)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_IndexedHeap_remove_impl(self, handle);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=1ffca5eed837c496 input=a9049054013a1b77]*/
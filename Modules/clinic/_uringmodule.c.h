@@ -0,0 +1,877 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_abstract.h"      // _PyNumber_Index()
+#include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
+#include "pycore_long.h"          // _PyLong_UnsignedInt_Converter()
+#include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+
+PyDoc_STRVAR(_uring_Ring__doc__,
+"Ring(entries=256)\n"
+"--\n"
+"\n"
+"io_uring instance.\n"
+"\n"
+"*entries* is the size of the submission queue.  It is rounded up to a\n"
+"power of two and clamped to the maximum supported by the kernel.");
+
+static PyObject *
+_uring_Ring_impl(PyTypeObject *type, unsigned int entries);
+
+static PyObject *
+_uring_Ring(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(entries), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "Ring",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    unsigned int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (!_PyLong_UnsignedInt_Converter(fastargs[0], &entries)) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = _uring_Ring_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_recv__doc__,
+"recv($self, key, fd, nbytes, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue the reception of up to nbytes bytes from the socket fd.\n"
+"\n"
+"Return the token of the operation.  On completion, the received data\n"
+"is reported as a bytes object.");
+
+#define _URING_RING_RECV_METHODDEF    \
+    {"recv", _PyCFunction_CAST(_uring_Ring_recv), METH_FASTCALL, _uring_Ring_recv__doc__},
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, PyObject *key, int fd,
+                      Py_ssize_t nbytes, int flags);
+
+static PyObject *
+_uring_Ring_recv(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_ssize_t nbytes;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[2]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        nbytes = ival;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_recv_impl(self, key, fd, nbytes, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_recv_into__doc__,
+"recv_into($self, key, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue the reception of data from the socket fd into buffer.\n"
+"\n"
+"Return the token of the operation.  The buffer must not be used until\n"
+"the operation is completed.");
+
+#define _URING_RING_RECV_INTO_METHODDEF    \
+    {"recv_into", _PyCFunction_CAST(_uring_Ring_recv_into), METH_FASTCALL, _uring_Ring_recv_into__doc__},
+
+static PyObject *
+_uring_Ring_recv_into_impl(RingObject *self, PyObject *key, int fd,
+                           Py_buffer *buffer, int flags);
+
+static PyObject *
+_uring_Ring_recv_into(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv_into", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[2], &buffer, PyBUF_WRITABLE) < 0) {
+        _PyArg_BadArgument("recv_into", "argument 3", "read-write bytes-like object", args[2]);
+        goto exit;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_recv_into_impl(self, key, fd, &buffer, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_send__doc__,
+"send($self, key, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue sending the whole content of buffer to the socket fd.\n"
+"\n"
+"Return the token of the operation.  On completion, the number of bytes\n"
+"sent is reported.");
+
+#define _URING_RING_SEND_METHODDEF    \
+    {"send", _PyCFunction_CAST(_uring_Ring_send), METH_FASTCALL, _uring_Ring_send__doc__},
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, PyObject *key, int fd,
+                      Py_buffer *buffer, int flags);
+
+static PyObject *
+_uring_Ring_send(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("send", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[2], &buffer, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_send_impl(self, key, fd, &buffer, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_read__doc__,
+"read($self, key, fd, nbytes, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue reading up to nbytes bytes from the file descriptor fd.\n"
+"\n"
+"Read at the current file position if offset is -1.  Return the token\n"
+"of the operation.  On completion, the data is reported as a bytes\n"
+"object.");
+
+#define _URING_RING_READ_METHODDEF    \
+    {"read", _PyCFunction_CAST(_uring_Ring_read), METH_FASTCALL, _uring_Ring_read__doc__},
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, PyObject *key, int fd,
+                      Py_ssize_t nbytes, long long offset);
+
+static PyObject *
+_uring_Ring_read(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_ssize_t nbytes;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[2]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        nbytes = ival;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_read_impl(self, key, fd, nbytes, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_readinto__doc__,
+"readinto($self, key, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue reading from the file descriptor fd into buffer.\n"
+"\n"
+"Read at the current file position if offset is -1.  Return the token\n"
+"of the operation.");
+
+#define _URING_RING_READINTO_METHODDEF    \
+    {"readinto", _PyCFunction_CAST(_uring_Ring_readinto), METH_FASTCALL, _uring_Ring_readinto__doc__},
+
+static PyObject *
+_uring_Ring_readinto_impl(RingObject *self, PyObject *key, int fd,
+                          Py_buffer *buffer, long long offset);
+
+static PyObject *
+_uring_Ring_readinto(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("readinto", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[2], &buffer, PyBUF_WRITABLE) < 0) {
+        _PyArg_BadArgument("readinto", "argument 3", "read-write bytes-like object", args[2]);
+        goto exit;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_readinto_impl(self, key, fd, &buffer, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_write__doc__,
+"write($self, key, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue writing the whole content of buffer to the file descriptor fd.\n"
+"\n"
+"Write at the current file position if offset is -1.  Return the token\n"
+"of the operation.");
+
+#define _URING_RING_WRITE_METHODDEF    \
+    {"write", _PyCFunction_CAST(_uring_Ring_write), METH_FASTCALL, _uring_Ring_write__doc__},
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, PyObject *key, int fd,
+                       Py_buffer *buffer, long long offset);
+
+static PyObject *
+_uring_Ring_write(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("write", nargs, 3, 4)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[2], &buffer, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_write_impl(self, key, fd, &buffer, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_accept__doc__,
+"accept($self, key, fd, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue accepting a connection on the listening socket fd.\n"
+"\n"
+"flags are passed to accept4(), for example SOCK_NONBLOCK | SOCK_CLOEXEC.\n"
+"Return the token of the operation.  On completion, the file descriptor\n"
+"of the new connection is reported.");
+
+#define _URING_RING_ACCEPT_METHODDEF    \
+    {"accept", _PyCFunction_CAST(_uring_Ring_accept), METH_FASTCALL, _uring_Ring_accept__doc__},
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, PyObject *key, int fd, int flags);
+
+static PyObject *
+_uring_Ring_accept(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("accept", nargs, 2, 3)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_accept_impl(self, key, fd, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_poll__doc__,
+"poll($self, key, fd, events, /)\n"
+"--\n"
+"\n"
+"Queue waiting until the file descriptor fd is ready for events.\n"
+"\n"
+"Return the token of the operation.  On completion, the mask of ready\n"
+"events is reported.");
+
+#define _URING_RING_POLL_METHODDEF    \
+    {"poll", _PyCFunction_CAST(_uring_Ring_poll), METH_FASTCALL, _uring_Ring_poll__doc__},
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, PyObject *key, int fd,
+                      unsigned int events);
+
+static PyObject *
+_uring_Ring_poll(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    unsigned int events;
+
+    if (!_PyArg_CheckPositional("poll", nargs, 3, 3)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    events = (unsigned int)PyLong_AsUnsignedLongMask(args[2]);
+    if (events == (unsigned int)-1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_poll_impl(self, key, fd, events);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_read_fixed__doc__,
+"read_fixed($self, key, fd, index, nbytes=-1, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue reading from fd into the registered buffer at index.\n"
+"\n"
+"Read up to nbytes bytes, or the size of the buffer if nbytes is -1.\n"
+"Return the token of the operation.");
+
+#define _URING_RING_READ_FIXED_METHODDEF    \
+    {"read_fixed", _PyCFunction_CAST(_uring_Ring_read_fixed), METH_FASTCALL, _uring_Ring_read_fixed__doc__},
+
+static PyObject *
+_uring_Ring_read_fixed_impl(RingObject *self, PyObject *key, int fd,
+                            Py_ssize_t index, Py_ssize_t nbytes,
+                            long long offset);
+
+static PyObject *
+_uring_Ring_read_fixed(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_ssize_t index;
+    Py_ssize_t nbytes = -1;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read_fixed", nargs, 3, 5)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[2]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        index = ival;
+    }
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[3]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        nbytes = ival;
+    }
+    if (nargs < 5) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[4]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_read_fixed_impl(self, key, fd, index, nbytes, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_write_fixed__doc__,
+"write_fixed($self, key, fd, index, nbytes, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue writing nbytes bytes of the registered buffer at index to fd.\n"
+"\n"
+"Return the token of the operation.");
+
+#define _URING_RING_WRITE_FIXED_METHODDEF    \
+    {"write_fixed", _PyCFunction_CAST(_uring_Ring_write_fixed), METH_FASTCALL, _uring_Ring_write_fixed__doc__},
+
+static PyObject *
+_uring_Ring_write_fixed_impl(RingObject *self, PyObject *key, int fd,
+                             Py_ssize_t index, Py_ssize_t nbytes,
+                             long long offset);
+
+static PyObject *
+_uring_Ring_write_fixed(RingObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *key;
+    int fd;
+    Py_ssize_t index;
+    Py_ssize_t nbytes;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("write_fixed", nargs, 4, 5)) {
+        goto exit;
+    }
+    key = args[0];
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[2]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        index = ival;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[3]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        nbytes = ival;
+    }
+    if (nargs < 5) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[4]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_write_fixed_impl(self, key, fd, index, nbytes, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_register_buffers__doc__,
+"register_buffers($self, buffers, /)\n"
+"--\n"
+"\n"
+"Register writable buffers with the kernel.\n"
+"\n"
+"Registered buffers are pinned in memory once instead of for each\n"
+"operation; use them with read_fixed() and write_fixed().");
+
+#define _URING_RING_REGISTER_BUFFERS_METHODDEF    \
+    {"register_buffers", (PyCFunction)_uring_Ring_register_buffers, METH_O, _uring_Ring_register_buffers__doc__},
+
+static PyObject *
+_uring_Ring_register_buffers_impl(RingObject *self, PyObject *buffers);
+
+static PyObject *
+_uring_Ring_register_buffers(RingObject *self, PyObject *buffers)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_register_buffers_impl(self, buffers);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_unregister_buffers__doc__,
+"unregister_buffers($self, /)\n"
+"--\n"
+"\n"
+"Unregister the buffers registered by register_buffers().");
+
+#define _URING_RING_UNREGISTER_BUFFERS_METHODDEF    \
+    {"unregister_buffers", (PyCFunction)_uring_Ring_unregister_buffers, METH_NOARGS, _uring_Ring_unregister_buffers__doc__},
+
+static PyObject *
+_uring_Ring_unregister_buffers_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_unregister_buffers(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_unregister_buffers_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_cancel__doc__,
+"cancel($self, token, /)\n"
+"--\n"
+"\n"
+"Request the cancellation of an operation.\n"
+"\n"
+"The cancelled operation is still reported by wait(), usually with\n"
+"-ECANCELED as result.  Unknown or finished tokens are ignored.");
+
+#define _URING_RING_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_uring_Ring_cancel, METH_O, _uring_Ring_cancel__doc__},
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long token);
+
+static PyObject *
+_uring_Ring_cancel(RingObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    unsigned long long token;
+
+    if (!_PyLong_UnsignedLongLong_Converter(arg, &token)) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_cancel_impl(self, token);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the queued operations and wait for completions.\n"
+"\n"
+"Wait at most timeout seconds for at least one operation to complete,\n"
+"or forever if timeout is None.  Return a list of (key, result, data)\n"
+"tuples.  result is the result of the system call, a negative errno\n"
+"value on failure.  data is the bytes object read by recv() and read(),\n"
+"or None.");
+
+#define _URING_RING_WAIT_METHODDEF    \
+    {"wait", _PyCFunction_CAST(_uring_Ring_wait), METH_FASTCALL|METH_KEYWORDS, _uring_Ring_wait__doc__},
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout_obj);
+
+static PyObject *
+_uring_Ring_wait(RingObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "wait",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout_obj = args[0];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_wait_impl(self, timeout_obj);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the file descriptor of the ring.");
+
+#define _URING_RING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)_uring_Ring_fileno, METH_NOARGS, _uring_Ring_fileno__doc__},
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_fileno(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_fileno_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Cancel the pending operations and close the ring.\n"
+"\n"
+"Block until the kernel reports that all operations are finished.");
+
+#define _URING_RING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)_uring_Ring_close, METH_NOARGS, _uring_Ring_close__doc__},
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_close(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_close_impl(self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=4c072b294ffa6e16 input=a9049054013a1b77]*/
@@ -286,6 +286,35 @@ gc_get_threshold(PyObject *module, PyObject *Py_UNUSED(ignored))
     return gc_get_threshold_impl(module);
 }
 
+PyDoc_STRVAR(gc_set_pause_target__doc__,
+"set_pause_target($module, seconds, /)\n"
+"--\n"
+"\n"
+"Set the target duration of the incremental collections, in seconds.\n"
+"\n"
+"Zero means no target.");
+
+#define GC_SET_PAUSE_TARGET_METHODDEF    \
+    {"set_pause_target", (PyCFunction)gc_set_pause_target, METH_O, gc_set_pause_target__doc__},
+
+PyDoc_STRVAR(gc_get_pause_target__doc__,
+"get_pause_target($module, /)\n"
+"--\n"
+"\n"
+"Return the target duration of the incremental collections, in seconds.");
+
+#define GC_GET_PAUSE_TARGET_METHODDEF    \
+    {"get_pause_target", (PyCFunction)gc_get_pause_target, METH_NOARGS, gc_get_pause_target__doc__},
+
+static PyObject *
+gc_get_pause_target_impl(PyObject *module);
+
+static PyObject *
+gc_get_pause_target(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return gc_get_pause_target_impl(module);
+}
+
 PyDoc_STRVAR(gc_get_count__doc__,
 "get_count($module, /)\n"
 "--\n"
@@ -580,4 +609,4 @@ gc_get_freeze_count(PyObject *module, PyObject *Py_UNUSED(ignored))
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=3e33248997e06c34 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=95061bd3fe74cc9b input=a9049054013a1b77]*/
@@ -8,6 +8,7 @@
 #include "pycore_gc.h"
 #include "pycore_object.h"      // _PyObject_IS_GC()
 #include "pycore_pystate.h"     // _PyInterpreterState_GET()
+#include "pycore_time.h"        // _PyTime_FromSecondsObject()
 #include "pycore_tuple.h"       // _PyTuple_FromArray()
 
 typedef struct _gc_runtime_state GCState;
@@ -186,6 +187,50 @@ gc_get_threshold_impl(PyObject *module)
                          0);
 }
 
+/*[clinic input]
+gc.set_pause_target
+
+    seconds: object
+    /
+
+Set the target duration of the incremental collections, in seconds.
+
+Zero means no target.
+[clinic start generated code]*/
+
+static PyObject *
+gc_set_pause_target(PyObject *module, PyObject *seconds)
+/*[clinic end generated code: output=9ed6d54fe8cfd416 input=26b5d77c5af91a92]*/
+{
+    PyTime_t target;
+    if (_PyTime_FromSecondsObject(&target, seconds,
+                                  _PyTime_ROUND_CEILING) < 0) {
+        return NULL;
+    }
+    if (target < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "pause target must be non-negative");
+        return NULL;
+    }
+    GCState *gcstate = get_gc_state();
+    gcstate->pause_target = target;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+gc.get_pause_target
+
+Return the target duration of the incremental collections, in seconds.
+[clinic start generated code]*/
+
+static PyObject *
+gc_get_pause_target_impl(PyObject *module)
+/*[clinic end generated code: output=9c71aef7d13f27c1 input=a5c2ef7c5d3e040c]*/
+{
+    GCState *gcstate = get_gc_state();
+    return PyFloat_FromDouble(PyTime_AsSecondsDouble(gcstate->pause_target));
+}
+
 /*[clinic input]
 gc.get_count
 
@@ -477,6 +522,8 @@ PyDoc_STRVAR(gc__doc__,
 "get_debug() -- Get debugging flags.\n"
 "set_threshold() -- Set the collection thresholds.\n"
 "get_threshold() -- Return the current the collection thresholds.\n"
+"set_pause_target() -- Set the target duration of incremental collections.\n"
+"get_pause_target() -- Return the target duration of incremental collections.\n"
 "get_objects() -- Return a list of all objects tracked by the collector.\n"
 "is_tracked() -- Returns true if a given object is tracked.\n"
 "is_finalized() -- Returns true if a given object has been already finalized.\n"
@@ -495,6 +542,8 @@ static PyMethodDef GcMethods[] = {
     GC_GET_COUNT_METHODDEF
     GC_SET_THRESHOLD_METHODDEF
     GC_GET_THRESHOLD_METHODDEF
+    GC_SET_PAUSE_TARGET_METHODDEF
+    GC_GET_PAUSE_TARGET_METHODDEF
     GC_COLLECT_METHODDEF
     GC_GET_OBJECTS_METHODDEF
     GC_GET_STATS_METHODDEF
@@ -1609,11 +1609,31 @@ gc_collect_increment(PyThreadState *tstate, struct gc_collection_stats *stats)
     intptr_t objects_marked = mark_stacks(tstate->interp, visited, gcstate->visited_space, false);
     GC_STAT_ADD(1, objects_transitively_reachable, objects_marked);
     gcstate->work_to_do -= objects_marked;
+    stats->visited += objects_marked;
     gc_list_set_space(&gcstate->young.head, gcstate->visited_space);
     gc_list_merge(&gcstate->young.head, &increment);
     gc_list_validate_space(&increment, gcstate->visited_space);
     Py_ssize_t increment_size = gc_list_size(&increment);
-    while (increment_size < gcstate->work_to_do) {
+    /* With a pause target, stop adding objects from the old space once the
+     * estimated duration of the increment reaches it.  The remaining work
+     * is carried over to the next increments.  The young generation is
+     * always collected entirely, and at least the share of the old space
+     * added to the work to do by each increment is always scanned: without
+     * it, a young generation costing more than the target would keep the
+     * scan of the old space, and its cyclic garbage, from ever completing. */
+    Py_ssize_t max_increment_size = PY_SSIZE_T_MAX;
+    if (gcstate->pause_target > 0 && gcstate->visit_cost > 0) {
+        double size = (double)gcstate->pause_target / gcstate->visit_cost;
+        if (size < (double)PY_SSIZE_T_MAX) {
+            max_increment_size = (Py_ssize_t)size;
+        }
+        Py_ssize_t min_old_size = gcstate->heap_size / SCAN_RATE_DIVISOR / scale_factor;
+        if (max_increment_size - increment_size < min_old_size) {
+            max_increment_size = increment_size + min_old_size;
+        }
+    }
+    while (increment_size < gcstate->work_to_do &&
+           increment_size < max_increment_size) {
         if (gc_list_is_empty(not_visited)) {
             break;
         }
@@ -1689,6 +1709,7 @@ gc_collect_region(PyThreadState *tstate,
     assert(gcstate->garbage != NULL);
     assert(!_PyErr_Occurred(tstate));
 
+    stats->visited += gc_list_size(from);
     gc_list_init(&unreachable);
     deduce_unreachable(from, &unreachable);
     validate_consistent_old_space(from);
@@ -1774,10 +1795,12 @@ do_gc_callback(GCState *gcstate, const char *phase,
     assert(PyList_CheckExact(gcstate->callbacks));
     PyObject *info = NULL;
     if (PyList_GET_SIZE(gcstate->callbacks) != 0) {
-        info = Py_BuildValue("{sisnsn}",
+        info = Py_BuildValue("{sisnsnsnsd}",
             "generation", generation,
             "collected", stats->collected,
-            "uncollectable", stats->uncollectable);
+            "uncollectable", stats->uncollectable,
+            "visited", stats->visited,
+            "duration", PyTime_AsSecondsDouble(stats->duration));
         if (info == NULL) {
             PyErr_FormatUnraisable("Exception ignored on invoking gc callbacks");
             return;
@@ -2013,6 +2036,9 @@ _PyGC_Collect(PyThreadState *tstate, int generation, _PyGC_Reason reason)
         PyDTrace_GC_START(generation);
     }
     PyObject *exc = _PyErr_GetRaisedException(tstate);
+    PyTime_t t1 = 0, t2 = 0;
+    // ignore errors: don't interrupt the GC if reading the clock fails
+    (void)PyTime_PerfCounterRaw(&t1);
     switch(generation) {
         case 0:
             gc_collect_young(tstate, &stats);
@@ -2026,6 +2052,17 @@ _PyGC_Collect(PyThreadState *tstate, int generation, _PyGC_Reason reason)
         default:
             Py_UNREACHABLE();
     }
+    (void)PyTime_PerfCounterRaw(&t2);
+    stats.duration = t2 - t1;
+    if (stats.visited > 0 && stats.duration > 0) {
+        /* Exponential moving average of the cost of a visit, used to size
+         * the increments to meet the pause target. */
+        double cost = (double)stats.duration / stats.visited;
+        if (gcstate->visit_cost > 0) {
+            cost = (gcstate->visit_cost * 3 + cost) / 4;
+        }
+        gcstate->visit_cost = cost;
+    }
     if (PyDTrace_GC_DONE_ENABLED()) {
         PyDTrace_GC_DONE(stats.uncollectable + stats.collected);
     }
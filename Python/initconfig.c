@@ -300,6 +300,9 @@ The following implementation-specific options are available:\n\
 #endif
 "\
 -X importtime: show how long each import takes; also PYTHONPROFILEIMPORTTIME\n\
+-X lazy_imports[=MODULES]: import modules lazily; MODULES is a comma separated\n\
+         list of modules, \"all\" by default, or of \"-MODULE\" to exclude;\n\
+         also PYTHONLAZYIMPORTS\n\
 -X int_max_str_digits=N: limit the size of int<->str conversions;\n\
          0 disables the limit; also PYTHONINTMAXSTRDIGITS\n\
 -X no_debug_ranges: don't include extra location information in code objects;\n\
@@ -392,6 +395,7 @@ static const char usage_envvars[] =
 "PYTHONINSPECT   : inspect interactively after running script (-i)\n"
 "PYTHONINTMAXSTRDIGITS: limit the size of int<->str conversions;\n"
 "                  0 disables the limit (-X int_max_str_digits=N)\n"
+"PYTHONLAZYIMPORTS: import modules lazily (-X lazy_imports)\n"
 "PYTHONNODEBUGRANGES: don't include extra location information in code objects\n"
 "                  (-X no_debug_ranges)\n"
 "PYTHONNOUSERSITE: disable user site directory (-s)\n"
@@ -69,6 +69,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_pyrepl",
 "_queue",
 "_random",
+"_remote_debugging",
 "_scproxy",
 "_sha1",
 "_sha2",
@@ -93,6 +94,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_tokenize",
 "_tracemalloc",
 "_typing",
+"_uring",
 "_uuid",
 "_warnings",
 "_weakref",
@@ -209,6 +211,7 @@ static const char* _Py_stdlib_module_names[] = {
 "posixpath",
 "pprint",
 "profile",
+"profiling",
 "pstats",
 "pty",
 "pwd",